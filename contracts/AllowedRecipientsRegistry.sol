@@ -5,10 +5,14 @@ pragma solidity ^0.8.4;
 
 import "./LimitsChecker.sol";
 
+import "OpenZeppelin/openzeppelin-contracts@4.3.2/contracts/proxy/utils/Initializable.sol";
+
 /// @author psirex, zuzueeka
 /// @title Registry of allowed addresses for payouts
 /// @notice Stores list of allowed addresses
-contract AllowedRecipientsRegistry is LimitsChecker {
+/// @dev The registry deployed with the constructor may be used as an implementation of
+///     minimal proxy (EIP-1167) clones. Clones are set up with initialize() method
+contract AllowedRecipientsRegistry is LimitsChecker, Initializable {
     // -------------
     // EVENTS
     // -------------
@@ -30,6 +34,7 @@ contract AllowedRecipientsRegistry is LimitsChecker {
         "RECIPIENT_ALREADY_ADDED_TO_ALLOWED_LIST";
     string private constant ERROR_RECIPIENT_NOT_FOUND_IN_ALLOWED_LIST =
         "RECIPIENT_NOT_FOUND_IN_ALLOWED_LIST";
+    string private constant ERROR_LENGTH_MISMATCH = "LENGTH_MISMATCH";
 
     // -------------
     // VARIABLES
@@ -56,6 +61,7 @@ contract AllowedRecipientsRegistry is LimitsChecker {
     /// @param _updateSpentAmountRoleHolders List of addresses which will
     ///     be granted with role UPDATE_SPENT_AMOUNT_ROLE
     /// @param _bokkyPooBahsDateTimeContract Address of bokkyPooBahs DateTime Contract
+    /// @dev The registry is marked as initialized, so initialize() can't be called on it
     constructor(
         address _admin,
         address[] memory _addRecipientToAllowedListRoleHolders,
@@ -69,7 +75,111 @@ contract AllowedRecipientsRegistry is LimitsChecker {
             _updateSpentAmountRoleHolders,
             _bokkyPooBahsDateTimeContract
         )
+        initializer
     {
+        _setupRecipientsRoles(
+            _admin,
+            _addRecipientToAllowedListRoleHolders,
+            _removeRecipientFromAllowedListRoleHolders
+        );
+    }
+
+    // -------------
+    // EXTERNAL METHODS
+    // -------------
+
+    /// @notice Sets up the minimal proxy clone of the registry. Takes the same
+    ///     parameters as the constructor and can be called only once
+    function initialize(
+        address _admin,
+        address[] memory _addRecipientToAllowedListRoleHolders,
+        address[] memory _removeRecipientFromAllowedListRoleHolders,
+        address[] memory _setParametersRoleHolders,
+        address[] memory _updateSpentAmountRoleHolders,
+        IBokkyPooBahsDateTimeContract _bokkyPooBahsDateTimeContract
+    ) external initializer {
+        _initializeLimitsChecker(
+            _setParametersRoleHolders,
+            _updateSpentAmountRoleHolders,
+            _bokkyPooBahsDateTimeContract
+        );
+        _setupRecipientsRoles(
+            _admin,
+            _addRecipientToAllowedListRoleHolders,
+            _removeRecipientFromAllowedListRoleHolders
+        );
+    }
+
+    /// @notice Adds address to list of allowed addresses for payouts
+    function addRecipient(address _recipient, string memory _title)
+        external
+        onlyRole(ADD_RECIPIENT_TO_ALLOWED_LIST_ROLE)
+    {
+        _addRecipient(_recipient, _title);
+    }
+
+    /// @notice Adds addresses to list of allowed addresses for payouts
+    /// @param _recipients Addresses to add
+    /// @param _titles Titles of the recipients, item at index i is the title of _recipients[i]
+    function addRecipients(address[] memory _recipients, string[] memory _titles)
+        external
+        onlyRole(ADD_RECIPIENT_TO_ALLOWED_LIST_ROLE)
+    {
+        require(_recipients.length == _titles.length, ERROR_LENGTH_MISMATCH);
+        for (uint256 i = 0; i < _recipients.length; ++i) {
+            _addRecipient(_recipients[i], _titles[i]);
+        }
+    }
+
+    /// @notice Removes address from list of allowed addresses for payouts
+    function removeRecipient(address _recipient)
+        external
+        onlyRole(REMOVE_RECIPIENT_FROM_ALLOWED_LIST_ROLE)
+    {
+        _removeRecipient(_recipient);
+    }
+
+    /// @notice Removes addresses from list of allowed addresses for payouts
+    /// @param _recipients Addresses to remove
+    function removeRecipients(address[] memory _recipients)
+        external
+        onlyRole(REMOVE_RECIPIENT_FROM_ALLOWED_LIST_ROLE)
+    {
+        for (uint256 i = 0; i < _recipients.length; ++i) {
+            _removeRecipient(_recipients[i]);
+        }
+    }
+
+    /// @notice Returns if passed address is listed as allowed recipient in the registry
+    function isRecipientAllowed(address _recipient) external view returns (bool) {
+        return allowedRecipientIndices[_recipient] > 0;
+    }
+
+    /// @notice Returns if all passed addresses are listed as allowed recipients in the registry
+    /// @dev Allows EVMScript factories to validate all recipients of the payout with one call
+    function areRecipientsAllowed(address[] memory _recipients) external view returns (bool) {
+        for (uint256 i = 0; i < _recipients.length; ++i) {
+            if (allowedRecipientIndices[_recipients[i]] == 0) {
+                return false;
+            }
+        }
+        return true;
+    }
+
+    /// @notice Returns current list of allowed recipients
+    function getAllowedRecipients() external view returns (address[] memory) {
+        return allowedRecipients;
+    }
+
+    // ------------------
+    // PRIVATE METHODS
+    // ------------------
+
+    function _setupRecipientsRoles(
+        address _admin,
+        address[] memory _addRecipientToAllowedListRoleHolders,
+        address[] memory _removeRecipientFromAllowedListRoleHolders
+    ) private {
         _setupRole(DEFAULT_ADMIN_ROLE, _admin);
         for (uint256 i = 0; i < _addRecipientToAllowedListRoleHolders.length; i++) {
             _setupRole(
@@ -85,15 +195,7 @@ contract AllowedRecipientsRegistry is LimitsChecker {
         }
     }
 
-    // -------------
-    // EXTERNAL METHODS
-    // -------------
-
-    /// @notice Adds address to list of allowed addresses for payouts
-    function addRecipient(address _recipient, string memory _title)
-        external
-        onlyRole(ADD_RECIPIENT_TO_ALLOWED_LIST_ROLE)
-    {
+    function _addRecipient(address _recipient, string memory _title) private {
         require(
             allowedRecipientIndices[_recipient] == 0,
             ERROR_RECIPIENT_ALREADY_ADDED_TO_ALLOWED_LIST
@@ -104,14 +206,10 @@ contract AllowedRecipientsRegistry is LimitsChecker {
         emit RecipientAdded(_recipient, _title);
     }
 
-    /// @notice Removes address from list of allowed addresses for payouts
     /// @dev To delete an allowed address from the allowedRecipients array in O(1),
     /// we swap the element to delete with the last one in the array,
     /// and then remove the last element (sometimes called as 'swap and pop').
-    function removeRecipient(address _recipient)
-        external
-        onlyRole(REMOVE_RECIPIENT_FROM_ALLOWED_LIST_ROLE)
-    {
+    function _removeRecipient(address _recipient) private {
         uint256 index = _getAllowedRecipientIndex(_recipient);
         uint256 lastIndex = allowedRecipients.length - 1;
 
@@ -126,20 +224,6 @@ contract AllowedRecipientsRegistry is LimitsChecker {
         emit RecipientRemoved(_recipient);
     }
 
-    /// @notice Returns if passed address is listed as allowed recipient in the registry
-    function isRecipientAllowed(address _recipient) external view returns (bool) {
-        return allowedRecipientIndices[_recipient] > 0;
-    }
-
-    /// @notice Returns current list of allowed recipients
-    function getAllowedRecipients() external view returns (address[] memory) {
-        return allowedRecipients;
-    }
-
-    // ------------------
-    // PRIVATE METHODS
-    // ------------------
-
     function _getAllowedRecipientIndex(address _recipient) private view returns (uint256 _index) {
         _index = allowedRecipientIndices[_recipient];
         require(_index > 0, ERROR_RECIPIENT_NOT_FOUND_IN_ALLOWED_LIST);
@@ -5,6 +5,7 @@ pragma solidity 0.8.6;
 
 import "../TrustedCaller.sol";
 import "../libraries/EVMScriptCreator.sol";
+import "../libraries/MemoryHashSet.sol";
 import "../interfaces/IEVMScriptFactory.sol";
 import "../interfaces/INodeOperatorsRegistry.sol";
 import "../interfaces/IACL.sol";
@@ -132,6 +133,12 @@ contract ActivateNodeOperators is TrustedCaller, IEVMScriptFactory {
             ERROR_NODE_OPERATOR_INDEX_OUT_OF_RANGE
         );
 
+        bytes32[] memory managerAddresses = new bytes32[](_decodedCallData.length);
+        for (uint256 i = 0; i < _decodedCallData.length; ++i) {
+            managerAddresses[i] = bytes32(uint256(uint160(_decodedCallData[i].managerAddress)));
+        }
+        uint256 duplicateManagerIndex = MemoryHashSet.findFirstDuplicate(managerAddresses);
+
         for (uint256 i = 0; i < _decodedCallData.length; ++i) {
             require(
                 i == 0 ||
@@ -145,14 +152,7 @@ contract ActivateNodeOperators is TrustedCaller, IEVMScriptFactory {
             );
 
             require(_decodedCallData[i].managerAddress != address(0), ERROR_ZERO_MANAGER_ADDRESS);
-
-            address managerAddress = _decodedCallData[i].managerAddress;
-            for (uint256 testIndex = i + 1; testIndex < _decodedCallData.length; ++testIndex) {
-                require(
-                    managerAddress != _decodedCallData[testIndex].managerAddress,
-                    ERROR_MANAGER_ADDRESSES_HAS_DUPLICATE
-                );
-            }
+            require(i != duplicateManagerIndex, ERROR_MANAGER_ADDRESSES_HAS_DUPLICATE);
 
             require(
                 acl.hasPermission(
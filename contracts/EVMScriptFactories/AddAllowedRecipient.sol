@@ -5,21 +5,12 @@ pragma solidity ^0.8.4;
 
 import "../TrustedCaller.sol";
 import "../AllowedRecipientsRegistry.sol";
-import "../libraries/EVMScriptCreator.sol";
+import "../libraries/AllowedRecipientsListUtils.sol";
 import "../interfaces/IEVMScriptFactory.sol";
 
 /// @author psirex, zuzueeka
 /// @notice Creates EVMScript to add new allowed recipient address to AllowedRecipientsRegistry
 contract AddAllowedRecipient is TrustedCaller, IEVMScriptFactory {
-    // -------------
-    // ERRORS
-    // -------------
-
-    string private constant ERROR_RECIPIENT_ADDRESS_IS_ZERO_ADDRESS =
-        "RECIPIENT_ADDRESS_IS_ZERO_ADDRESS";
-    string private constant ERROR_ALLOWED_RECIPIENT_ALREADY_ADDED =
-        "ALLOWED_RECIPIENT_ALREADY_ADDED";
-
     // -------------
     // VARIABLES
     // -------------
@@ -51,17 +42,9 @@ contract AddAllowedRecipient is TrustedCaller, IEVMScriptFactory {
         onlyTrustedCaller(_creator)
         returns (bytes memory)
     {
-        (address recipientAddress, ) = _decodeEVMScriptCallData(_evmScriptCallData);
-        require(recipientAddress != address(0), ERROR_RECIPIENT_ADDRESS_IS_ZERO_ADDRESS);
-        require(
-            !allowedRecipientsRegistry.isRecipientAllowed(recipientAddress),
-            ERROR_ALLOWED_RECIPIENT_ALREADY_ADDED
-        );
-
         return
-            EVMScriptCreator.createEVMScript(
-                address(allowedRecipientsRegistry),
-                allowedRecipientsRegistry.addRecipient.selector,
+            AllowedRecipientsListUtils.createAddRecipientEVMScript(
+                allowedRecipientsRegistry,
                 _evmScriptCallData
             );
     }
@@ -75,18 +58,6 @@ contract AddAllowedRecipient is TrustedCaller, IEVMScriptFactory {
         pure
         returns (address, string memory)
     {
-        return _decodeEVMScriptCallData(_evmScriptCallData);
-    }
-
-    // ------------------
-    // PRIVATE METHODS
-    // ------------------
-
-    function _decodeEVMScriptCallData(bytes memory _evmScriptCallData)
-        private
-        pure
-        returns (address, string memory)
-    {
-        return abi.decode(_evmScriptCallData, (address, string));
+        return AllowedRecipientsListUtils.decodeAddRecipientEVMScriptCallData(_evmScriptCallData);
     }
 }
@@ -0,0 +1,112 @@
+// SPDX-FileCopyrightText: 2025 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity ^0.8.4;
+
+import "../TrustedCaller.sol";
+import "../AllowedRecipientsRegistry.sol";
+import "../libraries/EVMScriptCreator.sol";
+import "../libraries/MemoryHashSet.sol";
+import "../interfaces/IEVMScriptFactory.sol";
+
+/// @notice Creates EVMScript to add multiple allowed recipient addresses to AllowedRecipientsRegistry
+/// with a single AllowedRecipientsRegistry.addRecipients() call
+contract AddAllowedRecipients is TrustedCaller, IEVMScriptFactory {
+    // -------------
+    // ERRORS
+    // -------------
+
+    string private constant ERROR_EMPTY_RECIPIENTS = "EMPTY_RECIPIENTS";
+    string private constant ERROR_LENGTH_MISMATCH = "LENGTH_MISMATCH";
+    string private constant ERROR_RECIPIENT_ADDRESS_IS_ZERO_ADDRESS =
+        "RECIPIENT_ADDRESS_IS_ZERO_ADDRESS";
+    string private constant ERROR_ALLOWED_RECIPIENT_ALREADY_ADDED =
+        "ALLOWED_RECIPIENT_ALREADY_ADDED";
+    string private constant ERROR_DUPLICATE_RECIPIENT = "DUPLICATE_RECIPIENT";
+
+    // -------------
+    // VARIABLES
+    // -------------
+
+    /// @notice Address of AllowedRecipientsRegistry
+    AllowedRecipientsRegistry public allowedRecipientsRegistry;
+
+    // -------------
+    // CONSTRUCTOR
+    // -------------
+
+    constructor(address _trustedCaller, address _allowedRecipientsRegistry)
+        TrustedCaller(_trustedCaller)
+    {
+        allowedRecipientsRegistry = AllowedRecipientsRegistry(_allowedRecipientsRegistry);
+    }
+
+    // -------------
+    // EXTERNAL METHODS
+    // -------------
+
+    /// @notice Creates EVMScript to add new allowed recipient addresses to allowedRecipientsRegistry
+    /// @param _creator Address who creates EVMScript
+    /// @param _evmScriptCallData Encoded tuple: (address[] recipients, string[] titles)
+    function createEVMScript(address _creator, bytes memory _evmScriptCallData)
+        external
+        view
+        override
+        onlyTrustedCaller(_creator)
+        returns (bytes memory)
+    {
+        (address[] memory recipients, string[] memory titles) =
+            _decodeEVMScriptCallData(_evmScriptCallData);
+        _validateInputData(recipients, titles);
+
+        return
+            EVMScriptCreator.createEVMScript(
+                address(allowedRecipientsRegistry),
+                allowedRecipientsRegistry.addRecipients.selector,
+                _evmScriptCallData
+            );
+    }
+
+    /// @notice Decodes call data used by createEVMScript method
+    /// @param _evmScriptCallData Encoded tuple: (address[] recipients, string[] titles)
+    /// @return Addresses of recipients to add
+    /// @return Titles of the recipients
+    function decodeEVMScriptCallData(bytes memory _evmScriptCallData)
+        external
+        pure
+        returns (address[] memory, string[] memory)
+    {
+        return _decodeEVMScriptCallData(_evmScriptCallData);
+    }
+
+    // ------------------
+    // PRIVATE METHODS
+    // ------------------
+
+    function _decodeEVMScriptCallData(bytes memory _evmScriptCallData)
+        private
+        pure
+        returns (address[] memory, string[] memory)
+    {
+        return abi.decode(_evmScriptCallData, (address[], string[]));
+    }
+
+    function _validateInputData(address[] memory _recipients, string[] memory _titles)
+        private
+        view
+    {
+        require(_recipients.length > 0, ERROR_EMPTY_RECIPIENTS);
+        require(_recipients.length == _titles.length, ERROR_LENGTH_MISMATCH);
+
+        uint256 duplicateRecipientIndex = MemoryHashSet.findFirstDuplicate(_recipients);
+
+        for (uint256 i = 0; i < _recipients.length; ++i) {
+            require(_recipients[i] != address(0), ERROR_RECIPIENT_ADDRESS_IS_ZERO_ADDRESS);
+            require(
+                !allowedRecipientsRegistry.isRecipientAllowed(_recipients[i]),
+                ERROR_ALLOWED_RECIPIENT_ALREADY_ADDED
+            );
+            require(i != duplicateRecipientIndex, ERROR_DUPLICATE_RECIPIENT);
+        }
+    }
+}
@@ -5,6 +5,7 @@ pragma solidity 0.8.6;
 
 import "../TrustedCaller.sol";
 import "../libraries/EVMScriptCreator.sol";
+import "../libraries/MemoryHashSet.sol";
 import "../interfaces/IEVMScriptFactory.sol";
 import "../interfaces/INodeOperatorsRegistry.sol";
 import "../interfaces/IACL.sol";
@@ -165,16 +166,17 @@ contract AddNodeOperators is TrustedCaller, IEVMScriptFactory {
             ERROR_MAX_OPERATORS_COUNT_EXCEEDED
         );
 
+        bytes32[] memory managerAddresses = new bytes32[](calldataLength);
+        for (uint256 i = 0; i < calldataLength; ++i) {
+            managerAddresses[i] = bytes32(uint256(uint160(_nodeOperatorInputs[i].managerAddress)));
+        }
+        uint256 duplicateManagerIndex = MemoryHashSet.findFirstDuplicate(managerAddresses);
+
         for (uint256 i = 0; i < calldataLength; ++i) {
             address managerAddress = _nodeOperatorInputs[i].managerAddress;
             address rewardAddress = _nodeOperatorInputs[i].rewardAddress;
             string memory name = _nodeOperatorInputs[i].name;
-            for (uint256 testIndex = i + 1; testIndex < calldataLength; ++testIndex) {
-                require(
-                    managerAddress != _nodeOperatorInputs[testIndex].managerAddress,
-                    ERROR_MANAGER_ADDRESSES_HAS_DUPLICATE
-                );
-            }
+            require(i != duplicateManagerIndex, ERROR_MANAGER_ADDRESSES_HAS_DUPLICATE);
 
             require(
                 acl.hasPermission(
@@ -5,6 +5,7 @@ pragma solidity 0.8.6;
 
 import "../TrustedCaller.sol";
 import "../libraries/EVMScriptCreator.sol";
+import "../libraries/MemoryHashSet.sol";
 import "../interfaces/IEVMScriptFactory.sol";
 import "../interfaces/INodeOperatorsRegistry.sol";
 import "../interfaces/IACL.sol";
@@ -135,20 +136,19 @@ contract ChangeNodeOperatorManagers is TrustedCaller, IEVMScriptFactory {
             ERROR_NODE_OPERATOR_INDEX_OUT_OF_RANGE
         );
 
+        bytes32[] memory managerAddresses = new bytes32[](_decodedCallData.length);
+        for (uint256 i = 0; i < _decodedCallData.length; ++i) {
+            managerAddresses[i] = bytes32(uint256(uint160(_decodedCallData[i].newManagerAddress)));
+        }
+        uint256 duplicateManagerIndex = MemoryHashSet.findFirstDuplicate(managerAddresses);
+
         for (uint256 i = 0; i < _decodedCallData.length; ++i) {
             require(
                 i == 0 ||
                     _decodedCallData[i].nodeOperatorId > _decodedCallData[i - 1].nodeOperatorId,
                 ERROR_NODE_OPERATORS_IS_NOT_SORTED
             );
-
-            address managerAddress = _decodedCallData[i].newManagerAddress;
-            for (uint256 testIndex = i + 1; testIndex < _decodedCallData.length; ++testIndex) {
-                require(
-                    managerAddress != _decodedCallData[testIndex].newManagerAddress,
-                    ERROR_MANAGER_ADDRESSES_HAS_DUPLICATE
-                );
-            }
+            require(i != duplicateManagerIndex, ERROR_MANAGER_ADDRESSES_HAS_DUPLICATE);
             require(
                 acl.getPermissionParamsLength(
                     _decodedCallData[i].oldManagerAddress,
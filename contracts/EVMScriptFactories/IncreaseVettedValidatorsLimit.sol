@@ -4,6 +4,7 @@
 pragma solidity 0.8.6;
 
 import "../libraries/EVMScriptCreator.sol";
+import "../libraries/NodeOperatorsRegistryReader.sol";
 import "../interfaces/IEVMScriptFactory.sol";
 import "../interfaces/INodeOperatorsRegistry.sol";
 
@@ -128,20 +129,16 @@ contract IncreaseVettedValidatorsLimit is IEVMScriptFactory {
     function _getNodeOperatorData(
         uint256 _nodeOperatorId
     ) private view returns (NodeOperatorData memory _nodeOperatorData) {
-        (
-            bool active,
-            ,
-            address rewardAddress,
-            uint64 stakingLimit,
-            ,
-            uint64 totalSigningKeys,
-
-        ) = nodeOperatorsRegistry.getNodeOperator(_nodeOperatorId, false);
+        NodeOperatorsRegistryReader.NodeOperatorSummary
+            memory nodeOperator = NodeOperatorsRegistryReader.getNodeOperatorSummary(
+                nodeOperatorsRegistry,
+                _nodeOperatorId
+            );
 
         _nodeOperatorData.id = _nodeOperatorId;
-        _nodeOperatorData.active = active;
-        _nodeOperatorData.rewardAddress = rewardAddress;
-        _nodeOperatorData.stakingLimit = stakingLimit;
-        _nodeOperatorData.totalSigningKeys = totalSigningKeys;
+        _nodeOperatorData.active = nodeOperator.active;
+        _nodeOperatorData.rewardAddress = nodeOperator.rewardAddress;
+        _nodeOperatorData.stakingLimit = nodeOperator.stakingLimit;
+        _nodeOperatorData.totalSigningKeys = nodeOperator.totalSigningKeys;
     }
 }
@@ -5,17 +5,12 @@ pragma solidity ^0.8.4;
 
 import "../TrustedCaller.sol";
 import "../AllowedRecipientsRegistry.sol";
-import "../libraries/EVMScriptCreator.sol";
+import "../libraries/AllowedRecipientsListUtils.sol";
 import "../interfaces/IEVMScriptFactory.sol";
 
 /// @author psirex, zuzueeka
 /// @notice Creates EVMScript to remove allowed recipient address from AllowedRecipientsRegistry
 contract RemoveAllowedRecipient is TrustedCaller, IEVMScriptFactory {
-    // -------------
-    // ERRORS
-    // -------------
-    string private constant ERROR_ALLOWED_RECIPIENT_NOT_FOUND = "ALLOWED_RECIPIENT_NOT_FOUND";
-
     // -------------
     // VARIABLES
     // -------------
@@ -47,16 +42,9 @@ contract RemoveAllowedRecipient is TrustedCaller, IEVMScriptFactory {
         onlyTrustedCaller(_creator)
         returns (bytes memory)
     {
-        require(
-            allowedRecipientsRegistry.isRecipientAllowed(
-                _decodeEVMScriptCallData(_evmScriptCallData)
-            ),
-            ERROR_ALLOWED_RECIPIENT_NOT_FOUND
-        );
         return
-            EVMScriptCreator.createEVMScript(
-                address(allowedRecipientsRegistry),
-                allowedRecipientsRegistry.removeRecipient.selector,
+            AllowedRecipientsListUtils.createRemoveRecipientEVMScript(
+                allowedRecipientsRegistry,
                 _evmScriptCallData
             );
     }
@@ -69,18 +57,7 @@ contract RemoveAllowedRecipient is TrustedCaller, IEVMScriptFactory {
         pure
         returns (address recipientAddress)
     {
-        return _decodeEVMScriptCallData(_evmScriptCallData);
-    }
-
-    // ------------------
-    // PRIVATE METHODS
-    // ------------------
-
-    function _decodeEVMScriptCallData(bytes memory _evmScriptCallData)
-        private
-        pure
-        returns (address)
-    {
-        return abi.decode(_evmScriptCallData, (address));
+        return
+            AllowedRecipientsListUtils.decodeRemoveRecipientEVMScriptCallData(_evmScriptCallData);
     }
 }
@@ -0,0 +1,64 @@
+// SPDX-FileCopyrightText: 2025 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity ^0.8.4;
+
+import "../TrustedCallerInitializable.sol";
+import "../AllowedRecipientsRegistry.sol";
+import "../libraries/AllowedRecipientsListUtils.sol";
+import "../interfaces/IEVMScriptFactory.sol";
+
+/// @notice Version of RemoveAllowedRecipient used as implementation of minimal proxy (EIP-1167)
+///     clones deployed by the allowed recipients clone factories
+contract RemoveAllowedRecipientInitializable is TrustedCallerInitializable, IEVMScriptFactory {
+    // -------------
+    // VARIABLES
+    // -------------
+
+    /// @notice Address of AllowedRecipientsRegistry
+    AllowedRecipientsRegistry public allowedRecipientsRegistry;
+
+    // -------------
+    // EXTERNAL METHODS
+    // -------------
+
+    /// @notice Sets up the clone. Can be called only once
+    /// @param _trustedCaller Address that has access to certain methods
+    /// @param _allowedRecipientsRegistry Address of AllowedRecipientsRegistry contract
+    function initialize(address _trustedCaller, address _allowedRecipientsRegistry)
+        external
+        initializer
+    {
+        _initializeTrustedCaller(_trustedCaller);
+        allowedRecipientsRegistry = AllowedRecipientsRegistry(_allowedRecipientsRegistry);
+    }
+
+    /// @notice Creates EVMScript to remove allowed recipient address from allowedRecipientsRegistry
+    /// @param _creator Address who creates EVMScript
+    /// @param _evmScriptCallData Encoded tuple: (address recipientAddress)
+    function createEVMScript(address _creator, bytes memory _evmScriptCallData)
+        external
+        view
+        override
+        onlyTrustedCaller(_creator)
+        returns (bytes memory)
+    {
+        return
+            AllowedRecipientsListUtils.createRemoveRecipientEVMScript(
+                allowedRecipientsRegistry,
+                _evmScriptCallData
+            );
+    }
+
+    /// @notice Decodes call data used by createEVMScript method
+    /// @param _evmScriptCallData Encoded tuple: (address recipientAddress)
+    /// @return recipientAddress Address to remove
+    function decodeEVMScriptCallData(bytes memory _evmScriptCallData)
+        external
+        pure
+        returns (address recipientAddress)
+    {
+        return
+            AllowedRecipientsListUtils.decodeRemoveRecipientEVMScriptCallData(_evmScriptCallData);
+    }
+}
@@ -0,0 +1,100 @@
+// SPDX-FileCopyrightText: 2025 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity ^0.8.4;
+
+import "../TrustedCaller.sol";
+import "../AllowedRecipientsRegistry.sol";
+import "../libraries/EVMScriptCreator.sol";
+import "../libraries/MemoryHashSet.sol";
+import "../interfaces/IEVMScriptFactory.sol";
+
+/// @notice Creates EVMScript to remove multiple allowed recipient addresses from AllowedRecipientsRegistry
+/// with a single AllowedRecipientsRegistry.removeRecipients() call
+contract RemoveAllowedRecipients is TrustedCaller, IEVMScriptFactory {
+    // -------------
+    // ERRORS
+    // -------------
+
+    string private constant ERROR_EMPTY_RECIPIENTS = "EMPTY_RECIPIENTS";
+    string private constant ERROR_ALLOWED_RECIPIENT_NOT_FOUND = "ALLOWED_RECIPIENT_NOT_FOUND";
+    string private constant ERROR_DUPLICATE_RECIPIENT = "DUPLICATE_RECIPIENT";
+
+    // -------------
+    // VARIABLES
+    // -------------
+
+    /// @notice Address of AllowedRecipientsRegistry
+    AllowedRecipientsRegistry public allowedRecipientsRegistry;
+
+    // -------------
+    // CONSTRUCTOR
+    // -------------
+
+    constructor(address _trustedCaller, address _allowedRecipientsRegistry)
+        TrustedCaller(_trustedCaller)
+    {
+        allowedRecipientsRegistry = AllowedRecipientsRegistry(_allowedRecipientsRegistry);
+    }
+
+    // -------------
+    // EXTERNAL METHODS
+    // -------------
+
+    /// @notice Creates EVMScript to remove allowed recipient addresses from allowedRecipientsRegistry
+    /// @param _creator Address who creates EVMScript
+    /// @param _evmScriptCallData Encoded tuple: (address[] recipients)
+    function createEVMScript(address _creator, bytes memory _evmScriptCallData)
+        external
+        view
+        override
+        onlyTrustedCaller(_creator)
+        returns (bytes memory)
+    {
+        _validateInputData(_decodeEVMScriptCallData(_evmScriptCallData));
+
+        return
+            EVMScriptCreator.createEVMScript(
+                address(allowedRecipientsRegistry),
+                allowedRecipientsRegistry.removeRecipients.selector,
+                _evmScriptCallData
+            );
+    }
+
+    /// @notice Decodes call data used by createEVMScript method
+    /// @param _evmScriptCallData Encoded tuple: (address[] recipients)
+    /// @return recipients Addresses to remove
+    function decodeEVMScriptCallData(bytes memory _evmScriptCallData)
+        external
+        pure
+        returns (address[] memory recipients)
+    {
+        return _decodeEVMScriptCallData(_evmScriptCallData);
+    }
+
+    // ------------------
+    // PRIVATE METHODS
+    // ------------------
+
+    function _decodeEVMScriptCallData(bytes memory _evmScriptCallData)
+        private
+        pure
+        returns (address[] memory)
+    {
+        return abi.decode(_evmScriptCallData, (address[]));
+    }
+
+    function _validateInputData(address[] memory _recipients) private view {
+        require(_recipients.length > 0, ERROR_EMPTY_RECIPIENTS);
+
+        uint256 duplicateRecipientIndex = MemoryHashSet.findFirstDuplicate(_recipients);
+
+        for (uint256 i = 0; i < _recipients.length; ++i) {
+            require(
+                allowedRecipientsRegistry.isRecipientAllowed(_recipients[i]),
+                ERROR_ALLOWED_RECIPIENT_NOT_FOUND
+            );
+            require(i != duplicateRecipientIndex, ERROR_DUPLICATE_RECIPIENT);
+        }
+    }
+}
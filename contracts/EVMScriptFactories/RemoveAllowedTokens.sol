@@ -0,0 +1,100 @@
+// SPDX-FileCopyrightText: 2025 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity ^0.8.4;
+
+import "../TrustedCaller.sol";
+import "../payouts/multi-token/AllowedTokensRegistry.sol";
+import "../libraries/EVMScriptCreator.sol";
+import "../libraries/MemoryHashSet.sol";
+import "../interfaces/IEVMScriptFactory.sol";
+
+/// @notice Creates EVMScript to remove multiple allowed token addresses from AllowedTokensRegistry
+/// with a single AllowedTokensRegistry.removeTokens() call
+contract RemoveAllowedTokens is TrustedCaller, IEVMScriptFactory {
+    // -------------
+    // ERRORS
+    // -------------
+
+    string private constant ERROR_EMPTY_TOKENS = "EMPTY_TOKENS";
+    string private constant ERROR_ALLOWED_TOKEN_NOT_FOUND = "ALLOWED_TOKEN_NOT_FOUND";
+    string private constant ERROR_DUPLICATE_TOKEN = "DUPLICATE_TOKEN";
+
+    // -------------
+    // VARIABLES
+    // -------------
+
+    /// @notice Address of AllowedTokensRegistry
+    AllowedTokensRegistry public allowedTokensRegistry;
+
+    // -------------
+    // CONSTRUCTOR
+    // -------------
+
+    constructor(address _trustedCaller, address _allowedTokensRegistry)
+        TrustedCaller(_trustedCaller)
+    {
+        allowedTokensRegistry = AllowedTokensRegistry(_allowedTokensRegistry);
+    }
+
+    // -------------
+    // EXTERNAL METHODS
+    // -------------
+
+    /// @notice Creates EVMScript to remove allowed token addresses from allowedTokensRegistry
+    /// @param _creator Address who creates EVMScript
+    /// @param _evmScriptCallData Encoded tuple: (address[] tokens)
+    function createEVMScript(address _creator, bytes memory _evmScriptCallData)
+        external
+        view
+        override
+        onlyTrustedCaller(_creator)
+        returns (bytes memory)
+    {
+        _validateInputData(_decodeEVMScriptCallData(_evmScriptCallData));
+
+        return
+            EVMScriptCreator.createEVMScript(
+                address(allowedTokensRegistry),
+                allowedTokensRegistry.removeTokens.selector,
+                _evmScriptCallData
+            );
+    }
+
+    /// @notice Decodes call data used by createEVMScript method
+    /// @param _evmScriptCallData Encoded tuple: (address[] tokens)
+    /// @return tokens Addresses of tokens to remove
+    function decodeEVMScriptCallData(bytes memory _evmScriptCallData)
+        external
+        pure
+        returns (address[] memory tokens)
+    {
+        return _decodeEVMScriptCallData(_evmScriptCallData);
+    }
+
+    // ------------------
+    // PRIVATE METHODS
+    // ------------------
+
+    function _decodeEVMScriptCallData(bytes memory _evmScriptCallData)
+        private
+        pure
+        returns (address[] memory)
+    {
+        return abi.decode(_evmScriptCallData, (address[]));
+    }
+
+    function _validateInputData(address[] memory _tokens) private view {
+        require(_tokens.length > 0, ERROR_EMPTY_TOKENS);
+
+        uint256 duplicateTokenIndex = MemoryHashSet.findFirstDuplicate(_tokens);
+
+        for (uint256 i = 0; i < _tokens.length; ++i) {
+            require(
+                allowedTokensRegistry.isTokenAllowed(_tokens[i]),
+                ERROR_ALLOWED_TOKEN_NOT_FOUND
+            );
+            require(i != duplicateTokenIndex, ERROR_DUPLICATE_TOKEN);
+        }
+    }
+}
@@ -5,6 +5,7 @@ pragma solidity 0.8.6;
 
 import "../TrustedCaller.sol";
 import "../libraries/EVMScriptCreator.sol";
+import "../libraries/NodeOperatorsRegistryReader.sol";
 import "../interfaces/IEVMScriptFactory.sol";
 import "../interfaces/INodeOperatorsRegistry.sol";
 
@@ -112,26 +113,19 @@ contract SetVettedValidatorsLimits is TrustedCaller, IEVMScriptFactory {
                 ERROR_NODE_OPERATORS_IS_NOT_SORTED
             );
 
-            (
-                bool active,
-                /* string memory name */,
-                /* address rewardAddress */,
-                /* uint64 stakingLimit */,
-                /* uint64 stoppedValidators */,
-                uint64 totalSigningKeys,
-                /* uint64 usedSigningKeys */
-            ) = nodeOperatorsRegistry.getNodeOperator(
-                _decodedCallData[i].nodeOperatorId,
-                false
-            );
+            NodeOperatorsRegistryReader.NodeOperatorSummary
+                memory nodeOperator = NodeOperatorsRegistryReader.getNodeOperatorSummary(
+                    nodeOperatorsRegistry,
+                    _decodedCallData[i].nodeOperatorId
+                );
 
             require(
-                totalSigningKeys >= _decodedCallData[i].stakingLimit,
+                nodeOperator.totalSigningKeys >= _decodedCallData[i].stakingLimit,
                 ERROR_NOT_ENOUGH_SIGNING_KEYS
             );
 
             require(
-                active == true,
+                nodeOperator.active == true,
                 ERROR_NODE_OPERATOR_IS_NOT_ACTIVE
             );
         }
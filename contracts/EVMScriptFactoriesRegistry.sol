@@ -20,6 +20,7 @@ contract EVMScriptFactoriesRegistry is AccessControl {
 
     event EVMScriptFactoryAdded(address indexed _evmScriptFactory, bytes _permissions);
     event EVMScriptFactoryRemoved(address indexed _evmScriptFactory);
+    event EVMScriptFactoryFastEnactmentChanged(address indexed _evmScriptFactory, bool _isAllowed);
 
     // ------------
     // STORAGE VARIABLES
@@ -35,6 +36,15 @@ contract EVMScriptFactoriesRegistry is AccessControl {
     /// @notice Permissions of current list of allowed EVMScript factories.
     mapping(address => bytes) public evmScriptFactoryPermissions;
 
+    // Permissions of EVMScript factories stored as sets to validate each call of
+    // EVMScript with a single lookup instead of the scan of the packed permissions
+    mapping(address => mapping(bytes24 => bool)) internal evmScriptFactoryPermissionsSets;
+
+    /// @notice Stores if motions created by the EVMScript factory can be enacted with the EVMScript
+    /// emitted on the motion creation, without the recreation of the EVMScript by the factory.
+    /// Disabled by default. Must stay disabled for factories validating the state at the enactment time
+    mapping(address => bool) public isFastEnactmentAllowed;
+
     // ------------
     // CONSTRUCTOR
     // ------------
@@ -58,6 +68,7 @@ contract EVMScriptFactoriesRegistry is AccessControl {
         evmScriptFactories.push(_evmScriptFactory);
         evmScriptFactoryIndices[_evmScriptFactory] = evmScriptFactories.length;
         evmScriptFactoryPermissions[_evmScriptFactory] = _permissions;
+        _permissions.addToPermissionsSet(evmScriptFactoryPermissionsSets[_evmScriptFactory]);
         emit EVMScriptFactoryAdded(_evmScriptFactory, _permissions);
     }
 
@@ -80,10 +91,28 @@ contract EVMScriptFactoriesRegistry is AccessControl {
 
         evmScriptFactories.pop();
         delete evmScriptFactoryIndices[_evmScriptFactory];
+        bytes memory permissions = evmScriptFactoryPermissions[_evmScriptFactory];
+        permissions.removeFromPermissionsSet(evmScriptFactoryPermissionsSets[_evmScriptFactory]);
         delete evmScriptFactoryPermissions[_evmScriptFactory];
+        if (isFastEnactmentAllowed[_evmScriptFactory]) {
+            delete isFastEnactmentAllowed[_evmScriptFactory];
+            emit EVMScriptFactoryFastEnactmentChanged(_evmScriptFactory, false);
+        }
         emit EVMScriptFactoryRemoved(_evmScriptFactory);
     }
 
+    /// @notice Allows or disallows enactment of motions created by the EVMScript factory without
+    /// the recreation of the EVMScript. Must be allowed only for factories whose EVMScripts stay
+    /// valid when the state checked by the factory on the motion creation changes before the enactment
+    function setFastEnactmentAllowed(address _evmScriptFactory, bool _isAllowed)
+        external
+        onlyRole(DEFAULT_ADMIN_ROLE)
+    {
+        require(_isEVMScriptFactory(_evmScriptFactory), "EVM_SCRIPT_FACTORY_NOT_FOUND");
+        isFastEnactmentAllowed[_evmScriptFactory] = _isAllowed;
+        emit EVMScriptFactoryFastEnactmentChanged(_evmScriptFactory, _isAllowed);
+    }
+
     /// @notice Returns current list of EVMScript factories
     function getEVMScriptFactories() external view returns (address[] memory) {
         return evmScriptFactories;
@@ -111,14 +140,39 @@ contract EVMScriptFactoriesRegistry is AccessControl {
             _creator,
             _evmScriptCallData
         );
-        bytes memory permissions = evmScriptFactoryPermissions[_evmScriptFactory];
-        require(permissions.canExecuteEVMScript(_evmScript), "HAS_NO_PERMISSIONS");
+        _validateEVMScriptPermissions(_evmScriptFactory, _evmScript);
+    }
+
+    /// @notice Validates EVMScript created by the given EVMScript factory before
+    /// its execution without recreation by the factory
+    /// @dev Reverts with error if fast enactment isn't allowed for the factory or if
+    /// script tries to call methods not listed in permissions
+    function _validateFastEnactment(address _evmScriptFactory, bytes memory _evmScript)
+        internal
+        view
+    {
+        require(_isEVMScriptFactory(_evmScriptFactory), "EVM_SCRIPT_FACTORY_NOT_FOUND");
+        require(isFastEnactmentAllowed[_evmScriptFactory], "FAST_ENACTMENT_NOT_ALLOWED");
+        _validateEVMScriptPermissions(_evmScriptFactory, _evmScript);
     }
 
     // ------------------
     // PRIVATE METHODS
     // ------------------
 
+    function _validateEVMScriptPermissions(address _evmScriptFactory, bytes memory _evmScript)
+        private
+        view
+    {
+        require(
+            EVMScriptPermissions.canExecuteEVMScript(
+                evmScriptFactoryPermissionsSets[_evmScriptFactory],
+                _evmScript
+            ),
+            "HAS_NO_PERMISSIONS"
+        );
+    }
+
     function _getEVMScriptFactoryIndex(address _evmScriptFactory)
         private
         view
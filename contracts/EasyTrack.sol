@@ -31,6 +31,27 @@ contract EasyTrack is Pausable, AccessControl, MotionSettings, EVMScriptFactorie
         bytes32 evmScriptHash;
     }
 
+    // Storage layout of the motion. Fields are packed into 4 storage slots instead of 9 slots
+    // of the Motion struct, which reduces the cost of creation, objection and deletion of motions.
+    // Values never exceed the types sizes: ids grow by one, timestamps and block numbers fit into
+    // 48 bits, objectionsThreshold is limited by MAX_OBJECTIONS_THRESHOLD, motionDuration by uint32,
+    // objectionsAmount and snapshotTotalSupply by the total supply of the MiniMe token which stores
+    // balances as uint128. snapshotTotalSupply is the total supply of the governance token at the
+    // snapshot block, cached on the first objection. It shares the slot with objectionsAmount,
+    // so caching doesn't cost additional storage writes.
+    struct MotionStorage {
+        address evmScriptFactory;
+        uint48 id;
+        uint16 objectionsThreshold;
+        uint32 duration;
+        address creator;
+        uint48 startDate;
+        uint48 snapshotBlock;
+        uint128 objectionsAmount;
+        uint128 snapshotTotalSupply;
+        bytes32 evmScriptHash;
+    }
+
     // -------------
     // EVENTS
     // -------------
@@ -41,6 +62,7 @@ contract EasyTrack is Pausable, AccessControl, MotionSettings, EVMScriptFactorie
         bytes _evmScriptCallData,
         bytes _evmScript
     );
+    event MotionEVMScriptHashed(uint256 indexed _motionId, bytes32 _evmScriptHash);
     event MotionObjected(
         uint256 indexed _motionId,
         address indexed _objector,
@@ -52,6 +74,7 @@ contract EasyTrack is Pausable, AccessControl, MotionSettings, EVMScriptFactorie
     event MotionCanceled(uint256 indexed _motionId);
     event MotionEnacted(uint256 indexed _motionId);
     event EVMScriptExecutorChanged(address indexed _evmScriptExecutor);
+    event CompactMotionCreatedEventChanged(bool _compactMotionCreatedEvent);
 
     // -------------
     // ERRORS
@@ -63,6 +86,7 @@ contract EasyTrack is Pausable, AccessControl, MotionSettings, EVMScriptFactorie
     string private constant ERROR_UNEXPECTED_EVM_SCRIPT = "UNEXPECTED_EVM_SCRIPT";
     string private constant ERROR_MOTION_NOT_FOUND = "MOTION_NOT_FOUND";
     string private constant ERROR_MOTIONS_LIMIT_REACHED = "MOTIONS_LIMIT_REACHED";
+    string private constant ERROR_LENGTH_MISMATCH = "LENGTH_MISMATCH";
 
     // -------------
     // ROLES
@@ -82,8 +106,8 @@ contract EasyTrack is Pausable, AccessControl, MotionSettings, EVMScriptFactorie
     // STORAGE VARIABLES
     // ------------
 
-    /// @notice List of active motions
-    Motion[] public motions;
+    // List of active motions
+    MotionStorage[] internal motionsStorage;
 
     // Id of the lastly created motion
     uint256 internal lastMotionId;
@@ -101,6 +125,11 @@ contract EasyTrack is Pausable, AccessControl, MotionSettings, EVMScriptFactorie
     /// @notice Stores if motion with given id has been objected from given address.
     mapping(uint256 => mapping(address => bool)) public objections;
 
+    /// @notice Whether MotionCreated event is emitted without EVMScript of the motion.
+    /// When set, MotionCreated contains empty _evmScript and the hash of the EVMScript
+    /// is emitted in the MotionEVMScriptHashed event instead
+    bool public compactMotionCreatedEvent;
+
     // ------------
     // CONSTRUCTOR
     // ------------
@@ -135,31 +164,39 @@ contract EasyTrack is Pausable, AccessControl, MotionSettings, EVMScriptFactorie
         whenNotPaused
         returns (uint256 _newMotionId)
     {
-        require(motions.length < motionsCountLimit, ERROR_MOTIONS_LIMIT_REACHED);
+        require(motionsStorage.length < motionsCountLimit, ERROR_MOTIONS_LIMIT_REACHED);
 
-        Motion storage newMotion = motions.push();
+        MotionStorage storage newMotion = motionsStorage.push();
         _newMotionId = ++lastMotionId;
 
-        newMotion.id = _newMotionId;
+        newMotion.id = uint48(_newMotionId);
         newMotion.creator = msg.sender;
-        newMotion.startDate = block.timestamp;
-        newMotion.snapshotBlock = block.number;
-        newMotion.duration = motionDuration;
-        newMotion.objectionsThreshold = objectionsThreshold;
+        newMotion.startDate = uint48(block.timestamp);
+        newMotion.snapshotBlock = uint48(block.number);
+        newMotion.duration = uint32(motionDuration);
+        newMotion.objectionsThreshold = uint16(objectionsThreshold);
         newMotion.evmScriptFactory = _evmScriptFactory;
-        motionIndicesByMotionId[_newMotionId] = motions.length;
+        motionIndicesByMotionId[_newMotionId] = motionsStorage.length;
 
         bytes memory evmScript =
             _createEVMScript(_evmScriptFactory, msg.sender, _evmScriptCallData);
-        newMotion.evmScriptHash = keccak256(evmScript);
-
-        emit MotionCreated(
-            _newMotionId,
-            msg.sender,
-            _evmScriptFactory,
-            _evmScriptCallData,
-            evmScript
-        );
+        bytes32 evmScriptHash = keccak256(evmScript);
+        newMotion.evmScriptHash = evmScriptHash;
+
+        if (compactMotionCreatedEvent) {
+            // EVMScript can be rebuilt off-chain calling createEVMScript() of the factory
+            // with the same call data at the creation block and checked against the hash
+            emit MotionCreated(_newMotionId, msg.sender, _evmScriptFactory, _evmScriptCallData, "");
+            emit MotionEVMScriptHashed(_newMotionId, evmScriptHash);
+        } else {
+            emit MotionCreated(
+                _newMotionId,
+                msg.sender,
+                _evmScriptFactory,
+                _evmScriptCallData,
+                evmScript
+            );
+        }
     }
 
     /// @notice Enacts motion with given id
@@ -170,26 +207,55 @@ contract EasyTrack is Pausable, AccessControl, MotionSettings, EVMScriptFactorie
         external
         whenNotPaused
     {
-        Motion storage motion = _getMotion(_motionId);
-        require(motion.startDate + motion.duration <= block.timestamp, ERROR_MOTION_NOT_PASSED);
+        _enactMotion(_motionId, _evmScriptCallData, evmScriptExecutor);
+    }
 
-        address creator = motion.creator;
-        bytes32 evmScriptHash = motion.evmScriptHash;
+    /// @notice Enacts motion with given id executing the passed EVMScript without its recreation by
+    /// the EVMScript factory. Allowed only for motions created by factories with allowed fast enactment
+    /// @param _motionId Id of motion to enact
+    /// @param _evmScript EVMScript of the motion, same as emitted in the MotionCreated event.
+    /// Transaction reverts if the EVMScript differs
+    function enactMotionWithEVMScript(uint256 _motionId, bytes memory _evmScript)
+        external
+        whenNotPaused
+    {
+        MotionStorage storage motion = _getMotion(_motionId);
+        require(
+            uint256(motion.startDate) + motion.duration <= block.timestamp,
+            ERROR_MOTION_NOT_PASSED
+        );
+        require(motion.evmScriptHash == keccak256(_evmScript), ERROR_UNEXPECTED_EVM_SCRIPT);
         address evmScriptFactory = motion.evmScriptFactory;
 
         _deleteMotion(_motionId);
         emit MotionEnacted(_motionId);
 
-        bytes memory evmScript = _createEVMScript(evmScriptFactory, creator, _evmScriptCallData);
-        require(evmScriptHash == keccak256(evmScript), ERROR_UNEXPECTED_EVM_SCRIPT);
+        _validateFastEnactment(evmScriptFactory, _evmScript);
+        evmScriptExecutor.executeEVMScript(_evmScript);
+    }
 
-        evmScriptExecutor.executeEVMScript(evmScript);
+    /// @notice Enacts motions with given ids in one transaction
+    /// @param _motionIds Ids of motions to enact
+    /// @param _evmScriptsCallData Encoded call data of EVMScript factories. Item at index i must be the same
+    /// as passed on the creation of the motion with id _motionIds[i]
+    /// @dev Enactment of the batch is atomic: if any of the motions can't be enacted the transaction reverts
+    /// with the error of that motion (MOTION_NOT_FOUND, MOTION_NOT_PASSED, UNEXPECTED_EVM_SCRIPT or the error
+    /// of the EVMScript execution) and none of the motions are enacted
+    function enactMotions(uint256[] calldata _motionIds, bytes[] calldata _evmScriptsCallData)
+        external
+        whenNotPaused
+    {
+        require(_motionIds.length == _evmScriptsCallData.length, ERROR_LENGTH_MISMATCH);
+        IEVMScriptExecutor executor = evmScriptExecutor;
+        for (uint256 i = 0; i < _motionIds.length; ++i) {
+            _enactMotion(_motionIds[i], _evmScriptsCallData[i], executor);
+        }
     }
 
     /// @notice Submits an objection from `governanceToken` holder.
     /// @param _motionId Id of motion to object
     function objectToMotion(uint256 _motionId) external {
-        Motion storage motion = _getMotion(_motionId);
+        MotionStorage storage motion = _getMotion(_motionId);
         require(!objections[_motionId][msg.sender], ERROR_ALREADY_OBJECTED);
         objections[_motionId][msg.sender] = true;
 
@@ -197,7 +263,11 @@ contract EasyTrack is Pausable, AccessControl, MotionSettings, EVMScriptFactorie
         uint256 objectorBalance = governanceToken.balanceOfAt(msg.sender, snapshotBlock);
         require(objectorBalance > 0, ERROR_NOT_ENOUGH_BALANCE);
 
-        uint256 totalSupply = governanceToken.totalSupplyAt(snapshotBlock);
+        uint256 totalSupply = motion.snapshotTotalSupply;
+        if (totalSupply == 0) {
+            totalSupply = governanceToken.totalSupplyAt(snapshotBlock);
+            motion.snapshotTotalSupply = uint128(totalSupply);
+        }
         uint256 newObjectionsAmount = motion.objectionsAmount + objectorBalance;
         uint256 newObjectionsAmountPct = (HUNDRED_PERCENT * newObjectionsAmount) / totalSupply;
 
@@ -210,7 +280,7 @@ contract EasyTrack is Pausable, AccessControl, MotionSettings, EVMScriptFactorie
         );
 
         if (newObjectionsAmountPct < motion.objectionsThreshold) {
-            motion.objectionsAmount = newObjectionsAmount;
+            motion.objectionsAmount = uint128(newObjectionsAmount);
         } else {
             _deleteMotion(_motionId);
             emit MotionRejected(_motionId);
@@ -221,7 +291,7 @@ contract EasyTrack is Pausable, AccessControl, MotionSettings, EVMScriptFactorie
     /// @param _motionId Id of motion to cancel
     /// @dev Method reverts if it is called with not existed _motionId
     function cancelMotion(uint256 _motionId) external {
-        Motion storage motion = _getMotion(_motionId);
+        MotionStorage storage motion = _getMotion(_motionId);
         require(motion.creator == msg.sender, ERROR_NOT_CREATOR);
         _deleteMotion(_motionId);
         emit MotionCanceled(_motionId);
@@ -240,13 +310,24 @@ contract EasyTrack is Pausable, AccessControl, MotionSettings, EVMScriptFactorie
 
     /// @notice Cancels all active motions
     function cancelAllMotions() external onlyRole(CANCEL_ROLE) {
-        uint256 motionsCount = motions.length;
-        while (motionsCount > 0) {
-            motionsCount -= 1;
-            uint256 motionId = motions[motionsCount].id;
-            _deleteMotion(motionId);
-            emit MotionCanceled(motionId);
-        }
+        _cancelLastMotions(motionsStorage.length);
+    }
+
+    /// @notice Cancels at most _maxMotionsCount active motions, starting from the end of the list of active motions.
+    /// Repeated calls continue canceling from where the previous call stopped until no active motions left
+    /// @dev Allows to cancel all motions in several transactions when cancelAllMotions() exceeds the block gas limit
+    /// @param _maxMotionsCount Max number of motions to cancel in the call
+    /// @return _activeMotionsCount Number of active motions left after the call
+    function cancelAllMotionsBounded(uint256 _maxMotionsCount)
+        external
+        onlyRole(CANCEL_ROLE)
+        returns (uint256 _activeMotionsCount)
+    {
+        _activeMotionsCount = motionsStorage.length;
+        uint256 motionsToCancelCount =
+            _maxMotionsCount < _activeMotionsCount ? _maxMotionsCount : _activeMotionsCount;
+        _cancelLastMotions(motionsToCancelCount);
+        _activeMotionsCount -= motionsToCancelCount;
     }
 
     /// @notice Sets new EVMScriptExecutor
@@ -259,6 +340,17 @@ contract EasyTrack is Pausable, AccessControl, MotionSettings, EVMScriptFactorie
         emit EVMScriptExecutorChanged(_evmScriptExecutor);
     }
 
+    /// @notice Sets whether MotionCreated event is emitted without EVMScript of the motion
+    /// @param _compactMotionCreatedEvent If true, MotionCreated is emitted with empty _evmScript
+    /// followed by MotionEVMScriptHashed event with the hash of the EVMScript
+    function setCompactMotionCreatedEvent(bool _compactMotionCreatedEvent)
+        external
+        onlyRole(DEFAULT_ADMIN_ROLE)
+    {
+        compactMotionCreatedEvent = _compactMotionCreatedEvent;
+        emit CompactMotionCreatedEventChanged(_compactMotionCreatedEvent);
+    }
+
     /// @notice Pauses Easy Track if it isn't paused.
     /// Paused Easy Track can't create and enact motions
     function pause() external whenNotPaused onlyRole(PAUSE_ROLE) {
@@ -274,20 +366,56 @@ contract EasyTrack is Pausable, AccessControl, MotionSettings, EVMScriptFactorie
     /// @param _motionId Id of motion to check opportunity to object
     /// @param _objector Address of objector
     function canObjectToMotion(uint256 _motionId, address _objector) external view returns (bool) {
-        Motion storage motion = _getMotion(_motionId);
+        MotionStorage storage motion = _getMotion(_motionId);
         uint256 balance = governanceToken.balanceOfAt(_objector, motion.snapshotBlock);
         return balance > 0 && !objections[_motionId][_objector];
     }
 
     /// @notice Returns list of active motions
-    function getMotions() external view returns (Motion[] memory) {
-        return motions;
+    function getMotions() external view returns (Motion[] memory _motions) {
+        uint256 motionsCount = motionsStorage.length;
+        _motions = new Motion[](motionsCount);
+        for (uint256 i = 0; i < motionsCount; ++i) {
+            _motions[i] = _unpackMotion(motionsStorage[i]);
+        }
     }
 
     /// @notice Returns motion with the given id
     /// @param _motionId Id of motion to retrieve
     function getMotion(uint256 _motionId) external view returns (Motion memory) {
-        return _getMotion(_motionId);
+        return _unpackMotion(_getMotion(_motionId));
+    }
+
+    /// @notice Returns active motion stored at the given index of the list of active motions
+    /// @dev Keeps the ABI of the getter of the public motions array from previous versions
+    /// @param _index Index of motion in the list of active motions
+    function motions(uint256 _index)
+        external
+        view
+        returns (
+            uint256,
+            address,
+            address,
+            uint256,
+            uint256,
+            uint256,
+            uint256,
+            uint256,
+            bytes32
+        )
+    {
+        MotionStorage storage motion = motionsStorage[_index];
+        return (
+            motion.id,
+            motion.evmScriptFactory,
+            motion.creator,
+            motion.duration,
+            motion.startDate,
+            motion.snapshotBlock,
+            motion.objectionsThreshold,
+            motion.objectionsAmount,
+            motion.evmScriptHash
+        );
     }
 
     // -------
@@ -299,22 +427,76 @@ contract EasyTrack is Pausable, AccessControl, MotionSettings, EVMScriptFactorie
     // the array, and then remove the last element (sometimes called as 'swap and pop').
     function _deleteMotion(uint256 _motionId) private {
         uint256 index = motionIndicesByMotionId[_motionId] - 1;
-        uint256 lastIndex = motions.length - 1;
+        uint256 lastIndex = motionsStorage.length - 1;
 
         if (index != lastIndex) {
-            Motion storage lastMotion = motions[lastIndex];
-            motions[index] = lastMotion;
+            MotionStorage storage lastMotion = motionsStorage[lastIndex];
+            motionsStorage[index] = lastMotion;
             motionIndicesByMotionId[lastMotion.id] = index + 1;
         }
 
-        motions.pop();
+        motionsStorage.pop();
         delete motionIndicesByMotionId[_motionId];
     }
 
+    // Cancels given number of motions from the end of the list of active motions.
+    // Deletion of the last motion doesn't move other motions, so the list stays in order for the next call
+    function _cancelLastMotions(uint256 _motionsCount) private {
+        uint256 motionsCount = motionsStorage.length;
+        uint256 motionsLeftCount = motionsCount - _motionsCount;
+        while (motionsCount > motionsLeftCount) {
+            motionsCount -= 1;
+            uint256 motionId = motionsStorage[motionsCount].id;
+            _deleteMotion(motionId);
+            emit MotionCanceled(motionId);
+        }
+    }
+
+    // Enacts passed motion with given id using the given EVMScriptExecutor
+    function _enactMotion(
+        uint256 _motionId,
+        bytes memory _evmScriptCallData,
+        IEVMScriptExecutor _evmScriptExecutor
+    ) private {
+        MotionStorage storage motion = _getMotion(_motionId);
+        require(
+            uint256(motion.startDate) + motion.duration <= block.timestamp,
+            ERROR_MOTION_NOT_PASSED
+        );
+
+        address creator = motion.creator;
+        bytes32 evmScriptHash = motion.evmScriptHash;
+        address evmScriptFactory = motion.evmScriptFactory;
+
+        _deleteMotion(_motionId);
+        emit MotionEnacted(_motionId);
+
+        bytes memory evmScript = _createEVMScript(evmScriptFactory, creator, _evmScriptCallData);
+        require(evmScriptHash == keccak256(evmScript), ERROR_UNEXPECTED_EVM_SCRIPT);
+
+        _evmScriptExecutor.executeEVMScript(evmScript);
+    }
+
     // Returns motion with given id if it exists
-    function _getMotion(uint256 _motionId) private view returns (Motion storage) {
+    function _getMotion(uint256 _motionId) private view returns (MotionStorage storage) {
         uint256 _motionIndex = motionIndicesByMotionId[_motionId];
         require(_motionIndex > 0, ERROR_MOTION_NOT_FOUND);
-        return motions[_motionIndex - 1];
+        return motionsStorage[_motionIndex - 1];
+    }
+
+    // Converts packed motion from the storage into the Motion struct returned by view methods
+    function _unpackMotion(MotionStorage storage _motion) private view returns (Motion memory) {
+        return
+            Motion({
+                id: _motion.id,
+                evmScriptFactory: _motion.evmScriptFactory,
+                creator: _motion.creator,
+                duration: _motion.duration,
+                startDate: _motion.startDate,
+                snapshotBlock: _motion.snapshotBlock,
+                objectionsThreshold: _motion.objectionsThreshold,
+                objectionsAmount: _motion.objectionsAmount,
+                evmScriptHash: _motion.evmScriptHash
+            });
     }
 }
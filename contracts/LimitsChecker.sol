@@ -4,6 +4,7 @@
 pragma solidity ^0.8.4;
 
 import "./libraries/EVMScriptCreator.sol";
+import "./libraries/DateTimeArithmetic.sol";
 import "./interfaces/IBokkyPooBahsDateTimeContract.sol";
 
 import "OpenZeppelin/openzeppelin-contracts@4.3.2/contracts/access/AccessControl.sol";
@@ -29,6 +30,9 @@ import "OpenZeppelin/openzeppelin-contracts@4.3.2/contracts/access/AccessControl
 /// If periodDurationMonths = 1, then shift of currentPeriodEndTimestamp occurs once a month
 /// and currentPeriodEndTimestamp can take values 1 Feb, 1 Mar, 1 Apr, etc
 ///
+/// When useDateTimeArithmetic is enabled with setDateTimeArithmeticMode(), period boundaries are
+/// calculated in-contract with DateTimeArithmetic instead of the calls to BokkyPooBahsDateTimeContract.
+///
 contract LimitsChecker is AccessControl {
     // -------------
     // EVENTS
@@ -42,6 +46,7 @@ contract LimitsChecker is AccessControl {
     );
     event CurrentPeriodAdvanced(uint256 indexed _periodStartTimestamp);
     event BokkyPooBahsDateTimeContractChanged(address indexed _newAddress);
+    event DateTimeArithmeticModeChanged(bool _useDateTimeArithmetic);
     event SpentAmountChanged(uint256 _newSpentAmount);
 
     // -------------
@@ -52,6 +57,7 @@ contract LimitsChecker is AccessControl {
     string private constant ERROR_TOO_LARGE_LIMIT = "TOO_LARGE_LIMIT";
     string private constant ERROR_SAME_DATE_TIME_CONTRACT_ADDRESS =
         "SAME_DATE_TIME_CONTRACT_ADDRESS";
+    string private constant ERROR_SAME_DATE_TIME_ARITHMETIC_MODE = "SAME_DATE_TIME_ARITHMETIC_MODE";
     string private constant ERROR_SPENT_AMOUNT_EXCEEDS_LIMIT = "ERROR_SPENT_AMOUNT_EXCEEDS_LIMIT";
 
     // -------------
@@ -71,6 +77,10 @@ contract LimitsChecker is AccessControl {
     /// @notice Address of BokkyPooBahsDateTimeContract
     IBokkyPooBahsDateTimeContract public bokkyPooBahsDateTimeContract;
 
+    /// @notice If dates are calculated in-contract with DateTimeArithmetic library instead of
+    ///     the calls to bokkyPooBahsDateTimeContract. Shares the storage slot with its address
+    bool public useDateTimeArithmetic;
+
     /// @notice Length of period in months
     uint64 internal periodDurationMonths;
 
@@ -96,13 +106,11 @@ contract LimitsChecker is AccessControl {
         address[] memory _updateSpentAmountRoleHolders,
         IBokkyPooBahsDateTimeContract _bokkyPooBahsDateTimeContract
     ) {
-        for (uint256 i = 0; i < _setParametersRoleHolders.length; i++) {
-            _setupRole(SET_PARAMETERS_ROLE, _setParametersRoleHolders[i]);
-        }
-        for (uint256 i = 0; i < _updateSpentAmountRoleHolders.length; i++) {
-            _setupRole(UPDATE_SPENT_AMOUNT_ROLE, _updateSpentAmountRoleHolders[i]);
-        }
-        bokkyPooBahsDateTimeContract = _bokkyPooBahsDateTimeContract;
+        _initializeLimitsChecker(
+            _setParametersRoleHolders,
+            _updateSpentAmountRoleHolders,
+            _bokkyPooBahsDateTimeContract
+        );
     }
 
     // -------------
@@ -120,11 +128,7 @@ contract LimitsChecker is AccessControl {
         view
         returns (bool)
     {
-        if (block.timestamp + _motionDuration >= currentPeriodEndTimestamp) {
-            return _payoutAmount <= limit;
-        } else {
-            return _payoutAmount <= _spendableBalance(limit, spentAmount);
-        }
+        return _payoutAmount <= _getMaxPayoutAmount(limit, spentAmount, _motionDuration);
     }
 
     /// @notice Checks if _payoutAmount may be spent and increases spentAmount by _payoutAmount.
@@ -225,6 +229,37 @@ contract LimitsChecker is AccessControl {
         return _getCurrentPeriodState(limit, spentAmount, currentPeriodEndTimestamp);
     }
 
+    /// @notice Returns forecast of the spendable balance in one call
+    /// @notice Unlike spendableBalance() and getPeriodState(), takes into account that the period
+    /// @notice may be advanced already but not shifted yet by updateSpentAmount or setLimitParameters.
+    /// @param _motionDuration Motion duration - minimal time required to pass before enacting of motion
+    /// @return _spendableBalanceNow - balance which can be spent if the payout is made now
+    /// @return _periodEndTimestamp - end date of the period the block timestamp belongs to
+    /// @return _spendableBalanceInNextPeriod - balance which can be spent after the period end
+    /// @return _maxPayoutAmount - max amount passing isUnderSpendableBalance with _motionDuration
+    function getSpendableBalanceForecast(uint256 _motionDuration)
+        external
+        view
+        returns (
+            uint256 _spendableBalanceNow,
+            uint256 _periodEndTimestamp,
+            uint256 _spendableBalanceInNextPeriod,
+            uint256 _maxPayoutAmount
+        )
+    {
+        uint256 limitLocal = limit;
+        uint256 spentAmountLocal = spentAmount;
+
+        _periodEndTimestamp = currentPeriodEndTimestamp;
+        _spendableBalanceNow = _spendableBalance(limitLocal, spentAmountLocal);
+        if (block.timestamp >= _periodEndTimestamp && periodDurationMonths != 0) {
+            _periodEndTimestamp = _getPeriodEndFromTimestamp(block.timestamp);
+            _spendableBalanceNow = limitLocal;
+        }
+        _spendableBalanceInNextPeriod = limitLocal;
+        _maxPayoutAmount = _getMaxPayoutAmount(limitLocal, spentAmountLocal, _motionDuration);
+    }
+
     /// @notice Sets address of BokkyPooBahsDateTime contract
     /// @dev Need this to be able to replace the contract in case of a bug in it
     /// @param _bokkyPooBahsDateTimeContract New address of the BokkyPooBahsDateTime library
@@ -241,6 +276,23 @@ contract LimitsChecker is AccessControl {
         emit BokkyPooBahsDateTimeContractChanged(_bokkyPooBahsDateTimeContract);
     }
 
+    /// @notice Switches between the in-contract calculation of dates with DateTimeArithmetic
+    ///     library and the calls to bokkyPooBahsDateTimeContract
+    /// @dev Both modes give the same period boundaries, the in-contract one makes no external calls
+    /// @param _useDateTimeArithmetic True to calculate dates in-contract
+    function setDateTimeArithmeticMode(bool _useDateTimeArithmetic)
+        external
+        onlyRole(SET_PARAMETERS_ROLE)
+    {
+        require(
+            _useDateTimeArithmetic != useDateTimeArithmetic,
+            ERROR_SAME_DATE_TIME_ARITHMETIC_MODE
+        );
+
+        useDateTimeArithmetic = _useDateTimeArithmetic;
+        emit DateTimeArithmeticModeChanged(_useDateTimeArithmetic);
+    }
+
     /// @notice Allows setting the amount of spent tokens in the current period manually
     /// @param _newSpentAmount New value for the amount of spent tokens in the current period
     function unsafeSetSpentAmount(uint256 _newSpentAmount) external onlyRole(SET_PARAMETERS_ROLE) {
@@ -255,6 +307,20 @@ contract LimitsChecker is AccessControl {
     // ------------------
     // PRIVATE METHODS
     // ------------------
+    function _initializeLimitsChecker(
+        address[] memory _setParametersRoleHolders,
+        address[] memory _updateSpentAmountRoleHolders,
+        IBokkyPooBahsDateTimeContract _bokkyPooBahsDateTimeContract
+    ) internal {
+        for (uint256 i = 0; i < _setParametersRoleHolders.length; i++) {
+            _setupRole(SET_PARAMETERS_ROLE, _setParametersRoleHolders[i]);
+        }
+        for (uint256 i = 0; i < _updateSpentAmountRoleHolders.length; i++) {
+            _setupRole(UPDATE_SPENT_AMOUNT_ROLE, _updateSpentAmountRoleHolders[i]);
+        }
+        bokkyPooBahsDateTimeContract = _bokkyPooBahsDateTimeContract;
+    }
+
     function _getCurrentPeriodState(
         uint256 _limit,
         uint256 _spentAmount,
@@ -285,6 +351,18 @@ contract LimitsChecker is AccessControl {
         return _spentAmount < _limit ? _limit - _spentAmount : 0;
     }
 
+    function _getMaxPayoutAmount(
+        uint256 _limit,
+        uint256 _spentAmount,
+        uint256 _motionDuration
+    ) internal view returns (uint256) {
+        /// Upfront check: the motion started in one period will probably be enacted in the next one
+        if (block.timestamp + _motionDuration >= currentPeriodEndTimestamp) {
+            return _limit;
+        }
+        return _spendableBalance(_limit, _spentAmount);
+    }
+
     function _validatePeriodDurationMonths(uint256 _periodDurationMonths) internal pure {
         require(
             _periodDurationMonths == 1 ||
@@ -298,7 +376,7 @@ contract LimitsChecker is AccessControl {
 
     function _getPeriodStartFromTimestamp(uint256 _timestamp) internal view returns (uint256) {
         // Get year and number of month of the timestamp:
-        (uint256 year, uint256 month, ) = bokkyPooBahsDateTimeContract.timestampToDate(_timestamp);
+        (uint256 year, uint256 month, ) = _timestampToDate(_timestamp);
         // We assume that the year will remain the same,
         // because the beginning of the current calendar period will necessarily be in the same year.
         uint256 periodStartYear = year;
@@ -306,12 +384,7 @@ contract LimitsChecker is AccessControl {
         uint256 periodStartMonth = _getFirstMonthInPeriodFromMonth(month, periodDurationMonths);
         // The beginning of the period always matches the calendar date of the beginning of the month.
         uint256 periodStartDay = 1;
-        return
-            bokkyPooBahsDateTimeContract.timestampFromDate(
-                periodStartYear,
-                periodStartMonth,
-                periodStartDay
-            );
+        return _timestampFromDate(periodStartYear, periodStartMonth, periodStartDay);
     }
 
     function _getFirstMonthInPeriodFromMonth(uint256 _month, uint256 _periodDurationMonths)
@@ -330,7 +403,46 @@ contract LimitsChecker is AccessControl {
     }
 
     function _getPeriodEndFromTimestamp(uint256 _timestamp) internal view returns (uint256) {
-        uint256 periodStart = _getPeriodStartFromTimestamp(_timestamp);
-        return bokkyPooBahsDateTimeContract.addMonths(periodStart, periodDurationMonths);
+        if (!useDateTimeArithmetic) {
+            uint256 periodStart = _getPeriodStartFromTimestamp(_timestamp);
+            return bokkyPooBahsDateTimeContract.addMonths(periodStart, periodDurationMonths);
+        }
+        // The period starts at midnight of the first day of the month, so the end of the period
+        // is the first day of the month following the last month of the period.
+        (uint256 year, uint256 month, ) = DateTimeArithmetic.timestampToDate(_timestamp);
+        uint256 periodEndMonth = _getFirstMonthInPeriodFromMonth(month, periodDurationMonths) +
+            periodDurationMonths;
+        return
+            DateTimeArithmetic.timestampFromDate(
+                year + (periodEndMonth - 1) / 12,
+                ((periodEndMonth - 1) % 12) + 1,
+                1
+            );
+    }
+
+    function _timestampToDate(uint256 _timestamp)
+        private
+        view
+        returns (
+            uint256,
+            uint256,
+            uint256
+        )
+    {
+        if (useDateTimeArithmetic) {
+            return DateTimeArithmetic.timestampToDate(_timestamp);
+        }
+        return bokkyPooBahsDateTimeContract.timestampToDate(_timestamp);
+    }
+
+    function _timestampFromDate(
+        uint256 _year,
+        uint256 _month,
+        uint256 _day
+    ) private view returns (uint256) {
+        if (useDateTimeArithmetic) {
+            return DateTimeArithmetic.timestampFromDate(_year, _month, _day);
+        }
+        return bokkyPooBahsDateTimeContract.timestampFromDate(_year, _month, _day);
     }
 }
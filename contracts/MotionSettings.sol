@@ -91,6 +91,8 @@ contract MotionSettings is AccessControl {
 
     function _setMotionDuration(uint256 _motionDuration) internal {
         require(_motionDuration >= MIN_MOTION_DURATION, ERROR_VALUE_TOO_SMALL);
+        // EasyTrack stores duration of motions as uint32
+        require(_motionDuration <= type(uint32).max, ERROR_VALUE_TOO_LARGE);
         motionDuration = _motionDuration;
         emit MotionDurationChanged(_motionDuration);
     }
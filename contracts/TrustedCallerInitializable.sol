@@ -0,0 +1,29 @@
+// SPDX-FileCopyrightText: 2025 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity ^0.8.4;
+
+import "OpenZeppelin/openzeppelin-contracts@4.3.2/contracts/proxy/utils/Initializable.sol";
+
+/// @notice Version of TrustedCaller for contracts used as implementations of minimal proxy
+///     (EIP-1167) clones. Trusted caller is stored in the storage of the clone.
+/// @dev Trusted caller set once on initialization and can't be changed. The implementation
+///     itself is marked as initialized on deployment and can't be initialized.
+contract TrustedCallerInitializable is Initializable {
+    string private constant ERROR_TRUSTED_CALLER_IS_ZERO_ADDRESS = "TRUSTED_CALLER_IS_ZERO_ADDRESS";
+    string private constant ERROR_CALLER_IS_FORBIDDEN = "CALLER_IS_FORBIDDEN";
+
+    address public trustedCaller;
+
+    constructor() initializer {}
+
+    modifier onlyTrustedCaller(address _caller) {
+        require(_caller == trustedCaller, ERROR_CALLER_IS_FORBIDDEN);
+        _;
+    }
+
+    function _initializeTrustedCaller(address _trustedCaller) internal {
+        require(_trustedCaller != address(0), ERROR_TRUSTED_CALLER_IS_ZERO_ADDRESS);
+        trustedCaller = _trustedCaller;
+    }
+}
@@ -0,0 +1,80 @@
+// SPDX-FileCopyrightText: 2025 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity ^0.8.4;
+
+import "../AllowedRecipientsRegistry.sol";
+import "./EVMScriptCreator.sol";
+
+/// @notice Validation and creation of EVMScripts adding and removing allowed recipients, shared by
+///     AddAllowedRecipient, RemoveAllowedRecipient and their Initializable versions
+library AllowedRecipientsListUtils {
+    // -------------
+    // ERRORS
+    // -------------
+
+    string private constant ERROR_RECIPIENT_ADDRESS_IS_ZERO_ADDRESS =
+        "RECIPIENT_ADDRESS_IS_ZERO_ADDRESS";
+    string private constant ERROR_ALLOWED_RECIPIENT_ALREADY_ADDED =
+        "ALLOWED_RECIPIENT_ALREADY_ADDED";
+    string private constant ERROR_ALLOWED_RECIPIENT_NOT_FOUND = "ALLOWED_RECIPIENT_NOT_FOUND";
+
+    /// @notice Validates call data and creates EVMScript to add new allowed recipient address
+    /// @param _evmScriptCallData Encoded tuple: (address recipientAddress, string memory title)
+    function createAddRecipientEVMScript(
+        AllowedRecipientsRegistry _allowedRecipientsRegistry,
+        bytes memory _evmScriptCallData
+    ) internal view returns (bytes memory) {
+        (address recipientAddress, ) = decodeAddRecipientEVMScriptCallData(_evmScriptCallData);
+        require(recipientAddress != address(0), ERROR_RECIPIENT_ADDRESS_IS_ZERO_ADDRESS);
+        require(
+            !_allowedRecipientsRegistry.isRecipientAllowed(recipientAddress),
+            ERROR_ALLOWED_RECIPIENT_ALREADY_ADDED
+        );
+
+        return
+            EVMScriptCreator.createEVMScript(
+                address(_allowedRecipientsRegistry),
+                _allowedRecipientsRegistry.addRecipient.selector,
+                _evmScriptCallData
+            );
+    }
+
+    /// @notice Validates call data and creates EVMScript to remove allowed recipient address
+    /// @param _evmScriptCallData Encoded tuple: (address recipientAddress)
+    function createRemoveRecipientEVMScript(
+        AllowedRecipientsRegistry _allowedRecipientsRegistry,
+        bytes memory _evmScriptCallData
+    ) internal view returns (bytes memory) {
+        require(
+            _allowedRecipientsRegistry.isRecipientAllowed(
+                decodeRemoveRecipientEVMScriptCallData(_evmScriptCallData)
+            ),
+            ERROR_ALLOWED_RECIPIENT_NOT_FOUND
+        );
+        return
+            EVMScriptCreator.createEVMScript(
+                address(_allowedRecipientsRegistry),
+                _allowedRecipientsRegistry.removeRecipient.selector,
+                _evmScriptCallData
+            );
+    }
+
+    /// @notice Decodes call data used to add allowed recipient
+    function decodeAddRecipientEVMScriptCallData(bytes memory _evmScriptCallData)
+        internal
+        pure
+        returns (address, string memory)
+    {
+        return abi.decode(_evmScriptCallData, (address, string));
+    }
+
+    /// @notice Decodes call data used to remove allowed recipient
+    function decodeRemoveRecipientEVMScriptCallData(bytes memory _evmScriptCallData)
+        internal
+        pure
+        returns (address)
+    {
+        return abi.decode(_evmScriptCallData, (address));
+    }
+}
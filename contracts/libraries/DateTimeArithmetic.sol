@@ -0,0 +1,91 @@
+// SPDX-FileCopyrightText: 2025 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity ^0.8.4;
+
+/// @notice Date conversions of BokkyPooBahsDateTimeLibrary reimplemented as internal
+/// functions, so the dates are calculated without external calls.
+/// @dev Arithmetic is the same as in BokkyPooBahsDateTimeLibrary v1.00
+/// (https://github.com/bokkypoobah/BokkyPooBahsDateTimeLibrary), dates are in UTC
+library DateTimeArithmetic {
+    uint256 internal constant SECONDS_PER_DAY = 24 * 60 * 60;
+    int256 private constant OFFSET19700101 = 2440588;
+
+    // -------------
+    // ERRORS
+    // -------------
+    string private constant ERROR_YEAR_BEFORE_1970 = "YEAR_BEFORE_1970";
+
+    /// @notice Same as BokkyPooBahsDateTimeContract.timestampToDate
+    function timestampToDate(uint256 _timestamp)
+        internal
+        pure
+        returns (
+            uint256 _year,
+            uint256 _month,
+            uint256 _day
+        )
+    {
+        return _daysToDate(_timestamp / SECONDS_PER_DAY);
+    }
+
+    /// @notice Same as BokkyPooBahsDateTimeContract.timestampFromDate
+    function timestampFromDate(
+        uint256 _year,
+        uint256 _month,
+        uint256 _day
+    ) internal pure returns (uint256) {
+        return _daysFromDate(_year, _month, _day) * SECONDS_PER_DAY;
+    }
+
+    /// @dev Converts the number of days since 1970/01/01 to the date. Values are positive
+    /// for every day after 1970/01/01, so the signed division rounds the same as the library.
+    function _daysToDate(uint256 _days)
+        private
+        pure
+        returns (
+            uint256 _year,
+            uint256 _month,
+            uint256 _day
+        )
+    {
+        int256 l = int256(_days) + 68569 + OFFSET19700101;
+        int256 n = (4 * l) / 146097;
+        l = l - (146097 * n + 3) / 4;
+        int256 year = (4000 * (l + 1)) / 1461001;
+        l = l - (1461 * year) / 4 + 31;
+        int256 month = (80 * l) / 2447;
+        int256 day = l - (2447 * month) / 80;
+        l = month / 11;
+        month = month + 2 - 12 * l;
+        year = 100 * (n - 49) + year + l;
+
+        _year = uint256(year);
+        _month = uint256(month);
+        _day = uint256(day);
+    }
+
+    /// @dev Converts the date to the number of days since 1970/01/01.
+    /// (month - 14) / 12 rounds towards zero: -1 for January and February, 0 otherwise
+    function _daysFromDate(
+        uint256 _year,
+        uint256 _month,
+        uint256 _day
+    ) private pure returns (uint256) {
+        require(_year >= 1970, ERROR_YEAR_BEFORE_1970);
+        int256 year = int256(_year);
+        int256 month = int256(_month);
+        int256 monthShift = (month - 14) / 12;
+
+        int256 days_ = int256(_day) -
+            32075 +
+            (1461 * (year + 4800 + monthShift)) /
+            4 +
+            (367 * (month - 2 - monthShift * 12)) /
+            12 -
+            (3 * ((year + 4900 + monthShift) / 100)) /
+            4 -
+            OFFSET19700101;
+        return uint256(days_);
+    }
+}
@@ -10,6 +10,13 @@ library EVMScriptCreator {
     // Id of default CallsScript Aragon's executor.
     bytes4 private constant SPEC_ID = hex"00000001";
 
+    // Length of the SPEC_ID in bytes
+    uint256 private constant SPEC_ID_LENGTH = 4;
+
+    // Length of the call header in bytes: address (20 bytes), length of
+    // call data with method id (4 bytes) and method id (4 bytes)
+    uint256 private constant CALL_HEADER_LENGTH = 28;
+
     /// @notice Encodes one method call as EVMScript
     function createEVMScript(
         address _to,
@@ -32,18 +39,12 @@ library EVMScriptCreator {
         bytes4 _methodId,
         bytes[] memory _evmScriptCallData
     ) internal pure returns (bytes memory _evmScript) {
+        _evmScript = _allocateEVMScript(_evmScriptCallData);
+
+        uint256 offset = SPEC_ID_LENGTH;
         for (uint256 i = 0; i < _evmScriptCallData.length; ++i) {
-            _evmScript = bytes.concat(
-                _evmScript,
-                abi.encodePacked(
-                    _to,
-                    uint32(_evmScriptCallData[i].length) + 4,
-                    _methodId,
-                    _evmScriptCallData[i]
-                )
-            );
+            offset = _writeCall(_evmScript, offset, _to, _methodId, _evmScriptCallData[i]);
         }
-        _evmScript = bytes.concat(SPEC_ID, _evmScript);
     }
 
     /// @notice Encodes multiple calls to different methods within the same contract as EVMScript
@@ -54,18 +55,12 @@ library EVMScriptCreator {
     ) internal pure returns (bytes memory _evmScript) {
         require(_methodIds.length == _evmScriptCallData.length, "LENGTH_MISMATCH");
 
+        _evmScript = _allocateEVMScript(_evmScriptCallData);
+
+        uint256 offset = SPEC_ID_LENGTH;
         for (uint256 i = 0; i < _methodIds.length; ++i) {
-            _evmScript = bytes.concat(
-                _evmScript,
-                abi.encodePacked(
-                    _to,
-                    uint32(_evmScriptCallData[i].length) + 4,
-                    _methodIds[i],
-                    _evmScriptCallData[i]
-                )
-            );
+            offset = _writeCall(_evmScript, offset, _to, _methodIds[i], _evmScriptCallData[i]);
         }
-        _evmScript = bytes.concat(SPEC_ID, _evmScript);
     }
 
     /// @notice Encodes multiple calls to different contracts as EVMScript
@@ -77,17 +72,63 @@ library EVMScriptCreator {
         require(_to.length == _methodIds.length, "LENGTH_MISMATCH");
         require(_to.length == _evmScriptCallData.length, "LENGTH_MISMATCH");
 
+        _evmScript = _allocateEVMScript(_evmScriptCallData);
+
+        uint256 offset = SPEC_ID_LENGTH;
         for (uint256 i = 0; i < _to.length; ++i) {
-            _evmScript = bytes.concat(
-                _evmScript,
-                abi.encodePacked(
-                    _to[i],
-                    uint32(_evmScriptCallData[i].length) + 4,
-                    _methodIds[i],
-                    _evmScriptCallData[i]
-                )
-            );
+            offset = _writeCall(_evmScript, offset, _to[i], _methodIds[i], _evmScriptCallData[i]);
+        }
+    }
+
+    // Allocates EVMScript of the final length for the calls with given call data and writes SPEC_ID into it.
+    // Building the EVMScript in one allocation keeps the memory expansion cost linear in the number of calls
+    function _allocateEVMScript(bytes[] memory _evmScriptCallData)
+        private
+        pure
+        returns (bytes memory _evmScript)
+    {
+        uint256 evmScriptLength = SPEC_ID_LENGTH + CALL_HEADER_LENGTH * _evmScriptCallData.length;
+        for (uint256 i = 0; i < _evmScriptCallData.length; ++i) {
+            evmScriptLength += _evmScriptCallData[i].length;
+        }
+        _evmScript = new bytes(evmScriptLength);
+
+        bytes4 specId = SPEC_ID;
+        assembly {
+            mstore(add(_evmScript, 0x20), specId)
+        }
+    }
+
+    // Writes the call into EVMScript at the given offset and returns the offset of the next call.
+    // Words are written in increasing order of addresses, so bytes written beyond the end of the call
+    // are overwritten by the next call. Bytes written beyond the end of the last call lie outside
+    // of the EVMScript length and are never read
+    function _writeCall(
+        bytes memory _evmScript,
+        uint256 _offset,
+        address _to,
+        bytes4 _methodId,
+        bytes memory _evmScriptCallData
+    ) private pure returns (uint256) {
+        uint256 callDataLength = _evmScriptCallData.length;
+
+        assembly {
+            let ptr := add(add(_evmScript, 0x20), _offset)
+            mstore(ptr, shl(96, _to))
+            mstore(add(ptr, 20), shl(224, add(callDataLength, 4)))
+            mstore(add(ptr, 24), and(_methodId, shl(224, 0xffffffff)))
+
+            // skip the call header, 28 bytes
+            ptr := add(ptr, 28)
+            let src := add(_evmScriptCallData, 0x20)
+            for {
+                let i := 0
+            } lt(i, callDataLength) {
+                i := add(i, 0x20)
+            } {
+                mstore(add(ptr, i), mload(add(src, i)))
+            }
         }
-        _evmScript = bytes.concat(SPEC_ID, _evmScript);
+        return _offset + CALL_HEADER_LENGTH + callDataLength;
     }
 }
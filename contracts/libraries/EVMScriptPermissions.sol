@@ -57,6 +57,48 @@ library EVMScriptPermissions {
         return true;
     }
 
+    /// @notice Validates that passed EVMScript calls only methods contained in the set of permissions.
+    /// @dev Unlike the version accepting packed permissions, checks every call with a single
+    /// storage read instead of the scan of all permissions. Returns false if EVMScript is empty
+    function canExecuteEVMScript(
+        mapping(bytes24 => bool) storage _permissionsSet,
+        bytes memory _evmScript
+    ) internal view returns (bool) {
+        uint256 location = SPEC_ID_SIZE; // first 4 bytes reserved for SPEC_ID
+        if (_evmScript.length <= location) {
+            return false;
+        }
+
+        while (location < _evmScript.length) {
+            (bytes24 methodToCall, uint32 callDataLength) = _getNextMethodId(_evmScript, location);
+            if (!_permissionsSet[methodToCall]) {
+                return false;
+            }
+            location += ADDRESS_SIZE + CALLDATA_LENGTH_SIZE + callDataLength;
+        }
+        return true;
+    }
+
+    /// @notice Adds each permission listed in packed _permissions to the set of permissions
+    function addToPermissionsSet(
+        bytes memory _permissions,
+        mapping(bytes24 => bool) storage _permissionsSet
+    ) internal {
+        for (uint256 location = 0; location < _permissions.length; location += PERMISSION_SIZE) {
+            _permissionsSet[_permissions.bytes24At(location)] = true;
+        }
+    }
+
+    /// @notice Removes each permission listed in packed _permissions from the set of permissions
+    function removeFromPermissionsSet(
+        bytes memory _permissions,
+        mapping(bytes24 => bool) storage _permissionsSet
+    ) internal {
+        for (uint256 location = 0; location < _permissions.length; location += PERMISSION_SIZE) {
+            delete _permissionsSet[_permissions.bytes24At(location)];
+        }
+    }
+
     /// @notice Validates that bytes with permissions not empty and has correct length
     function isValidPermissions(bytes memory _permissions) internal pure returns (bool) {
         return _permissions.length > 0 && _permissions.length % PERMISSION_SIZE == 0;
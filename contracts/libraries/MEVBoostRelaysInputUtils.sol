@@ -4,6 +4,7 @@
 pragma solidity 0.8.6;
 
 import "../interfaces/IMEVBoostRelayAllowedList.sol";
+import "./MemoryHashSet.sol";
 
 /// @author swissarmytowel
 /// @notice Utility functions for validating and decoding MEV Boost relay input data
@@ -44,6 +45,12 @@ library MEVBoostRelaysInputUtils {
 
         require(relaysCount > 0, ERROR_EMPTY_RELAYS_ARRAY);
 
+        bytes32[] memory uriHashes = _hashRelayURIs(_relays);
+        uint256 duplicateURIIndex = MemoryHashSet.findFirstDuplicate(uriHashes);
+        MemoryHashSet.HashSet memory allowedURIHashes = MemoryHashSet.fromKeys(
+            _hashRelayURIs(_currentAllowedRelays)
+        );
+
         for (uint256 i; i < relaysCount; ) {
             IMEVBoostRelayAllowedList.Relay memory relay = _relays[i];
             // Validate the Relay parameters: URI, operator, and description
@@ -60,12 +67,9 @@ library MEVBoostRelaysInputUtils {
                 ERROR_MAX_STRING_LENGTH_EXCEEDED
             );
 
-            _validateNoDuplicateInputFromIndex(i, _relays);
+            require(i != duplicateURIIndex, ERROR_DUPLICATE_RELAY_URI);
 
-            bool relayExistsInList = _isRelayURIContained(
-                bytes(_relays[i].uri),
-                _currentAllowedRelays
-            );
+            bool relayExistsInList = MemoryHashSet.contains(allowedURIHashes, uriHashes[i]);
 
             if (_expectExistence) {
                 require(relayExistsInList, ERROR_RELAY_NOT_FOUND);
@@ -90,6 +94,12 @@ library MEVBoostRelaysInputUtils {
 
         uint256 relayURIsCount = _relayURIs.length;
 
+        bytes32[] memory uriHashes = _hashURIs(_relayURIs);
+        uint256 duplicateURIIndex = MemoryHashSet.findFirstDuplicate(uriHashes);
+        MemoryHashSet.HashSet memory allowedURIHashes = MemoryHashSet.fromKeys(
+            _hashRelayURIs(_currentAllowedRelays)
+        );
+
         for (uint256 i; i < relayURIsCount; ) {
             bytes memory uri = bytes(_relayURIs[i]);
 
@@ -97,9 +107,9 @@ library MEVBoostRelaysInputUtils {
             require(uri.length > 0, ERROR_EMPTY_RELAY_URI);
             require(uri.length <= MAX_STRING_LENGTH, ERROR_MAX_STRING_LENGTH_EXCEEDED);
 
-            _validateNoDuplicateInputFromIndex(i, _relayURIs);
+            require(i != duplicateURIIndex, ERROR_DUPLICATE_RELAY_URI);
 
-            bool relayExistsInList = _isRelayURIContained(uri, _currentAllowedRelays);
+            bool relayExistsInList = MemoryHashSet.contains(allowedURIHashes, uriHashes[i]);
             // This validation is only used for removing relays, so the relay should exist in the list
             require(relayExistsInList, ERROR_RELAY_NOT_FOUND);
 
@@ -131,36 +141,16 @@ library MEVBoostRelaysInputUtils {
     // Private Helper Functions
     // ========================================================
 
-    /// @dev Asserts that a relay URI exists or not in the current relay list according to the expected condition
-    function _isRelayURIContained(
-        bytes memory _uri,
-        IMEVBoostRelayAllowedList.Relay[] memory _currentAllowedRelays
-    ) private pure returns (bool exists) {
-        uint256 currentAllowedRelaysLength = _currentAllowedRelays.length;
-        bytes32 uriHash = keccak256(_uri);
-
-        for (uint256 j; j < currentAllowedRelaysLength; ) {
-            if (keccak256(bytes(_currentAllowedRelays[j].uri)) == uriHash) {
-                exists = true;
-                break;
-            }
-
-            unchecked {
-                ++j;
-            }
-        }
-    }
-
-    /// @dev Checks for duplicate URIs in a string array of URIs
-    ///      Starts checking from the current relay index to optimize gas usage
-    function _validateNoDuplicateInputFromIndex(
-        uint256 _currentRelayIndex,
-        string[] memory _relayURIs
-    ) private pure {
-        bytes32 currentURIHash = keccak256(bytes(_relayURIs[_currentRelayIndex]));
+    /// @dev Returns keccak256 hashes of the URIs of relay structs. Input URIs are compared
+    ///      with each other and with the current relay list by the hashes in linear time
+    function _hashRelayURIs(
+        IMEVBoostRelayAllowedList.Relay[] memory _relays
+    ) private pure returns (bytes32[] memory uriHashes) {
+        uint256 relaysCount = _relays.length;
+        uriHashes = new bytes32[](relaysCount);
 
-        for (uint256 i = _currentRelayIndex + 1; i < _relayURIs.length; ) {
-            require(keccak256(bytes(_relayURIs[i])) != currentURIHash, ERROR_DUPLICATE_RELAY_URI);
+        for (uint256 i; i < relaysCount; ) {
+            uriHashes[i] = keccak256(bytes(_relays[i].uri));
 
             unchecked {
                 ++i;
@@ -168,16 +158,13 @@ library MEVBoostRelaysInputUtils {
         }
     }
 
-    /// @dev Checks for duplicate URIs in a Relay struct array
-    ///      Starts checking from the current relay index to optimize gas usage
-    function _validateNoDuplicateInputFromIndex(
-        uint256 _currentRelayIndex,
-        IMEVBoostRelayAllowedList.Relay[] memory _relays
-    ) private pure {
-        bytes32 currentURIHash = keccak256(bytes(_relays[_currentRelayIndex].uri));
+    /// @dev Returns keccak256 hashes of the URI strings
+    function _hashURIs(string[] memory _relayURIs) private pure returns (bytes32[] memory uriHashes) {
+        uint256 relayURIsCount = _relayURIs.length;
+        uriHashes = new bytes32[](relayURIsCount);
 
-        for (uint256 i = _currentRelayIndex + 1; i < _relays.length; ) {
-            require(keccak256(bytes(_relays[i].uri)) != currentURIHash, ERROR_DUPLICATE_RELAY_URI);
+        for (uint256 i; i < relayURIsCount; ) {
+            uriHashes[i] = keccak256(bytes(_relayURIs[i]));
 
             unchecked {
                 ++i;
@@ -0,0 +1,94 @@
+// SPDX-FileCopyrightText: 2025 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity ^0.8.4;
+
+/// @notice Hash set of bytes32 keys allocated in memory. Used to validate EVMScript factories
+/// input against duplicates and lists of existing items in linear time instead of nested loops.
+/// @dev Open addressing table with linear probing. The capacity is at least twice the max
+/// number of keys, so the probe sequence always reaches an empty slot. Keys are expected to be
+/// uniformly distributed (keccak256 hashes, addresses), so their low bits are used as slots.
+library MemoryHashSet {
+    struct HashSet {
+        bytes32[] keys;
+        // Position of the key passed on insertion + 1, 0 for empty slots
+        uint256[] positions;
+        uint256 mask;
+    }
+
+    /// @notice Creates empty hash set to store up to _maxSize keys
+    function create(uint256 _maxSize) internal pure returns (HashSet memory _set) {
+        uint256 capacity = 1;
+        while (capacity < 2 * _maxSize) {
+            capacity <<= 1;
+        }
+        _set.keys = new bytes32[](capacity);
+        _set.positions = new uint256[](capacity);
+        _set.mask = capacity - 1;
+    }
+
+    /// @notice Adds the key with its position in the input into the set
+    /// @return _existingPosition Position of the same key inserted before + 1,
+    ///     0 if the key wasn't in the set and was inserted
+    function insert(
+        HashSet memory _set,
+        bytes32 _key,
+        uint256 _position
+    ) internal pure returns (uint256 _existingPosition) {
+        uint256 slot = uint256(_key) & _set.mask;
+        while (_set.positions[slot] != 0) {
+            if (_set.keys[slot] == _key) {
+                return _set.positions[slot];
+            }
+            slot = (slot + 1) & _set.mask;
+        }
+        _set.keys[slot] = _key;
+        _set.positions[slot] = _position + 1;
+    }
+
+    /// @notice Returns if the key is in the set
+    function contains(HashSet memory _set, bytes32 _key) internal pure returns (bool) {
+        uint256 slot = uint256(_key) & _set.mask;
+        while (_set.positions[slot] != 0) {
+            if (_set.keys[slot] == _key) {
+                return true;
+            }
+            slot = (slot + 1) & _set.mask;
+        }
+        return false;
+    }
+
+    /// @notice Creates hash set of the passed keys
+    function fromKeys(bytes32[] memory _keys) internal pure returns (HashSet memory _set) {
+        _set = create(_keys.length);
+        for (uint256 i = 0; i < _keys.length; ++i) {
+            insert(_set, _keys[i], i);
+        }
+    }
+
+    /// @notice Returns the lowest index of the key which is repeated later in the array,
+    ///     the same index where the nested loops comparing every key with the following
+    ///     ones would find the duplicate
+    /// @return _index Index of the duplicated key or _keys.length if there are no duplicates
+    function findFirstDuplicate(bytes32[] memory _keys) internal pure returns (uint256 _index) {
+        HashSet memory set = create(_keys.length);
+        _index = _keys.length;
+        for (uint256 i = 0; i < _keys.length; ++i) {
+            uint256 existingPosition = insert(set, _keys[i], i);
+            if (existingPosition != 0 && existingPosition - 1 < _index) {
+                _index = existingPosition - 1;
+            }
+        }
+    }
+
+    /// @notice Same as findFirstDuplicate(bytes32[]) for the array of addresses
+    function findFirstDuplicate(address[] memory _addresses) internal pure returns (uint256) {
+        bytes32[] memory keys;
+        // address[] and bytes32[] have the same layout in memory: addresses are stored
+        // in 32 bytes words padded with zeros, so the array is reused without copying
+        assembly {
+            keys := _addresses
+        }
+        return findFirstDuplicate(keys);
+    }
+}
@@ -0,0 +1,91 @@
+// SPDX-FileCopyrightText: 2025 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity ^0.8.4;
+
+import "../interfaces/INodeOperatorsRegistry.sol";
+
+/// @notice Reads the static fields of NodeOperatorsRegistry.getNodeOperator() without
+/// ABI decoding of the whole result. Used by EVMScript factories validating many node operators.
+/// @dev NodeOperatorsRegistry is an Aragon app proxy: every call to it resolves the implementation
+/// via Kernel, so a single getNodeOperator() call per node operator is cheaper than separate
+/// getNodeOperatorIsActive() and getTotalSigningKeyCount() calls. The name isn't requested
+/// (_fullInfo = false) and only the head of the return data is copied into memory.
+library NodeOperatorsRegistryReader {
+    struct NodeOperatorSummary {
+        bool active;
+        address rewardAddress;
+        uint64 stakingLimit;
+        uint64 totalSigningKeys;
+    }
+
+    // Size of getNodeOperator() return data head: 7 words, the name is encoded after them
+    uint256 private constant NODE_OPERATOR_HEAD_SIZE = 224;
+
+    // Offsets of the fields in the head of getNodeOperator() return data:
+    // (bool active, string name, address rewardAddress, uint64 stakingLimit,
+    //  uint64 stoppedValidators, uint64 totalSigningKeys, uint64 usedSigningKeys)
+    // The word at offset 32 is the offset of the name and isn't read
+    uint256 private constant ACTIVE_OFFSET = 0;
+    uint256 private constant REWARD_ADDRESS_OFFSET = 64;
+    uint256 private constant STAKING_LIMIT_OFFSET = 96;
+    uint256 private constant TOTAL_SIGNING_KEYS_OFFSET = 160;
+
+    // -------------
+    // ERRORS
+    // -------------
+    string private constant ERROR_INVALID_NODE_OPERATOR_DATA = "INVALID_NODE_OPERATOR_DATA";
+
+    /// @notice Returns the data of the node operator used by EVMScript factories validation
+    /// @dev Reverts with the error of NodeOperatorsRegistry if getNodeOperator() reverts
+    function getNodeOperatorSummary(
+        INodeOperatorsRegistry _nodeOperatorsRegistry,
+        uint256 _nodeOperatorId
+    ) internal view returns (NodeOperatorSummary memory _summary) {
+        bytes4 selector = INodeOperatorsRegistry.getNodeOperator.selector;
+        bool success;
+        uint256 returnDataSize;
+        uint256 active;
+        uint256 rewardAddress;
+        uint256 stakingLimit;
+        uint256 totalSigningKeys;
+        assembly {
+            // memory after the free memory pointer is used as a scratch space: it isn't
+            // allocated, the values are read from it right after the call
+            let ptr := mload(0x40)
+            mstore(ptr, selector)
+            mstore(add(ptr, 4), _nodeOperatorId)
+            mstore(add(ptr, 36), 0)
+            success := staticcall(
+                gas(),
+                _nodeOperatorsRegistry,
+                ptr,
+                68,
+                ptr,
+                NODE_OPERATOR_HEAD_SIZE
+            )
+            returnDataSize := returndatasize()
+            if iszero(success) {
+                returndatacopy(ptr, 0, returnDataSize)
+                revert(ptr, returnDataSize)
+            }
+            active := mload(add(ptr, ACTIVE_OFFSET))
+            rewardAddress := mload(add(ptr, REWARD_ADDRESS_OFFSET))
+            stakingLimit := mload(add(ptr, STAKING_LIMIT_OFFSET))
+            totalSigningKeys := mload(add(ptr, TOTAL_SIGNING_KEYS_OFFSET))
+        }
+        require(
+            returnDataSize >= NODE_OPERATOR_HEAD_SIZE &&
+                active <= 1 &&
+                rewardAddress <= type(uint160).max &&
+                stakingLimit <= type(uint64).max &&
+                totalSigningKeys <= type(uint64).max,
+            ERROR_INVALID_NODE_OPERATOR_DATA
+        );
+
+        _summary.active = active == 1;
+        _summary.rewardAddress = address(uint160(rewardAddress));
+        _summary.stakingLimit = uint64(stakingLimit);
+        _summary.totalSigningKeys = uint64(totalSigningKeys);
+    }
+}
@@ -0,0 +1,108 @@
+// SPDX-FileCopyrightText: 2025 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity ^0.8.4;
+
+import "contracts/payouts/multi-token/interfaces/IAllowedRecipientsRegistry.sol";
+import "contracts/interfaces/IFinance.sol";
+import "contracts/libraries/EVMScriptCreator.sol";
+
+/// @notice Validation and creation of top up EVMScripts shared by TopUpAllowedRecipientsUtils
+///     and TopUpAllowedRecipientsSingleTokenUtils
+library TopUpAllowedRecipientsCommonUtils {
+    // -------------
+    // ERRORS
+    // -------------
+    string private constant ERROR_LENGTH_MISMATCH = "LENGTH_MISMATCH";
+    string private constant ERROR_EMPTY_DATA = "EMPTY_DATA";
+    string private constant ERROR_ZERO_AMOUNT = "ZERO_AMOUNT";
+    string private constant ERROR_RECIPIENT_NOT_ALLOWED = "RECIPIENT_NOT_ALLOWED";
+    string private constant ERROR_SUM_EXCEEDS_SPENDABLE_BALANCE = "SUM_EXCEEDS_SPENDABLE_BALANCE";
+
+    /// @notice Validates lengths and amounts of the top up and returns the sum of the amounts
+    function sumAmounts(address[] memory _recipients, uint256[] memory _amounts)
+        internal
+        pure
+        returns (uint256 totalAmount)
+    {
+        require(_amounts.length == _recipients.length, ERROR_LENGTH_MISMATCH);
+        require(_recipients.length > 0, ERROR_EMPTY_DATA);
+
+        for (uint256 i = 0; i < _recipients.length; ++i) {
+            require(_amounts[i] > 0, ERROR_ZERO_AMOUNT);
+            totalAmount += _amounts[i];
+        }
+    }
+
+    /// @notice Validates that recipients are allowed and the amount fits into the limit
+    ///     of the registry with two calls to it
+    function validateRecipientsAndLimit(
+        IAllowedRecipientsRegistry _allowedRecipientsRegistry,
+        address[] memory _recipients,
+        uint256 _amount,
+        uint256 _motionDuration
+    ) internal view {
+        require(
+            _areRecipientsAllowed(_allowedRecipientsRegistry, _recipients),
+            ERROR_RECIPIENT_NOT_ALLOWED
+        );
+        require(
+            _allowedRecipientsRegistry.isUnderSpendableBalance(_amount, _motionDuration),
+            ERROR_SUM_EXCEEDS_SPENDABLE_BALANCE
+        );
+    }
+
+    /// @notice Creates EVMScript to top up recipients with the payments from Finance
+    /// @dev the EVMScript has one extra call to updateSpentAmount() to enforce the limits
+    function createTopUpEVMScript(
+        IAllowedRecipientsRegistry _allowedRecipientsRegistry,
+        IFinance _finance,
+        address _token,
+        address[] memory _recipients,
+        uint256[] memory _amounts,
+        uint256 _spentAmount
+    ) internal view returns (bytes memory) {
+        address[] memory to = new address[](_recipients.length + 1);
+        bytes4[] memory methodIds = new bytes4[](_recipients.length + 1);
+        bytes[] memory evmScriptsCalldata = new bytes[](_recipients.length + 1);
+
+        to[0] = address(_allowedRecipientsRegistry);
+        methodIds[0] = _allowedRecipientsRegistry.updateSpentAmount.selector;
+        evmScriptsCalldata[0] = abi.encode(_spentAmount);
+
+        for (uint256 i = 0; i < _recipients.length; ++i) {
+            to[i + 1] = address(_finance);
+            methodIds[i + 1] = _finance.newImmediatePayment.selector;
+            evmScriptsCalldata[i + 1] = abi.encode(
+                _token,
+                _recipients[i],
+                _amounts[i],
+                "Easy Track: top up recipient"
+            );
+        }
+
+        return EVMScriptCreator.createEVMScript(to, methodIds, evmScriptsCalldata);
+    }
+
+    // ------------------
+    // PRIVATE METHODS
+    // ------------------
+
+    /// @dev Registries deployed before areRecipientsAllowed() was added don't have it,
+    ///     so recipients are checked one by one when the batched call fails
+    function _areRecipientsAllowed(
+        IAllowedRecipientsRegistry _allowedRecipientsRegistry,
+        address[] memory _recipients
+    ) private view returns (bool) {
+        try _allowedRecipientsRegistry.areRecipientsAllowed(_recipients) returns (bool allowed) {
+            return allowed;
+        } catch {
+            for (uint256 i = 0; i < _recipients.length; ++i) {
+                if (!_allowedRecipientsRegistry.isRecipientAllowed(_recipients[i])) {
+                    return false;
+                }
+            }
+            return true;
+        }
+    }
+}
@@ -0,0 +1,210 @@
+// SPDX-FileCopyrightText: 2025 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity ^0.8.4;
+
+import "contracts/EVMScriptFactories/AddAllowedRecipientInitializable.sol";
+import "contracts/EVMScriptFactories/RemoveAllowedRecipientInitializable.sol";
+import "./TopUpAllowedRecipientsInitializable.sol";
+import "contracts/AllowedRecipientsRegistry.sol";
+import "./AllowedTokensRegistry.sol";
+
+import "OpenZeppelin/openzeppelin-contracts@4.3.2/contracts/proxy/Clones.sol";
+
+/// @notice Factory for Allowed Recipient Easy Track contracts deploying minimal proxy (EIP-1167)
+///     clones of the implementations instead of full contracts. Has the same interface and events
+///     as AllowedRecipientsFactory, so it's used by AllowedRecipientsBuilder the same way
+/// @dev Implementations are deployed once and passed to the constructor. Registries deployed with
+///     the constructor are initialized on deployment, so their state is never used by clones
+contract AllowedRecipientsCloneFactory {
+    event AllowedRecipientsRegistryDeployed(
+        address indexed creator,
+        address indexed allowedRecipientsRegistry,
+        address _defaultAdmin,
+        address[] addRecipientToAllowedListRoleHolders,
+        address[] removeRecipientFromAllowedListRoleHolders,
+        address[] setLimitParametersRoleHolders,
+        address[] updateSpentAmountRoleHolders,
+        IBokkyPooBahsDateTimeContract bokkyPooBahsDateTimeContract
+    );
+
+    event AllowedTokensRegistryDeployed(
+        address indexed creator,
+        address indexed allowedTokensRegistry,
+        address _defaultAdmin,
+        address[] addTokenToAllowedListRoleHolders,
+        address[] removeTokenFromAllowedListRoleHolders
+    );
+
+    event TopUpAllowedRecipientsDeployed(
+        address indexed creator,
+        address indexed topUpAllowedRecipients,
+        address trustedCaller,
+        address allowedRecipientsRegistry,
+        address allowedTokenssRegistry,
+        address finance,
+        address easyTrack
+    );
+
+    event AddAllowedRecipientDeployed(
+        address indexed creator,
+        address indexed addAllowedRecipient,
+        address trustedCaller,
+        address allowedRecipientsRegistry
+    );
+
+    event RemoveAllowedRecipientDeployed(
+        address indexed creator,
+        address indexed removeAllowedRecipient,
+        address trustedCaller,
+        address allowedRecipientsRegistry
+    );
+
+    /// @notice Implementation of AllowedRecipientsRegistry clones
+    address public immutable allowedRecipientsRegistryImplementation;
+
+    /// @notice Implementation of AllowedTokensRegistry clones
+    address public immutable allowedTokensRegistryImplementation;
+
+    /// @notice Implementation of TopUpAllowedRecipients clones
+    address public immutable topUpAllowedRecipientsImplementation;
+
+    /// @notice Implementation of AddAllowedRecipient clones
+    address public immutable addAllowedRecipientImplementation;
+
+    /// @notice Implementation of RemoveAllowedRecipient clones
+    address public immutable removeAllowedRecipientImplementation;
+
+    /// @param _allowedRecipientsRegistryImplementation Deployed AllowedRecipientsRegistry
+    /// @param _allowedTokensRegistryImplementation Deployed AllowedTokensRegistry
+    /// @param _topUpAllowedRecipientsImplementation Deployed TopUpAllowedRecipientsInitializable
+    /// @param _addAllowedRecipientImplementation Deployed AddAllowedRecipientInitializable
+    /// @param _removeAllowedRecipientImplementation Deployed RemoveAllowedRecipientInitializable
+    constructor(
+        address _allowedRecipientsRegistryImplementation,
+        address _allowedTokensRegistryImplementation,
+        address _topUpAllowedRecipientsImplementation,
+        address _addAllowedRecipientImplementation,
+        address _removeAllowedRecipientImplementation
+    ) {
+        allowedRecipientsRegistryImplementation = _allowedRecipientsRegistryImplementation;
+        allowedTokensRegistryImplementation = _allowedTokensRegistryImplementation;
+        topUpAllowedRecipientsImplementation = _topUpAllowedRecipientsImplementation;
+        addAllowedRecipientImplementation = _addAllowedRecipientImplementation;
+        removeAllowedRecipientImplementation = _removeAllowedRecipientImplementation;
+    }
+
+    function deployAllowedRecipientsRegistry(
+        address _defaultAdmin,
+        address[] calldata _addRecipientToAllowedListRoleHolders,
+        address[] calldata _removeRecipientFromAllowedListRoleHolders,
+        address[] calldata _setLimitParametersRoleHolders,
+        address[] calldata _updateSpentAmountRoleHolders,
+        IBokkyPooBahsDateTimeContract _bokkyPooBahsDateTimeContract
+    ) external returns (AllowedRecipientsRegistry registry) {
+        registry = AllowedRecipientsRegistry(Clones.clone(allowedRecipientsRegistryImplementation));
+        registry.initialize(
+            _defaultAdmin,
+            _addRecipientToAllowedListRoleHolders,
+            _removeRecipientFromAllowedListRoleHolders,
+            _setLimitParametersRoleHolders,
+            _updateSpentAmountRoleHolders,
+            _bokkyPooBahsDateTimeContract
+        );
+
+        emit AllowedRecipientsRegistryDeployed(
+            msg.sender,
+            address(registry),
+            _defaultAdmin,
+            _addRecipientToAllowedListRoleHolders,
+            _removeRecipientFromAllowedListRoleHolders,
+            _setLimitParametersRoleHolders,
+            _updateSpentAmountRoleHolders,
+            _bokkyPooBahsDateTimeContract
+        );
+    }
+
+    function deployAllowedTokensRegistry(
+        address _defaultAdmin,
+        address[] calldata _addTokensToAllowedListRoleHolders,
+        address[] calldata _removeTokensFromAllowedListRoleHolders
+    ) external returns (AllowedTokensRegistry registry) {
+        registry = AllowedTokensRegistry(Clones.clone(allowedTokensRegistryImplementation));
+        registry.initialize(
+            _defaultAdmin,
+            _addTokensToAllowedListRoleHolders,
+            _removeTokensFromAllowedListRoleHolders
+        );
+
+        emit AllowedTokensRegistryDeployed(
+            msg.sender,
+            address(registry),
+            _defaultAdmin,
+            _addTokensToAllowedListRoleHolders,
+            _removeTokensFromAllowedListRoleHolders
+        );
+    }
+
+    function deployTopUpAllowedRecipients(
+        address _trustedCaller,
+        address _allowedRecipientsRegistry,
+        address _allowedTokensRegistry,
+        address _finance,
+        address _easyTrack
+    ) external returns (TopUpAllowedRecipientsInitializable topUpAllowedRecipients) {
+        topUpAllowedRecipients = TopUpAllowedRecipientsInitializable(
+            Clones.clone(topUpAllowedRecipientsImplementation)
+        );
+        topUpAllowedRecipients.initialize(
+            _trustedCaller,
+            _allowedRecipientsRegistry,
+            _allowedTokensRegistry,
+            _finance,
+            _easyTrack
+        );
+
+        emit TopUpAllowedRecipientsDeployed(
+            msg.sender,
+            address(topUpAllowedRecipients),
+            _trustedCaller,
+            _allowedRecipientsRegistry,
+            _allowedTokensRegistry,
+            _finance,
+            _easyTrack
+        );
+    }
+
+    function deployAddAllowedRecipient(address _trustedCaller, address _allowedRecipientsRegistry)
+        external
+        returns (AddAllowedRecipientInitializable addAllowedRecipient)
+    {
+        addAllowedRecipient = AddAllowedRecipientInitializable(
+            Clones.clone(addAllowedRecipientImplementation)
+        );
+        addAllowedRecipient.initialize(_trustedCaller, _allowedRecipientsRegistry);
+
+        emit AddAllowedRecipientDeployed(
+            msg.sender,
+            address(addAllowedRecipient),
+            _trustedCaller,
+            _allowedRecipientsRegistry
+        );
+    }
+
+    function deployRemoveAllowedRecipient(
+        address _trustedCaller,
+        address _allowedRecipientsRegistry
+    ) external returns (RemoveAllowedRecipientInitializable removeAllowedRecipient) {
+        removeAllowedRecipient = RemoveAllowedRecipientInitializable(
+            Clones.clone(removeAllowedRecipientImplementation)
+        );
+        removeAllowedRecipient.initialize(_trustedCaller, _allowedRecipientsRegistry);
+
+        emit RemoveAllowedRecipientDeployed(
+            msg.sender,
+            address(removeAllowedRecipient),
+            _trustedCaller,
+            _allowedRecipientsRegistry
+        );
+    }
+}
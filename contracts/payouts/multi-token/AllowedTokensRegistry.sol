@@ -4,8 +4,11 @@ pragma solidity ^0.8.4;
 
 import "OpenZeppelin/openzeppelin-contracts@4.3.2/contracts/access/AccessControl.sol";
 import "OpenZeppelin/openzeppelin-contracts@4.3.2/contracts/token/ERC20/extensions/IERC20Metadata.sol";
+import "OpenZeppelin/openzeppelin-contracts@4.3.2/contracts/proxy/utils/Initializable.sol";
 
-contract AllowedTokensRegistry is AccessControl {
+/// @dev The registry deployed with the constructor may be used as an implementation of
+///     minimal proxy (EIP-1167) clones. Clones are set up with initialize() method
+contract AllowedTokensRegistry is AccessControl, Initializable {
     // -------------
     // EVENTS
     // -------------
@@ -36,6 +39,10 @@ contract AllowedTokensRegistry is AccessControl {
     // plus 1 because index 0 means a value is not in the set.
     mapping(address => uint256) private allowedTokenIndices;
 
+    // Decimals of the allowed tokens cached on addition to the list and refreshed
+    // by refreshTokenDecimals(), plus 1 because 0 means the decimals of the token are not cached.
+    mapping(address => uint256) private allowedTokenDecimals;
+
     /// @notice Precise number of tokens in the system
     uint8 internal constant DECIMALS = 18;
 
@@ -43,47 +50,55 @@ contract AllowedTokensRegistry is AccessControl {
         address _admin,
         address[] memory _addTokenToAllowedListRoleHolders,
         address[] memory _removeTokenFromAllowedListRoleHolders
-    ) {
-        _setupRole(DEFAULT_ADMIN_ROLE, _admin);
-        for (uint256 i = 0; i < _addTokenToAllowedListRoleHolders.length; i++) {
-            _setupRole(ADD_TOKEN_TO_ALLOWED_LIST_ROLE, _addTokenToAllowedListRoleHolders[i]);
-        }
-        for (uint256 i = 0; i < _removeTokenFromAllowedListRoleHolders.length; i++) {
-            _setupRole(REMOVE_TOKEN_FROM_ALLOWED_LIST_ROLE, _removeTokenFromAllowedListRoleHolders[i]);
-        }
+    ) initializer {
+        _setupRoles(_admin, _addTokenToAllowedListRoleHolders, _removeTokenFromAllowedListRoleHolders);
     }
 
     // -------------
     // EXTERNAL METHODS
     // -------------
 
+    /// @notice Sets up the minimal proxy clone of the registry. Takes the same
+    ///     parameters as the constructor and can be called only once
+    function initialize(
+        address _admin,
+        address[] memory _addTokenToAllowedListRoleHolders,
+        address[] memory _removeTokenFromAllowedListRoleHolders
+    ) external initializer {
+        _setupRoles(_admin, _addTokenToAllowedListRoleHolders, _removeTokenFromAllowedListRoleHolders);
+    }
+
     /// @notice Adds address to list of allowed tokens for payouts
     function addToken(address _token) external onlyRole(ADD_TOKEN_TO_ALLOWED_LIST_ROLE) {
-        require(_token != address(0), ERROR_TOKEN_ADDRESS_IS_ZERO);
-        require(allowedTokenIndices[_token] == 0, ERROR_TOKEN_ALREADY_ADDED_TO_ALLOWED_LIST);
+        _addToken(_token);
+    }
 
-        allowedTokens.push(_token);
-        allowedTokenIndices[_token] = allowedTokens.length;
-        emit TokenAdded(_token);
+    /// @notice Adds addresses to list of allowed tokens for payouts
+    function addTokens(address[] memory _tokens) external onlyRole(ADD_TOKEN_TO_ALLOWED_LIST_ROLE) {
+        for (uint256 i = 0; i < _tokens.length; ++i) {
+            _addToken(_tokens[i]);
+        }
     }
 
     /// @notice Removes address from list of allowed tokens for payouts
-    /// @dev To delete an allowed token from the allowedTokens array in O(1),
-    /// we swap the element to delete with the last one in the array,
-    /// and then remove the last element (sometimes called as 'swap and pop').
     function removeToken(address _token) external onlyRole(REMOVE_TOKEN_FROM_ALLOWED_LIST_ROLE) {
-        uint256 index = _getAllowedTokenIndex(_token);
-        uint256 lastIndex = allowedTokens.length - 1;
+        _removeToken(_token);
+    }
 
-        if (index != lastIndex) {
-            address lastAllowedToken = allowedTokens[lastIndex];
-            allowedTokens[index] = lastAllowedToken;
-            allowedTokenIndices[lastAllowedToken] = index + 1;
+    /// @notice Removes addresses from list of allowed tokens for payouts
+    function removeTokens(address[] memory _tokens) external onlyRole(REMOVE_TOKEN_FROM_ALLOWED_LIST_ROLE) {
+        for (uint256 i = 0; i < _tokens.length; ++i) {
+            _removeToken(_tokens[i]);
         }
+    }
 
-        allowedTokens.pop();
-        delete allowedTokenIndices[_token];
-        emit TokenRemoved(_token);
+    /// @notice Updates decimals of the allowed token cached on addition to the list
+    /// @dev ERC20 decimals are not expected to change, but upgradeable tokens may change them.
+    ///     Anyone may sync the cache with the token, as normalizeAmount() did reading decimals()
+    ///     of the token on each call before the decimals were cached
+    function refreshTokenDecimals(address _token) external {
+        _getAllowedTokenIndex(_token);
+        _cacheTokenDecimals(_token);
     }
 
     /// @notice Returns if passed address is listed as allowed token in the registry
@@ -97,12 +112,42 @@ contract AllowedTokensRegistry is AccessControl {
     }
 
     /// @notice Transforms amout from token format to precise format
+    /// @dev Decimals of the allowed tokens are cached on addition to the list,
+    /// decimals of other tokens are requested from the token
     function normalizeAmount(uint256 _tokenAmount, address _token) external view returns (uint256) {
         require(_token != address(0), ERROR_TOKEN_ADDRESS_IS_ZERO);
+        return _normalizeAmount(_tokenAmount, _token);
+    }
+
+    /// @notice Returns if the token is allowed and transforms amount of it to precise format.
+    ///     Combines isTokenAllowed() and normalizeAmount() to validate top ups with one call
+    /// @return _isAllowed If the token is listed as allowed token in the registry
+    /// @return _normalizedAmount Amount in precise format or 0 when the token isn't allowed
+    function normalizeAllowedTokenAmount(uint256 _tokenAmount, address _token)
+        external
+        view
+        returns (bool _isAllowed, uint256 _normalizedAmount)
+    {
+        if (allowedTokenIndices[_token] == 0) return (false, 0);
+        return (true, _normalizeAmount(_tokenAmount, _token));
+    }
 
+    /// @notice Returns precision of the token
+    function decimals() pure external returns (uint8) {
+        return DECIMALS;
+    }
+
+    // ------------------
+    // PRIVATE METHODS
+    // ------------------
+
+    function _normalizeAmount(uint256 _tokenAmount, address _token) private view returns (uint256) {
         if (_tokenAmount == 0) return 0;
 
-        uint8 tokenDecimals = IERC20Metadata(_token).decimals();
+        uint256 cachedTokenDecimals = allowedTokenDecimals[_token];
+        uint8 tokenDecimals = cachedTokenDecimals == 0
+            ? IERC20Metadata(_token).decimals()
+            : uint8(cachedTokenDecimals - 1);
 
         if (tokenDecimals == DECIMALS) return _tokenAmount;
         if (tokenDecimals > DECIMALS) {
@@ -113,14 +158,63 @@ contract AllowedTokensRegistry is AccessControl {
         return _tokenAmount * 10 ** (DECIMALS - tokenDecimals);
     }
 
-    /// @notice Returns precision of the token
-    function decimals() pure external returns (uint8) {
-        return DECIMALS;
+    function _setupRoles(
+        address _admin,
+        address[] memory _addTokenToAllowedListRoleHolders,
+        address[] memory _removeTokenFromAllowedListRoleHolders
+    ) private {
+        _setupRole(DEFAULT_ADMIN_ROLE, _admin);
+        for (uint256 i = 0; i < _addTokenToAllowedListRoleHolders.length; i++) {
+            _setupRole(ADD_TOKEN_TO_ALLOWED_LIST_ROLE, _addTokenToAllowedListRoleHolders[i]);
+        }
+        for (uint256 i = 0; i < _removeTokenFromAllowedListRoleHolders.length; i++) {
+            _setupRole(REMOVE_TOKEN_FROM_ALLOWED_LIST_ROLE, _removeTokenFromAllowedListRoleHolders[i]);
+        }
     }
 
-    // ------------------
-    // PRIVATE METHODS
-    // ------------------
+    function _addToken(address _token) private {
+        require(_token != address(0), ERROR_TOKEN_ADDRESS_IS_ZERO);
+        require(allowedTokenIndices[_token] == 0, ERROR_TOKEN_ALREADY_ADDED_TO_ALLOWED_LIST);
+
+        allowedTokens.push(_token);
+        allowedTokenIndices[_token] = allowedTokens.length;
+        _cacheTokenDecimals(_token);
+        emit TokenAdded(_token);
+    }
+
+    /// @dev To delete an allowed token from the allowedTokens array in O(1),
+    /// we swap the element to delete with the last one in the array,
+    /// and then remove the last element (sometimes called as 'swap and pop').
+    function _removeToken(address _token) private {
+        uint256 index = _getAllowedTokenIndex(_token);
+        uint256 lastIndex = allowedTokens.length - 1;
+
+        if (index != lastIndex) {
+            address lastAllowedToken = allowedTokens[lastIndex];
+            allowedTokens[index] = lastAllowedToken;
+            allowedTokenIndices[lastAllowedToken] = index + 1;
+        }
+
+        allowedTokens.pop();
+        delete allowedTokenIndices[_token];
+        delete allowedTokenDecimals[_token];
+        emit TokenRemoved(_token);
+    }
+
+    /// @dev Tokens without decimals() may be added to the list as before,
+    /// normalizeAmount() calls the token and reverts for them.
+    function _cacheTokenDecimals(address _token) private {
+        delete allowedTokenDecimals[_token];
+        (bool success, bytes memory data) = _token.staticcall(
+            abi.encodeWithSelector(IERC20Metadata.decimals.selector)
+        );
+        if (!success || data.length < 32) return;
+
+        uint256 tokenDecimals = abi.decode(data, (uint256));
+        if (tokenDecimals <= type(uint8).max) {
+            allowedTokenDecimals[_token] = tokenDecimals + 1;
+        }
+    }
 
     function _getAllowedTokenIndex(address _token) private view returns (uint256 _index) {
         _index = allowedTokenIndices[_token];
@@ -6,24 +6,13 @@ pragma solidity ^0.8.4;
 import "contracts/TrustedCaller.sol";
 import "./interfaces/IAllowedRecipientsRegistry.sol";
 import "./interfaces/IAllowedTokensRegistry.sol";
+import "./TopUpAllowedRecipientsUtils.sol";
 import "contracts/interfaces/IFinance.sol";
-import "contracts/libraries/EVMScriptCreator.sol";
 import "contracts/interfaces/IEVMScriptFactory.sol";
 import "contracts/interfaces/IEasyTrack.sol";
 
 /// @notice Creates EVMScript to top up allowed recipients addresses within the current spendable balance
 contract TopUpAllowedRecipients is TrustedCaller, IEVMScriptFactory {
-    // -------------
-    // ERRORS
-    // -------------
-    string private constant ERROR_LENGTH_MISMATCH = "LENGTH_MISMATCH";
-    string private constant ERROR_EMPTY_DATA = "EMPTY_DATA";
-    string private constant ERROR_ZERO_AMOUNT = "ZERO_AMOUNT";
-    string private constant ERROR_TOKEN_NOT_ALLOWED = "TOKEN_NOT_ALLOWED";
-    string private constant ERROR_RECIPIENT_NOT_ALLOWED = "RECIPIENT_NOT_ALLOWED";
-    string private constant ERROR_ZERO_RECIPIENT = "ZERO_RECIPIENT";
-    string private constant ERROR_SUM_EXCEEDS_SPENDABLE_BALANCE = "SUM_EXCEEDS_SPENDABLE_BALANCE";
-
     // -------------
     // VARIABLES
     // -------------
@@ -73,7 +62,7 @@ contract TopUpAllowedRecipients is TrustedCaller, IEVMScriptFactory {
     /// token - address of token to top up
     /// recipients - addresses of recipients to top up
     /// amounts - corresponding amounts of token to transfer
-    /// @dev note that the arrays below has one extra element to store limit enforcement calls
+    /// @dev the EVMScript has one extra call to updateSpentAmount() to enforce the limits
     function createEVMScript(address _creator, bytes calldata _evmScriptCallData)
         external
         view
@@ -81,25 +70,14 @@ contract TopUpAllowedRecipients is TrustedCaller, IEVMScriptFactory {
         onlyTrustedCaller(_creator)
         returns (bytes memory)
     {
-        (address token, address[] memory recipients, uint256[] memory amounts) =
-            _decodeEVMScriptCallData(_evmScriptCallData);
-        uint256 normalizedAmount = _validateEVMScriptCallData(token, recipients, amounts);
-
-        address[] memory to = new address[](recipients.length + 1);
-        bytes4[] memory methodIds = new bytes4[](recipients.length + 1);
-        bytes[] memory evmScriptsCalldata = new bytes[](recipients.length + 1);
-
-        to[0] = address(allowedRecipientsRegistry);
-        methodIds[0] = allowedRecipientsRegistry.updateSpentAmount.selector;
-        evmScriptsCalldata[0] = abi.encode(normalizedAmount);
-
-        for (uint256 i = 0; i < recipients.length; ++i) {
-            to[i + 1] = address(finance);
-            methodIds[i + 1] = finance.newImmediatePayment.selector;
-            evmScriptsCalldata[i + 1] = abi.encode(token, recipients[i], amounts[i], "Easy Track: top up recipient");
-        }
-
-        return EVMScriptCreator.createEVMScript(to, methodIds, evmScriptsCalldata);
+        return
+            TopUpAllowedRecipientsUtils.createEVMScript(
+                allowedRecipientsRegistry,
+                allowedTokensRegistry,
+                finance,
+                easyTrack,
+                _evmScriptCallData
+            );
     }
 
     /// @notice Decodes call data used by createEVMScript method
@@ -114,48 +92,6 @@ contract TopUpAllowedRecipients is TrustedCaller, IEVMScriptFactory {
         pure
         returns (address token, address[] memory recipients, uint256[] memory amounts)
     {
-        return _decodeEVMScriptCallData(_evmScriptCallData);
-    }
-
-    // ------------------
-    // PRIVATE METHODS
-    // ------------------
-
-    function _validateEVMScriptCallData(address token, address[] memory _recipients, uint256[] memory _amounts)
-        private
-        view
-        returns (uint256 normalizedAmount)
-    {
-        require(_amounts.length == _recipients.length, ERROR_LENGTH_MISMATCH);
-        require(_recipients.length > 0, ERROR_EMPTY_DATA);
-        require(allowedTokensRegistry.isTokenAllowed(token), ERROR_TOKEN_NOT_ALLOWED);
-
-        uint256 totalAmount;
-
-        for (uint256 i = 0; i < _recipients.length; ++i) {
-            require(_amounts[i] > 0, ERROR_ZERO_AMOUNT);
-            require(_recipients[i] != address(0), ERROR_ZERO_RECIPIENT);
-            require(allowedRecipientsRegistry.isRecipientAllowed(_recipients[i]), ERROR_RECIPIENT_NOT_ALLOWED);
-            totalAmount += _amounts[i];
-        }
-
-        normalizedAmount = allowedTokensRegistry.normalizeAmount(totalAmount, token);
-
-        _validateSpendableBalance(normalizedAmount);
-    }
-
-    function _decodeEVMScriptCallData(bytes calldata _evmScriptCallData)
-        private
-        pure
-        returns (address token, address[] memory recipients, uint256[] memory amounts)
-    {
-        return abi.decode(_evmScriptCallData, (address, address[], uint256[]));
-    }
-
-    function _validateSpendableBalance(uint256 _amount) private view {
-        require(
-            allowedRecipientsRegistry.isUnderSpendableBalance(_amount, easyTrack.motionDuration()),
-            ERROR_SUM_EXCEEDS_SPENDABLE_BALANCE
-        );
+        return TopUpAllowedRecipientsUtils.decodeEVMScriptCallData(_evmScriptCallData);
     }
-}
\ No newline at end of file
+}
@@ -0,0 +1,96 @@
+// SPDX-FileCopyrightText: 2025 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity ^0.8.4;
+
+import "contracts/TrustedCallerInitializable.sol";
+import "./interfaces/IAllowedRecipientsRegistry.sol";
+import "./interfaces/IAllowedTokensRegistry.sol";
+import "./TopUpAllowedRecipientsUtils.sol";
+import "contracts/interfaces/IFinance.sol";
+import "contracts/interfaces/IEVMScriptFactory.sol";
+import "contracts/interfaces/IEasyTrack.sol";
+
+/// @notice Version of TopUpAllowedRecipients used as implementation of minimal proxy (EIP-1167)
+///     clones deployed by AllowedRecipientsCloneFactory
+contract TopUpAllowedRecipientsInitializable is TrustedCallerInitializable, IEVMScriptFactory {
+    // -------------
+    // VARIABLES
+    // -------------
+
+    /// @notice Address of EasyTrack contract
+    IEasyTrack public easyTrack;
+
+    /// @notice Address of Aragon's Finance contract
+    IFinance public finance;
+
+    /// @notice Address of AllowedRecipientsRegistry contract
+    IAllowedRecipientsRegistry public allowedRecipientsRegistry;
+
+    /// @notice Address of AllowedTokensRegistry contract
+    IAllowedTokensRegistry public allowedTokensRegistry;
+
+    // -------------
+    // EXTERNAL METHODS
+    // -------------
+
+    /// @notice Sets up the clone. Can be called only once
+    /// @param _trustedCaller Address that has access to certain methods.
+    ///     Set once on initialization and can't be changed.
+    /// @param _allowedRecipientsRegistry Address of AllowedRecipientsRegistry contract
+    /// @param _allowedTokensRegistry Address of AllowedTokensRegistry contract
+    /// @param _finance Address of Aragon's Finance contract
+    /// @param _easyTrack Address of EasyTrack contract
+    function initialize(
+        address _trustedCaller,
+        address _allowedRecipientsRegistry,
+        address _allowedTokensRegistry,
+        address _finance,
+        address _easyTrack
+    ) external initializer {
+        _initializeTrustedCaller(_trustedCaller);
+        finance = IFinance(_finance);
+        allowedRecipientsRegistry = IAllowedRecipientsRegistry(_allowedRecipientsRegistry);
+        allowedTokensRegistry = IAllowedTokensRegistry(_allowedTokensRegistry);
+        easyTrack = IEasyTrack(_easyTrack);
+    }
+
+    /// @notice Creates EVMScript to top up allowed recipients addresses
+    /// @param _creator Address who creates EVMScript
+    /// @param _evmScriptCallData Encoded tuple: (address token, address[] recipients, uint256[] amounts) where
+    /// token - address of token to top up
+    /// recipients - addresses of recipients to top up
+    /// amounts - corresponding amounts of token to transfer
+    /// @dev the EVMScript has one extra call to updateSpentAmount() to enforce the limits
+    function createEVMScript(address _creator, bytes calldata _evmScriptCallData)
+        external
+        view
+        override
+        onlyTrustedCaller(_creator)
+        returns (bytes memory)
+    {
+        return
+            TopUpAllowedRecipientsUtils.createEVMScript(
+                allowedRecipientsRegistry,
+                allowedTokensRegistry,
+                finance,
+                easyTrack,
+                _evmScriptCallData
+            );
+    }
+
+    /// @notice Decodes call data used by createEVMScript method
+    /// @param _evmScriptCallData Encoded tuple: (address[] recipients, uint256[] amounts) where
+    /// recipients - addresses of recipients to top up
+    /// amounts - corresponding amounts of token to transfer
+    /// @return token Address of payout token
+    /// @return recipients Addresses of recipients to top up
+    /// @return amounts Amounts of token to transfer
+    function decodeEVMScriptCallData(bytes calldata _evmScriptCallData)
+        external
+        pure
+        returns (address token, address[] memory recipients, uint256[] memory amounts)
+    {
+        return TopUpAllowedRecipientsUtils.decodeEVMScriptCallData(_evmScriptCallData);
+    }
+}
@@ -0,0 +1,119 @@
+// SPDX-FileCopyrightText: 2025 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity ^0.8.4;
+
+import "./interfaces/IAllowedRecipientsRegistry.sol";
+import "./interfaces/IAllowedTokensRegistry.sol";
+import "contracts/interfaces/IFinance.sol";
+import "contracts/interfaces/IEasyTrack.sol";
+import "contracts/payouts/TopUpAllowedRecipientsCommonUtils.sol";
+
+/// @notice Validation and creation of top up EVMScripts shared by TopUpAllowedRecipients
+///     and TopUpAllowedRecipientsInitializable
+/// @dev Validation makes 4 external calls: one to the tokens registry, two to the recipients
+///     registry (recipients and limit checks) and one to EasyTrack for the motion duration,
+///     which may be changed by the DAO and so isn't cached by the factories
+library TopUpAllowedRecipientsUtils {
+    // -------------
+    // ERRORS
+    // -------------
+    string private constant ERROR_TOKEN_NOT_ALLOWED = "TOKEN_NOT_ALLOWED";
+    string private constant ERROR_ZERO_RECIPIENT = "ZERO_RECIPIENT";
+
+    /// @notice Validates call data and creates EVMScript to top up allowed recipients addresses
+    /// @param _evmScriptCallData Encoded tuple: (address token, address[] recipients, uint256[] amounts)
+    /// @dev the EVMScript has one extra call to updateSpentAmount() to enforce the limits
+    function createEVMScript(
+        IAllowedRecipientsRegistry _allowedRecipientsRegistry,
+        IAllowedTokensRegistry _allowedTokensRegistry,
+        IFinance _finance,
+        IEasyTrack _easyTrack,
+        bytes calldata _evmScriptCallData
+    ) internal view returns (bytes memory) {
+        (
+            address token,
+            address[] memory recipients,
+            uint256[] memory amounts
+        ) = decodeEVMScriptCallData(_evmScriptCallData);
+        uint256 normalizedAmount = _validateEVMScriptCallData(
+            _allowedRecipientsRegistry,
+            _allowedTokensRegistry,
+            _easyTrack,
+            token,
+            recipients,
+            amounts
+        );
+        return
+            TopUpAllowedRecipientsCommonUtils.createTopUpEVMScript(
+                _allowedRecipientsRegistry,
+                _finance,
+                token,
+                recipients,
+                amounts,
+                normalizedAmount
+            );
+    }
+
+    /// @notice Decodes call data used by createEVMScript method
+    function decodeEVMScriptCallData(bytes calldata _evmScriptCallData)
+        internal
+        pure
+        returns (address token, address[] memory recipients, uint256[] memory amounts)
+    {
+        return abi.decode(_evmScriptCallData, (address, address[], uint256[]));
+    }
+
+    // ------------------
+    // PRIVATE METHODS
+    // ------------------
+
+    function _validateEVMScriptCallData(
+        IAllowedRecipientsRegistry _allowedRecipientsRegistry,
+        IAllowedTokensRegistry _allowedTokensRegistry,
+        IEasyTrack _easyTrack,
+        address _token,
+        address[] memory _recipients,
+        uint256[] memory _amounts
+    ) private view returns (uint256 normalizedAmount) {
+        uint256 totalAmount = TopUpAllowedRecipientsCommonUtils.sumAmounts(_recipients, _amounts);
+        for (uint256 i = 0; i < _recipients.length; ++i) {
+            require(_recipients[i] != address(0), ERROR_ZERO_RECIPIENT);
+        }
+
+        bool isTokenAllowed;
+        (isTokenAllowed, normalizedAmount) = _normalizeAllowedTokenAmount(
+            _allowedTokensRegistry,
+            totalAmount,
+            _token
+        );
+        require(isTokenAllowed, ERROR_TOKEN_NOT_ALLOWED);
+
+        TopUpAllowedRecipientsCommonUtils.validateRecipientsAndLimit(
+            _allowedRecipientsRegistry,
+            _recipients,
+            normalizedAmount,
+            _easyTrack.motionDuration()
+        );
+    }
+
+    /// @dev Registries deployed before normalizeAllowedTokenAmount() was added don't have it,
+    ///     so the token is checked and the amount is normalized with two calls when it fails
+    function _normalizeAllowedTokenAmount(
+        IAllowedTokensRegistry _allowedTokensRegistry,
+        uint256 _amount,
+        address _token
+    ) private view returns (bool, uint256) {
+        try _allowedTokensRegistry.normalizeAllowedTokenAmount(_amount, _token) returns (
+            bool isAllowed,
+            uint256 normalizedAmount
+        ) {
+            return (isAllowed, normalizedAmount);
+        } catch {
+            if (!_allowedTokensRegistry.isTokenAllowed(_token)) {
+                return (false, 0);
+            }
+            return (true, _allowedTokensRegistry.normalizeAmount(_amount, _token));
+        }
+    }
+}
@@ -10,6 +10,8 @@ interface IAllowedRecipientsRegistry {
 
     function isRecipientAllowed(address _recipient) external view returns (bool);
 
+    function areRecipientsAllowed(address[] memory _recipients) external view returns (bool);
+
     function setLimitParameters(uint256 _limit, uint256 _periodDurationMonths) external;
 
     function getLimitParameters() external view returns (uint256, uint256);
@@ -25,4 +27,14 @@ interface IAllowedRecipientsRegistry {
     function bokkyPooBahsDateTimeContract() external view returns (address);
 
     function isUnderSpendableBalance(uint256 _amount, uint256 _motionDuration) external view returns (bool);
+
+    function getSpendableBalanceForecast(uint256 _motionDuration)
+        external
+        view
+        returns (
+            uint256 _spendableBalanceNow,
+            uint256 _periodEndTimestamp,
+            uint256 _spendableBalanceInNextPeriod,
+            uint256 _maxPayoutAmount
+        );
 }
\ No newline at end of file
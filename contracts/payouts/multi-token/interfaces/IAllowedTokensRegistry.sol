@@ -19,4 +19,11 @@ interface IAllowedTokensRegistry {
     function decimals() external view returns (uint8);
 
     function normalizeAmount(uint256 _amount, address _token) external view returns (uint256);
+
+    function normalizeAllowedTokenAmount(uint256 _amount, address _token)
+        external
+        view
+        returns (bool _isAllowed, uint256 _normalizedAmount);
+
+    function refreshTokenDecimals(address _token) external;
 }
\ No newline at end of file
@@ -0,0 +1,176 @@
+// SPDX-FileCopyrightText: 2025 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity ^0.8.4;
+
+import "contracts/EVMScriptFactories/AddAllowedRecipientInitializable.sol";
+import "contracts/EVMScriptFactories/RemoveAllowedRecipientInitializable.sol";
+import "./TopUpAllowedRecipientsSingleTokenInitializable.sol";
+import "contracts/AllowedRecipientsRegistry.sol";
+
+import "OpenZeppelin/openzeppelin-contracts@4.3.2/contracts/proxy/Clones.sol";
+
+/// @notice Factory for Allowed Recipient Easy Track contracts deploying minimal proxy (EIP-1167)
+///     clones of the implementations instead of full contracts. Has the same interface and events
+///     as AllowedRecipientsFactorySingleToken, so it's used by AllowedRecipientsBuilderSingleToken
+///     the same way
+/// @dev Implementations are deployed once and passed to the constructor. The registry deployed with
+///     the constructor is initialized on deployment, so its state is never used by clones
+contract AllowedRecipientsCloneFactorySingleToken {
+    event AllowedRecipientsRegistryDeployed(
+        address indexed creator,
+        address indexed allowedRecipientsRegistry,
+        address _defaultAdmin,
+        address[] addRecipientToAllowedListRoleHolders,
+        address[] removeRecipientFromAllowedListRoleHolders,
+        address[] setLimitParametersRoleHolders,
+        address[] updateSpentAmountRoleHolders,
+        IBokkyPooBahsDateTimeContract bokkyPooBahsDateTimeContract
+    );
+
+    event TopUpAllowedRecipientsDeployed(
+        address indexed creator,
+        address indexed topUpAllowedRecipients,
+        address trustedCaller,
+        address allowedRecipientsRegistry,
+        address finance,
+        address token,
+        address easyTrack
+    );
+
+    event AddAllowedRecipientDeployed(
+        address indexed creator,
+        address indexed addAllowedRecipient,
+        address trustedCaller,
+        address allowedRecipientsRegistry
+    );
+
+    event RemoveAllowedRecipientDeployed(
+        address indexed creator,
+        address indexed removeAllowedRecipient,
+        address trustedCaller,
+        address allowedRecipientsRegistry
+    );
+
+    /// @notice Implementation of AllowedRecipientsRegistry clones
+    address public immutable allowedRecipientsRegistryImplementation;
+
+    /// @notice Implementation of TopUpAllowedRecipientsSingleToken clones
+    address public immutable topUpAllowedRecipientsImplementation;
+
+    /// @notice Implementation of AddAllowedRecipient clones
+    address public immutable addAllowedRecipientImplementation;
+
+    /// @notice Implementation of RemoveAllowedRecipient clones
+    address public immutable removeAllowedRecipientImplementation;
+
+    /// @param _allowedRecipientsRegistryImplementation Deployed AllowedRecipientsRegistry
+    /// @param _topUpAllowedRecipientsImplementation Deployed
+    ///     TopUpAllowedRecipientsSingleTokenInitializable
+    /// @param _addAllowedRecipientImplementation Deployed AddAllowedRecipientInitializable
+    /// @param _removeAllowedRecipientImplementation Deployed RemoveAllowedRecipientInitializable
+    constructor(
+        address _allowedRecipientsRegistryImplementation,
+        address _topUpAllowedRecipientsImplementation,
+        address _addAllowedRecipientImplementation,
+        address _removeAllowedRecipientImplementation
+    ) {
+        allowedRecipientsRegistryImplementation = _allowedRecipientsRegistryImplementation;
+        topUpAllowedRecipientsImplementation = _topUpAllowedRecipientsImplementation;
+        addAllowedRecipientImplementation = _addAllowedRecipientImplementation;
+        removeAllowedRecipientImplementation = _removeAllowedRecipientImplementation;
+    }
+
+    function deployAllowedRecipientsRegistry(
+        address _defaultAdmin,
+        address[] memory _addRecipientToAllowedListRoleHolders,
+        address[] memory _removeRecipientFromAllowedListRoleHolders,
+        address[] memory _setLimitParametersRoleHolders,
+        address[] memory _updateSpentAmountRoleHolders,
+        IBokkyPooBahsDateTimeContract _bokkyPooBahsDateTimeContract
+    ) public returns (AllowedRecipientsRegistry registry) {
+        registry = AllowedRecipientsRegistry(Clones.clone(allowedRecipientsRegistryImplementation));
+        registry.initialize(
+            _defaultAdmin,
+            _addRecipientToAllowedListRoleHolders,
+            _removeRecipientFromAllowedListRoleHolders,
+            _setLimitParametersRoleHolders,
+            _updateSpentAmountRoleHolders,
+            _bokkyPooBahsDateTimeContract
+        );
+
+        emit AllowedRecipientsRegistryDeployed(
+            msg.sender,
+            address(registry),
+            _defaultAdmin,
+            _addRecipientToAllowedListRoleHolders,
+            _removeRecipientFromAllowedListRoleHolders,
+            _setLimitParametersRoleHolders,
+            _updateSpentAmountRoleHolders,
+            _bokkyPooBahsDateTimeContract
+        );
+    }
+
+    function deployTopUpAllowedRecipients(
+        address _trustedCaller,
+        address _allowedRecipientsRegistry,
+        address _token,
+        address _finance,
+        address _easyTrack
+    ) public returns (TopUpAllowedRecipientsSingleTokenInitializable topUpAllowedRecipients) {
+        topUpAllowedRecipients = TopUpAllowedRecipientsSingleTokenInitializable(
+            Clones.clone(topUpAllowedRecipientsImplementation)
+        );
+        topUpAllowedRecipients.initialize(
+            _trustedCaller,
+            _allowedRecipientsRegistry,
+            _finance,
+            _token,
+            _easyTrack
+        );
+
+        emit TopUpAllowedRecipientsDeployed(
+            msg.sender,
+            address(topUpAllowedRecipients),
+            _trustedCaller,
+            _allowedRecipientsRegistry,
+            _finance,
+            _token,
+            _easyTrack
+        );
+    }
+
+    function deployAddAllowedRecipient(address _trustedCaller, address _allowedRecipientsRegistry)
+        public
+        returns (AddAllowedRecipientInitializable addAllowedRecipient)
+    {
+        addAllowedRecipient = AddAllowedRecipientInitializable(
+            Clones.clone(addAllowedRecipientImplementation)
+        );
+        addAllowedRecipient.initialize(_trustedCaller, _allowedRecipientsRegistry);
+
+        emit AddAllowedRecipientDeployed(
+            msg.sender,
+            address(addAllowedRecipient),
+            _trustedCaller,
+            _allowedRecipientsRegistry
+        );
+    }
+
+    function deployRemoveAllowedRecipient(
+        address _trustedCaller,
+        address _allowedRecipientsRegistry
+    ) public returns (RemoveAllowedRecipientInitializable removeAllowedRecipient) {
+        removeAllowedRecipient = RemoveAllowedRecipientInitializable(
+            Clones.clone(removeAllowedRecipientImplementation)
+        );
+        removeAllowedRecipient.initialize(_trustedCaller, _allowedRecipientsRegistry);
+
+        emit RemoveAllowedRecipientDeployed(
+            msg.sender,
+            address(removeAllowedRecipient),
+            _trustedCaller,
+            _allowedRecipientsRegistry
+        );
+    }
+}
@@ -6,21 +6,12 @@ pragma solidity ^0.8.4;
 import "contracts/TrustedCaller.sol";
 import "contracts/AllowedRecipientsRegistry.sol";
 import "contracts/interfaces/IFinance.sol";
-import "contracts/libraries/EVMScriptCreator.sol";
 import "contracts/interfaces/IEVMScriptFactory.sol";
 import "contracts/EasyTrack.sol";
+import "./TopUpAllowedRecipientsSingleTokenUtils.sol";
 
 /// @notice Creates EVMScript to top up allowed recipients addresses within the current spendable balance
 contract TopUpAllowedRecipientsSingleToken is TrustedCaller, IEVMScriptFactory {
-    // -------------
-    // ERRORS
-    // -------------
-    string private constant ERROR_LENGTH_MISMATCH = "LENGTH_MISMATCH";
-    string private constant ERROR_EMPTY_DATA = "EMPTY_DATA";
-    string private constant ERROR_ZERO_AMOUNT = "ZERO_AMOUNT";
-    string private constant ERROR_RECIPIENT_NOT_ALLOWED = "RECIPIENT_NOT_ALLOWED";
-    string private constant ERROR_SUM_EXCEEDS_SPENDABLE_BALANCE = "SUM_EXCEEDS_SPENDABLE_BALANCE";
-
     // -------------
     // VARIABLES
     // -------------
@@ -69,7 +60,7 @@ contract TopUpAllowedRecipientsSingleToken is TrustedCaller, IEVMScriptFactory {
     /// @param _evmScriptCallData Encoded tuple: (address[] recipients, uint256[] amounts) where
     /// recipients - addresses of recipients to top up
     /// amounts - corresponding amounts of token to transfer
-    /// @dev note that the arrays below has one extra element to store limit enforcement calls
+    /// @dev the EVMScript has one extra call to updateSpentAmount() to enforce the limits
     function createEVMScript(address _creator, bytes memory _evmScriptCallData)
         external
         view
@@ -77,31 +68,14 @@ contract TopUpAllowedRecipientsSingleToken is TrustedCaller, IEVMScriptFactory {
         onlyTrustedCaller(_creator)
         returns (bytes memory)
     {
-        (address[] memory recipients, uint256[] memory amounts) = _decodeEVMScriptCallData(
-            _evmScriptCallData
-        );
-        uint256 totalAmount = _validateEVMScriptCallData(recipients, amounts);
-
-        address[] memory to = new address[](recipients.length + 1);
-        bytes4[] memory methodIds = new bytes4[](recipients.length + 1);
-        bytes[] memory evmScriptsCalldata = new bytes[](recipients.length + 1);
-
-        to[0] = address(allowedRecipientsRegistry);
-        methodIds[0] = allowedRecipientsRegistry.updateSpentAmount.selector;
-        evmScriptsCalldata[0] = abi.encode(totalAmount);
-
-        for (uint256 i = 0; i < recipients.length; ++i) {
-            to[i + 1] = address(finance);
-            methodIds[i + 1] = finance.newImmediatePayment.selector;
-            evmScriptsCalldata[i + 1] = abi.encode(
+        return
+            TopUpAllowedRecipientsSingleTokenUtils.createEVMScript(
+                allowedRecipientsRegistry,
+                finance,
+                easyTrack,
                 token,
-                recipients[i],
-                amounts[i],
-                "Easy Track: top up recipient"
+                _evmScriptCallData
             );
-        }
-
-        return EVMScriptCreator.createEVMScript(to, methodIds, evmScriptsCalldata);
     }
 
     /// @notice Decodes call data used by createEVMScript method
@@ -115,45 +89,6 @@ contract TopUpAllowedRecipientsSingleToken is TrustedCaller, IEVMScriptFactory {
         pure
         returns (address[] memory recipients, uint256[] memory amounts)
     {
-        return _decodeEVMScriptCallData(_evmScriptCallData);
-    }
-
-    // ------------------
-    // PRIVATE METHODS
-    // ------------------
-
-    function _validateEVMScriptCallData(address[] memory _recipients, uint256[] memory _amounts)
-        private
-        view
-        returns (uint256 totalAmount)
-    {
-        require(_amounts.length == _recipients.length, ERROR_LENGTH_MISMATCH);
-        require(_recipients.length > 0, ERROR_EMPTY_DATA);
-
-        for (uint256 i = 0; i < _recipients.length; ++i) {
-            require(_amounts[i] > 0, ERROR_ZERO_AMOUNT);
-            require(
-                allowedRecipientsRegistry.isRecipientAllowed(_recipients[i]),
-                ERROR_RECIPIENT_NOT_ALLOWED
-            );
-            totalAmount += _amounts[i];
-        }
-
-        _validateSpendableBalance(totalAmount);
-    }
-
-    function _decodeEVMScriptCallData(bytes memory _evmScriptCallData)
-        private
-        pure
-        returns (address[] memory recipients, uint256[] memory amounts)
-    {
-        return abi.decode(_evmScriptCallData, (address[], uint256[]));
-    }
-
-    function _validateSpendableBalance(uint256 _amount) private view {
-        require(
-            allowedRecipientsRegistry.isUnderSpendableBalance(_amount, easyTrack.motionDuration()),
-            ERROR_SUM_EXCEEDS_SPENDABLE_BALANCE
-        );
+        return TopUpAllowedRecipientsSingleTokenUtils.decodeEVMScriptCallData(_evmScriptCallData);
     }
 }
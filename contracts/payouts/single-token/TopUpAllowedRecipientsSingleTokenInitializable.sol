@@ -0,0 +1,96 @@
+// SPDX-FileCopyrightText: 2025 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity ^0.8.4;
+
+import "contracts/TrustedCallerInitializable.sol";
+import "contracts/AllowedRecipientsRegistry.sol";
+import "contracts/interfaces/IFinance.sol";
+import "contracts/interfaces/IEVMScriptFactory.sol";
+import "contracts/EasyTrack.sol";
+import "./TopUpAllowedRecipientsSingleTokenUtils.sol";
+
+/// @notice Version of TopUpAllowedRecipientsSingleToken used as implementation of minimal proxy
+///     (EIP-1167) clones deployed by AllowedRecipientsCloneFactorySingleToken
+contract TopUpAllowedRecipientsSingleTokenInitializable is
+    TrustedCallerInitializable,
+    IEVMScriptFactory
+{
+    // -------------
+    // VARIABLES
+    // -------------
+
+    /// @notice Address of EasyTrack contract
+    EasyTrack public easyTrack;
+
+    /// @notice Address of Aragon's Finance contract
+    IFinance public finance;
+
+    /// @notice Address of payout token
+    address public token;
+
+    /// @notice Address of AllowedRecipientsRegistry contract
+    AllowedRecipientsRegistry public allowedRecipientsRegistry;
+
+    // -------------
+    // EXTERNAL METHODS
+    // -------------
+
+    /// @notice Sets up the clone. Can be called only once
+    /// @param _trustedCaller Address that has access to certain methods.
+    ///     Set once on initialization and can't be changed.
+    /// @param _allowedRecipientsRegistry Address of AllowedRecipientsRegistry contract
+    /// @param _finance Address of Aragon's Finance contract
+    /// @param _token Address of payout token
+    /// @param _easyTrack Address of EasyTrack contract
+    function initialize(
+        address _trustedCaller,
+        address _allowedRecipientsRegistry,
+        address _finance,
+        address _token,
+        address _easyTrack
+    ) external initializer {
+        _initializeTrustedCaller(_trustedCaller);
+        finance = IFinance(_finance);
+        token = _token;
+        allowedRecipientsRegistry = AllowedRecipientsRegistry(_allowedRecipientsRegistry);
+        easyTrack = EasyTrack(_easyTrack);
+    }
+
+    /// @notice Creates EVMScript to top up allowed recipients addresses
+    /// @param _creator Address who creates EVMScript
+    /// @param _evmScriptCallData Encoded tuple: (address[] recipients, uint256[] amounts) where
+    /// recipients - addresses of recipients to top up
+    /// amounts - corresponding amounts of token to transfer
+    /// @dev the EVMScript has one extra call to updateSpentAmount() to enforce the limits
+    function createEVMScript(address _creator, bytes memory _evmScriptCallData)
+        external
+        view
+        override
+        onlyTrustedCaller(_creator)
+        returns (bytes memory)
+    {
+        return
+            TopUpAllowedRecipientsSingleTokenUtils.createEVMScript(
+                allowedRecipientsRegistry,
+                finance,
+                easyTrack,
+                token,
+                _evmScriptCallData
+            );
+    }
+
+    /// @notice Decodes call data used by createEVMScript method
+    /// @param _evmScriptCallData Encoded tuple: (address[] recipients, uint256[] amounts) where
+    /// recipients - addresses of recipients to top up
+    /// amounts - corresponding amounts of token to transfer
+    /// @return recipients Addresses of recipients to top up
+    /// @return amounts Amounts of token to transfer
+    function decodeEVMScriptCallData(bytes memory _evmScriptCallData)
+        external
+        pure
+        returns (address[] memory recipients, uint256[] memory amounts)
+    {
+        return TopUpAllowedRecipientsSingleTokenUtils.decodeEVMScriptCallData(_evmScriptCallData);
+    }
+}
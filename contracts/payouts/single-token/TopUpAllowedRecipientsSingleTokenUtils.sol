@@ -0,0 +1,58 @@
+// SPDX-FileCopyrightText: 2025 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity ^0.8.4;
+
+import "contracts/AllowedRecipientsRegistry.sol";
+import "contracts/interfaces/IFinance.sol";
+import "contracts/EasyTrack.sol";
+import "contracts/payouts/TopUpAllowedRecipientsCommonUtils.sol";
+
+/// @notice Validation and creation of top up EVMScripts shared by TopUpAllowedRecipientsSingleToken
+///     and TopUpAllowedRecipientsSingleTokenInitializable
+library TopUpAllowedRecipientsSingleTokenUtils {
+    /// @notice Validates call data and creates EVMScript to top up allowed recipients addresses
+    /// @param _evmScriptCallData Encoded tuple: (address[] recipients, uint256[] amounts)
+    /// @dev the EVMScript has one extra call to updateSpentAmount() to enforce the limits
+    function createEVMScript(
+        AllowedRecipientsRegistry _allowedRecipientsRegistry,
+        IFinance _finance,
+        EasyTrack _easyTrack,
+        address _token,
+        bytes memory _evmScriptCallData
+    ) internal view returns (bytes memory) {
+        (address[] memory recipients, uint256[] memory amounts) = decodeEVMScriptCallData(
+            _evmScriptCallData
+        );
+        IAllowedRecipientsRegistry allowedRecipientsRegistry = IAllowedRecipientsRegistry(
+            address(_allowedRecipientsRegistry)
+        );
+
+        uint256 totalAmount = TopUpAllowedRecipientsCommonUtils.sumAmounts(recipients, amounts);
+        TopUpAllowedRecipientsCommonUtils.validateRecipientsAndLimit(
+            allowedRecipientsRegistry,
+            recipients,
+            totalAmount,
+            _easyTrack.motionDuration()
+        );
+
+        return
+            TopUpAllowedRecipientsCommonUtils.createTopUpEVMScript(
+                allowedRecipientsRegistry,
+                _finance,
+                _token,
+                recipients,
+                amounts,
+                totalAmount
+            );
+    }
+
+    /// @notice Decodes call data used by createEVMScript method
+    function decodeEVMScriptCallData(bytes memory _evmScriptCallData)
+        internal
+        pure
+        returns (address[] memory recipients, uint256[] memory amounts)
+    {
+        return abi.decode(_evmScriptCallData, (address[], uint256[]));
+    }
+}
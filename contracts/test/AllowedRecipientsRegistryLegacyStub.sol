@@ -0,0 +1,20 @@
+// SPDX-FileCopyrightText: 2025 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity ^0.8.4;
+
+/// @notice Helper contract with stub implementation of AllowedRecipientsRegistry deployed
+///     before areRecipientsAllowed() was added
+contract AllowedRecipientsRegistryLegacyStub {
+    mapping(address => bool) public isRecipientAllowed;
+
+    function addRecipient(address _recipient, string memory) external {
+        isRecipientAllowed[_recipient] = true;
+    }
+
+    function updateSpentAmount(uint256) external {}
+
+    function isUnderSpendableBalance(uint256, uint256) external pure returns (bool) {
+        return true;
+    }
+}
@@ -8,6 +8,26 @@ import "../libraries/EVMScriptPermissions.sol";
 /// @author psirex
 /// @notice Helper contract to test internal methods of EVMScriptPermissions library
 contract EVMScriptPermissionsWrapper {
+    using EVMScriptPermissions for bytes;
+
+    mapping(bytes24 => bool) internal permissionsSet;
+
+    function addToPermissionsSet(bytes memory _permissions) external {
+        _permissions.addToPermissionsSet(permissionsSet);
+    }
+
+    function removeFromPermissionsSet(bytes memory _permissions) external {
+        _permissions.removeFromPermissionsSet(permissionsSet);
+    }
+
+    function canExecuteEVMScriptWithPermissionsSet(bytes memory _evmScript)
+        external
+        view
+        returns (bool)
+    {
+        return EVMScriptPermissions.canExecuteEVMScript(permissionsSet, _evmScript);
+    }
+
     function canExecuteEVMScript(bytes memory _permissions, bytes memory _evmScript)
         external
         pure
@@ -0,0 +1,27 @@
+// SPDX-FileCopyrightText: 2025 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity ^0.8.4;
+
+/// @notice Helper contract with stub implementation of MiniMe governance token.
+///     Balances and total supply are the same at every block and can be changed at any time
+contract GovernanceTokenStub {
+    uint256 public totalSupply;
+    mapping(address => uint256) public balanceOf;
+
+    function setTotalSupply(uint256 _totalSupply) external {
+        totalSupply = _totalSupply;
+    }
+
+    function setBalance(address _owner, uint256 _balance) external {
+        balanceOf[_owner] = _balance;
+    }
+
+    function balanceOfAt(address _owner, uint256) external view returns (uint256) {
+        return balanceOf[_owner];
+    }
+
+    function totalSupplyAt(uint256) external view returns (uint256) {
+        return totalSupply;
+    }
+}
@@ -35,4 +35,17 @@ contract LimitsCheckerWithPrivateViewsExposed is LimitsChecker {
     function getPeriodEndFromTimestamp(uint256 _timestamp) public view returns (uint256) {
         return _getPeriodEndFromTimestamp(_timestamp);
     }
+
+    function getPeriodRangesFromTimestamps(uint256[] memory _timestamps)
+        public
+        view
+        returns (uint256[] memory _periodStarts, uint256[] memory _periodEnds)
+    {
+        _periodStarts = new uint256[](_timestamps.length);
+        _periodEnds = new uint256[](_timestamps.length);
+        for (uint256 i = 0; i < _timestamps.length; ++i) {
+            _periodStarts[i] = _getPeriodStartFromTimestamp(_timestamps[i]);
+            _periodEnds[i] = _getPeriodEndFromTimestamp(_timestamps[i]);
+        }
+    }
 }
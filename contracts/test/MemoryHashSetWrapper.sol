@@ -0,0 +1,50 @@
+// SPDX-FileCopyrightText: 2025 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity ^0.8.4;
+
+import "../libraries/MemoryHashSet.sol";
+
+/// @notice Helper contract to test internal methods of MemoryHashSet library
+library MemoryHashSetWrapper {
+    function findFirstDuplicate(bytes32[] memory _keys) external pure returns (uint256) {
+        return MemoryHashSet.findFirstDuplicate(_keys);
+    }
+
+    function findFirstDuplicateAddress(address[] memory _addresses)
+        external
+        pure
+        returns (uint256)
+    {
+        return MemoryHashSet.findFirstDuplicate(_addresses);
+    }
+
+    function containsAll(bytes32[] memory _keys, bytes32[] memory _lookupKeys)
+        external
+        pure
+        returns (bool[] memory _contains)
+    {
+        MemoryHashSet.HashSet memory set = MemoryHashSet.fromKeys(_keys);
+        _contains = new bool[](_lookupKeys.length);
+        for (uint256 i = 0; i < _lookupKeys.length; ++i) {
+            _contains[i] = MemoryHashSet.contains(set, _lookupKeys[i]);
+        }
+    }
+
+    /// @dev Nested loops used by EVMScript factories before MemoryHashSet, kept as a
+    ///     reference for the tests and the gas benchmark
+    function findFirstDuplicateWithNestedLoops(bytes32[] memory _keys)
+        external
+        pure
+        returns (uint256)
+    {
+        for (uint256 i = 0; i < _keys.length; ++i) {
+            for (uint256 j = i + 1; j < _keys.length; ++j) {
+                if (_keys[i] == _keys[j]) {
+                    return i;
+                }
+            }
+        }
+        return _keys.length;
+    }
+}
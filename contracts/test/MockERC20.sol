@@ -10,4 +10,8 @@ contract MockERC20 {
     constructor(uint8 _decimals) {
         decimals = _decimals;
     }
+
+    function setDecimals(uint8 _decimals) external {
+        decimals = _decimals;
+    }
 }
\ No newline at end of file
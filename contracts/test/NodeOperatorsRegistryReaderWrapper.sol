@@ -0,0 +1,20 @@
+// SPDX-FileCopyrightText: 2025 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity 0.8.6;
+
+import "../libraries/NodeOperatorsRegistryReader.sol";
+
+/// @notice Helper contract to test internal methods of NodeOperatorsRegistryReader library
+contract NodeOperatorsRegistryReaderWrapper {
+    function getNodeOperatorSummary(
+        INodeOperatorsRegistry _nodeOperatorsRegistry,
+        uint256 _nodeOperatorId
+    ) external view returns (NodeOperatorsRegistryReader.NodeOperatorSummary memory) {
+        return
+            NodeOperatorsRegistryReader.getNodeOperatorSummary(
+                _nodeOperatorsRegistry,
+                _nodeOperatorId
+            );
+    }
+}
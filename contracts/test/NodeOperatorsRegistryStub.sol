@@ -11,6 +11,7 @@ contract NodeOperatorsRegistryStub {
     address public rewardAddress;
     uint64 public stakingLimit = 200;
     uint64 public totalSigningKeys = 400;
+    uint256 public nodeOperatorsCount = 1;
 
     constructor(address _rewardAddress) {
         rewardAddress = _rewardAddress;
@@ -35,6 +36,10 @@ contract NodeOperatorsRegistryStub {
         _totalSigningKeys = totalSigningKeys;
     }
 
+    function getNodeOperatorsCount() external view returns (uint256) {
+        return nodeOperatorsCount;
+    }
+
     function setNodeOperatorStakingLimit(uint256 _id, uint64 _stakingLimit) external {
         stakingLimit = _stakingLimit;
     }
@@ -58,4 +63,8 @@ contract NodeOperatorsRegistryStub {
     function setTotalSigningKeys(uint64 _totalSigningKeys) public {
         totalSigningKeys = _totalSigningKeys;
     }
+
+    function setNodeOperatorsCount(uint256 _nodeOperatorsCount) public {
+        nodeOperatorsCount = _nodeOperatorsCount;
+    }
 }
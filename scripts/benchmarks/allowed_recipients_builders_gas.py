@@ -0,0 +1,88 @@
+"""Deploy gas of allowed recipients setups with full contracts and minimal proxy clones
+
+Run with `brownie run scripts/benchmarks/allowed_recipients_builders_gas.py`
+
+Deploys AllowedRecipientsBuilder and AllowedRecipientsBuilderSingleToken twice on the development
+network: with the factories deploying full contracts and with the factories deploying EIP-1167
+clones of the implementations. The registries call BokkyPooBahsDateTimeContract deployed on
+the development network. Reports the gas used by deployFullSetup() and
+deploySingleRecipientTopUpOnlySetup() of every builder and the one-off cost of the clone factory
+deployment including the implementations.
+"""
+
+from brownie import (
+    accounts,
+    history,
+    AllowedRecipientsBuilder,
+    AllowedRecipientsBuilderSingleToken,
+    AllowedRecipientsFactory,
+    AllowedRecipientsFactorySingleToken,
+    EasyTrack,
+    MockERC20,
+)
+
+from utils import deployed_date_time, deployment
+
+MOTION_DURATION = 72 * 60 * 60
+LIMIT = 10_000 * 10**18
+PERIOD_DURATION_MONTHS = 3
+RECIPIENTS_COUNT = 5
+
+
+def deploy_gas(deploy):
+    """Returns the result of deploy() and the gas used by the transactions sent by it"""
+    transactions_count = len(history)
+    result = deploy()
+    return result, sum(tx.gas_used for tx in history[transactions_count:])
+
+
+def main():
+    deployer = accounts[0]
+    finance = accounts[1]
+    evm_script_executor = accounts[2]
+    trusted_caller = accounts[3]
+    tx_params = {"from": deployer}
+
+    token = deployer.deploy(MockERC20, 18)
+    easy_track = deployer.deploy(EasyTrack, token, deployer, MOTION_DURATION, 20, 50)
+    easy_track.setEVMScriptExecutor(evm_script_executor, tx_params)
+    date_time_contract = deployed_date_time.deploy_date_time_contract(deployer)
+
+    recipients = [accounts.add().address for _ in range(RECIPIENTS_COUNT)]
+    titles = [f"Recipient #{i}" for i in range(RECIPIENTS_COUNT)]
+
+    multi_token_factory, full_factory_gas = deploy_gas(lambda: AllowedRecipientsFactory.deploy(tx_params))
+    multi_token_clone_factory, clone_factory_gas = deploy_gas(
+        lambda: deployment.deploy_allowed_recipients_clone_factory(tx_params)
+    )
+    print("Multi token")
+    print(f"  factory deploy: full {full_factory_gas}, clones (with implementations) {clone_factory_gas}")
+    for factory_name, factory in [("full", multi_token_factory), ("clones", multi_token_clone_factory)]:
+        builder = AllowedRecipientsBuilder.deploy(factory, deployer, easy_track, finance, date_time_contract, tx_params)
+        full_setup = builder.deployFullSetup(
+            trusted_caller, LIMIT, PERIOD_DURATION_MONTHS, [token], recipients, titles, 0, tx_params
+        )
+        single_recipient_setup = builder.deploySingleRecipientTopUpOnlySetup(
+            recipients[0], titles[0], [token], LIMIT, PERIOD_DURATION_MONTHS, 0, tx_params
+        )
+        print(f"  {factory_name:>6}: deployFullSetup() {full_setup.gas_used}, ", end="")
+        print(f"deploySingleRecipientTopUpOnlySetup() {single_recipient_setup.gas_used}")
+
+    single_token_factory, full_factory_gas = deploy_gas(lambda: AllowedRecipientsFactorySingleToken.deploy(tx_params))
+    single_token_clone_factory, clone_factory_gas = deploy_gas(
+        lambda: deployment.deploy_allowed_recipients_clone_factory_single_token(tx_params)
+    )
+    print("Single token")
+    print(f"  factory deploy: full {full_factory_gas}, clones (with implementations) {clone_factory_gas}")
+    for factory_name, factory in [("full", single_token_factory), ("clones", single_token_clone_factory)]:
+        builder = AllowedRecipientsBuilderSingleToken.deploy(
+            factory, deployer, easy_track, finance, date_time_contract, tx_params
+        )
+        full_setup = builder.deployFullSetup(
+            trusted_caller, token, LIMIT, PERIOD_DURATION_MONTHS, recipients, titles, 0, tx_params
+        )
+        single_recipient_setup = builder.deploySingleRecipientTopUpOnlySetup(
+            recipients[0], titles[0], token, LIMIT, PERIOD_DURATION_MONTHS, 0, tx_params
+        )
+        print(f"  {factory_name:>6}: deployFullSetup() {full_setup.gas_used}, ", end="")
+        print(f"deploySingleRecipientTopUpOnlySetup() {single_recipient_setup.gas_used}")
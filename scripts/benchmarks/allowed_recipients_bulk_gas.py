@@ -0,0 +1,47 @@
+"""Gas comparison of N single addRecipient()/removeRecipient() calls vs one addRecipients()/removeRecipients()
+
+Run with `brownie run scripts/benchmarks/allowed_recipients_bulk_gas.py`
+
+Recipients are added to and removed from a fresh AllowedRecipientsRegistry. The single calls
+are sent as separate transactions, so their total includes the base cost of every transaction,
+the same as N separate motions would pay when each of them is enacted.
+"""
+
+from brownie import accounts, AllowedRecipientsRegistry
+
+RECIPIENTS_COUNTS = [1, 5, 10, 25, 50]
+RECIPIENT_TITLE = "Allowed Recipient"
+
+
+def main():
+    deployer = accounts[0]
+    registry = deployer.deploy(
+        AllowedRecipientsRegistry,
+        deployer,
+        [deployer],
+        [deployer],
+        [],
+        [],
+        # the date time contract is not used by the adding and removing of recipients
+        deployer,
+    )
+    tx_params = {"from": deployer}
+
+    print(f"{'recipients':>10} {'add single':>11} {'add batch':>10} {'remove single':>14} {'remove batch':>13}")
+    for recipients_count in RECIPIENTS_COUNTS:
+        recipients = [accounts.add().address for _ in range(recipients_count)]
+        titles = [RECIPIENT_TITLE] * recipients_count
+
+        add_single_gas = sum(
+            registry.addRecipient(recipient, title, tx_params).gas_used for recipient, title in zip(recipients, titles)
+        )
+        remove_single_gas = sum(registry.removeRecipient(recipient, tx_params).gas_used for recipient in recipients)
+
+        add_batch_gas = registry.addRecipients(recipients, titles, tx_params).gas_used
+        remove_batch_gas = registry.removeRecipients(recipients, tx_params).gas_used
+        assert len(registry.getAllowedRecipients()) == 0
+
+        print(
+            f"{recipients_count:>10} {add_single_gas:>11} {add_batch_gas:>10} "
+            f"{remove_single_gas:>14} {remove_batch_gas:>13}"
+        )
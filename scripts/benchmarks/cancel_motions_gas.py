@@ -0,0 +1,56 @@
+"""Gas per canceled motion of EasyTrack.cancelAllMotions() and EasyTrack.cancelAllMotionsBounded()
+
+Run with `brownie run scripts/benchmarks/cancel_motions_gas.py`
+
+Objections aren't used, so the script runs on the development network without the LDO token.
+The number of active motions is limited by EasyTrack.MAX_MOTIONS_LIMIT.
+"""
+
+from brownie import accounts, chain, EasyTrack, EVMScriptFactoryStub
+
+ACTIVE_MOTIONS_COUNTS = [1, 5, 10, 20, 24]
+BATCH_SIZES = [1, 5, 10]
+MIN_MOTION_DURATION = 48 * 60 * 60
+OBJECTIONS_THRESHOLD = 50
+
+
+def create_motions(easy_track, evm_script_factory, motions_count, creator):
+    for _ in range(motions_count):
+        easy_track.createMotion(evm_script_factory, b"", {"from": creator})
+
+
+def main():
+    deployer = accounts[0]
+    easy_track = deployer.deploy(
+        EasyTrack,
+        deployer,
+        deployer,
+        MIN_MOTION_DURATION,
+        0,
+        OBJECTIONS_THRESHOLD,
+    )
+    easy_track.setMotionsCountLimit(easy_track.MAX_MOTIONS_LIMIT(), {"from": deployer})
+    evm_script_factory = deployer.deploy(EVMScriptFactoryStub)
+    easy_track.addEVMScriptFactory(evm_script_factory, evm_script_factory.DEFAULT_PERMISSIONS(), {"from": deployer})
+
+    print(f"{'motions':>7} {'batch':>6} {'txs':>4} {'max tx gas':>11} {'gas per motion':>15}")
+    for motions_count in ACTIVE_MOTIONS_COUNTS:
+        chain.snapshot()
+        create_motions(easy_track, evm_script_factory, motions_count, deployer)
+        tx = easy_track.cancelAllMotions({"from": deployer})
+        print(f"{motions_count:>7} {'all':>6} {1:>4} {tx.gas_used:>11} {tx.gas_used // motions_count:>15}")
+        chain.revert()
+
+        for batch_size in BATCH_SIZES:
+            if batch_size > motions_count:
+                continue
+            chain.snapshot()
+            create_motions(easy_track, evm_script_factory, motions_count, deployer)
+            gas_used = []
+            while len(easy_track.getMotions()) > 0:
+                gas_used.append(easy_track.cancelAllMotionsBounded(batch_size, {"from": deployer}).gas_used)
+            chain.revert()
+            print(
+                f"{motions_count:>7} {batch_size:>6} {len(gas_used):>4} {max(gas_used):>11} "
+                f"{sum(gas_used) // motions_count:>15}"
+            )
@@ -0,0 +1,59 @@
+"""Gas costs of the input validation against duplicates in EVMScript factories
+
+Run with `brownie run scripts/benchmarks/duplicates_validation_gas.py`
+
+For 10, 50 and 100 entries the script reports the execution gas of:
+  - the search of duplicated manager addresses (AddNodeOperators, ActivateNodeOperators,
+    ChangeNodeOperatorManagers) with MemoryHashSet and with the nested loops used before
+  - MEVBoostRelaysInputUtils.validateRelays() and validateRelayURIs() when the current
+    relay list has the same number of relays. Inputs are built from the relays
+    of the mev_boost_relay_test_config fixture used by tests/evm_script_factories.
+    To compare with the nested loops, run the script on the revision before MemoryHashSet
+    with the manager addresses part removed.
+"""
+
+from brownie import accounts, MemoryHashSetWrapper, MEVBoostRelaysInputUtilsWrapper
+
+ENTRIES_COUNTS = [10, 50, 100]
+TEST_RELAYS = [
+    # uri, operator, is_mandatory, description
+    ("https://relay1.example.com", "Operator 1", True, "First relay description"),
+    ("https://relay2.example.com", "Operator 2", False, "Second relay description"),
+    ("https://relay3.example.com", "Operator 3", True, "Third relay description"),
+]
+
+
+def make_relays(count, prefix):
+    relays = []
+    for i in range(count):
+        uri, operator, is_mandatory, description = TEST_RELAYS[i % len(TEST_RELAYS)]
+        relays.append((uri.replace("https://", f"https://{prefix}{i}."), operator, is_mandatory, description))
+    return relays
+
+
+def execution_gas(contract_call, *args):
+    return contract_call.estimate_gas(*args) - 21_000
+
+
+def main():
+    deployer = accounts[0]
+    hash_set_wrapper = deployer.deploy(MemoryHashSetWrapper)
+    relays_wrapper = deployer.deploy(MEVBoostRelaysInputUtilsWrapper)
+
+    print(f"{'entries':>7} {'managers nested':>16} {'managers hash set':>18} {'add relays':>11} {'remove relays':>14}")
+    for entries_count in ENTRIES_COUNTS:
+        managers = [accounts.add().address for _ in range(entries_count)]
+        manager_keys = ["0x" + manager[2:].lower().rjust(64, "0") for manager in managers]
+        nested_gas = execution_gas(hash_set_wrapper.findFirstDuplicateWithNestedLoops, manager_keys)
+        hash_set_gas = execution_gas(hash_set_wrapper.findFirstDuplicateAddress, managers)
+
+        current_relays = make_relays(entries_count, "current")
+        new_relays = make_relays(entries_count, "new")
+        add_relays_gas = execution_gas(relays_wrapper.validateRelays, new_relays, current_relays, False)
+        remove_relays_gas = execution_gas(
+            relays_wrapper.validateRelayURIs, [relay[0] for relay in current_relays], current_relays
+        )
+
+        print(
+            f"{entries_count:>7} {nested_gas:>16} {hash_set_gas:>18} {add_relays_gas:>11} {remove_relays_gas:>14}"
+        )
@@ -0,0 +1,83 @@
+"""Micro-benchmark of utils.evm_script_codec against the legacy hex-string encoder
+
+Run with `brownie run scripts/benchmarks/evm_script_codec.py` or `python -m scripts.benchmarks.evm_script_codec`
+"""
+
+import os
+import timeit
+
+import eth_abi
+
+from utils import evm_script_codec
+
+ACTIONS_COUNTS = [1, 10, 100, 1000]
+CALLDATA_SIZE = 4 + 32 * 4
+
+
+def legacy_encode_call_script(actions, spec_id=1):
+    """Copy of utils.evm_script.encode_call_script before the codec was introduced"""
+    result = "0x" + str(spec_id).zfill(8)
+    for to, calldata in actions:
+        addr_bytes = to[2:].lower()
+        calldata_bytes = calldata[2:] if calldata[0:2] == "0x" else calldata
+        length = eth_abi.encode(["uint32"], [len(calldata_bytes) // 2]).hex()
+        result += addr_bytes + length[56:] + calldata_bytes
+    return result
+
+
+def legacy_decode_call_script(evm_script):
+    """Typical ad-hoc parser of hex EVMScripts"""
+    evm_script = evm_script[2:]
+    actions = []
+    location = 8
+    while location < len(evm_script):
+        to = "0x" + evm_script[location : location + 40]
+        length = int(evm_script[location + 40 : location + 48], 16)
+        calldata = "0x" + evm_script[location + 48 : location + 48 + length * 2]
+        actions.append((to, calldata))
+        location += 48 + length * 2
+    return actions
+
+
+def make_actions(count):
+    return [("0x" + os.urandom(20).hex(), "0x" + os.urandom(CALLDATA_SIZE).hex()) for _ in range(count)]
+
+
+def measure(fn, *args):
+    timer = timeit.Timer(lambda: fn(*args))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number
+
+
+def main():
+    print(f"{'actions':>8} {'op':>8} {'legacy, us':>12} {'codec, us':>12} {'speedup':>8}")
+    for count in ACTIONS_COUNTS:
+        actions = make_actions(count)
+        evm_script = legacy_encode_call_script(actions)
+        assert evm_script_codec.encode_call_script(actions) == evm_script
+        decoded_actions = evm_script_codec.decode_call_script(evm_script)[1]
+        # the legacy parser returns lowercase addresses, the codec returns checksummed ones
+        assert [(to.lower(), calldata) for to, calldata in decoded_actions] == legacy_decode_call_script(evm_script)
+
+        evm_script_bytes = bytes.fromhex(evm_script[2:])
+        results = [
+            (
+                "encode",
+                measure(legacy_encode_call_script, actions),
+                measure(evm_script_codec.build_call_script, actions),
+            ),
+            (
+                "decode",
+                measure(legacy_decode_call_script, evm_script),
+                measure(lambda script: list(evm_script_codec.iter_call_script(script)), evm_script_bytes),
+            ),
+        ]
+        for op, legacy_time, codec_time in results:
+            print(
+                f"{count:>8} {op:>8} {legacy_time * 1e6:>12.1f} {codec_time * 1e6:>12.1f} "
+                f"{legacy_time / codec_time:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
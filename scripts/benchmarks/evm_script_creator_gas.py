@@ -0,0 +1,36 @@
+"""Gas scaling of EVMScriptCreator.createEVMScript() with the number of calls
+
+Run with `brownie run scripts/benchmarks/evm_script_creator_gas.py`
+
+Gas per call stays flat when the EVMScript is built in one allocation and grows
+with the number of calls when memory is re-allocated for every call.
+To compare implementations run the script on both revisions of the library.
+"""
+
+import os
+
+from brownie import accounts, EVMScriptCreatorWrapper
+
+CALLS_COUNTS = [1, 10, 50, 100, 200, 500]
+CALLDATA_ARGS_SIZE = 32 * 2
+
+
+def main():
+    wrapper = EVMScriptCreatorWrapper.deploy({"from": accounts[0]})
+
+    print(f"{'calls':>6} {'same method':>12} {'different contracts':>20} {'gas per call':>13}")
+    for calls_count in CALLS_COUNTS:
+        to = ["0x" + os.urandom(20).hex() for _ in range(calls_count)]
+        method_ids = ["0x" + os.urandom(4).hex() for _ in range(calls_count)]
+        call_data = ["0x" + os.urandom(CALLDATA_ARGS_SIZE).hex() for _ in range(calls_count)]
+
+        same_method_gas = wrapper.createEVMScript["address,bytes4,bytes[]"].estimate_gas(
+            to[0], method_ids[0], call_data
+        )
+        different_contracts_gas = wrapper.createEVMScript["address[],bytes4[],bytes[]"].estimate_gas(
+            to, method_ids, call_data
+        )
+        print(
+            f"{calls_count:>6} {same_method_gas:>12} {different_contracts_gas:>20} "
+            f"{different_contracts_gas // calls_count:>13}"
+        )
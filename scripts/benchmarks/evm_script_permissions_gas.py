@@ -0,0 +1,45 @@
+"""Gas comparison of EVMScript permissions validation: scan of packed permissions vs permissions set
+
+Run with `brownie run scripts/benchmarks/evm_script_permissions_gas.py --network mainnet-fork`
+
+Every call of the benchmarked EVMScript targets the last permission in the list,
+which is the worst case for the scan of the packed permissions. The wrapper receives packed
+permissions in calldata, while EVMScriptFactoriesRegistry loads them from storage, so the
+saving for registered factories is higher than reported.
+"""
+
+import os
+
+from brownie import accounts, EVMScriptPermissionsWrapper
+
+from utils.evm_script import encode_call_script
+
+PERMISSIONS_COUNTS = [1, 2, 4, 8, 16, 32, 64]
+CALLS_COUNTS = [1, 10, 25, 50, 100]
+CALLDATA_ARGS_SIZE = 32 * 2
+
+
+def make_permissions(count):
+    return [("0x" + os.urandom(20).hex(), os.urandom(4).hex()) for _ in range(count)]
+
+
+def main():
+    wrapper = EVMScriptPermissionsWrapper.deploy({"from": accounts[0]})
+
+    print(f"{'permissions':>11} {'calls':>6} {'packed scan':>12} {'set lookup':>11} {'saving':>8}")
+    for permissions_count in PERMISSIONS_COUNTS:
+        permissions_list = make_permissions(permissions_count)
+        permissions = "0x" + "".join(to[2:] + selector for to, selector in permissions_list)
+        wrapper.addToPermissionsSet(permissions, {"from": accounts[0]})
+
+        to, selector = permissions_list[-1]
+        for calls_count in CALLS_COUNTS:
+            calldata = "0x" + selector + os.urandom(CALLDATA_ARGS_SIZE).hex()
+            evm_script = encode_call_script([(to, calldata)] * calls_count)
+
+            packed_gas = wrapper.canExecuteEVMScript.estimate_gas(permissions, evm_script)
+            set_gas = wrapper.canExecuteEVMScriptWithPermissionsSet.estimate_gas(evm_script)
+            saving = 100 * (packed_gas - set_gas) / packed_gas
+            print(f"{permissions_count:>11} {calls_count:>6} {packed_gas:>12} {set_gas:>11} {saving:>7.1f}%")
+
+        wrapper.removeFromPermissionsSet(permissions, {"from": accounts[0]})
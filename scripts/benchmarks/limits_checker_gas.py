@@ -0,0 +1,46 @@
+"""Gas comparison of LimitsChecker period calculations: BokkyPooBahsDateTimeContract vs in-contract arithmetic
+
+Run with `brownie run scripts/benchmarks/limits_checker_gas.py --network mainnet-fork`
+
+Two LimitsChecker instances are deployed: one uses the deployed BokkyPooBahsDateTimeContract,
+another one is switched with setDateTimeArithmeticMode() to calculate period boundaries
+in-contract. For every period duration the script reports the gas used by updateSpentAmount()
+which advances the period (the enactment of the first top-up motion in the period), by
+updateSpentAmount() inside of the period and by the getPeriodState() view.
+"""
+
+from brownie import accounts, chain, network, LimitsChecker
+
+from utils import deployed_date_time, limits_calendar
+
+PERIOD_LIMIT = 10**24
+PAYOUT_AMOUNT = 10**18
+
+
+def measure(limits_checker, period_duration, tx_params):
+    limits_checker.setLimitParameters(PERIOD_LIMIT, period_duration, tx_params)
+    _, period_end = limits_calendar.period_range(chain.time(), period_duration)
+    chain.mine(1, period_end)
+
+    advance_gas = limits_checker.updateSpentAmount(PAYOUT_AMOUNT, tx_params).gas_used
+    in_period_gas = limits_checker.updateSpentAmount(PAYOUT_AMOUNT, tx_params).gas_used
+    view_gas = limits_checker.getPeriodState.estimate_gas() - 21_000
+    return advance_gas, in_period_gas, view_gas
+
+
+def main():
+    deployer = accounts[0]
+    tx_params = {"from": deployer}
+    date_time_contract = deployed_date_time.date_time_contract(network=network.show_active())
+
+    external_checker = deployer.deploy(LimitsChecker, [deployer], [deployer], date_time_contract)
+    in_contract_checker = deployer.deploy(LimitsChecker, [deployer], [deployer], date_time_contract)
+    in_contract_checker.setDateTimeArithmeticMode(True, tx_params)
+
+    print(f"{'months':>6} {'mode':>12} {'advance':>8} {'in period':>10} {'period state':>13}")
+    for period_duration in limits_calendar.PERIOD_DURATIONS_MONTHS:
+        for mode, limits_checker in [("external", external_checker), ("in-contract", in_contract_checker)]:
+            chain.snapshot()
+            advance_gas, in_period_gas, view_gas = measure(limits_checker, period_duration, tx_params)
+            chain.revert()
+            print(f"{period_duration:>6} {mode:>12} {advance_gas:>8} {in_period_gas:>10} {view_gas:>13}")
@@ -0,0 +1,44 @@
+"""Gas costs of motions creation with full and compact MotionCreated events
+
+Run with `brownie run scripts/benchmarks/motion_created_event_gas.py`
+
+Deploys EasyTrack with EVMScriptFactoryStub on the development network and reports the gas used
+by createMotion() for EVMScripts of different sizes with compactMotionCreatedEvent unset and set.
+Compact events don't contain the EVMScript, but emit an additional MotionEVMScriptHashed event,
+so they are cheaper only for EVMScripts longer than about a hundred bytes.
+"""
+
+from brownie import accounts, EasyTrack, EVMScriptFactoryStub, MockERC20
+
+EVM_SCRIPT_SIZES = [100, 500, 1_000, 5_000, 10_000]
+MOTION_DURATION = 72 * 60 * 60
+# EVMScript is a spec id followed by the actions. The stub doesn't validate it, so the content is arbitrary
+CALLS_SCRIPT_SPEC_ID = "00000001"
+
+
+def create_motion_gas(easy_track, evm_script_factory, creator):
+    tx = easy_track.createMotion(evm_script_factory, b"", {"from": creator})
+    easy_track.cancelMotion(tx.return_value, {"from": creator})
+    return tx.gas_used
+
+
+def main():
+    deployer = accounts[0]
+    tx_params = {"from": deployer}
+
+    token = deployer.deploy(MockERC20, 18)
+    easy_track = deployer.deploy(EasyTrack, token, deployer, MOTION_DURATION, 20, 50)
+    evm_script_factory = deployer.deploy(EVMScriptFactoryStub)
+    easy_track.addEVMScriptFactory(evm_script_factory, evm_script_factory.DEFAULT_PERMISSIONS(), tx_params)
+    # the first motion initializes the storage of the motions counter
+    create_motion_gas(easy_track, evm_script_factory, deployer)
+
+    print(f"{'EVMScript size':>14} {'full event':>11} {'compact event':>14}")
+    for evm_script_size in EVM_SCRIPT_SIZES:
+        evm_script_factory.setEVMScript("0x" + CALLS_SCRIPT_SPEC_ID + "ff" * (evm_script_size - 4), tx_params)
+
+        easy_track.setCompactMotionCreatedEvent(False, tx_params)
+        full_event_gas = create_motion_gas(easy_track, evm_script_factory, deployer)
+        easy_track.setCompactMotionCreatedEvent(True, tx_params)
+        compact_event_gas = create_motion_gas(easy_track, evm_script_factory, deployer)
+        print(f"{evm_script_size:>14} {full_event_gas:>11} {compact_event_gas:>14}")
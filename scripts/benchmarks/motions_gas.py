@@ -0,0 +1,73 @@
+"""Gas costs of EasyTrack motions depending on the number of active motions
+
+Run with `brownie run scripts/benchmarks/motions_gas.py --network mainnet-fork`
+
+For every number of active motions the script reports the gas used by:
+  - createMotion() of the last active motion
+  - objectToMotion() which doesn't reject the motion
+  - enactMotion() of the first motion, so the last motion is moved to its place
+  - cancelAllMotions() of all active motions
+
+The number of active motions is limited by EasyTrack.MAX_MOTIONS_LIMIT, larger counts are skipped.
+To compare storage layouts run the script on both revisions of the contracts.
+"""
+
+from brownie import accounts, chain, network, EasyTrack, EVMScriptFactoryStub, EVMScriptExecutorStub
+
+from utils.lido import contracts
+from utils.test_helpers import set_account_balance
+
+ACTIVE_MOTIONS_COUNTS = [1, 5, 10, 20, 24, 50, 100]
+MIN_MOTION_DURATION = 48 * 60 * 60
+OBJECTIONS_THRESHOLD = 50
+OBJECTOR_BALANCE = 10**18
+
+
+def main():
+    deployer = accounts[0]
+    objector = accounts[1]
+
+    lido_contracts = contracts(network=network.show_active())
+    agent = lido_contracts.aragon.agent
+    set_account_balance(agent.address)
+    lido_contracts.ldo.transfer(objector, OBJECTOR_BALANCE, {"from": agent})
+
+    easy_track = deployer.deploy(
+        EasyTrack,
+        lido_contracts.ldo,
+        deployer,
+        MIN_MOTION_DURATION,
+        0,
+        OBJECTIONS_THRESHOLD,
+    )
+    max_motions_limit = easy_track.MAX_MOTIONS_LIMIT()
+    easy_track.setMotionsCountLimit(max_motions_limit, {"from": deployer})
+    easy_track.setEVMScriptExecutor(deployer.deploy(EVMScriptExecutorStub), {"from": deployer})
+    evm_script_factory = deployer.deploy(EVMScriptFactoryStub)
+    easy_track.addEVMScriptFactory(evm_script_factory, evm_script_factory.DEFAULT_PERMISSIONS(), {"from": deployer})
+
+    print(f"{'motions':>7} {'create':>8} {'object':>8} {'enact':>8} {'cancel all':>11}")
+    for motions_count in ACTIVE_MOTIONS_COUNTS:
+        if motions_count > max_motions_limit:
+            print(f"{motions_count:>7} skipped: MAX_MOTIONS_LIMIT is {max_motions_limit}")
+            continue
+
+        chain.snapshot()
+        for _ in range(motions_count):
+            create_tx = easy_track.createMotion(evm_script_factory, b"", {"from": deployer})
+        motion_ids = [motion[0] for motion in easy_track.getMotions()]
+
+        object_tx = easy_track.objectToMotion(motion_ids[0], {"from": objector})
+        assert "MotionRejected" not in object_tx.events
+
+        chain.sleep(MIN_MOTION_DURATION + 1)
+        enact_tx = easy_track.enactMotion(motion_ids[0], b"", {"from": deployer})
+        easy_track.createMotion(evm_script_factory, b"", {"from": deployer})
+        cancel_all_tx = easy_track.cancelAllMotions({"from": deployer})
+        assert len(cancel_all_tx.events["MotionCanceled"]) == motions_count
+        chain.revert()
+
+        print(
+            f"{motions_count:>7} {create_tx.gas_used:>8} {object_tx.gas_used:>8} "
+            f"{enact_tx.gas_used:>8} {cancel_all_tx.gas_used:>11}"
+        )
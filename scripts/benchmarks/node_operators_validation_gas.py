@@ -0,0 +1,46 @@
+"""Gas costs of node operators validation in vetted validators limits EVMScript factories
+
+Run with `brownie run scripts/benchmarks/node_operators_validation_gas.py`
+
+Deploys SetVettedValidatorsLimits and IncreaseVettedValidatorsLimit with NodeOperatorsRegistryStub
+and reports the execution gas of createEVMScript() for 1-100 node operators together with the
+gas per node operator. The stub is a plain contract, while on mainnet every call to
+NodeOperatorsRegistry also pays for the Aragon proxy, so the numbers show the cost of reading
+and decoding the node operators data in the factories. The script uses only the methods
+existing before NodeOperatorsRegistryReader, so it can be run on both revisions to compare them.
+"""
+
+from eth_abi import encode
+from brownie import accounts, IncreaseVettedValidatorsLimit, NodeOperatorsRegistryStub, SetVettedValidatorsLimits
+
+NODE_OPERATORS_COUNTS = [1, 10, 25, 50, 100]
+
+
+def execution_gas(factory, creator, call_data):
+    return factory.createEVMScript.estimate_gas(creator, call_data) - 21_000
+
+
+def main():
+    deployer = accounts[0]
+    node_operator = accounts[1]
+
+    node_operators_registry = deployer.deploy(NodeOperatorsRegistryStub, node_operator)
+    node_operators_registry.setNodeOperatorsCount(max(NODE_OPERATORS_COUNTS), {"from": deployer})
+    staking_limit = node_operators_registry.stakingLimit() + 1
+
+    set_vetted_validators_limits = deployer.deploy(SetVettedValidatorsLimits, deployer, node_operators_registry)
+    increase_vetted_validators_limit = deployer.deploy(IncreaseVettedValidatorsLimit, node_operators_registry)
+
+    increase_gas = execution_gas(
+        increase_vetted_validators_limit,
+        node_operator,
+        "0x" + encode(["(uint256,uint256)"], [(0, staking_limit)]).hex(),
+    )
+    print(f"IncreaseVettedValidatorsLimit gas: {increase_gas}")
+
+    print(f"{'node operators':>14} {'SetVettedValidatorsLimits':>26} {'per node operator':>18}")
+    for node_operators_count in NODE_OPERATORS_COUNTS:
+        input_params = [(node_operator_id, staking_limit) for node_operator_id in range(node_operators_count)]
+        call_data = encode(["(uint256,uint256)[]"], [input_params])
+        set_gas = execution_gas(set_vetted_validators_limits, deployer, "0x" + call_data.hex())
+        print(f"{node_operators_count:>14} {set_gas:>26} {set_gas // node_operators_count:>18}")
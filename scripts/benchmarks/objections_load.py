@@ -0,0 +1,65 @@
+"""Load test of EasyTrack.objectToMotion() with hundreds of distinct LDO holders
+
+Run with `brownie run scripts/benchmarks/objections_load.py --network mainnet-fork`
+
+LDO is distributed from the Aragon Agent to OBJECTORS_COUNT (200 by default) new accounts,
+every account objects to the same motion. The total supply of LDO at the snapshot block is
+cached by the motion on the first objection, so the report compares the gas of the first
+objection with the gas of the following ones and shows the cost of totalSupplyAt() which
+isn't paid by them.
+"""
+
+from brownie import accounts, network, web3, EasyTrack, EVMScriptFactoryStub
+
+from utils.config import get_env
+from utils.lido import contracts
+from utils.test_helpers import set_account_balance
+
+DEFAULT_OBJECTORS_COUNT = 200
+MIN_MOTION_DURATION = 48 * 60 * 60
+MAX_OBJECTIONS_THRESHOLD = 500
+OBJECTOR_BALANCE = 10**18
+
+
+def main():
+    objectors_count = int(get_env("OBJECTORS_COUNT", str(DEFAULT_OBJECTORS_COUNT)))
+    deployer = accounts[0]
+
+    lido_contracts = contracts(network=network.show_active())
+    ldo = lido_contracts.ldo
+    agent = lido_contracts.aragon.agent
+    set_account_balance(agent.address)
+
+    easy_track = deployer.deploy(
+        EasyTrack,
+        ldo,
+        deployer,
+        MIN_MOTION_DURATION,
+        1,
+        MAX_OBJECTIONS_THRESHOLD,
+    )
+    evm_script_factory = deployer.deploy(EVMScriptFactoryStub)
+    easy_track.addEVMScriptFactory(evm_script_factory, evm_script_factory.DEFAULT_PERMISSIONS(), {"from": deployer})
+
+    print(f"Distributing LDO to {objectors_count} objectors")
+    objectors = [accounts.add() for _ in range(objectors_count)]
+    for objector in objectors:
+        set_account_balance(objector.address)
+        ldo.transfer(objector, OBJECTOR_BALANCE, {"from": agent})
+
+    easy_track.createMotion(evm_script_factory, b"", {"from": deployer})
+    snapshot_block = easy_track.getMotion(1)[5]
+    total_supply_at_gas = ldo.totalSupplyAt.estimate_gas(snapshot_block) - 21_000
+
+    gas_used = []
+    for objector in objectors:
+        gas_used.append(easy_track.objectToMotion(1, {"from": objector}).gas_used)
+    assert len(easy_track.getMotions()) == 1, "motion was rejected, decrease OBJECTORS_COUNT"
+
+    following_gas = gas_used[1:] or [0]
+    print(f"Block: {web3.eth.block_number}, snapshot block: {snapshot_block}")
+    print(f"First objection gas: {gas_used[0]}")
+    print(f"Following objections gas: min {min(following_gas)}, max {max(following_gas)}, ", end="")
+    print(f"avg {sum(following_gas) // len(following_gas)}")
+    print(f"totalSupplyAt() execution gas not paid by following objections: ~{total_supply_at_gas}")
+    print(f"Total saving for {objectors_count} objections: ~{total_supply_at_gas * (objectors_count - 1)}")
@@ -0,0 +1,77 @@
+"""Gas costs of top up EVMScripts creation depending on the number of recipients
+
+Run with `brownie run scripts/benchmarks/top_up_validation_gas.py`
+
+Deploys AllowedRecipientsRegistry, AllowedTokensRegistry and both top up factories with
+their dependencies on the development network and reports the execution gas of
+createEVMScript() of TopUpAllowedRecipientsSingleToken and TopUpAllowedRecipients.
+The same validation is made by EasyTrack on the motion creation and on the enactment.
+The script uses only the contract methods existing before areRecipientsAllowed() and the
+cached token decimals, so it can be run on both revisions to compare them.
+"""
+
+from brownie import (
+    accounts,
+    AllowedRecipientsRegistry,
+    AllowedTokensRegistry,
+    EasyTrack,
+    MockERC20,
+    TopUpAllowedRecipients,
+    TopUpAllowedRecipientsSingleToken,
+)
+
+from utils import deployed_date_time
+from utils.evm_script import encode_calldata
+
+RECIPIENTS_COUNTS = [1, 10, 25, 50, 100]
+MOTION_DURATION = 72 * 60 * 60
+PERIOD_LIMIT = 10**30
+TOP_UP_AMOUNT = 10**6
+
+
+def execution_gas(factory, creator, call_data):
+    return factory.createEVMScript.estimate_gas(creator, call_data) - 21_000
+
+
+def main():
+    deployer = accounts[0]
+    finance = accounts[1]
+    tx_params = {"from": deployer}
+
+    token = deployer.deploy(MockERC20, 6)
+    easy_track = deployer.deploy(EasyTrack, token, deployer, MOTION_DURATION, 20, 50)
+    date_time_contract = deployed_date_time.deploy_date_time_contract(deployer)
+    recipients_registry = deployer.deploy(
+        AllowedRecipientsRegistry, deployer, [deployer], [deployer], [deployer], [deployer], date_time_contract
+    )
+    recipients_registry.setLimitParameters(PERIOD_LIMIT, 12, tx_params)
+    tokens_registry = deployer.deploy(AllowedTokensRegistry, deployer, [deployer], [deployer])
+    tokens_registry.addToken(token, tx_params)
+
+    single_token_factory = deployer.deploy(
+        TopUpAllowedRecipientsSingleToken, deployer, recipients_registry, finance, token, easy_track
+    )
+    multi_token_factory = deployer.deploy(
+        TopUpAllowedRecipients, deployer, recipients_registry, tokens_registry, finance, easy_track
+    )
+
+    recipients = []
+    print(f"{'recipients':>10} {'single token':>13} {'multi token':>12}")
+    for recipients_count in RECIPIENTS_COUNTS:
+        while len(recipients) < recipients_count:
+            recipient = accounts.add().address
+            recipients_registry.addRecipient(recipient, f"Recipient #{len(recipients)}", tx_params)
+            recipients.append(recipient)
+        amounts = [TOP_UP_AMOUNT] * recipients_count
+
+        single_token_gas = execution_gas(
+            single_token_factory,
+            deployer,
+            encode_calldata(["address[]", "uint256[]"], [recipients, amounts]),
+        )
+        multi_token_gas = execution_gas(
+            multi_token_factory,
+            deployer,
+            encode_calldata(["address", "address[]", "uint256[]"], [token.address, recipients, amounts]),
+        )
+        print(f"{recipients_count:>10} {single_token_gas:>13} {multi_token_gas:>12}")
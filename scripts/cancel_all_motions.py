@@ -0,0 +1,59 @@
+"""Emergency cancellation of all active EasyTrack motions
+
+Cancels motions with EasyTrack.cancelAllMotionsBounded() in batches of CANCEL_BATCH_SIZE motions
+until no active motions left, so the cancellation never hits the block gas limit.
+The sender must have CANCEL_ROLE. The script can be restarted at any moment: every
+call continues from the motions left after the previous one.
+
+Env variables:
+    EASY_TRACK_ADDRESS - address of EasyTrack, mainnet EasyTrack by default
+    CANCEL_BATCH_SIZE - max number of motions canceled per transaction, 10 by default
+"""
+
+from brownie import EasyTrack
+from utils.config import get_is_live, get_deployer_account, get_env, prompt_bool
+from utils import log
+
+MAINNET_EASY_TRACK_ADDRESS = "0xF0211b7660680B49De1A7E9f25C65660F0a13Fea"
+DEFAULT_CANCEL_BATCH_SIZE = 10
+
+
+def main():
+    easy_track = EasyTrack.at(get_env("EASY_TRACK_ADDRESS", MAINNET_EASY_TRACK_ADDRESS))
+    batch_size = int(get_env("CANCEL_BATCH_SIZE", str(DEFAULT_CANCEL_BATCH_SIZE)))
+    if batch_size <= 0:
+        raise ValueError("CANCEL_BATCH_SIZE must be positive")
+    deployer = get_deployer_account(get_is_live())
+
+    active_motions_count = len(easy_track.getMotions())
+    print("DEPLOYER:", deployer)
+    print(
+        f"Cancel {active_motions_count} active motions on EasyTrack ({easy_track.address}) "
+        f"in batches of {batch_size} motions"
+    )
+    if active_motions_count == 0:
+        log.ok("No active motions")
+        return
+    if not easy_track.hasRole(easy_track.CANCEL_ROLE(), deployer):
+        log.warning(f"{deployer} has no CANCEL_ROLE, aborting")
+        return
+
+    print("Proceed? [y/n]: ")
+    if not prompt_bool():
+        print("Aborting")
+        return
+
+    tx_params = {"from": deployer}
+    canceled_motions_count = 0
+    while active_motions_count > 0:
+        tx = easy_track.cancelAllMotionsBounded(batch_size, tx_params)
+        canceled_motion_ids = [event["_motionId"] for event in tx.events["MotionCanceled"]]
+        canceled_motions_count += len(canceled_motion_ids)
+        # new motions may be created between the transactions, they are canceled too
+        active_motions_count = len(easy_track.getMotions())
+        log.ok(
+            f"Canceled motions {', '.join(f'#{motion_id}' for motion_id in canceled_motion_ids)}",
+            f"{canceled_motions_count} canceled, {active_motions_count} left, gas used {tx.gas_used}",
+        )
+
+    log.ok("All motions canceled", canceled_motions_count)
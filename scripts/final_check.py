@@ -19,6 +19,7 @@ from utils import lido, constants, log, mainnet_fork, evm_script
 from scripts.grant_executor_permissions import grant_executor_permissions
 from brownie.network.account import PublicKeyAccount
 from utils.evm_script import encode_calldata
+from utils.motion_evm_script import get_motion_created_event
 
 
 def main():
@@ -830,7 +831,7 @@ def assert_motion_created_event(tx, creator, evm_script_factory, evm_script_call
     )
     assert_equals(
         "    MotionCreated._evmScript is correct",
-        tx.events["MotionCreated"]["_evmScript"] == evm_script,
+        get_motion_created_event(tx)["_evmScript"] == evm_script,
         True,
     )
 
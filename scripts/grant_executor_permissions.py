@@ -8,7 +8,7 @@ def main():
     evm_script_executor = get_env("EVM_SCRIPT_EXECUTOR")
 
     lido_contracts = lido.contracts(network="mainnet")
-    lido_permissions = lido_contracts.permissions()
+    lido_permissions = lido_contracts.permissions
 
     required_permissions = [
         lido_permissions.finance.CREATE_PAYMENTS_ROLE,
@@ -48,7 +48,7 @@ def main():
         # "priority_fee": "4 gwei",
     }
     vote_id = grant_executor_permissions(
-        lido_contracts == lido_contracts,
+        lido_contracts=lido_contracts,
         evm_script_executor=evm_script_executor,
         permissions_to_grant=permissions_to_grant,
         tx_params=tx_params,
@@ -6,6 +6,7 @@ from brownie import (
     TopUpAllowedRecipients,
     AddAllowedRecipient,
     RemoveAllowedRecipient,
+    AllowedRecipientsCloneFactory,
 )
 
 from utils import lido, deployed_easy_track, log, deployment
@@ -41,6 +42,8 @@ tokens_registry_deploy_tx_hash = ""
 top_up_allowed_recipients_deploy_tx_hash = ""
 add_allowed_recipient_deploy_tx_hash = ""
 remove_allowed_recipient_deploy_tx_hash = ""
+# address of the factory used by the builder to deploy the setup
+allowed_recipients_factory_address = ""
 
 
 def main(
@@ -50,6 +53,7 @@ def main(
     top_up_allowed_recipients_deploy_tx_hash: str,
     add_allowed_recipient_deploy_tx_hash: str,
     remove_allowed_recipient_deploy_tx_hash: str,
+    allowed_recipients_factory_address: str = allowed_recipients_factory_address,
 ):
     network_name = network.show_active()
 
@@ -122,6 +126,49 @@ def main(
         remove_allowed_recipient_address
     )
 
+    #####################
+    # Minimal proxy clones checks
+    #####################
+
+    clones = [
+        (
+            recipients_registry_deploy_tx,
+            "AllowedRecipientsRegistryDeployed",
+            recipients_registry_address,
+            "allowedRecipientsRegistryImplementation",
+        ),
+        (
+            tokens_registry_deploy_tx,
+            "AllowedTokensRegistryDeployed",
+            tokens_registry_address,
+            "allowedTokensRegistryImplementation",
+        ),
+        (top_up_deploy_tx, "TopUpAllowedRecipientsDeployed", top_up_address, "topUpAllowedRecipientsImplementation"),
+        (
+            add_allowed_recipient_deploy_tx,
+            "AddAllowedRecipientDeployed",
+            add_allowed_recipient_address,
+            "addAllowedRecipientImplementation",
+        ),
+        (
+            remove_allowed_recipient_deploy_tx,
+            "RemoveAllowedRecipientDeployed",
+            remove_allowed_recipient_address,
+            "removeAllowedRecipientImplementation",
+        ),
+    ]
+    for deploy_tx, event_name, contract_address, implementation_getter in clones:
+        implementation = deployment.check_clone_implementation(
+            AllowedRecipientsCloneFactory,
+            allowed_recipients_factory_address,
+            deploy_tx,
+            event_name,
+            contract_address,
+            implementation_getter,
+        )
+        if implementation is not None:
+            log.ok(f"{event_name} contract {contract_address} is a clone of", implementation)
+
     #####################
     # TopUpAllowedRecipients checks
     #####################
@@ -4,6 +4,7 @@ from brownie import (
     AllowedRecipientsRegistry,
     TopUpAllowedRecipients,
     AllowedTokensRegistry,
+    AllowedRecipientsCloneFactory,
 )
 
 from utils.test_helpers import (
@@ -34,6 +35,8 @@ deploy_config = deployment.AllowedRecipientsMultiTokenSingleRecipientSetupDeploy
 recipients_registry_deploy_tx_hash = ""
 tokens_registry_deploy_tx_hash = ""
 top_up_allowed_recipients_deploy_tx_hash = ""
+# address of the factory used by the builder to deploy the setup
+allowed_recipients_factory_address = ""
 
 
 def main(
@@ -41,6 +44,7 @@ def main(
     recipients_registry_deploy_tx_hash: str = recipients_registry_deploy_tx_hash,
     tokens_registry_deploy_tx_hash: str = tokens_registry_deploy_tx_hash,
     top_up_allowed_recipients_deploy_tx_hash: str = top_up_allowed_recipients_deploy_tx_hash,
+    allowed_recipients_factory_address: str = allowed_recipients_factory_address,
 ):
     network_name = network.show_active()
 
@@ -97,6 +101,42 @@ def main(
     )
     tokens_registry = AllowedTokensRegistry.at(tokens_registry_address)
 
+    #####################
+    # Minimal proxy clones checks
+    #####################
+
+    clones = [
+        (
+            recipients_registry_deploy_tx,
+            "AllowedRecipientsRegistryDeployed",
+            recipients_registry_address,
+            "allowedRecipientsRegistryImplementation",
+        ),
+        (
+            tokens_registry_deploy_tx,
+            "AllowedTokensRegistryDeployed",
+            tokens_registry_address,
+            "allowedTokensRegistryImplementation",
+        ),
+        (
+            top_up_deploy_tx,
+            "TopUpAllowedRecipientsDeployed",
+            top_up_allowed_recipient_address,
+            "topUpAllowedRecipientsImplementation",
+        ),
+    ]
+    for deploy_tx, event_name, contract_address, implementation_getter in clones:
+        implementation = deployment.check_clone_implementation(
+            AllowedRecipientsCloneFactory,
+            allowed_recipients_factory_address,
+            deploy_tx,
+            event_name,
+            contract_address,
+            implementation_getter,
+        )
+        if implementation is not None:
+            log.ok(f"{event_name} contract {contract_address} is a clone of", implementation)
+
     #####################
     # TopUpAllowedRecipients checks
     #####################
@@ -7,9 +7,9 @@ from utils.config import (
     prompt_bool,
     get_network_name,
 )
-from utils import lido, deployed_easy_track, log, deployed_date_time
+from utils import lido, deployed_easy_track, log, deployed_date_time, deployment
 
-from brownie import AllowedRecipientsFactory, AllowedRecipientsBuilder
+from brownie import AllowedRecipientsFactory, AllowedRecipientsCloneFactory, AllowedRecipientsBuilder
 
 
 def main():
@@ -19,6 +19,8 @@ def main():
     et_contracts = deployed_easy_track.contracts(network=network_name)
     deployer = get_deployer_account(get_is_live(), network=network_name)
     bokky_poo_bahs_date_time_contract = deployed_date_time.date_time_contract(network=network_name)
+    # deploy the factory creating minimal proxy (EIP-1167) clones instead of full contracts
+    use_clones = get_env("USE_CLONES", "0").lower() in ("1", "true")
 
     easy_track = et_contracts.easy_track
     evm_script_executor = et_contracts.evm_script_executor
@@ -41,6 +43,7 @@ def main():
     log.br()
 
     log.nb("BokkyPooBahsDateTimeContract", bokky_poo_bahs_date_time_contract)
+    log.nb("Factory", "AllowedRecipientsCloneFactory" if use_clones else "AllowedRecipientsFactory")
 
     log.br()
 
@@ -58,19 +61,23 @@ def main():
         agent=contracts.aragon.agent,
         bokky_poo_bahs_date_time_contract=bokky_poo_bahs_date_time_contract,
         tx_params=tx_params,
+        use_clones=use_clones,
     )
 
     log.br()
 
     log.ok("Allowed recipients factory and builder have been deployed...")
-    log.nb("Deployed AllowedRecipientsFactory", allowed_recipients_factory)
+    log.nb("Deployed factory", allowed_recipients_factory)
     log.nb("Deployed AllowedRecipientsBuilder", allowed_recipients_builder)
 
     log.br()
 
     if get_is_live() and get_env("FORCE_VERIFY", False):
         log.ok("Trying to verify contracts...")
-        AllowedRecipientsFactory.publish_source(allowed_recipients_factory)
+        if use_clones:
+            deployment.publish_clone_factory_sources(AllowedRecipientsCloneFactory, allowed_recipients_factory)
+        else:
+            AllowedRecipientsFactory.publish_source(allowed_recipients_factory)
         AllowedRecipientsBuilder.publish_source(allowed_recipients_builder)
 
 
@@ -80,9 +87,13 @@ def deploy_factory_and_builder(
     agent,
     bokky_poo_bahs_date_time_contract,
     tx_params,
+    use_clones=False,
 ):
 
-    factory = AllowedRecipientsFactory.deploy(tx_params)
+    if use_clones:
+        factory = deployment.deploy_allowed_recipients_clone_factory(tx_params)
+    else:
+        factory = AllowedRecipientsFactory.deploy(tx_params)
 
     builder = AllowedRecipientsBuilder.deploy(
         factory, agent, easy_track, finance, bokky_poo_bahs_date_time_contract, tx_params
@@ -5,6 +5,7 @@ from brownie import (
     TopUpAllowedRecipientsSingleToken,
     AddAllowedRecipient,
     RemoveAllowedRecipient,
+    AllowedRecipientsCloneFactorySingleToken,
 )
 
 from utils import lido, deployed_easy_track, deployed_date_time, log, deployment
@@ -30,11 +31,14 @@ deploy_config = deployment.AllowedRecipientsSingleTokenFullSetupDeployConfig(
 )
 
 deployment_tx_hash = ""
+# address of the factory used by the builder to deploy the setup
+allowed_recipients_factory_address = ""
 
 
 def main(
     deploy_config: deployment.AllowedRecipientsSingleTokenFullSetupDeployConfig = deploy_config,
     deployment_tx_hash: str = deployment_tx_hash,
+    allowed_recipients_factory_address: str = allowed_recipients_factory_address,
 ):
     network_name = network.show_active()
 
@@ -79,6 +83,33 @@ def main(
     add_allowed_recipient = AddAllowedRecipient.at(add_allowed_recipient_address)
     remove_allowed_recipient = RemoveAllowedRecipient.at(remove_allowed_recipient_address)
 
+    #####################
+    # Minimal proxy clones checks
+    #####################
+
+    clones = [
+        (tx, "AllowedRecipientsRegistryDeployed", registry_address, "allowedRecipientsRegistryImplementation"),
+        (tx, "TopUpAllowedRecipientsDeployed", top_up_address, "topUpAllowedRecipientsImplementation"),
+        (tx, "AddAllowedRecipientDeployed", add_allowed_recipient_address, "addAllowedRecipientImplementation"),
+        (
+            tx,
+            "RemoveAllowedRecipientDeployed",
+            remove_allowed_recipient_address,
+            "removeAllowedRecipientImplementation",
+        ),
+    ]
+    for deploy_tx, event_name, contract_address, implementation_getter in clones:
+        implementation = deployment.check_clone_implementation(
+            AllowedRecipientsCloneFactorySingleToken,
+            allowed_recipients_factory_address,
+            deploy_tx,
+            event_name,
+            contract_address,
+            implementation_getter,
+        )
+        if implementation is not None:
+            log.ok(f"{event_name} contract {contract_address} is a clone of", implementation)
+
     assert registry.bokkyPooBahsDateTimeContract() == date_time_contract
     assert top_up_allowed_recipients.easyTrack() == et_contracts.easy_track
     assert top_up_allowed_recipients.finance() == contracts.aragon.finance
@@ -1,4 +1,10 @@
-from brownie import chain, network, AllowedRecipientsRegistry, TopUpAllowedRecipientsSingleToken
+from brownie import (
+    chain,
+    network,
+    AllowedRecipientsRegistry,
+    TopUpAllowedRecipientsSingleToken,
+    AllowedRecipientsCloneFactorySingleToken,
+)
 
 from utils import lido, deployed_easy_track, deployed_date_time, log, deployment
 from hexbytes import HexBytes
@@ -23,10 +29,13 @@ deploy_config = deployment.AllowedRecipientsSingleTokenSingleRecipientSetupDeplo
 )
 
 deployment_tx_hash = ""
+# address of the factory used by the builder to deploy the setup
+allowed_recipients_factory_address = ""
 
 def main(
     deploy_config: deployment.AllowedRecipientsSingleTokenSingleRecipientSetupDeployConfig = deploy_config,
     deployment_tx_hash: str = deployment_tx_hash,
+    allowed_recipients_factory_address: str = allowed_recipients_factory_address,
 ):
     network_name = network.show_active()
 
@@ -63,6 +72,26 @@ def main(
     registry = AllowedRecipientsRegistry.at(registry_address)
     top_up_allowed_recipients = TopUpAllowedRecipientsSingleToken.at(add_allowed_recipient_address)
 
+    #####################
+    # Minimal proxy clones checks
+    #####################
+
+    clones = [
+        (tx, "AllowedRecipientsRegistryDeployed", registry_address, "allowedRecipientsRegistryImplementation"),
+        (tx, "TopUpAllowedRecipientsDeployed", add_allowed_recipient_address, "topUpAllowedRecipientsImplementation"),
+    ]
+    for deploy_tx, event_name, contract_address, implementation_getter in clones:
+        implementation = deployment.check_clone_implementation(
+            AllowedRecipientsCloneFactorySingleToken,
+            allowed_recipients_factory_address,
+            deploy_tx,
+            event_name,
+            contract_address,
+            implementation_getter,
+        )
+        if implementation is not None:
+            log.ok(f"{event_name} contract {contract_address} is a clone of", implementation)
+
     assert top_up_allowed_recipients.easyTrack() == et_contracts.easy_track
     assert top_up_allowed_recipients.finance() == contracts.aragon.finance
     assert top_up_allowed_recipients.token() == deploy_config.token
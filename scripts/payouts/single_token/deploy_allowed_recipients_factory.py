@@ -7,9 +7,13 @@ from utils.config import (
     prompt_bool,
     get_network_name,
 )
-from utils import lido, deployed_easy_track, log, deployed_date_time
+from utils import lido, deployed_easy_track, log, deployed_date_time, deployment
 
-from brownie import AllowedRecipientsFactorySingleToken, AllowedRecipientsBuilderSingleToken
+from brownie import (
+    AllowedRecipientsFactorySingleToken,
+    AllowedRecipientsCloneFactorySingleToken,
+    AllowedRecipientsBuilderSingleToken,
+)
 
 
 def main():
@@ -19,6 +23,8 @@ def main():
     et_contracts = deployed_easy_track.contracts(network=network_name)
     deployer = get_deployer_account(get_is_live(), network=network_name)
     bokky_poo_bahs_date_time_contract = deployed_date_time.date_time_contract(network=network_name)
+    # deploy the factory creating minimal proxy (EIP-1167) clones instead of full contracts
+    use_clones = get_env("USE_CLONES", "0").lower() in ("1", "true")
 
     easy_track = et_contracts.easy_track
     evm_script_executor = et_contracts.evm_script_executor
@@ -41,6 +47,10 @@ def main():
     log.br()
 
     log.nb("BokkyPooBahsDateTimeContract", bokky_poo_bahs_date_time_contract)
+    log.nb(
+        "Factory",
+        "AllowedRecipientsCloneFactorySingleToken" if use_clones else "AllowedRecipientsFactorySingleToken",
+    )
 
     log.br()
 
@@ -58,6 +68,7 @@ def main():
         agent=contracts.aragon.agent,
         bokky_poo_bahs_date_time_contract=bokky_poo_bahs_date_time_contract,
         tx_params=tx_params,
+        use_clones=use_clones,
     )
 
     log.br()
@@ -70,7 +81,12 @@ def main():
 
     if get_is_live() and get_env("FORCE_VERIFY", False):
         log.ok("Trying to verify contracts...")
-        AllowedRecipientsFactorySingleToken.publish_source(allowed_recipients_factory)
+        if use_clones:
+            deployment.publish_clone_factory_sources(
+                AllowedRecipientsCloneFactorySingleToken, allowed_recipients_factory
+            )
+        else:
+            AllowedRecipientsFactorySingleToken.publish_source(allowed_recipients_factory)
         AllowedRecipientsBuilderSingleToken.publish_source(allowed_recipients_builder)
 
 
@@ -80,9 +96,13 @@ def deploy_factory_and_builder(
     agent,
     bokky_poo_bahs_date_time_contract,
     tx_params,
+    use_clones=False,
 ):
 
-    factory = AllowedRecipientsFactorySingleToken.deploy(tx_params)
+    if use_clones:
+        factory = deployment.deploy_allowed_recipients_clone_factory_single_token(tx_params)
+    else:
+        factory = AllowedRecipientsFactorySingleToken.deploy(tx_params)
 
     builder = AllowedRecipientsBuilderSingleToken.deploy(
         factory, agent, easy_track, finance, bokky_poo_bahs_date_time_contract, tx_params
@@ -8,7 +8,7 @@ def main():
     evm_script_executor = get_env("EVM_SCRIPT_EXECUTOR")
 
     lido_contracts = lido.contracts(network="mainnet")
-    lido_permissions = lido_contracts.permissions()
+    lido_permissions = lido_contracts.permissions
     all_lido_permissions = lido_permissions.all()
     granted_permissions = lido_permissions.filter_granted(all_lido_permissions, evm_script_executor)
 
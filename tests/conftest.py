@@ -1,4 +1,5 @@
 import os
+from pathlib import Path
 from typing import Optional
 
 import pytest
@@ -12,6 +13,29 @@ from utils.csm import contracts as csm_contracts_
 from utils import deployed_date_time
 from utils.test_helpers import set_account_balance
 from utils.lido import external_contracts
+from utils.fork_state_cache import ForkStateCache
+from utils import gas_benchmark
+from utils.gas_benchmark import GasBaseline
+from utils import parallel_fork
+from utils import contracts_registry
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    """Assigns separate forked node to every xdist worker when tests run with -n option"""
+    config.addinivalue_line("markers", "gas_benchmark: gas benchmark of motions, run with GAS_BENCHMARK=1")
+    parallel_fork.configure(config)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skips gas benchmarks unless they are enabled and the baseline to compare with exists"""
+    skip_reason = gas_benchmark.get_skip_reason()
+    if skip_reason is None:
+        return
+    for item in items:
+        if "gas_benchmark" in item.keywords:
+            item.add_marker(pytest.mark.skip(reason=skip_reason))
+
 
 ####################################
 # Brownie Blockchain State Snapshots
@@ -28,7 +52,11 @@ def gas():
 
 @pytest.fixture(scope="module", autouse=True)
 def mod_isolation(module_isolation):
-    """Snapshot ganache at start of module."""
+    """Snapshot ganache at start of module. module_isolation resets the fork, so contract
+    setups cached by utils.contracts_registry are dropped before and after the module"""
+    contracts_registry.invalidate(network=network.show_active())
+    yield
+    contracts_registry.invalidate(network=network.show_active())
 
 
 @pytest.fixture(autouse=True)
@@ -91,16 +119,21 @@ def lego_program(accounts):
 @pytest.fixture(scope="module")
 def lido_contracts():
     contracts = lido_contracts_(network=brownie.network.show_active())
-    # Set balances for contracts due to london hardfork changes in gas calculation: gasPrice=0 is not supported anymore
-    set_account_balance(contracts.lido_addresses.aragon.acl)
-    set_account_balance(contracts.lido_addresses.aragon.agent)
-    set_account_balance(contracts.lido_addresses.aragon.voting)
-    set_account_balance(contracts.lido_addresses.aragon.finance)
-    set_account_balance(contracts.lido_addresses.aragon.gov_token)
-    set_account_balance(contracts.lido_addresses.aragon.calls_script)
-    set_account_balance(contracts.lido_addresses.aragon.token_manager)
-    set_account_balance(contracts.lido_addresses.aragon.kernel)
-    set_account_balance(contracts.lido_addresses.dual_governance_admin_executor)
+    # Set balances for contracts due to london hardfork changes in gas calculation: gasPrice=0 is not supported anymore.
+    # Every xdist worker forks the same block, so all workers start modules from the same balances
+    aragon = contracts.lido_addresses.aragon
+    for address in [
+        aragon.acl,
+        aragon.agent,
+        aragon.voting,
+        aragon.finance,
+        aragon.gov_token,
+        aragon.calls_script,
+        aragon.token_manager,
+        aragon.kernel,
+        contracts.lido_addresses.dual_governance_admin_executor,
+    ]:
+        set_account_balance(address)
     return contracts
 
 
@@ -201,6 +234,18 @@ def remove_allowed_recipients(owner, allowed_recipients_registry, RemoveAllowedR
     return owner.deploy(RemoveAllowedRecipient, owner, registry)
 
 
+@pytest.fixture(scope="module")
+def add_allowed_recipients_batch(owner, allowed_recipients_registry, AddAllowedRecipients):
+    (registry, _, _, _, _, _) = allowed_recipients_registry
+    return owner.deploy(AddAllowedRecipients, owner, registry)
+
+
+@pytest.fixture(scope="module")
+def remove_allowed_recipients_batch(owner, allowed_recipients_registry, RemoveAllowedRecipients):
+    (registry, _, _, _, _, _) = allowed_recipients_registry
+    return owner.deploy(RemoveAllowedRecipients, owner, registry)
+
+
 ############
 # MOCKS AND TEST WRAPPERS
 ############
@@ -221,11 +266,21 @@ def bytes_utils_wrapper(accounts, BytesUtilsWrapper):
     return accounts[0].deploy(BytesUtilsWrapper)
 
 
+@pytest.fixture(scope="module")
+def memory_hash_set_wrapper(accounts, MemoryHashSetWrapper):
+    return accounts[0].deploy(MemoryHashSetWrapper)
+
+
 @pytest.fixture(scope="module")
 def mev_boost_relay_input_utils_wrapper(owner, MEVBoostRelaysInputUtilsWrapper):
     return owner.deploy(MEVBoostRelaysInputUtilsWrapper)
 
 
+@pytest.fixture(scope="module")
+def node_operators_registry_reader_wrapper(owner, NodeOperatorsRegistryReaderWrapper):
+    return owner.deploy(NodeOperatorsRegistryReaderWrapper)
+
+
 @pytest.fixture(scope="module")
 def node_operators_registry_stub(owner, node_operator, NodeOperatorsRegistryStub):
     return owner.deploy(NodeOperatorsRegistryStub, node_operator)
@@ -320,6 +375,18 @@ def allowed_tokens_registry(AllowedTokensRegistry, owner, accounts):
     return (registry, owner, add_token_role_holder, remove_token_role_holder)
 
 
+@pytest.fixture(scope="module")
+def add_allowed_tokens(owner, allowed_tokens_registry, AddAllowedTokens):
+    (registry, _, _, _) = allowed_tokens_registry
+    return owner.deploy(AddAllowedTokens, owner, registry)
+
+
+@pytest.fixture(scope="module")
+def remove_allowed_tokens(owner, allowed_tokens_registry, RemoveAllowedTokens):
+    (registry, _, _, _) = allowed_tokens_registry
+    return owner.deploy(RemoveAllowedTokens, owner, registry)
+
+
 @pytest.fixture(scope="module")
 def top_up_allowed_recipients_single_token(
     allowed_recipients_registry,
@@ -357,6 +424,7 @@ def steth(lido_contracts):
 def usdc():
     return external_contracts(network=brownie.network.show_active())["usdc"]
 
+
 @pytest.fixture(scope="module")
 def dai():
     return external_contracts(network=brownie.network.show_active())["dai"]
@@ -493,6 +561,80 @@ def helpers():
     return Helpers
 
 
+@pytest.fixture(scope="session", autouse=True)
+def fork_state_cache():
+    """Caches state of the fork after deployments made by fixtures. Set FORK_STATE_CACHE=0 to disable.
+    Autouse, so the cache tracks state changes made by other fixtures from the start of the session"""
+    tests_dir = Path(__file__).parent
+    fixture_files = sorted(tests_dir.rglob("conftest.py")) + [tests_dir / "constants.py"]
+    cache = ForkStateCache(fixture_files=fixture_files)
+    cache.watch()
+    return cache
+
+
+@pytest.fixture(scope="session")
+def gas_baseline():
+    """Gas baseline of motions. Run benchmarks with GAS_BASELINE_UPDATE=1 (without -n) to rewrite it"""
+    baseline = GasBaseline()
+    yield baseline
+    if baseline.update:
+        baseline.save()
+
+
+@pytest.fixture(scope="module")
+def benchmark_motion(gas_baseline, lido_contracts):
+    """Creates and enacts the motion, failing when its gas exceeds the baseline.
+    With fast_enactment=True and EasyTrack supporting the fast enactment, the motion is also
+    enacted with enactMotionWithEVMScript() before the regular enactment. The fast enactment and
+    the permission granted for it are undone, so the factory keeps the fast enactment disabled
+    and the returned enactment transaction is always the enactMotion() one"""
+
+    def _benchmark_motion(
+        easy_track,
+        name,
+        batch_size,
+        evm_script_factory,
+        evm_script_calldata,
+        creator,
+        enactor,
+        fast_enactment=False,
+    ):
+        creation_tx = easy_track.createMotion(evm_script_factory, evm_script_calldata, {"from": creator})
+        motion_id = creation_tx.events["MotionCreated"]["_motionId"]
+        chain.sleep(easy_track.motionDuration() + 100)
+
+        fast_enactment_gas = None
+        admin = lido_contracts.aragon.voting
+        if (
+            fast_enactment
+            and hasattr(easy_track, "enactMotionWithEVMScript")
+            and easy_track.hasRole(easy_track.DEFAULT_ADMIN_ROLE(), admin)
+        ):
+            assert not easy_track.isFastEnactmentAllowed(evm_script_factory)
+            easy_track.setFastEnactmentAllowed(evm_script_factory, True, {"from": admin})
+            fast_enactment_tx = easy_track.enactMotionWithEVMScript(
+                motion_id, creation_tx.events["MotionCreated"]["_evmScript"], {"from": enactor}
+            )
+            fast_enactment_gas = fast_enactment_tx.gas_used
+            chain.undo(2)
+            assert not easy_track.isFastEnactmentAllowed(evm_script_factory)
+            chain.sleep(easy_track.motionDuration() + 100)
+
+        enactment_tx = easy_track.enactMotion(
+            motion_id,
+            creation_tx.events["MotionCreated"]["_evmScriptCallData"],
+            {"from": enactor},
+        )
+
+        regressions = gas_baseline.record(
+            name, batch_size, creation_tx.gas_used, enactment_tx.gas_used, fast_enactment_gas
+        )
+        assert not regressions, "Gas regressions:\n" + "\n".join(regressions)
+        return creation_tx, enactment_tx
+
+    return _benchmark_motion
+
+
 @pytest.fixture(scope="module")
 def vote_id_from_env() -> Optional[int]:
     _env_name = "OMNIBUS_VOTE_ID"
@@ -0,0 +1,80 @@
+from brownie import ZERO_ADDRESS, reverts
+from utils.evm_script import encode_calldata, encode_call_script
+
+
+def test_deploy(owner, AddAllowedRecipients, allowed_recipients_registry):
+    "Must deploy contract with correct data"
+    (registry, _, _, _, _, _) = allowed_recipients_registry
+    contract = owner.deploy(AddAllowedRecipients, owner, registry)
+
+    assert contract.trustedCaller() == owner
+    assert contract.allowedRecipientsRegistry() == registry
+
+
+def test_only_trusted_caller_can_be_creator(owner, stranger, add_allowed_recipients_batch):
+    call_data = create_calldata([owner.address], ["Owner"])
+
+    with reverts("CALLER_IS_FORBIDDEN"):
+        add_allowed_recipients_batch.createEVMScript(stranger, call_data, {"from": owner})
+
+    add_allowed_recipients_batch.createEVMScript(owner, call_data, {"from": owner})
+
+
+def test_revert_create_evm_script_with_empty_recipients(owner, add_allowed_recipients_batch):
+    with reverts("EMPTY_RECIPIENTS"):
+        add_allowed_recipients_batch.createEVMScript(owner, create_calldata([], []))
+
+
+def test_revert_create_evm_script_with_length_mismatch(owner, stranger, add_allowed_recipients_batch):
+    with reverts("LENGTH_MISMATCH"):
+        add_allowed_recipients_batch.createEVMScript(owner, create_calldata([owner.address, stranger.address], ["A"]))
+
+
+def test_revert_create_evm_script_with_zero_recipient_address(owner, add_allowed_recipients_batch):
+    with reverts("RECIPIENT_ADDRESS_IS_ZERO_ADDRESS"):
+        add_allowed_recipients_batch.createEVMScript(
+            owner, create_calldata([owner.address, ZERO_ADDRESS], ["Owner", "Zero"])
+        )
+
+
+def test_revert_recipient_already_added(owner, stranger, add_allowed_recipients_batch, allowed_recipients_registry):
+    (registry, _, add_recipient_role_holder, _, _, _) = allowed_recipients_registry
+    registry.addRecipient(stranger, "Stranger", {"from": add_recipient_role_holder})
+
+    with reverts("ALLOWED_RECIPIENT_ALREADY_ADDED"):
+        add_allowed_recipients_batch.createEVMScript(
+            owner, create_calldata([owner.address, stranger.address], ["Owner", "Stranger"])
+        )
+
+
+def test_revert_duplicate_recipient(owner, stranger, add_allowed_recipients_batch):
+    with reverts("DUPLICATE_RECIPIENT"):
+        add_allowed_recipients_batch.createEVMScript(
+            owner,
+            create_calldata([stranger.address, owner.address, stranger.address], ["Stranger", "Owner", "Stranger"]),
+        )
+
+
+def test_create_evm_script_correctly(owner, stranger, add_allowed_recipients_batch, allowed_recipients_registry):
+    (registry, _, _, _, _, _) = allowed_recipients_registry
+    recipients, titles = [owner.address, stranger.address], ["Owner", "Stranger"]
+
+    evm_script = add_allowed_recipients_batch.createEVMScript(owner, create_calldata(recipients, titles))
+
+    expected_evm_script = encode_call_script(
+        [(registry.address, registry.addRecipients.encode_input(recipients, titles))]
+    )
+    assert evm_script == expected_evm_script
+
+
+def test_decode_evm_script_calldata_correctly(owner, stranger, add_allowed_recipients_batch):
+    recipients, titles = [owner.address, stranger.address], ["Owner", "Stranger"]
+
+    assert add_allowed_recipients_batch.decodeEVMScriptCallData(create_calldata(recipients, titles)) == (
+        recipients,
+        titles,
+    )
+
+
+def create_calldata(recipients, titles):
+    return encode_calldata(["address[]", "string[]"], [recipients, titles])
@@ -0,0 +1,65 @@
+import pytest
+from brownie import ZERO_ADDRESS, reverts
+from utils.evm_script import encode_calldata, encode_call_script
+
+
+@pytest.fixture(scope="module")
+def tokens(accounts):
+    return [account.address for account in accounts[3:6]]
+
+
+def test_deploy(owner, AddAllowedTokens, allowed_tokens_registry):
+    "Must deploy contract with correct data"
+    (registry, _, _, _) = allowed_tokens_registry
+    contract = owner.deploy(AddAllowedTokens, owner, registry)
+
+    assert contract.trustedCaller() == owner
+    assert contract.allowedTokensRegistry() == registry
+
+
+def test_only_trusted_caller_can_be_creator(owner, stranger, tokens, add_allowed_tokens):
+    call_data = create_calldata(tokens)
+
+    with reverts("CALLER_IS_FORBIDDEN"):
+        add_allowed_tokens.createEVMScript(stranger, call_data, {"from": owner})
+
+    add_allowed_tokens.createEVMScript(owner, call_data, {"from": owner})
+
+
+def test_revert_create_evm_script_with_empty_tokens(owner, add_allowed_tokens):
+    with reverts("EMPTY_TOKENS"):
+        add_allowed_tokens.createEVMScript(owner, create_calldata([]))
+
+
+def test_revert_create_evm_script_with_zero_token_address(owner, tokens, add_allowed_tokens):
+    with reverts("TOKEN_ADDRESS_IS_ZERO_ADDRESS"):
+        add_allowed_tokens.createEVMScript(owner, create_calldata(tokens + [ZERO_ADDRESS]))
+
+
+def test_revert_token_already_added(owner, tokens, add_allowed_tokens, allowed_tokens_registry):
+    (registry, _, add_token_role_holder, _) = allowed_tokens_registry
+    registry.addToken(tokens[1], {"from": add_token_role_holder})
+
+    with reverts("ALLOWED_TOKEN_ALREADY_ADDED"):
+        add_allowed_tokens.createEVMScript(owner, create_calldata(tokens))
+
+
+def test_revert_duplicate_token(owner, tokens, add_allowed_tokens):
+    with reverts("DUPLICATE_TOKEN"):
+        add_allowed_tokens.createEVMScript(owner, create_calldata(tokens + tokens[:1]))
+
+
+def test_create_evm_script_correctly(owner, tokens, add_allowed_tokens, allowed_tokens_registry):
+    (registry, _, _, _) = allowed_tokens_registry
+
+    evm_script = add_allowed_tokens.createEVMScript(owner, create_calldata(tokens))
+
+    assert evm_script == encode_call_script([(registry.address, registry.addTokens.encode_input(tokens))])
+
+
+def test_decode_evm_script_calldata_correctly(tokens, add_allowed_tokens):
+    assert add_allowed_tokens.decodeEVMScriptCallData(create_calldata(tokens)) == tokens
+
+
+def create_calldata(tokens):
+    return encode_calldata(["address[]"], [tokens])
@@ -152,3 +152,27 @@ def test_decode_evm_script_call_data(node_operators_registry, increase_vetted_va
 
     EVM_SCRIPT_CALLDATA = create_calldata(input_params)
     assert increase_vetted_validators_limit_factory.decodeEVMScriptCallData(EVM_SCRIPT_CALLDATA) == input_params
+
+
+def test_create_evm_script_reads_node_operator_data(owner, node_operator, node_operators_registry_stub):
+    "Must validate the input against reward address, staking limit and signing keys returned by getNodeOperator()"
+    factory = IncreaseVettedValidatorsLimit.deploy(node_operators_registry_stub, {"from": owner})
+    input_params = (0, node_operators_registry_stub.stakingLimit() + 1)
+
+    evm_script = factory.createEVMScript(node_operator, create_calldata(input_params))
+    assert evm_script == encode_call_script(
+        [
+            (
+                node_operators_registry_stub.address,
+                node_operators_registry_stub.setNodeOperatorStakingLimit.encode_input(*input_params),
+            )
+        ]
+    )
+
+    with reverts("STAKING_LIMIT_TOO_LOW"):
+        factory.createEVMScript(node_operator, create_calldata((0, node_operators_registry_stub.stakingLimit())))
+
+    with reverts("NOT_ENOUGH_SIGNING_KEYS"):
+        factory.createEVMScript(
+            node_operator, create_calldata((0, node_operators_registry_stub.totalSigningKeys() + 1))
+        )
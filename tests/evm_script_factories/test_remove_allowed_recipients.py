@@ -0,0 +1,63 @@
+import pytest
+from brownie import reverts
+from utils.evm_script import encode_calldata, encode_call_script
+
+
+@pytest.fixture(scope="module")
+def recipients(accounts):
+    return [account.address for account in accounts[3:6]]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def add_recipients(recipients, allowed_recipients_registry):
+    (registry, _, add_recipient_role_holder, _, _, _) = allowed_recipients_registry
+    registry.addRecipients(recipients, ["Recipient"] * len(recipients), {"from": add_recipient_role_holder})
+
+
+def test_deploy(owner, RemoveAllowedRecipients, allowed_recipients_registry):
+    "Must deploy contract with correct data"
+    (registry, _, _, _, _, _) = allowed_recipients_registry
+    contract = owner.deploy(RemoveAllowedRecipients, owner, registry)
+
+    assert contract.trustedCaller() == owner
+    assert contract.allowedRecipientsRegistry() == registry
+
+
+def test_only_trusted_caller_can_be_creator(owner, stranger, recipients, remove_allowed_recipients_batch):
+    call_data = create_calldata(recipients)
+
+    with reverts("CALLER_IS_FORBIDDEN"):
+        remove_allowed_recipients_batch.createEVMScript(stranger, call_data, {"from": owner})
+
+    remove_allowed_recipients_batch.createEVMScript(owner, call_data, {"from": owner})
+
+
+def test_revert_create_evm_script_with_empty_recipients(owner, remove_allowed_recipients_batch):
+    with reverts("EMPTY_RECIPIENTS"):
+        remove_allowed_recipients_batch.createEVMScript(owner, create_calldata([]))
+
+
+def test_revert_recipient_not_found(owner, stranger, recipients, remove_allowed_recipients_batch):
+    with reverts("ALLOWED_RECIPIENT_NOT_FOUND"):
+        remove_allowed_recipients_batch.createEVMScript(owner, create_calldata(recipients + [stranger.address]))
+
+
+def test_revert_duplicate_recipient(owner, recipients, remove_allowed_recipients_batch):
+    with reverts("DUPLICATE_RECIPIENT"):
+        remove_allowed_recipients_batch.createEVMScript(owner, create_calldata(recipients + recipients[:1]))
+
+
+def test_create_evm_script_correctly(owner, recipients, remove_allowed_recipients_batch, allowed_recipients_registry):
+    (registry, _, _, _, _, _) = allowed_recipients_registry
+
+    evm_script = remove_allowed_recipients_batch.createEVMScript(owner, create_calldata(recipients))
+
+    assert evm_script == encode_call_script([(registry.address, registry.removeRecipients.encode_input(recipients))])
+
+
+def test_decode_evm_script_calldata_correctly(recipients, remove_allowed_recipients_batch):
+    assert remove_allowed_recipients_batch.decodeEVMScriptCallData(create_calldata(recipients)) == recipients
+
+
+def create_calldata(recipients):
+    return encode_calldata(["address[]"], [recipients])
@@ -0,0 +1,63 @@
+import pytest
+from brownie import reverts
+from utils.evm_script import encode_calldata, encode_call_script
+
+
+@pytest.fixture(scope="module")
+def tokens(accounts):
+    return [account.address for account in accounts[3:6]]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def add_tokens(tokens, allowed_tokens_registry):
+    (registry, _, add_token_role_holder, _) = allowed_tokens_registry
+    registry.addTokens(tokens, {"from": add_token_role_holder})
+
+
+def test_deploy(owner, RemoveAllowedTokens, allowed_tokens_registry):
+    "Must deploy contract with correct data"
+    (registry, _, _, _) = allowed_tokens_registry
+    contract = owner.deploy(RemoveAllowedTokens, owner, registry)
+
+    assert contract.trustedCaller() == owner
+    assert contract.allowedTokensRegistry() == registry
+
+
+def test_only_trusted_caller_can_be_creator(owner, stranger, tokens, remove_allowed_tokens):
+    call_data = create_calldata(tokens)
+
+    with reverts("CALLER_IS_FORBIDDEN"):
+        remove_allowed_tokens.createEVMScript(stranger, call_data, {"from": owner})
+
+    remove_allowed_tokens.createEVMScript(owner, call_data, {"from": owner})
+
+
+def test_revert_create_evm_script_with_empty_tokens(owner, remove_allowed_tokens):
+    with reverts("EMPTY_TOKENS"):
+        remove_allowed_tokens.createEVMScript(owner, create_calldata([]))
+
+
+def test_revert_token_not_found(owner, stranger, tokens, remove_allowed_tokens):
+    with reverts("ALLOWED_TOKEN_NOT_FOUND"):
+        remove_allowed_tokens.createEVMScript(owner, create_calldata(tokens + [stranger.address]))
+
+
+def test_revert_duplicate_token(owner, tokens, remove_allowed_tokens):
+    with reverts("DUPLICATE_TOKEN"):
+        remove_allowed_tokens.createEVMScript(owner, create_calldata(tokens + tokens[:1]))
+
+
+def test_create_evm_script_correctly(owner, tokens, remove_allowed_tokens, allowed_tokens_registry):
+    (registry, _, _, _) = allowed_tokens_registry
+
+    evm_script = remove_allowed_tokens.createEVMScript(owner, create_calldata(tokens))
+
+    assert evm_script == encode_call_script([(registry.address, registry.removeTokens.encode_input(tokens))])
+
+
+def test_decode_evm_script_calldata_correctly(tokens, remove_allowed_tokens):
+    assert remove_allowed_tokens.decodeEVMScriptCallData(create_calldata(tokens)) == tokens
+
+
+def create_calldata(tokens):
+    return encode_calldata(["address[]"], [tokens])
@@ -117,3 +117,31 @@ def test_decode_evm_script_call_data(node_operators_registry, set_vetted_validat
 
     EVM_SCRIPT_CALLDATA = create_calldata(input_params)
     assert set_vetted_validators_limits_factory.decodeEVMScriptCallData(EVM_SCRIPT_CALLDATA) == input_params
+
+
+def test_create_evm_script_validates_node_operators_data(owner, node_operators_registry_stub):
+    "Must validate activity and signing keys of every node operator returned by getNodeOperator()"
+    factory = SetVettedValidatorsLimits.deploy(owner, node_operators_registry_stub, {"from": owner})
+    node_operators_registry_stub.setNodeOperatorsCount(3)
+    input_params = [(0, 400), (2, 400)]
+
+    evm_script = factory.createEVMScript(owner, create_calldata(input_params))
+    expected_evm_script = encode_call_script(
+        [
+            (
+                node_operators_registry_stub.address,
+                node_operators_registry_stub.setNodeOperatorStakingLimit.encode_input(input_param[0], input_param[1]),
+            )
+            for input_param in input_params
+        ]
+    )
+    assert evm_script == expected_evm_script
+
+    node_operators_registry_stub.setTotalSigningKeys(399)
+    with reverts("NOT_ENOUGH_SIGNING_KEYS"):
+        factory.createEVMScript(owner, create_calldata(input_params))
+
+    node_operators_registry_stub.setTotalSigningKeys(400)
+    node_operators_registry_stub.setActive(False)
+    with reverts("NODE_OPERATOR_IS_NOT_ACTIVE"):
+        factory.createEVMScript(owner, create_calldata(input_params))
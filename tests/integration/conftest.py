@@ -80,6 +80,7 @@ def easy_track(
     lido_contracts,
     deployer,
     load_deployed_contract,
+    fork_state_cache,
 ):
 
     loaded_easy_track = load_deployed_contract("EasyTrack")
@@ -95,39 +96,41 @@ def easy_track(
     if not loaded_easy_track is None:
         return loaded_easy_track
 
-    deployed_easy_track = EasyTrack.deploy(
-        lido_contracts.ldo,
-        lido_contracts.aragon.voting,
-        constants.MIN_MOTION_DURATION,
-        constants.MAX_MOTIONS_LIMIT,
-        constants.DEFAULT_OBJECTIONS_THRESHOLD,
-        {"from": deployer},
-    )
+    def deploy():
+        deployed_easy_track = EasyTrack.deploy(
+            lido_contracts.ldo,
+            lido_contracts.aragon.voting,
+            constants.MIN_MOTION_DURATION,
+            constants.MAX_MOTIONS_LIMIT,
+            constants.DEFAULT_OBJECTIONS_THRESHOLD,
+            {"from": deployer},
+        )
 
-    evm_script_executor = EVMScriptExecutor.deploy(
-        lido_contracts.aragon.calls_script, deployed_easy_track, {"from": deployer}
-    )
+        evm_script_executor = EVMScriptExecutor.deploy(
+            lido_contracts.aragon.calls_script, deployed_easy_track, {"from": deployer}
+        )
 
-    deployed_easy_track.setEVMScriptExecutor(evm_script_executor, {"from": lido_contracts.aragon.voting})
-    evm_script_executor.transferOwnership(lido_contracts.aragon.voting, {"from": deployer})
+        deployed_easy_track.setEVMScriptExecutor(evm_script_executor, {"from": lido_contracts.aragon.voting})
+        evm_script_executor.transferOwnership(lido_contracts.aragon.voting, {"from": deployer})
 
-    assert evm_script_executor.owner() == lido_contracts.aragon.voting
+        assert evm_script_executor.owner() == lido_contracts.aragon.voting
 
-    create_payments_permission = lido_contracts.permissions.finance.CREATE_PAYMENTS_ROLE
+        create_payments_permission = lido_contracts.permissions.finance.CREATE_PAYMENTS_ROLE
 
-    if not lido_contracts.aragon.acl.hasPermission(
-        evm_script_executor,
-        create_payments_permission.app,
-        create_payments_permission.role,
-    ):
-        lido_contracts.aragon.acl.grantPermission(
+        if not lido_contracts.aragon.acl.hasPermission(
             evm_script_executor,
             create_payments_permission.app,
             create_payments_permission.role,
-            {"from": lido_contracts.aragon.voting},
-        )
-
-    return deployed_easy_track
+        ):
+            lido_contracts.aragon.acl.grantPermission(
+                evm_script_executor,
+                create_payments_permission.app,
+                create_payments_permission.role,
+                {"from": lido_contracts.aragon.voting},
+            )
+        return {"EasyTrack": deployed_easy_track.address}
+
+    return EasyTrack.at(fork_state_cache.cached("integration.easy_track", deploy)["EasyTrack"])
 
 
 @pytest.fixture(scope="module")
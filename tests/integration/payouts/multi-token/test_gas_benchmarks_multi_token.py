@@ -0,0 +1,157 @@
+import pytest
+
+from utils import deployment, evm_script, test_helpers
+from utils.gas_benchmark import BENCHMARK_BATCH_SIZES
+
+pytestmark = pytest.mark.gas_benchmark
+
+TOP_UP_AMOUNT = 10**18
+
+
+def make_recipient_addresses(count):
+    return ["0x000000000000000000000000000000000000{:04}".format(i + 1) for i in range(count)]
+
+
+@pytest.fixture(scope="module")
+def recipients_registry(registries):
+    (allowed_recipients_registry, _) = registries
+    return allowed_recipients_registry
+
+
+@pytest.fixture(scope="module")
+def add_recipients(recipients_registry, lido_contracts):
+    def _add_recipients(recipient_addresses):
+        agent = lido_contracts.aragon.agent
+        add_recipient_role = recipients_registry.ADD_RECIPIENT_TO_ALLOWED_LIST_ROLE()
+        if not recipients_registry.hasRole(add_recipient_role, agent):
+            recipients_registry.grantRole(add_recipient_role, agent, {"from": agent})
+        for index, recipient_address in enumerate(recipient_addresses):
+            recipients_registry.addRecipient(recipient_address, f"benchmark recipient #{index}", {"from": agent})
+
+    return _add_recipients
+
+
+@pytest.fixture(scope="module")
+def add_allowed_recipients_evm_script_factory(
+    AddAllowedRecipients, easy_track, lido_contracts, recipients_registry, trusted_caller, deployer
+):
+    evm_script_factory = AddAllowedRecipients.deploy(trusted_caller, recipients_registry, {"from": deployer})
+    easy_track.addEVMScriptFactory(
+        evm_script_factory,
+        deployment.create_permission(recipients_registry, "addRecipients"),
+        {"from": lido_contracts.aragon.voting},
+    )
+    return evm_script_factory
+
+
+@pytest.fixture(scope="module")
+def remove_allowed_recipients_evm_script_factory(
+    RemoveAllowedRecipients, easy_track, lido_contracts, recipients_registry, trusted_caller, deployer
+):
+    evm_script_factory = RemoveAllowedRecipients.deploy(trusted_caller, recipients_registry, {"from": deployer})
+    easy_track.addEVMScriptFactory(
+        evm_script_factory,
+        deployment.create_permission(recipients_registry, "removeRecipients"),
+        {"from": lido_contracts.aragon.voting},
+    )
+    return evm_script_factory
+
+
+@pytest.mark.skip_coverage
+@pytest.mark.parametrize("batch_size", BENCHMARK_BATCH_SIZES)
+def test_top_up_allowed_recipients_gas(
+    batch_size,
+    easy_track,
+    stranger,
+    dai,
+    add_recipients,
+    add_allowed_token,
+    ensure_agent_dai_balance,
+    allowed_recipients_limit_params,
+    top_up_allowed_recipients_evm_script_factory,
+    benchmark_motion,
+):
+    recipient_addresses = make_recipient_addresses(batch_size)
+    add_recipients(recipient_addresses)
+    add_allowed_token(dai)
+    ensure_agent_dai_balance(batch_size * TOP_UP_AMOUNT // 10**18)
+
+    test_helpers.advance_chain_time_to_beginning_of_the_next_period(allowed_recipients_limit_params.duration)
+
+    benchmark_motion(
+        easy_track,
+        "TopUpAllowedRecipients",
+        batch_size,
+        top_up_allowed_recipients_evm_script_factory,
+        evm_script.encode_calldata(
+            ["address", "address[]", "uint256[]"], [dai, recipient_addresses, [TOP_UP_AMOUNT] * batch_size]
+        ),
+        top_up_allowed_recipients_evm_script_factory.trustedCaller(),
+        stranger,
+    )
+
+
+@pytest.mark.skip_coverage
+def test_add_and_remove_allowed_recipient_gas(
+    easy_track,
+    stranger,
+    trusted_caller,
+    add_allowed_recipient_evm_script_factory,
+    remove_allowed_recipient_evm_script_factory,
+    benchmark_motion,
+):
+    "AddAllowedRecipient and RemoveAllowedRecipient manage a single recipient, so they have only batch size 1"
+    recipient_address = make_recipient_addresses(1)[0]
+
+    benchmark_motion(
+        easy_track,
+        "AddAllowedRecipient",
+        1,
+        add_allowed_recipient_evm_script_factory,
+        evm_script.encode_calldata(["address", "string"], [recipient_address, "benchmark recipient"]),
+        trusted_caller,
+        stranger,
+    )
+    benchmark_motion(
+        easy_track,
+        "RemoveAllowedRecipient",
+        1,
+        remove_allowed_recipient_evm_script_factory,
+        evm_script.encode_calldata(["address"], [recipient_address]),
+        trusted_caller,
+        stranger,
+    )
+
+
+@pytest.mark.skip_coverage
+@pytest.mark.parametrize("batch_size", BENCHMARK_BATCH_SIZES)
+def test_add_and_remove_allowed_recipients_gas(
+    batch_size,
+    easy_track,
+    stranger,
+    trusted_caller,
+    add_allowed_recipients_evm_script_factory,
+    remove_allowed_recipients_evm_script_factory,
+    benchmark_motion,
+):
+    recipient_addresses = make_recipient_addresses(batch_size)
+    titles = [f"benchmark recipient #{i}" for i in range(batch_size)]
+
+    benchmark_motion(
+        easy_track,
+        "AddAllowedRecipients",
+        batch_size,
+        add_allowed_recipients_evm_script_factory,
+        evm_script.encode_calldata(["address[]", "string[]"], [recipient_addresses, titles]),
+        trusted_caller,
+        stranger,
+    )
+    benchmark_motion(
+        easy_track,
+        "RemoveAllowedRecipients",
+        batch_size,
+        remove_allowed_recipients_evm_script_factory,
+        evm_script.encode_calldata(["address[]"], [recipient_addresses]),
+        trusted_caller,
+        stranger,
+    )
@@ -4,6 +4,7 @@ from brownie import reverts
 from brownie.network import chain
 
 from utils import evm_script, test_helpers
+from utils.batch_enactment import enact_passed_motions
 from utils.dual_governance import submit_proposals, process_pending_proposals
 
 MAX_SECONDS_IN_MONTH = 31 * 24 * 60 * 60
@@ -64,6 +65,50 @@ def test_add_multiple_recipients_by_concurrent_motions(
     assert len(allowed_recipients_registry.getAllowedRecipients()) == allowed_recipients_count_before + 2
 
 
+def test_add_multiple_recipients_by_batch_enactment(
+    recipients,
+    stranger,
+    easy_track,
+    allowed_recipients_registry,
+    create_add_allowed_recipient_motion,
+    add_allowed_recipient_evm_script_factory,
+):
+    first_recipient, second_recipient = recipients[:2]
+
+    allowed_recipients_count_before = len(allowed_recipients_registry.getAllowedRecipients())
+
+    first_motion_creation_tx = create_add_allowed_recipient_motion(
+        add_allowed_recipient_evm_script_factory,
+        first_recipient.address,
+        first_recipient.title,
+    )
+    # the motion adding the same recipient can't be enacted and must be skipped
+    create_add_allowed_recipient_motion(
+        add_allowed_recipient_evm_script_factory,
+        first_recipient.address,
+        first_recipient.title,
+    )
+    second_motion_creation_tx = create_add_allowed_recipient_motion(
+        add_allowed_recipient_evm_script_factory,
+        second_recipient.address,
+        second_recipient.title,
+    )
+
+    chain.sleep(easy_track.motionDuration() + 100)
+
+    motion_enactment_tx = enact_passed_motions(
+        easy_track, {"from": stranger}, start_block=first_motion_creation_tx.block_number
+    )
+
+    assert [event["_motionId"] for event in motion_enactment_tx.events["MotionEnacted"]] == [
+        first_motion_creation_tx.events["MotionCreated"]["_motionId"],
+        second_motion_creation_tx.events["MotionCreated"]["_motionId"],
+    ]
+    assert allowed_recipients_registry.isRecipientAllowed(first_recipient.address)
+    assert allowed_recipients_registry.isRecipientAllowed(second_recipient.address)
+    assert len(allowed_recipients_registry.getAllowedRecipients()) == allowed_recipients_count_before + 2
+
+
 def test_fail_add_same_recipient_by_second_concurrent_motion(
     recipients,
     easy_track,
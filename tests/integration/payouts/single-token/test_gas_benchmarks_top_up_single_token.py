@@ -0,0 +1,55 @@
+import pytest
+
+from utils import evm_script, test_helpers
+from utils.gas_benchmark import BENCHMARK_BATCH_SIZES
+
+pytestmark = pytest.mark.gas_benchmark
+
+TOP_UP_AMOUNT = 10**18
+
+
+def make_recipient_addresses(count):
+    return ["0x000000000000000000000000000000000000{:04}".format(i + 1) for i in range(count)]
+
+
+@pytest.fixture(scope="module")
+def add_recipients(allowed_recipients_registry, lido_contracts):
+    def _add_recipients(recipient_addresses):
+        agent = lido_contracts.aragon.agent
+        add_recipient_role = allowed_recipients_registry.ADD_RECIPIENT_TO_ALLOWED_LIST_ROLE()
+        if not allowed_recipients_registry.hasRole(add_recipient_role, agent):
+            allowed_recipients_registry.grantRole(add_recipient_role, agent, {"from": agent})
+        for index, recipient_address in enumerate(recipient_addresses):
+            allowed_recipients_registry.addRecipient(
+                recipient_address, f"benchmark recipient #{index}", {"from": agent}
+            )
+
+    return _add_recipients
+
+
+@pytest.mark.skip_coverage
+@pytest.mark.parametrize("batch_size", BENCHMARK_BATCH_SIZES)
+def test_top_up_allowed_recipients_gas(
+    batch_size,
+    easy_track,
+    stranger,
+    add_recipients,
+    allowed_recipients_limit_params,
+    top_up_allowed_recipients_evm_script_factory,
+    benchmark_motion,
+):
+    recipient_addresses = make_recipient_addresses(batch_size)
+    add_recipients(recipient_addresses)
+
+    test_helpers.advance_chain_time_to_beginning_of_the_next_period(allowed_recipients_limit_params.duration)
+
+    benchmark_motion(
+        easy_track,
+        "TopUpAllowedRecipientsSingleToken",
+        batch_size,
+        top_up_allowed_recipients_evm_script_factory,
+        evm_script.encode_calldata(["address[]", "uint256[]"], [recipient_addresses, [TOP_UP_AMOUNT] * batch_size]),
+        top_up_allowed_recipients_evm_script_factory.trustedCaller(),
+        stranger,
+        fast_enactment=True,
+    )
@@ -0,0 +1,52 @@
+import pytest
+
+from utils import deployment, evm_script
+from utils.gas_benchmark import BENCHMARK_BATCH_SIZES
+from utils.test_helpers import set_account_balance
+
+pytestmark = pytest.mark.gas_benchmark
+
+
+@pytest.fixture(scope="module")
+def csm_settle_el_stealing_penalty_evm_script_factory(
+    CSMSettleElStealingPenalty, easy_track, lido_contracts, cs_module, trusted_caller, deployer
+):
+    evm_script_factory = CSMSettleElStealingPenalty.deploy(trusted_caller, cs_module, {"from": deployer})
+    easy_track.addEVMScriptFactory(
+        evm_script_factory,
+        deployment.create_permission(cs_module, "settleELRewardsStealingPenalty"),
+        {"from": lido_contracts.aragon.voting},
+    )
+
+    admin = cs_module.getRoleMember(cs_module.DEFAULT_ADMIN_ROLE(), 0)
+    set_account_balance(admin)
+    cs_module.grantRole(
+        cs_module.SETTLE_EL_REWARDS_STEALING_PENALTY_ROLE(), easy_track.evmScriptExecutor(), {"from": admin}
+    )
+    return evm_script_factory
+
+
+@pytest.mark.skip_coverage
+@pytest.mark.parametrize("batch_size", BENCHMARK_BATCH_SIZES)
+def test_csm_settle_el_stealing_penalty_gas(
+    batch_size,
+    easy_track,
+    stranger,
+    trusted_caller,
+    cs_module,
+    csm_settle_el_stealing_penalty_evm_script_factory,
+    benchmark_motion,
+):
+    "Node operators of the forked CSModule have no locked bond, so the settlement of every one is a no-op"
+    if cs_module.getNodeOperatorsCount() < batch_size:
+        pytest.skip(f"CSModule has less than {batch_size} node operators")
+
+    benchmark_motion(
+        easy_track,
+        "CSMSettleELStealingPenalty",
+        batch_size,
+        csm_settle_el_stealing_penalty_evm_script_factory,
+        evm_script.encode_calldata(["uint256[]"], [list(range(batch_size))]),
+        trusted_caller,
+        stranger,
+    )
@@ -0,0 +1,48 @@
+import pytest
+
+from utils import deployment, evm_script
+from utils.gas_benchmark import BENCHMARK_BATCH_SIZES
+
+pytestmark = pytest.mark.gas_benchmark
+
+TOP_UP_AMOUNT = 10**18
+
+
+@pytest.fixture(scope="module")
+def top_up_lego_program_evm_script_factory(
+    TopUpLegoProgram, easy_track, lido_contracts, lego_program, trusted_caller, deployer
+):
+    evm_script_factory = TopUpLegoProgram.deploy(
+        trusted_caller, lido_contracts.aragon.finance, lego_program, {"from": deployer}
+    )
+    easy_track.addEVMScriptFactory(
+        evm_script_factory,
+        deployment.create_permission(lido_contracts.aragon.finance, "newImmediatePayment"),
+        {"from": lido_contracts.aragon.voting},
+    )
+    return evm_script_factory
+
+
+@pytest.mark.skip_coverage
+@pytest.mark.parametrize("batch_size", BENCHMARK_BATCH_SIZES)
+def test_top_up_lego_program_gas(
+    batch_size,
+    easy_track,
+    stranger,
+    trusted_caller,
+    lido_contracts,
+    top_up_lego_program_evm_script_factory,
+    benchmark_motion,
+):
+    "Every payment of the batch transfers LDO, the Agent holds enough of it for all batch sizes"
+    benchmark_motion(
+        easy_track,
+        "TopUpLegoProgram",
+        batch_size,
+        top_up_lego_program_evm_script_factory,
+        evm_script.encode_calldata(
+            ["address[]", "uint256[]"], [[lido_contracts.ldo.address] * batch_size, [TOP_UP_AMOUNT] * batch_size]
+        ),
+        trusted_caller,
+        stranger,
+    )
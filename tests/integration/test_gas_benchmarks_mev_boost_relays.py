@@ -0,0 +1,131 @@
+import pytest
+
+from utils.evm_script import encode_call_script, encode_calldata
+from utils.dual_governance import submit_proposals, process_pending_proposals
+from utils.gas_benchmark import BENCHMARK_BATCH_SIZES
+
+pytestmark = pytest.mark.gas_benchmark
+
+MAX_NUM_RELAYS = 40
+
+
+def make_relays(count, description="benchmark relay"):
+    return [(f"https://relay-{i}.benchmark.io", f"Operator #{i}", i % 2 == 0, description) for i in range(count)]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def script_executor_is_manager(lido_contracts, mev_boost_relay_allowed_list, easy_track):
+    evm_executor = easy_track.evmScriptExecutor()
+    agent = lido_contracts.aragon.agent
+
+    if mev_boost_relay_allowed_list.get_manager().lower() == evm_executor.lower():
+        return
+
+    set_manager_script = encode_call_script(
+        [(mev_boost_relay_allowed_list.address, mev_boost_relay_allowed_list.set_manager.encode_input(evm_executor))]
+    )
+    vote_id, _ = lido_contracts.create_voting(
+        evm_script=encode_call_script(
+            submit_proposals(
+                [
+                    (
+                        [(agent.address, agent.forward.encode_input(set_manager_script))],
+                        "Set manager for MEV Boost Relay Allowed List to EVMScriptExecutor",
+                    )
+                ]
+            )
+        ),
+        description="Set manager for MEV Boost Relay Allowed List to EVMScriptExecutor",
+        tx_params={"from": agent.address},
+    )
+    lido_contracts.execute_voting(vote_id)
+    process_pending_proposals()
+
+
+@pytest.fixture(scope="module")
+def prepare_relays_list(lido_contracts, mev_boost_relay_allowed_list):
+    def _prepare_relays_list(relays_to_add_count, relays_to_keep=()):
+        # free the space for the new relays, so the motion doesn't hit MAX_NUM_RELAYS
+        current_relays = list(mev_boost_relay_allowed_list.get_relays())
+        while len(current_relays) + relays_to_add_count > MAX_NUM_RELAYS:
+            relay = current_relays.pop()
+            mev_boost_relay_allowed_list.remove_relay(relay[0], {"from": lido_contracts.aragon.agent.address})
+        for relay in relays_to_keep:
+            mev_boost_relay_allowed_list.add_relay(*relay, {"from": lido_contracts.aragon.agent.address})
+
+    return _prepare_relays_list
+
+
+@pytest.mark.skip_coverage
+@pytest.mark.parametrize("batch_size", BENCHMARK_BATCH_SIZES)
+def test_add_mev_boost_relays_gas(
+    batch_size,
+    easy_track,
+    stranger,
+    rmc_factories_multisig,
+    add_mev_boost_relays_evm_script_factory,
+    prepare_relays_list,
+    benchmark_motion,
+):
+    relays = make_relays(batch_size)
+    prepare_relays_list(batch_size)
+
+    benchmark_motion(
+        easy_track,
+        "AddMEVBoostRelays",
+        batch_size,
+        add_mev_boost_relays_evm_script_factory,
+        encode_calldata(["(string,string,bool,string)[]"], [relays]),
+        rmc_factories_multisig,
+        stranger,
+    )
+
+
+@pytest.mark.skip_coverage
+@pytest.mark.parametrize("batch_size", BENCHMARK_BATCH_SIZES)
+def test_remove_mev_boost_relays_gas(
+    batch_size,
+    easy_track,
+    stranger,
+    rmc_factories_multisig,
+    remove_mev_boost_relays_evm_script_factory,
+    prepare_relays_list,
+    benchmark_motion,
+):
+    relays = make_relays(batch_size)
+    prepare_relays_list(batch_size, relays_to_keep=relays)
+
+    benchmark_motion(
+        easy_track,
+        "RemoveMEVBoostRelays",
+        batch_size,
+        remove_mev_boost_relays_evm_script_factory,
+        encode_calldata(["string[]"], [[relay[0] for relay in relays]]),
+        rmc_factories_multisig,
+        stranger,
+    )
+
+
+@pytest.mark.skip_coverage
+@pytest.mark.parametrize("batch_size", BENCHMARK_BATCH_SIZES)
+def test_edit_mev_boost_relays_gas(
+    batch_size,
+    easy_track,
+    stranger,
+    rmc_factories_multisig,
+    edit_mev_boost_relays_evm_script_factory,
+    prepare_relays_list,
+    benchmark_motion,
+):
+    relays = make_relays(batch_size)
+    prepare_relays_list(batch_size, relays_to_keep=relays)
+
+    benchmark_motion(
+        easy_track,
+        "EditMEVBoostRelays",
+        batch_size,
+        edit_mev_boost_relays_evm_script_factory,
+        encode_calldata(["(string,string,bool,string)[]"], [make_relays(batch_size, "edited benchmark relay")]),
+        rmc_factories_multisig,
+        stranger,
+    )
@@ -0,0 +1,129 @@
+import pytest
+
+from utils import deployment, evm_script
+from utils.gas_benchmark import BENCHMARK_BATCH_SIZES
+
+pytestmark = pytest.mark.gas_benchmark
+
+TOP_UP_AMOUNT = 10**18
+
+
+def make_reward_program_addresses(count):
+    return ["0x000000000000000000000000000000000005{:04}".format(i + 1) for i in range(count)]
+
+
+@pytest.fixture(scope="module")
+def reward_programs_registry(RewardProgramsRegistry, easy_track, lido_contracts, deployer):
+    voting = lido_contracts.aragon.voting
+    evm_script_executor = easy_track.evmScriptExecutor()
+    return RewardProgramsRegistry.deploy(
+        voting, [voting, evm_script_executor], [voting, evm_script_executor], {"from": deployer}
+    )
+
+
+@pytest.fixture(scope="module")
+def add_reward_program_evm_script_factory(
+    AddRewardProgram, easy_track, lido_contracts, reward_programs_registry, trusted_caller, deployer
+):
+    evm_script_factory = AddRewardProgram.deploy(trusted_caller, reward_programs_registry, {"from": deployer})
+    easy_track.addEVMScriptFactory(
+        evm_script_factory,
+        deployment.create_permission(reward_programs_registry, "addRewardProgram"),
+        {"from": lido_contracts.aragon.voting},
+    )
+    return evm_script_factory
+
+
+@pytest.fixture(scope="module")
+def remove_reward_program_evm_script_factory(
+    RemoveRewardProgram, easy_track, lido_contracts, reward_programs_registry, trusted_caller, deployer
+):
+    evm_script_factory = RemoveRewardProgram.deploy(trusted_caller, reward_programs_registry, {"from": deployer})
+    easy_track.addEVMScriptFactory(
+        evm_script_factory,
+        deployment.create_permission(reward_programs_registry, "removeRewardProgram"),
+        {"from": lido_contracts.aragon.voting},
+    )
+    return evm_script_factory
+
+
+@pytest.fixture(scope="module")
+def top_up_reward_programs_evm_script_factory(
+    TopUpRewardPrograms, easy_track, lido_contracts, reward_programs_registry, trusted_caller, deployer
+):
+    evm_script_factory = TopUpRewardPrograms.deploy(
+        trusted_caller,
+        reward_programs_registry,
+        lido_contracts.aragon.finance,
+        lido_contracts.ldo,
+        {"from": deployer},
+    )
+    easy_track.addEVMScriptFactory(
+        evm_script_factory,
+        deployment.create_permission(lido_contracts.aragon.finance, "newImmediatePayment"),
+        {"from": lido_contracts.aragon.voting},
+    )
+    return evm_script_factory
+
+
+@pytest.mark.skip_coverage
+def test_add_and_remove_reward_program_gas(
+    easy_track,
+    stranger,
+    trusted_caller,
+    add_reward_program_evm_script_factory,
+    remove_reward_program_evm_script_factory,
+    benchmark_motion,
+):
+    "AddRewardProgram and RemoveRewardProgram manage a single reward program, so they have only batch size 1"
+    reward_program_address = make_reward_program_addresses(1)[0]
+
+    benchmark_motion(
+        easy_track,
+        "AddRewardProgram",
+        1,
+        add_reward_program_evm_script_factory,
+        evm_script.encode_calldata(["address", "string"], [reward_program_address, "benchmark reward program"]),
+        trusted_caller,
+        stranger,
+    )
+    benchmark_motion(
+        easy_track,
+        "RemoveRewardProgram",
+        1,
+        remove_reward_program_evm_script_factory,
+        evm_script.encode_calldata(["address"], [reward_program_address]),
+        trusted_caller,
+        stranger,
+    )
+
+
+@pytest.mark.skip_coverage
+@pytest.mark.parametrize("batch_size", BENCHMARK_BATCH_SIZES)
+def test_top_up_reward_programs_gas(
+    batch_size,
+    easy_track,
+    stranger,
+    trusted_caller,
+    lido_contracts,
+    reward_programs_registry,
+    top_up_reward_programs_evm_script_factory,
+    benchmark_motion,
+):
+    reward_program_addresses = make_reward_program_addresses(batch_size)
+    for index, reward_program_address in enumerate(reward_program_addresses):
+        reward_programs_registry.addRewardProgram(
+            reward_program_address, f"benchmark reward program #{index}", {"from": lido_contracts.aragon.voting}
+        )
+
+    benchmark_motion(
+        easy_track,
+        "TopUpRewardPrograms",
+        batch_size,
+        top_up_reward_programs_evm_script_factory,
+        evm_script.encode_calldata(
+            ["address[]", "uint256[]"], [reward_program_addresses, [TOP_UP_AMOUNT] * batch_size]
+        ),
+        trusted_caller,
+        stranger,
+    )
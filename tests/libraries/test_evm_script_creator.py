@@ -1,6 +1,7 @@
 import pytest
 from eth_abi import encode
 from utils.evm_script import encode_call_script
+from utils.evm_script_codec import iter_call_script, decode_call_script
 from brownie import reverts
 
 
@@ -179,6 +180,56 @@ def test_create_evm_script_many_addresses(
     assert evm_script == expected_evm_script
 
 
+def test_decode_evm_script_many_addresses(
+    accounts,
+    reward_programs_registry,
+    evm_script_creator_wrapper,
+    node_operators_registry_stub,
+):
+    reward_program = accounts[3]
+    to = [node_operators_registry_stub.address, reward_programs_registry.address]
+    method_id = [
+        node_operators_registry_stub.setNodeOperatorStakingLimit.signature,
+        reward_programs_registry.removeRewardProgram.signature,
+    ]
+    method_call_data = [
+        encode_set_node_operator_staking_limit_calldata(1, 300),
+        encode_remove_reward_program_calldata(reward_program.address),
+    ]
+    evm_script = evm_script_creator_wrapper.createEVMScript["address[],bytes4[],bytes[]"](
+        to, method_id, method_call_data
+    )
+
+    actions = list(iter_call_script(evm_script, spec_id=1))
+    assert len(actions) == 2
+    for action, expected_to, expected_method_id, expected_call_data in zip(actions, to, method_id, method_call_data):
+        assert action.to == expected_to
+        assert "0x" + action.selector.hex() == expected_method_id
+        assert "0x" + action.calldata[4:].hex() == expected_call_data
+
+    spec_id, decoded_actions = decode_call_script(evm_script)
+    assert spec_id == 1
+    assert encode_call_script(decoded_actions, spec_id) == evm_script
+
+
+@pytest.mark.parametrize("calls_count", [0, 1, 7, 300])
+def test_create_evm_script_unaligned_call_data(accounts, evm_script_creator_wrapper, calls_count):
+    "EVMScripts with call data of lengths not multiple of 32 bytes must be encoded byte-for-byte"
+    to = [accounts[i % 10].address for i in range(calls_count)]
+    method_ids = ["0x{:08x}".format(0xA1B2C300 + i % 256) for i in range(calls_count)]
+    call_data = ["0x" + bytes((i + j) % 256 for j in range(i % 67)).hex() for i in range(calls_count)]
+
+    assert evm_script_creator_wrapper.createEVMScript["address[],bytes4[],bytes[]"](
+        to, method_ids, call_data
+    ) == encode_call_script([(to[i], method_ids[i] + call_data[i][2:]) for i in range(calls_count)])
+    assert evm_script_creator_wrapper.createEVMScript["address,bytes4[],bytes[]"](
+        accounts[0].address, method_ids, call_data
+    ) == encode_call_script([(accounts[0].address, method_ids[i] + call_data[i][2:]) for i in range(calls_count)])
+    assert evm_script_creator_wrapper.createEVMScript["address,bytes4,bytes[]"](
+        accounts[0].address, "0xa1b2c3d4", call_data
+    ) == encode_call_script([(accounts[0].address, "0xa1b2c3d4" + call_data[i][2:]) for i in range(calls_count)])
+
+
 def encode_remove_reward_program_calldata(reward_program):
     return "0x" + encode(["address"], [reward_program]).hex()
 
@@ -2,6 +2,7 @@ import pytest
 from brownie import ZERO_ADDRESS
 from brownie.convert import to_bytes
 from utils.evm_script import encode_call_script
+from utils.evm_script_permissions import PermissionSet, FactoryPermissionsCache
 
 
 @pytest.fixture(scope="session", params=range(5))
@@ -173,9 +174,71 @@ def test_can_execute_evm_script_has_no_permissions(
     assert not evm_script_permissions_wrapper.canExecuteEVMScript(permission, calldata)
 
 
+def test_can_execute_evm_script_with_permissions_set_evm_script_too_short(
+    evm_script_permissions_wrapper, valid_permissions
+):
+    evm_script_permissions_wrapper.addToPermissionsSet(valid_permissions)
+    assert not evm_script_permissions_wrapper.canExecuteEVMScriptWithPermissionsSet(b"")
+
+
+def test_can_execute_evm_script_with_permissions_set_has_permissions(
+    evm_script_permissions_wrapper, permissions_with_allowed_calldata
+):
+    permission, calldata = permissions_with_allowed_calldata
+    evm_script_permissions_wrapper.addToPermissionsSet(permission)
+    assert evm_script_permissions_wrapper.canExecuteEVMScriptWithPermissionsSet(calldata)
+
+    evm_script_permissions_wrapper.removeFromPermissionsSet(permission)
+    assert not evm_script_permissions_wrapper.canExecuteEVMScriptWithPermissionsSet(calldata)
+
+
+def test_can_execute_evm_script_with_permissions_set_has_no_permissions(
+    evm_script_permissions_wrapper, permissions_with_not_allowed_calldata
+):
+    permission, calldata = permissions_with_not_allowed_calldata
+    evm_script_permissions_wrapper.addToPermissionsSet(permission)
+    assert not evm_script_permissions_wrapper.canExecuteEVMScriptWithPermissionsSet(calldata)
+
+
 def test_is_valid_permissions_valid(evm_script_permissions_wrapper, valid_permissions):
     assert evm_script_permissions_wrapper.isValidPermissions(valid_permissions)
 
 
 def test_is_valid_permissions_invalid(evm_script_permissions_wrapper, invalid_permissions):
     assert not evm_script_permissions_wrapper.isValidPermissions(invalid_permissions)
+
+
+def test_permission_set_matches_library_has_permissions(
+    evm_script_permissions_wrapper, permissions_with_allowed_calldata
+):
+    permission, calldata = permissions_with_allowed_calldata
+    assert evm_script_permissions_wrapper.canExecuteEVMScript(permission, calldata)
+    assert PermissionSet(permission).can_execute_evm_script(calldata)
+
+
+def test_permission_set_matches_library_has_no_permissions(
+    evm_script_permissions_wrapper, permissions_with_not_allowed_calldata
+):
+    permission, calldata = permissions_with_not_allowed_calldata
+    assert not evm_script_permissions_wrapper.canExecuteEVMScript(permission, calldata)
+    assert not PermissionSet(permission).can_execute_evm_script(calldata)
+
+
+def test_permission_set_validity(valid_permissions, invalid_permissions):
+    assert PermissionSet(valid_permissions).is_valid
+    assert not PermissionSet(invalid_permissions).is_valid
+
+
+def test_factory_permissions_cache(voting, easy_track, evm_script_factory_stub):
+    permissions = evm_script_factory_stub.DEFAULT_PERMISSIONS()
+    easy_track.addEVMScriptFactory(evm_script_factory_stub, permissions, {"from": voting})
+
+    cache = FactoryPermissionsCache(easy_track)
+    cache.preload()
+    assert len(cache.get(evm_script_factory_stub)) == len(permissions) // 24
+    assert cache.can_execute_evm_script(evm_script_factory_stub, evm_script_factory_stub.DEFAULT_EVM_SCRIPT())
+
+    easy_track.removeEVMScriptFactory(evm_script_factory_stub, {"from": voting})
+    assert cache.get(evm_script_factory_stub).is_valid
+    cache.invalidate(evm_script_factory_stub)
+    assert not cache.get(evm_script_factory_stub).is_valid
@@ -0,0 +1,56 @@
+import random
+
+import pytest
+from brownie import ZERO_ADDRESS
+
+
+def random_keys(count, unique_count):
+    unique_keys = ["0x" + random.getrandbits(256).to_bytes(32, "big").hex() for _ in range(unique_count)]
+    return [random.choice(unique_keys) for _ in range(count)]
+
+
+def first_duplicate(keys):
+    return next((i for i, key in enumerate(keys) if key in keys[i + 1 :]), len(keys))
+
+
+@pytest.mark.parametrize("count,unique_count", [(0, 1), (1, 1), (2, 2), (10, 10), (10, 8), (50, 45), (100, 99)])
+def test_find_first_duplicate(memory_hash_set_wrapper, count, unique_count):
+    random.seed(count * unique_count)
+    keys = random_keys(count, unique_count)
+
+    assert memory_hash_set_wrapper.findFirstDuplicate(keys) == first_duplicate(keys)
+    assert memory_hash_set_wrapper.findFirstDuplicateWithNestedLoops(keys) == first_duplicate(keys)
+
+
+def test_find_first_duplicate_returns_lowest_index(memory_hash_set_wrapper):
+    a, b, c = ["0x" + (bytes([i]) * 32).hex() for i in range(1, 4)]
+
+    # "b" is duplicated first, but "a" has the lower index of the first occurrence
+    assert memory_hash_set_wrapper.findFirstDuplicate([a, b, b, c, a]) == 0
+    assert memory_hash_set_wrapper.findFirstDuplicate([c, b, a, b]) == 1
+    assert memory_hash_set_wrapper.findFirstDuplicate([a, b, c]) == 3
+
+
+def test_find_first_duplicate_with_colliding_slots(memory_hash_set_wrapper):
+    "Keys with the same low bits are stored in the sequential slots"
+    keys = ["0x" + (i.to_bytes(16, "big") + bytes(16)).hex() for i in range(1, 20)]
+
+    assert memory_hash_set_wrapper.findFirstDuplicate(keys) == len(keys)
+    assert memory_hash_set_wrapper.findFirstDuplicate(keys + [keys[7]]) == 7
+
+
+def test_find_first_duplicate_address(memory_hash_set_wrapper, accounts):
+    addresses = [account.address for account in accounts[:5]] + [ZERO_ADDRESS]
+
+    assert memory_hash_set_wrapper.findFirstDuplicateAddress(addresses) == len(addresses)
+    assert memory_hash_set_wrapper.findFirstDuplicateAddress(addresses + [addresses[2]]) == 2
+    assert memory_hash_set_wrapper.findFirstDuplicateAddress(addresses + [ZERO_ADDRESS]) == len(addresses) - 1
+
+
+@pytest.mark.parametrize("set_size", [0, 1, 10, 100])
+def test_contains(memory_hash_set_wrapper, set_size):
+    random.seed(set_size)
+    keys = random_keys(set_size, set_size)
+    lookup_keys = keys[: set_size // 2] + random_keys(5, 5)
+
+    assert memory_hash_set_wrapper.containsAll(keys, lookup_keys) == [key in keys for key in lookup_keys]
@@ -209,6 +209,24 @@ def test_validate_uris_reverts_on_duplicate_entries(
         )
 
 
+def test_validate_uris_reverts_in_order_of_entries(
+    mev_boost_relay_input_utils_wrapper, allowed_uris, stranger, mev_boost_relay_test_config
+):
+    "Must revert with the error of the first invalid entry when the input has several errors"
+
+    with reverts("EMPTY_RELAY_URI"):
+        mev_boost_relay_input_utils_wrapper.validateRelayURIs(
+            ["", allowed_uris[0], allowed_uris[0]], mev_boost_relay_test_config["relays"], {"from": stranger}
+        )
+
+    with reverts("DUPLICATE_RELAY_URI"):
+        mev_boost_relay_input_utils_wrapper.validateRelayURIs(
+            [allowed_uris[1], allowed_uris[0], "", allowed_uris[0]],
+            mev_boost_relay_test_config["relays"],
+            {"from": stranger},
+        )
+
+
 # Decoding Function Tests
 def test_decode_structs_returns_valid_relay_struct_array(
     mev_boost_relay_input_utils_wrapper, mev_boost_relay_test_config
@@ -0,0 +1,53 @@
+from brownie import reverts
+
+# the first node operators of the Curated module and the last ones, which are added later and may be inactive
+NODE_OPERATORS_TO_CHECK_COUNT = 5
+
+
+def test_get_node_operator_summary_matches_get_node_operator(node_operators_registry_reader_wrapper, lido_contracts):
+    "Must read the same data as getNodeOperator() of the real NodeOperatorsRegistry"
+    node_operators_registry = lido_contracts.node_operators_registry
+    node_operators_count = node_operators_registry.getNodeOperatorsCount()
+    assert node_operators_count > NODE_OPERATORS_TO_CHECK_COUNT
+
+    node_operator_ids = list(range(NODE_OPERATORS_TO_CHECK_COUNT)) + list(
+        range(node_operators_count - NODE_OPERATORS_TO_CHECK_COUNT, node_operators_count)
+    )
+    for node_operator_id in node_operator_ids:
+        node_operator = node_operators_registry.getNodeOperator(node_operator_id, False)
+        summary = node_operators_registry_reader_wrapper.getNodeOperatorSummary(
+            node_operators_registry, node_operator_id
+        )
+
+        assert summary["active"] == node_operator["active"]
+        assert summary["rewardAddress"] == node_operator["rewardAddress"]
+        assert summary["stakingLimit"] == node_operator["stakingLimit"]
+        assert summary["totalSigningKeys"] == node_operator["totalSigningKeys"]
+
+
+def test_get_node_operator_summary_of_inactive_node_operator(
+    node_operators_registry_reader_wrapper, lido_contracts, agent
+):
+    node_operators_registry = lido_contracts.node_operators_registry
+    node_operator_id = 0
+    if node_operators_registry.getNodeOperatorIsActive(node_operator_id):
+        node_operators_registry.deactivateNodeOperator(node_operator_id, {"from": agent})
+
+    summary = node_operators_registry_reader_wrapper.getNodeOperatorSummary(node_operators_registry, node_operator_id)
+    node_operator = node_operators_registry.getNodeOperator(node_operator_id, False)
+
+    assert not summary["active"]
+    assert summary["rewardAddress"] == node_operator["rewardAddress"]
+    assert summary["stakingLimit"] == node_operator["stakingLimit"]
+    assert summary["totalSigningKeys"] == node_operator["totalSigningKeys"]
+
+
+def test_get_node_operator_summary_reverts_with_registry_error(node_operators_registry_reader_wrapper, lido_contracts):
+    "Must bubble up the revert of getNodeOperator() for unknown node operator"
+    node_operators_registry = lido_contracts.node_operators_registry
+    node_operators_count = node_operators_registry.getNodeOperatorsCount()
+
+    with reverts("OUT_OF_RANGE"):
+        node_operators_registry.getNodeOperator(node_operators_count, False)
+    with reverts("OUT_OF_RANGE"):
+        node_operators_registry_reader_wrapper.getNodeOperatorSummary(node_operators_registry, node_operators_count)
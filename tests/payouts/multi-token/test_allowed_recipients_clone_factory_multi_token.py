@@ -0,0 +1,263 @@
+import pytest
+import constants
+from brownie import Contract, chain, reverts, ZERO_ADDRESS
+
+from utils import deployment
+from utils.evm_script import encode_calldata
+from utils.test_helpers import (
+    ADD_RECIPIENT_TO_ALLOWED_LIST_ROLE,
+    REMOVE_RECIPIENT_FROM_ALLOWED_LIST_ROLE,
+    ADD_TOKEN_TO_ALLOWED_LIST_ROLE,
+    SET_PARAMETERS_ROLE,
+    UPDATE_SPENT_AMOUNT_ROLE,
+    DEFAULT_ADMIN_ROLE,
+)
+
+ALREADY_INITIALIZED_ERROR = "Initializable: contract is already initialized"
+
+
+@pytest.fixture(scope="module")
+def allowed_recipients_clone_factory(owner):
+    return deployment.deploy_allowed_recipients_clone_factory({"from": owner})
+
+
+@pytest.fixture(scope="module")
+def allowed_recipients_builder(
+    owner,
+    AllowedRecipientsBuilder,
+    allowed_recipients_clone_factory,
+    agent,
+    finance,
+    easy_track,
+    bokkyPooBahsDateTimeContract,
+):
+    return owner.deploy(
+        AllowedRecipientsBuilder,
+        allowed_recipients_clone_factory,
+        agent,
+        easy_track,
+        finance,
+        bokkyPooBahsDateTimeContract,
+    )
+
+
+def test_implementations_can_not_be_initialized(
+    stranger,
+    allowed_recipients_clone_factory,
+    AllowedRecipientsRegistry,
+    AllowedTokensRegistry,
+    TopUpAllowedRecipientsInitializable,
+    AddAllowedRecipientInitializable,
+    RemoveAllowedRecipientInitializable,
+):
+    factory = allowed_recipients_clone_factory
+    recipients_registry = AllowedRecipientsRegistry.at(factory.allowedRecipientsRegistryImplementation())
+    with reverts(ALREADY_INITIALIZED_ERROR):
+        recipients_registry.initialize(
+            stranger, [stranger], [stranger], [stranger], [stranger], ZERO_ADDRESS, {"from": stranger}
+        )
+
+    tokens_registry = AllowedTokensRegistry.at(factory.allowedTokensRegistryImplementation())
+    with reverts(ALREADY_INITIALIZED_ERROR):
+        tokens_registry.initialize(stranger, [stranger], [stranger], {"from": stranger})
+
+    top_up = TopUpAllowedRecipientsInitializable.at(factory.topUpAllowedRecipientsImplementation())
+    with reverts(ALREADY_INITIALIZED_ERROR):
+        top_up.initialize(stranger, stranger, stranger, stranger, stranger, {"from": stranger})
+
+    for implementation in [
+        AddAllowedRecipientInitializable.at(factory.addAllowedRecipientImplementation()),
+        RemoveAllowedRecipientInitializable.at(factory.removeAllowedRecipientImplementation()),
+    ]:
+        with reverts(ALREADY_INITIALIZED_ERROR):
+            implementation.initialize(stranger, stranger, {"from": stranger})
+
+
+def test_deploy_with_zero_trusted_caller(stranger, allowed_recipients_clone_factory):
+    with reverts("TRUSTED_CALLER_IS_ZERO_ADDRESS"):
+        allowed_recipients_clone_factory.deployAddAllowedRecipient(ZERO_ADDRESS, stranger, {"from": stranger})
+
+
+def test_deploy_full_setup(
+    allowed_recipients_builder,
+    allowed_recipients_clone_factory,
+    stranger,
+    agent,
+    ldo,
+    finance,
+    easy_track,
+    evm_script_executor,
+    AllowedRecipientsRegistry,
+    AllowedTokensRegistry,
+    AddAllowedRecipientInitializable,
+    RemoveAllowedRecipientInitializable,
+    TopUpAllowedRecipientsInitializable,
+):
+    recipients = [
+        "0xbbe8dDEf5BF31b71Ff5DbE89635f9dB4DeFC667E",
+        "0x07fC01f46dC1348d7Ce43787b5Bbd52d8711a92D",
+    ]
+    titles = ["Default Reward Program", "Happy"]
+    trusted_caller = "0x3eaE0B337413407FB3C65324735D797ddc7E071D"
+    limit = 10_000 * 10**18
+    period = 1
+    spent_amount = 10**18
+
+    tx = allowed_recipients_builder.deployFullSetup(
+        trusted_caller, limit, period, [ldo], recipients, titles, spent_amount, {"from": stranger}
+    )
+
+    factory = allowed_recipients_clone_factory
+    recipients_registry_address = tx.events["AllowedRecipientsRegistryDeployed"]["allowedRecipientsRegistry"]
+    tokens_registry_address = tx.events["AllowedTokensRegistryDeployed"]["allowedTokensRegistry"]
+    top_up_address = tx.events["TopUpAllowedRecipientsDeployed"]["topUpAllowedRecipients"]
+    add_recipient_address = tx.events["AddAllowedRecipientDeployed"]["addAllowedRecipient"]
+    remove_recipient_address = tx.events["RemoveAllowedRecipientDeployed"]["removeAllowedRecipient"]
+
+    for contract_address, implementation in [
+        (recipients_registry_address, factory.allowedRecipientsRegistryImplementation()),
+        (tokens_registry_address, factory.allowedTokensRegistryImplementation()),
+        (top_up_address, factory.topUpAllowedRecipientsImplementation()),
+        (add_recipient_address, factory.addAllowedRecipientImplementation()),
+        (remove_recipient_address, factory.removeAllowedRecipientImplementation()),
+    ]:
+        assert deployment.get_clone_implementation(contract_address) == implementation
+
+    recipients_registry = Contract.from_abi(
+        "AllowedRecipientsRegistry", recipients_registry_address, AllowedRecipientsRegistry.abi
+    )
+    tokens_registry = Contract.from_abi("AllowedTokensRegistry", tokens_registry_address, AllowedTokensRegistry.abi)
+    top_up_allowed_recipients = Contract.from_abi(
+        "TopUpAllowedRecipientsInitializable", top_up_address, TopUpAllowedRecipientsInitializable.abi
+    )
+    add_allowed_recipient = Contract.from_abi(
+        "AddAllowedRecipientInitializable", add_recipient_address, AddAllowedRecipientInitializable.abi
+    )
+    remove_allowed_recipient = Contract.from_abi(
+        "RemoveAllowedRecipientInitializable", remove_recipient_address, RemoveAllowedRecipientInitializable.abi
+    )
+
+    assert recipients_registry.getAllowedRecipients() == recipients
+    assert recipients_registry.getLimitParameters() == (limit, period)
+    assert recipients_registry.spendableBalance() == limit - spent_amount
+    assert recipients_registry.hasRole(DEFAULT_ADMIN_ROLE, agent)
+    assert recipients_registry.hasRole(ADD_RECIPIENT_TO_ALLOWED_LIST_ROLE, evm_script_executor)
+    assert recipients_registry.hasRole(REMOVE_RECIPIENT_FROM_ALLOWED_LIST_ROLE, evm_script_executor)
+    assert recipients_registry.hasRole(UPDATE_SPENT_AMOUNT_ROLE, evm_script_executor)
+    assert not recipients_registry.hasRole(SET_PARAMETERS_ROLE, allowed_recipients_builder)
+
+    assert tokens_registry.getAllowedTokens() == [ldo]
+    assert tokens_registry.hasRole(DEFAULT_ADMIN_ROLE, agent)
+    assert not tokens_registry.hasRole(ADD_TOKEN_TO_ALLOWED_LIST_ROLE, allowed_recipients_builder)
+
+    assert top_up_allowed_recipients.trustedCaller() == trusted_caller
+    assert top_up_allowed_recipients.allowedRecipientsRegistry() == recipients_registry
+    assert top_up_allowed_recipients.allowedTokensRegistry() == tokens_registry
+    assert top_up_allowed_recipients.finance() == finance
+    assert top_up_allowed_recipients.easyTrack() == easy_track
+
+    for evm_script_factory in [add_allowed_recipient, remove_allowed_recipient]:
+        assert evm_script_factory.trustedCaller() == trusted_caller
+        assert evm_script_factory.allowedRecipientsRegistry() == recipients_registry
+
+    with reverts(ALREADY_INITIALIZED_ERROR):
+        recipients_registry.initialize(
+            stranger, [stranger], [stranger], [stranger], [stranger], ZERO_ADDRESS, {"from": stranger}
+        )
+    with reverts(ALREADY_INITIALIZED_ERROR):
+        tokens_registry.initialize(stranger, [stranger], [stranger], {"from": stranger})
+    with reverts(ALREADY_INITIALIZED_ERROR):
+        top_up_allowed_recipients.initialize(stranger, stranger, stranger, stranger, stranger, {"from": stranger})
+    with reverts(ALREADY_INITIALIZED_ERROR):
+        add_allowed_recipient.initialize(stranger, stranger, {"from": stranger})
+
+
+def test_clones_have_independent_state(allowed_recipients_builder, accounts, stranger, ldo, AllowedRecipientsRegistry):
+    registries = []
+    for recipient, limit in [(accounts[3], 100 * 10**18), (accounts[4], 200 * 10**18)]:
+        tx = allowed_recipients_builder.deploySingleRecipientTopUpOnlySetup(
+            recipient, "Recipient", [ldo], limit, 3, 0, {"from": stranger}
+        )
+        registries.append(
+            AllowedRecipientsRegistry.at(tx.events["AllowedRecipientsRegistryDeployed"]["allowedRecipientsRegistry"])
+        )
+
+    assert registries[0].getAllowedRecipients() == [accounts[3]]
+    assert registries[1].getAllowedRecipients() == [accounts[4]]
+    assert registries[0].getLimitParameters() == (100 * 10**18, 3)
+    assert registries[1].getLimitParameters() == (200 * 10**18, 3)
+
+
+def test_check_clone_implementation(
+    allowed_recipients_builder, allowed_recipients_clone_factory, stranger, ldo, AllowedRecipientsCloneFactory
+):
+    tx = allowed_recipients_builder.deploySingleRecipientTopUpOnlySetup(
+        stranger, "Recipient", [ldo], 100 * 10**18, 3, 0, {"from": stranger}
+    )
+    factory = allowed_recipients_clone_factory
+    clones = [
+        ("AllowedRecipientsRegistryDeployed", "allowedRecipientsRegistry", "allowedRecipientsRegistryImplementation"),
+        ("AllowedTokensRegistryDeployed", "allowedTokensRegistry", "allowedTokensRegistryImplementation"),
+        ("TopUpAllowedRecipientsDeployed", "topUpAllowedRecipients", "topUpAllowedRecipientsImplementation"),
+    ]
+    for event_name, address_arg, implementation_getter in clones:
+        contract_address = tx.events[event_name][address_arg]
+        implementation = deployment.check_clone_implementation(
+            AllowedRecipientsCloneFactory, factory, tx, event_name, contract_address, implementation_getter
+        )
+        assert implementation == getattr(factory, implementation_getter)()
+
+        with pytest.raises(AssertionError):
+            deployment.check_clone_implementation(
+                AllowedRecipientsCloneFactory, stranger, tx, event_name, contract_address, implementation_getter
+            )
+
+
+def test_top_up_motion_through_clones(
+    allowed_recipients_builder,
+    accounts,
+    stranger,
+    voting,
+    acl,
+    ldo,
+    finance,
+    easy_track,
+    evm_script_executor,
+    AllowedRecipientsRegistry,
+    TopUpAllowedRecipientsInitializable,
+):
+    recipient = accounts[3]
+    trusted_caller = accounts[4]
+    limit = 100 * 10**18
+    amount = 10**18
+
+    tx = allowed_recipients_builder.deployFullSetup(
+        trusted_caller, limit, 3, [ldo], [recipient], ["Recipient"], 0, {"from": stranger}
+    )
+    recipients_registry = AllowedRecipientsRegistry.at(
+        tx.events["AllowedRecipientsRegistryDeployed"]["allowedRecipientsRegistry"]
+    )
+    top_up_allowed_recipients = TopUpAllowedRecipientsInitializable.at(
+        tx.events["TopUpAllowedRecipientsDeployed"]["topUpAllowedRecipients"]
+    )
+
+    easy_track.addEVMScriptFactory(
+        top_up_allowed_recipients,
+        deployment.create_permission(finance, "newImmediatePayment")
+        + deployment.create_permission(recipients_registry, "updateSpentAmount")[2:],
+        {"from": voting},
+    )
+    if not acl.hasPermission(evm_script_executor, finance, finance.CREATE_PAYMENTS_ROLE()):
+        acl.grantPermission(evm_script_executor, finance, finance.CREATE_PAYMENTS_ROLE(), {"from": voting})
+
+    evm_script_call_data = encode_calldata(
+        ["address", "address[]", "uint256[]"], [ldo.address, [recipient.address], [amount]]
+    )
+    motion_tx = easy_track.createMotion(top_up_allowed_recipients, evm_script_call_data, {"from": trusted_caller})
+    chain.sleep(constants.MIN_MOTION_DURATION + 1)
+
+    recipient_balance_before = ldo.balanceOf(recipient)
+    easy_track.enactMotion(motion_tx.events["MotionCreated"]["_motionId"], evm_script_call_data, {"from": stranger})
+
+    assert ldo.balanceOf(recipient) == recipient_balance_before + amount
+    assert recipients_registry.spendableBalance() == limit - amount
@@ -223,6 +223,39 @@ def test_remove_not_existing_token(allowed_tokens_registry, ldo):
         registry.removeToken(ldo, {"from": remove_token_role_holder})
 
 
+def test_add_and_remove_tokens_in_batch(allowed_tokens_registry, ldo, steth):
+    (registry, _, add_token_role_holder, remove_token_role_holder) = allowed_tokens_registry
+
+    registry.addTokens([ldo, steth], {"from": add_token_role_holder})
+
+    assert registry.getAllowedTokens() == [ldo, steth]
+
+    registry.removeTokens([ldo], {"from": remove_token_role_holder})
+
+    assert not registry.isTokenAllowed(ldo)
+    assert registry.getAllowedTokens() == [steth]
+
+
+def test_add_tokens_in_batch_with_duplicates(allowed_tokens_registry, ldo):
+    (registry, _, add_token_role_holder, _) = allowed_tokens_registry
+
+    with reverts("TOKEN_ALREADY_ADDED_TO_ALLOWED_LIST"):
+        registry.addTokens([ldo, ldo], {"from": add_token_role_holder})
+
+    assert len(registry.getAllowedTokens()) == 0
+
+
+def test_remove_tokens_in_batch_with_not_existing_token(allowed_tokens_registry, ldo, steth):
+    (registry, _, add_token_role_holder, remove_token_role_holder) = allowed_tokens_registry
+
+    registry.addToken(ldo, {"from": add_token_role_holder})
+
+    with reverts("TOKEN_NOT_FOUND_IN_ALLOWED_LIST"):
+        registry.removeTokens([ldo, steth], {"from": remove_token_role_holder})
+
+    assert registry.getAllowedTokens() == [ldo]
+
+
 def test_normalize_amount(allowed_tokens_registry):
     (registry, _, _, _) = allowed_tokens_registry
 
@@ -242,4 +275,55 @@ def test_normalize_amount(allowed_tokens_registry):
 
     erc20decimals12 = MockERC20.deploy(12, {"from": accounts[0]})
     amount3 = 1000000000009
-    assert registry.normalizeAmount(amount3, erc20decimals12) == 1000000000009000000
\ No newline at end of file
+    assert registry.normalizeAmount(amount3, erc20decimals12) == 1000000000009000000
+
+
+def test_normalize_amount_uses_decimals_cached_on_addition(allowed_tokens_registry):
+    (registry, _, add_token_role_holder, remove_token_role_holder) = allowed_tokens_registry
+    token = MockERC20.deploy(6, {"from": accounts[0]})
+
+    registry.addToken(token, {"from": add_token_role_holder})
+    token.setDecimals(18, {"from": accounts[0]})
+
+    assert registry.normalizeAmount(10**6, token) == 10**18
+
+    registry.removeToken(token, {"from": remove_token_role_holder})
+
+    assert registry.normalizeAmount(10**6, token) == 10**6
+
+
+def test_add_token_without_decimals(allowed_tokens_registry, stranger):
+    (registry, _, add_token_role_holder, _) = allowed_tokens_registry
+
+    registry.addToken(stranger, {"from": add_token_role_holder})
+
+    assert registry.isTokenAllowed(stranger)
+    with reverts():
+        registry.normalizeAmount(1, stranger)
+
+
+def test_refresh_token_decimals(allowed_tokens_registry, stranger):
+    (registry, _, add_token_role_holder, _) = allowed_tokens_registry
+    token = MockERC20.deploy(6, {"from": accounts[0]})
+
+    with reverts("TOKEN_NOT_FOUND_IN_ALLOWED_LIST"):
+        registry.refreshTokenDecimals(token, {"from": stranger})
+
+    registry.addToken(token, {"from": add_token_role_holder})
+    token.setDecimals(18, {"from": accounts[0]})
+    registry.refreshTokenDecimals(token, {"from": stranger})
+
+    assert registry.normalizeAmount(10**6, token) == 10**6
+
+
+def test_normalize_allowed_token_amount(allowed_tokens_registry):
+    (registry, _, add_token_role_holder, _) = allowed_tokens_registry
+    token = MockERC20.deploy(6, {"from": accounts[0]})
+
+    assert registry.normalizeAllowedTokenAmount(10**6, token) == (False, 0)
+    assert registry.normalizeAllowedTokenAmount(10**6, ZERO_ADDRESS) == (False, 0)
+
+    registry.addToken(token, {"from": add_token_role_holder})
+
+    assert registry.normalizeAllowedTokenAmount(10**6, token) == (True, 10**18)
+    assert registry.normalizeAllowedTokenAmount(0, token) == (True, 0)
@@ -0,0 +1,49 @@
+from brownie import accounts, reverts
+
+from utils.evm_script import encode_calldata, encode_call_script
+
+
+def make_call_data(token, recipients, amounts):
+    return encode_calldata(["address", "address[]", "uint256[]"], [token, recipients, amounts])
+
+
+def test_create_evm_script_with_registry_without_batched_check(
+    allowed_tokens_registry,
+    TopUpAllowedRecipients,
+    AllowedRecipientsRegistryLegacyStub,
+    owner,
+    finance,
+    ldo,
+    easy_track,
+    stranger,
+):
+    "Must check recipients one by one when the registry has no areRecipientsAllowed()"
+    (tokens_registry, _, add_token_role_holder, _) = allowed_tokens_registry
+    tokens_registry.addToken(ldo, {"from": add_token_role_holder})
+
+    recipients = [accounts[3].address, accounts[4].address]
+    recipients_registry = owner.deploy(AllowedRecipientsRegistryLegacyStub)
+    for recipient in recipients:
+        recipients_registry.addRecipient(recipient, "Test Recipient", {"from": owner})
+
+    top_up_factory = owner.deploy(
+        TopUpAllowedRecipients, owner, recipients_registry, tokens_registry, finance, easy_track
+    )
+
+    evm_script = top_up_factory.createEVMScript(owner, make_call_data(ldo, recipients, [123, 456]))
+    assert evm_script == encode_call_script(
+        [
+            (recipients_registry.address, recipients_registry.updateSpentAmount.encode_input(579)),
+            (
+                finance.address,
+                finance.newImmediatePayment.encode_input(ldo, recipients[0], 123, "Easy Track: top up recipient"),
+            ),
+            (
+                finance.address,
+                finance.newImmediatePayment.encode_input(ldo, recipients[1], 456, "Easy Track: top up recipient"),
+            ),
+        ]
+    )
+
+    with reverts("RECIPIENT_NOT_ALLOWED"):
+        top_up_factory.createEVMScript(owner, make_call_data(ldo, recipients + [stranger.address], [123, 456, 789]))
@@ -0,0 +1,170 @@
+import pytest
+from brownie import reverts, ZERO_ADDRESS
+
+from utils import deployment
+from utils.evm_script import encode_calldata, encode_call_script
+from utils.test_helpers import (
+    ADD_RECIPIENT_TO_ALLOWED_LIST_ROLE,
+    UPDATE_SPENT_AMOUNT_ROLE,
+    DEFAULT_ADMIN_ROLE,
+)
+
+ALREADY_INITIALIZED_ERROR = "Initializable: contract is already initialized"
+
+
+@pytest.fixture(scope="module")
+def allowed_recipients_clone_factory(owner):
+    return deployment.deploy_allowed_recipients_clone_factory_single_token({"from": owner})
+
+
+@pytest.fixture(scope="module")
+def allowed_recipients_builder(
+    owner,
+    AllowedRecipientsBuilderSingleToken,
+    allowed_recipients_clone_factory,
+    agent,
+    finance,
+    easy_track,
+    bokkyPooBahsDateTimeContract,
+):
+    return owner.deploy(
+        AllowedRecipientsBuilderSingleToken,
+        allowed_recipients_clone_factory,
+        agent,
+        easy_track,
+        finance,
+        bokkyPooBahsDateTimeContract,
+    )
+
+
+def test_implementations_can_not_be_initialized(
+    stranger,
+    allowed_recipients_clone_factory,
+    AllowedRecipientsRegistry,
+    TopUpAllowedRecipientsSingleTokenInitializable,
+    AddAllowedRecipientInitializable,
+    RemoveAllowedRecipientInitializable,
+):
+    factory = allowed_recipients_clone_factory
+    recipients_registry = AllowedRecipientsRegistry.at(factory.allowedRecipientsRegistryImplementation())
+    with reverts(ALREADY_INITIALIZED_ERROR):
+        recipients_registry.initialize(
+            stranger, [stranger], [stranger], [stranger], [stranger], ZERO_ADDRESS, {"from": stranger}
+        )
+
+    top_up = TopUpAllowedRecipientsSingleTokenInitializable.at(factory.topUpAllowedRecipientsImplementation())
+    with reverts(ALREADY_INITIALIZED_ERROR):
+        top_up.initialize(stranger, stranger, stranger, stranger, stranger, {"from": stranger})
+
+    for implementation in [
+        AddAllowedRecipientInitializable.at(factory.addAllowedRecipientImplementation()),
+        RemoveAllowedRecipientInitializable.at(factory.removeAllowedRecipientImplementation()),
+    ]:
+        with reverts(ALREADY_INITIALIZED_ERROR):
+            implementation.initialize(stranger, stranger, {"from": stranger})
+
+
+def test_deploy_full_setup(
+    allowed_recipients_builder,
+    allowed_recipients_clone_factory,
+    stranger,
+    agent,
+    ldo,
+    finance,
+    easy_track,
+    evm_script_executor,
+    AllowedRecipientsRegistry,
+    AddAllowedRecipientInitializable,
+    RemoveAllowedRecipientInitializable,
+    TopUpAllowedRecipientsSingleTokenInitializable,
+):
+    recipients = [
+        "0xbbe8dDEf5BF31b71Ff5DbE89635f9dB4DeFC667E",
+        "0x07fC01f46dC1348d7Ce43787b5Bbd52d8711a92D",
+    ]
+    titles = ["Default Reward Program", "Happy"]
+    trusted_caller = "0x3eaE0B337413407FB3C65324735D797ddc7E071D"
+    limit = 10_000 * 10**18
+    period = 1
+    spent_amount = 10**18
+
+    tx = allowed_recipients_builder.deployFullSetup(
+        trusted_caller, ldo, limit, period, recipients, titles, spent_amount, {"from": stranger}
+    )
+
+    factory = allowed_recipients_clone_factory
+    registry_address = tx.events["AllowedRecipientsRegistryDeployed"]["allowedRecipientsRegistry"]
+    top_up_address = tx.events["TopUpAllowedRecipientsDeployed"]["topUpAllowedRecipients"]
+    add_recipient_address = tx.events["AddAllowedRecipientDeployed"]["addAllowedRecipient"]
+    remove_recipient_address = tx.events["RemoveAllowedRecipientDeployed"]["removeAllowedRecipient"]
+
+    for contract_address, implementation in [
+        (registry_address, factory.allowedRecipientsRegistryImplementation()),
+        (top_up_address, factory.topUpAllowedRecipientsImplementation()),
+        (add_recipient_address, factory.addAllowedRecipientImplementation()),
+        (remove_recipient_address, factory.removeAllowedRecipientImplementation()),
+    ]:
+        assert deployment.get_clone_implementation(contract_address) == implementation
+
+    registry = AllowedRecipientsRegistry.at(registry_address)
+    top_up_allowed_recipients = TopUpAllowedRecipientsSingleTokenInitializable.at(top_up_address)
+    add_allowed_recipient = AddAllowedRecipientInitializable.at(add_recipient_address)
+    remove_allowed_recipient = RemoveAllowedRecipientInitializable.at(remove_recipient_address)
+
+    assert registry.getAllowedRecipients() == recipients
+    assert registry.getLimitParameters() == (limit, period)
+    assert registry.spendableBalance() == limit - spent_amount
+    assert registry.hasRole(DEFAULT_ADMIN_ROLE, agent)
+    assert registry.hasRole(ADD_RECIPIENT_TO_ALLOWED_LIST_ROLE, evm_script_executor)
+    assert registry.hasRole(UPDATE_SPENT_AMOUNT_ROLE, evm_script_executor)
+    assert not registry.hasRole(UPDATE_SPENT_AMOUNT_ROLE, allowed_recipients_builder)
+
+    assert top_up_allowed_recipients.trustedCaller() == trusted_caller
+    assert top_up_allowed_recipients.allowedRecipientsRegistry() == registry
+    assert top_up_allowed_recipients.token() == ldo
+    assert top_up_allowed_recipients.finance() == finance
+    assert top_up_allowed_recipients.easyTrack() == easy_track
+
+    for evm_script_factory in [add_allowed_recipient, remove_allowed_recipient]:
+        assert evm_script_factory.trustedCaller() == trusted_caller
+        assert evm_script_factory.allowedRecipientsRegistry() == registry
+
+    with reverts(ALREADY_INITIALIZED_ERROR):
+        top_up_allowed_recipients.initialize(stranger, stranger, stranger, stranger, stranger, {"from": stranger})
+    with reverts(ALREADY_INITIALIZED_ERROR):
+        remove_allowed_recipient.initialize(stranger, stranger, {"from": stranger})
+
+
+def test_top_up_clone_creates_evm_script(
+    allowed_recipients_builder,
+    accounts,
+    stranger,
+    ldo,
+    finance,
+    AllowedRecipientsRegistry,
+    TopUpAllowedRecipientsSingleTokenInitializable,
+):
+    recipient = accounts[3]
+    amount = 10**18
+    tx = allowed_recipients_builder.deploySingleRecipientTopUpOnlySetup(
+        recipient, "Recipient", ldo, 100 * 10**18, 3, 0, {"from": stranger}
+    )
+    registry = AllowedRecipientsRegistry.at(tx.events["AllowedRecipientsRegistryDeployed"]["allowedRecipientsRegistry"])
+    top_up_allowed_recipients = TopUpAllowedRecipientsSingleTokenInitializable.at(
+        tx.events["TopUpAllowedRecipientsDeployed"]["topUpAllowedRecipients"]
+    )
+
+    evm_script_call_data = encode_calldata(["address[]", "uint256[]"], [[recipient.address], [amount]])
+    with reverts("CALLER_IS_FORBIDDEN"):
+        top_up_allowed_recipients.createEVMScript(stranger, evm_script_call_data)
+
+    evm_script = top_up_allowed_recipients.createEVMScript(recipient, evm_script_call_data)
+    assert evm_script == encode_call_script(
+        [
+            (registry.address, registry.updateSpentAmount.encode_input(amount)),
+            (
+                finance.address,
+                finance.newImmediatePayment.encode_input(ldo, recipient, amount, "Easy Track: top up recipient"),
+            ),
+        ]
+    )
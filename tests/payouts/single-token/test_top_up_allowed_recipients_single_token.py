@@ -167,6 +167,38 @@ def test_fail_create_evm_script_if_recipient_not_allowed(
     with reverts("RECIPIENT_NOT_ALLOWED"):
         top_up_factory.createEVMScript(trusted_caller, make_call_data([stranger.address], [123]))
 
+    with reverts("RECIPIENT_NOT_ALLOWED"):
+        top_up_factory.createEVMScript(trusted_caller, make_call_data([recipient, stranger.address], [123, 123]))
+
+
+def test_create_evm_script_with_registry_without_batched_check(
+    TopUpAllowedRecipientsSingleToken, AllowedRecipientsRegistryLegacyStub, owner, finance, ldo, easy_track, stranger
+):
+    "Must check recipients one by one when the registry has no areRecipientsAllowed()"
+    recipients = [accounts[3].address, accounts[4].address]
+    registry = owner.deploy(AllowedRecipientsRegistryLegacyStub)
+    for recipient in recipients:
+        registry.addRecipient(recipient, "Test Recipient", {"from": owner})
+
+    top_up_factory = owner.deploy(TopUpAllowedRecipientsSingleToken, owner, registry, finance, ldo, easy_track)
+
+    evm_script = top_up_factory.createEVMScript(owner, make_call_data(recipients, [123, 456]))
+    assert evm_script == encode_call_script(
+        [
+            (registry.address, registry.updateSpentAmount.encode_input(579)),
+            (
+                finance.address,
+                finance.newImmediatePayment.encode_input(ldo, recipients[0], 123, "Easy Track: top up recipient"),
+            ),
+            (
+                finance.address,
+                finance.newImmediatePayment.encode_input(ldo, recipients[1], 456, "Easy Track: top up recipient"),
+            ),
+        ]
+    )
+
+    with reverts("RECIPIENT_NOT_ALLOWED"):
+        top_up_factory.createEVMScript(owner, make_call_data(recipients + [stranger.address], [123, 456, 789]))
 
 def test_top_up_factory_evm_script_creation_happy_path(
     allowed_recipients_registry,
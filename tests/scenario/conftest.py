@@ -4,6 +4,8 @@ import json
 
 from brownie import (
     chain,
+    interface,
+    web3,
     AddNodeOperators,
     ActivateNodeOperators,
     DeactivateNodeOperators,
@@ -37,6 +39,42 @@ def et_contracts():
     return deployed_easy_track.contracts(network_name)
 
 
+@pytest.fixture(scope="module")
+def simple_dvt(
+    node_operators_registry,
+    kernel,
+    locator,
+    staking_router,
+    agent,
+    acl,
+):
+    nor_proxy = interface.AragonAppProxy(node_operators_registry)
+    module_name = "simple-dvt-registry"
+    name = web3.keccak(text=module_name).hex()
+    acl.grantPermission(agent, kernel, web3.keccak(text="APP_MANAGER_ROLE").hex(), {"from": agent})
+    simple_DVT_tx = kernel.newAppInstance(name, nor_proxy.implementation(), {"from": agent})
+
+    simple_dvt_contract = interface.NodeOperatorsRegistry(simple_DVT_tx.new_contracts[0])
+
+    simple_dvt_contract.initialize(locator, "0x01", 0, {"from": agent})
+
+    staking_router.grantRole(web3.keccak(text="STAKING_MODULE_MANAGE_ROLE").hex(), agent, {"from": agent})
+
+    staking_router.addStakingModule(
+        "Simple DVT", simple_dvt_contract, 10_000, 10_000, 500, 500, 150, 25, {"from": agent}
+    )
+
+    acl.createPermission(
+        agent,
+        simple_dvt_contract,
+        web3.keccak(text="MANAGE_NODE_OPERATOR_ROLE").hex(),
+        agent,
+        {"from": agent},
+    )
+
+    return simple_dvt_contract
+
+
 @pytest.fixture(scope="module")
 def easytrack_executor(et_contracts, stranger):
     def helper(creator, factory, calldata):
@@ -148,25 +186,29 @@ def add_node_operators_factory(
     deployed_artifact,
     use_deployed_contracts_from_env,
     steth,
+    fork_state_cache,
 ):
     if vote_id_from_env or use_deployed_contracts_from_env:
         return AddNodeOperators.at(deployed_artifact["AddNodeOperators"]["address"])
 
-    factory = AddNodeOperators.deploy(commitee_multisig, simple_dvt, acl, steth, {"from": deployer})
-    assert factory.nodeOperatorsRegistry() == simple_dvt
-    assert factory.trustedCaller() == commitee_multisig
+    def deploy():
+        factory = AddNodeOperators.deploy(commitee_multisig, simple_dvt, acl, steth, {"from": deployer})
+        assert factory.nodeOperatorsRegistry() == simple_dvt
+        assert factory.trustedCaller() == commitee_multisig
 
-    add_node_operators_permissions = (
-        simple_dvt.address
-        + simple_dvt.addNodeOperator.signature[2:]
-        + acl.address[2:]
-        + acl.grantPermissionP.signature[2:]
-    )
-    et_contracts.easy_track.addEVMScriptFactory(factory, add_node_operators_permissions, {"from": voting})
-    evm_script_factories = et_contracts.easy_track.getEVMScriptFactories()
-    assert evm_script_factories[-1] == factory
+        add_node_operators_permissions = (
+            simple_dvt.address
+            + simple_dvt.addNodeOperator.signature[2:]
+            + acl.address[2:]
+            + acl.grantPermissionP.signature[2:]
+        )
+        et_contracts.easy_track.addEVMScriptFactory(factory, add_node_operators_permissions, {"from": voting})
+        evm_script_factories = et_contracts.easy_track.getEVMScriptFactories()
+        assert evm_script_factories[-1] == factory
+        return {"factory": factory.address}
 
-    return factory
+    addresses = fork_state_cache.cached("scenario.add_node_operators_factory", deploy)
+    return AddNodeOperators.at(addresses["factory"])
 
 
 @pytest.fixture(scope="module")
@@ -180,30 +222,34 @@ def activate_node_operators_factory(
     deployed_artifact,
     vote_id_from_env,
     use_deployed_contracts_from_env,
+    fork_state_cache,
 ):
     print(vote_id_from_env)
     if vote_id_from_env or use_deployed_contracts_from_env:
         return ActivateNodeOperators.at(deployed_artifact["ActivateNodeOperators"]["address"])
 
-    factory = ActivateNodeOperators.deploy(commitee_multisig, simple_dvt, acl, {"from": deployer})
-    assert factory.nodeOperatorsRegistry() == simple_dvt
-    assert factory.trustedCaller() == commitee_multisig
+    def deploy():
+        factory = ActivateNodeOperators.deploy(commitee_multisig, simple_dvt, acl, {"from": deployer})
+        assert factory.nodeOperatorsRegistry() == simple_dvt
+        assert factory.trustedCaller() == commitee_multisig
 
-    activate_node_operators_permissions = (
-        simple_dvt.address
-        + simple_dvt.activateNodeOperator.signature[2:]
-        + acl.address[2:]
-        + acl.grantPermissionP.signature[2:]
-    )
-    et_contracts.easy_track.addEVMScriptFactory(
-        factory,
-        activate_node_operators_permissions,
-        {"from": voting},
-    )
-    evm_script_factories = et_contracts.easy_track.getEVMScriptFactories()
-    assert evm_script_factories[-1] == factory
+        activate_node_operators_permissions = (
+            simple_dvt.address
+            + simple_dvt.activateNodeOperator.signature[2:]
+            + acl.address[2:]
+            + acl.grantPermissionP.signature[2:]
+        )
+        et_contracts.easy_track.addEVMScriptFactory(
+            factory,
+            activate_node_operators_permissions,
+            {"from": voting},
+        )
+        evm_script_factories = et_contracts.easy_track.getEVMScriptFactories()
+        assert evm_script_factories[-1] == factory
+        return {"factory": factory.address}
 
-    return factory
+    addresses = fork_state_cache.cached("scenario.activate_node_operators_factory", deploy)
+    return ActivateNodeOperators.at(addresses["factory"])
 
 
 @pytest.fixture(scope="module")
@@ -217,29 +263,33 @@ def deactivate_node_operators_factory(
     deployed_artifact,
     vote_id_from_env,
     use_deployed_contracts_from_env,
+    fork_state_cache,
 ):
     if vote_id_from_env or use_deployed_contracts_from_env:
         return DeactivateNodeOperators.at(deployed_artifact["DeactivateNodeOperators"]["address"])
 
-    factory = DeactivateNodeOperators.deploy(commitee_multisig, simple_dvt, acl, {"from": deployer})
-    assert factory.nodeOperatorsRegistry() == simple_dvt
-    assert factory.trustedCaller() == commitee_multisig
+    def deploy():
+        factory = DeactivateNodeOperators.deploy(commitee_multisig, simple_dvt, acl, {"from": deployer})
+        assert factory.nodeOperatorsRegistry() == simple_dvt
+        assert factory.trustedCaller() == commitee_multisig
 
-    deactivate_node_operators_permissions = (
-        simple_dvt.address
-        + simple_dvt.deactivateNodeOperator.signature[2:]
-        + acl.address[2:]
-        + acl.revokePermission.signature[2:]
-    )
-    et_contracts.easy_track.addEVMScriptFactory(
-        factory,
-        deactivate_node_operators_permissions,
-        {"from": voting},
-    )
-    evm_script_factories = et_contracts.easy_track.getEVMScriptFactories()
-    assert evm_script_factories[-1] == factory
+        deactivate_node_operators_permissions = (
+            simple_dvt.address
+            + simple_dvt.deactivateNodeOperator.signature[2:]
+            + acl.address[2:]
+            + acl.revokePermission.signature[2:]
+        )
+        et_contracts.easy_track.addEVMScriptFactory(
+            factory,
+            deactivate_node_operators_permissions,
+            {"from": voting},
+        )
+        evm_script_factories = et_contracts.easy_track.getEVMScriptFactories()
+        assert evm_script_factories[-1] == factory
+        return {"factory": factory.address}
 
-    return factory
+    addresses = fork_state_cache.cached("scenario.deactivate_node_operators_factory", deploy)
+    return DeactivateNodeOperators.at(addresses["factory"])
 
 
 @pytest.fixture(scope="module")
@@ -252,24 +302,28 @@ def set_node_operator_name_factory(
     deployed_artifact,
     vote_id_from_env,
     use_deployed_contracts_from_env,
+    fork_state_cache,
 ):
     if vote_id_from_env or use_deployed_contracts_from_env:
         return SetNodeOperatorNames.at(deployed_artifact["SetNodeOperatorNames"]["address"])
 
-    factory = SetNodeOperatorNames.deploy(commitee_multisig, simple_dvt, {"from": deployer})
-    assert factory.nodeOperatorsRegistry() == simple_dvt
-    assert factory.trustedCaller() == commitee_multisig
+    def deploy():
+        factory = SetNodeOperatorNames.deploy(commitee_multisig, simple_dvt, {"from": deployer})
+        assert factory.nodeOperatorsRegistry() == simple_dvt
+        assert factory.trustedCaller() == commitee_multisig
 
-    set_node_operator_name_permissions = simple_dvt.address + simple_dvt.setNodeOperatorName.signature[2:]
-    et_contracts.easy_track.addEVMScriptFactory(
-        factory,
-        set_node_operator_name_permissions,
-        {"from": voting},
-    )
-    evm_script_factories = et_contracts.easy_track.getEVMScriptFactories()
-    assert evm_script_factories[-1] == factory
+        set_node_operator_name_permissions = simple_dvt.address + simple_dvt.setNodeOperatorName.signature[2:]
+        et_contracts.easy_track.addEVMScriptFactory(
+            factory,
+            set_node_operator_name_permissions,
+            {"from": voting},
+        )
+        evm_script_factories = et_contracts.easy_track.getEVMScriptFactories()
+        assert evm_script_factories[-1] == factory
+        return {"factory": factory.address}
 
-    return factory
+    addresses = fork_state_cache.cached("scenario.set_node_operator_name_factory", deploy)
+    return SetNodeOperatorNames.at(addresses["factory"])
 
 
 @pytest.fixture(scope="module")
@@ -283,24 +337,28 @@ def set_node_operator_reward_address_factory(
     vote_id_from_env,
     use_deployed_contracts_from_env,
     steth,
+    fork_state_cache,
 ):
     if vote_id_from_env or use_deployed_contracts_from_env:
         return SetNodeOperatorRewardAddresses.at(deployed_artifact["SetNodeOperatorRewardAddresses"]["address"])
 
-    factory = SetNodeOperatorRewardAddresses.deploy(commitee_multisig, simple_dvt, steth, {"from": deployer})
-    assert factory.nodeOperatorsRegistry() == simple_dvt
-    assert factory.trustedCaller() == commitee_multisig
+    def deploy():
+        factory = SetNodeOperatorRewardAddresses.deploy(commitee_multisig, simple_dvt, steth, {"from": deployer})
+        assert factory.nodeOperatorsRegistry() == simple_dvt
+        assert factory.trustedCaller() == commitee_multisig
 
-    set_node_operator_name_permissions = simple_dvt.address + simple_dvt.setNodeOperatorRewardAddress.signature[2:]
-    et_contracts.easy_track.addEVMScriptFactory(
-        factory,
-        set_node_operator_name_permissions,
-        {"from": voting},
-    )
-    evm_script_factories = et_contracts.easy_track.getEVMScriptFactories()
-    assert evm_script_factories[-1] == factory
+        set_node_operator_name_permissions = simple_dvt.address + simple_dvt.setNodeOperatorRewardAddress.signature[2:]
+        et_contracts.easy_track.addEVMScriptFactory(
+            factory,
+            set_node_operator_name_permissions,
+            {"from": voting},
+        )
+        evm_script_factories = et_contracts.easy_track.getEVMScriptFactories()
+        assert evm_script_factories[-1] == factory
+        return {"factory": factory.address}
 
-    return factory
+    addresses = fork_state_cache.cached("scenario.set_node_operator_reward_address_factory", deploy)
+    return SetNodeOperatorRewardAddresses.at(addresses["factory"])
 
 
 @pytest.fixture(scope="module")
@@ -313,24 +371,30 @@ def set_vetted_validators_limit_factory(
     deployed_artifact,
     vote_id_from_env,
     use_deployed_contracts_from_env,
+    fork_state_cache,
 ):
     if vote_id_from_env or use_deployed_contracts_from_env:
         return SetVettedValidatorsLimits.at(deployed_artifact["SetVettedValidatorsLimits"]["address"])
 
-    factory = SetVettedValidatorsLimits.deploy(commitee_multisig, simple_dvt, {"from": deployer})
-    assert factory.nodeOperatorsRegistry() == simple_dvt
-    assert factory.trustedCaller() == commitee_multisig
+    def deploy():
+        factory = SetVettedValidatorsLimits.deploy(commitee_multisig, simple_dvt, {"from": deployer})
+        assert factory.nodeOperatorsRegistry() == simple_dvt
+        assert factory.trustedCaller() == commitee_multisig
 
-    set_vetted_validators_limit_permission = simple_dvt.address + simple_dvt.setNodeOperatorStakingLimit.signature[2:]
-    et_contracts.easy_track.addEVMScriptFactory(
-        factory,
-        set_vetted_validators_limit_permission,
-        {"from": voting},
-    )
-    evm_script_factories = et_contracts.easy_track.getEVMScriptFactories()
-    assert evm_script_factories[-1] == factory
+        set_vetted_validators_limit_permission = (
+            simple_dvt.address + simple_dvt.setNodeOperatorStakingLimit.signature[2:]
+        )
+        et_contracts.easy_track.addEVMScriptFactory(
+            factory,
+            set_vetted_validators_limit_permission,
+            {"from": voting},
+        )
+        evm_script_factories = et_contracts.easy_track.getEVMScriptFactories()
+        assert evm_script_factories[-1] == factory
+        return {"factory": factory.address}
 
-    return factory
+    addresses = fork_state_cache.cached("scenario.set_vetted_validators_limit_factory", deploy)
+    return SetVettedValidatorsLimits.at(addresses["factory"])
 
 
 @pytest.fixture(scope="module")
@@ -343,25 +407,29 @@ def increase_vetted_validators_limit_factory(
     deployed_artifact,
     vote_id_from_env,
     use_deployed_contracts_from_env,
+    fork_state_cache,
 ):
     if vote_id_from_env or use_deployed_contracts_from_env:
         return IncreaseVettedValidatorsLimit.at(deployed_artifact["IncreaseVettedValidatorsLimit"]["address"])
 
-    factory = IncreaseVettedValidatorsLimit.deploy(simple_dvt, {"from": deployer})
-    assert factory.nodeOperatorsRegistry() == simple_dvt
+    def deploy():
+        factory = IncreaseVettedValidatorsLimit.deploy(simple_dvt, {"from": deployer})
+        assert factory.nodeOperatorsRegistry() == simple_dvt
 
-    increase_vetted_validators_limit_permission = (
-        simple_dvt.address + simple_dvt.setNodeOperatorStakingLimit.signature[2:]
-    )
-    et_contracts.easy_track.addEVMScriptFactory(
-        factory,
-        increase_vetted_validators_limit_permission,
-        {"from": voting},
-    )
-    evm_script_factories = et_contracts.easy_track.getEVMScriptFactories()
-    assert evm_script_factories[-1] == factory
+        increase_vetted_validators_limit_permission = (
+            simple_dvt.address + simple_dvt.setNodeOperatorStakingLimit.signature[2:]
+        )
+        et_contracts.easy_track.addEVMScriptFactory(
+            factory,
+            increase_vetted_validators_limit_permission,
+            {"from": voting},
+        )
+        evm_script_factories = et_contracts.easy_track.getEVMScriptFactories()
+        assert evm_script_factories[-1] == factory
+        return {"factory": factory.address}
 
-    return factory
+    addresses = fork_state_cache.cached("scenario.increase_vetted_validators_limit_factory", deploy)
+    return IncreaseVettedValidatorsLimit.at(addresses["factory"])
 
 
 @pytest.fixture(scope="module")
@@ -375,27 +443,31 @@ def change_node_operator_manager_factory(
     deployed_artifact,
     vote_id_from_env,
     use_deployed_contracts_from_env,
+    fork_state_cache,
 ):
     if vote_id_from_env or use_deployed_contracts_from_env:
         return ChangeNodeOperatorManagers.at(deployed_artifact["ChangeNodeOperatorManagers"]["address"])
 
-    factory = ChangeNodeOperatorManagers.deploy(commitee_multisig, simple_dvt, acl, {"from": deployer})
-    assert factory.nodeOperatorsRegistry() == simple_dvt
-    assert factory.trustedCaller() == commitee_multisig
-    assert factory.acl() == acl
+    def deploy():
+        factory = ChangeNodeOperatorManagers.deploy(commitee_multisig, simple_dvt, acl, {"from": deployer})
+        assert factory.nodeOperatorsRegistry() == simple_dvt
+        assert factory.trustedCaller() == commitee_multisig
+        assert factory.acl() == acl
 
-    change_node_operator_manager_permission = (
-        acl.address + acl.revokePermission.signature[2:] + acl.address[2:] + acl.grantPermissionP.signature[2:]
-    )
-    et_contracts.easy_track.addEVMScriptFactory(
-        factory,
-        change_node_operator_manager_permission,
-        {"from": voting},
-    )
-    evm_script_factories = et_contracts.easy_track.getEVMScriptFactories()
-    assert evm_script_factories[-1] == factory
+        change_node_operator_manager_permission = (
+            acl.address + acl.revokePermission.signature[2:] + acl.address[2:] + acl.grantPermissionP.signature[2:]
+        )
+        et_contracts.easy_track.addEVMScriptFactory(
+            factory,
+            change_node_operator_manager_permission,
+            {"from": voting},
+        )
+        evm_script_factories = et_contracts.easy_track.getEVMScriptFactories()
+        assert evm_script_factories[-1] == factory
+        return {"factory": factory.address}
 
-    return factory
+    addresses = fork_state_cache.cached("scenario.change_node_operator_manager_factory", deploy)
+    return ChangeNodeOperatorManagers.at(addresses["factory"])
 
 
 @pytest.fixture(scope="module")
@@ -408,23 +480,27 @@ def update_target_validator_limits_factory(
     deployed_artifact,
     vote_id_from_env,
     use_deployed_contracts_from_env,
+    fork_state_cache,
 ):
     if vote_id_from_env or use_deployed_contracts_from_env:
         return UpdateTargetValidatorLimits.at(deployed_artifact["UpdateTargetValidatorLimits"]["address"])
 
-    factory = UpdateTargetValidatorLimits.deploy(commitee_multisig, simple_dvt, {"from": deployer})
-    assert factory.nodeOperatorsRegistry() == simple_dvt
-    assert factory.trustedCaller() == commitee_multisig
+    def deploy():
+        factory = UpdateTargetValidatorLimits.deploy(commitee_multisig, simple_dvt, {"from": deployer})
+        assert factory.nodeOperatorsRegistry() == simple_dvt
+        assert factory.trustedCaller() == commitee_multisig
 
-    update_target_validators_limits_permission = (
-        simple_dvt.address + simple_dvt.updateTargetValidatorsLimits['uint256,uint256,uint256'].signature[2:]
-    )
-    et_contracts.easy_track.addEVMScriptFactory(
-        factory,
-        update_target_validators_limits_permission,
-        {"from": voting},
-    )
-    evm_script_factories = et_contracts.easy_track.getEVMScriptFactories()
-    assert evm_script_factories[-1] == factory
+        update_target_validators_limits_permission = (
+            simple_dvt.address + simple_dvt.updateTargetValidatorsLimits["uint256,uint256,uint256"].signature[2:]
+        )
+        et_contracts.easy_track.addEVMScriptFactory(
+            factory,
+            update_target_validators_limits_permission,
+            {"from": voting},
+        )
+        evm_script_factories = et_contracts.easy_track.getEVMScriptFactories()
+        assert evm_script_factories[-1] == factory
+        return {"factory": factory.address}
 
-    return factory
+    addresses = fork_state_cache.cached("scenario.update_target_validator_limits_factory", deploy)
+    return UpdateTargetValidatorLimits.at(addresses["factory"])
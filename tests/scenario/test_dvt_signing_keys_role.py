@@ -1,6 +1,5 @@
 import pytest
 from eth_abi import encode
-from brownie import web3, interface
 from utils.permission_parameters import Op, Param, encode_permission_params
 from utils.evm_script import encode_call_script
 from utils.dual_governance import submit_proposals, process_pending_proposals
@@ -15,43 +14,6 @@ clusters = [
 ]
 
 
-@pytest.fixture(scope="module")
-def simple_dvt(
-    node_operators_registry,
-    kernel,
-    locator,
-    staking_router,
-    agent,
-    acl,
-):
-    nor_proxy = interface.AragonAppProxy(node_operators_registry)
-    module_name = "simple-dvt-registry"
-    name = web3.keccak(text=module_name).hex()
-
-    acl.grantPermission(agent, kernel, web3.keccak(text="APP_MANAGER_ROLE").hex(), {"from": agent})
-    simple_DVT_tx = kernel.newAppInstance(name, nor_proxy.implementation(), {"from": agent})
-
-    simple_dvt_contract = interface.NodeOperatorsRegistry(simple_DVT_tx.new_contracts[0])
-
-    simple_dvt_contract.initialize(locator, "0x01", 0, {"from": agent})
-
-    staking_router.grantRole(web3.keccak(text="STAKING_MODULE_MANAGE_ROLE").hex(), agent, {"from": agent})
-
-    staking_router.addStakingModule(
-        "Simple DVT", simple_dvt_contract, 10_000, 10_000, 500, 500, 150, 25, {"from": agent}
-    )
-
-    acl.createPermission(
-        agent,
-        simple_dvt_contract,
-        web3.keccak(text="MANAGE_NODE_OPERATOR_ROLE").hex(),
-        agent,
-        {"from": agent},
-    )
-
-    return simple_dvt_contract
-
-
 @pytest.fixture(scope="module")
 def grant_roles(acl, et_contracts, agent, simple_dvt):
     # Grant roles
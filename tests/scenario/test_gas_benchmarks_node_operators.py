@@ -0,0 +1,353 @@
+import pytest
+from eth_abi import encode
+from brownie import accounts
+
+from utils.gas_benchmark import BENCHMARK_BATCH_SIZES
+from utils.test_helpers import set_account_balance
+
+pytestmark = pytest.mark.gas_benchmark
+
+SIGNING_KEY = {
+    "pubkey": "0x8bb1db218877a42047b953bdc32573445a78d93383ef5fd08f79c066d4781961db4f5ab5a7cc0cf1e4cbcc23fd17f9d7",
+    "signature": "0xad17ef7cdf0c4917aaebc067a785b049d417dda5d4dd66395b21bbd50781d51e28ee750183eca3d32e1f57b324049a06"
+    "135ad07d1aa243368bca9974e25233f050e0d6454894739f87faace698b90ea65ee4baba2758772e09fec4f1d8d35660",
+}
+
+
+def make_node_operators(count):
+    return [
+        {
+            "name": f"Benchmark Operator {i}",
+            "reward_address": "0x000000000000000000000000000000000001{:04}".format(i),
+            "manager": "0x000000000000000000000000000000000002{:04}".format(i),
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def grant_roles(acl, et_contracts, agent, simple_dvt):
+    acl.grantPermission(
+        et_contracts.evm_script_executor,
+        simple_dvt,
+        simple_dvt.MANAGE_NODE_OPERATOR_ROLE(),
+        {"from": agent},
+    )
+    acl.createPermission(
+        et_contracts.evm_script_executor,
+        simple_dvt,
+        simple_dvt.SET_NODE_OPERATOR_LIMIT_ROLE(),
+        agent,
+        {"from": agent},
+    )
+    acl.createPermission(
+        et_contracts.evm_script_executor,
+        simple_dvt,
+        simple_dvt.MANAGE_SIGNING_KEYS(),
+        et_contracts.evm_script_executor,
+        {"from": agent},
+    )
+    acl.createPermission(
+        et_contracts.evm_script_executor,
+        simple_dvt,
+        simple_dvt.STAKING_ROUTER_ROLE(),
+        agent,
+        {"from": agent},
+    )
+
+
+@pytest.fixture(scope="module")
+def increase_node_operator_staking_limit_factory(
+    et_contracts, voting, simple_dvt, deployer, IncreaseNodeOperatorStakingLimit
+):
+    """IncreaseNodeOperatorStakingLimit is benchmarked on the Simple DVT module, because the roles
+    of the EVMScriptExecutor on the curated module can be granted only with a DAO vote"""
+    factory = IncreaseNodeOperatorStakingLimit.deploy(simple_dvt, {"from": deployer})
+    et_contracts.easy_track.addEVMScriptFactory(
+        factory,
+        simple_dvt.address + simple_dvt.setNodeOperatorStakingLimit.signature[2:],
+        {"from": voting},
+    )
+    return factory
+
+
+@pytest.fixture(scope="module")
+def add_node_operators(easytrack_executor, commitee_multisig, add_node_operators_factory, simple_dvt):
+    def _add_node_operators(node_operators):
+        easytrack_executor(
+            commitee_multisig,
+            add_node_operators_factory,
+            add_node_operators_calldata(simple_dvt.getNodeOperatorsCount(), node_operators),
+        )
+
+    return _add_node_operators
+
+
+@pytest.fixture(scope="module")
+def add_signing_keys(simple_dvt):
+    def _add_signing_keys(node_operator_id, manager, keys_count):
+        set_account_balance(manager)
+        simple_dvt.addSigningKeysOperatorBH(
+            node_operator_id,
+            keys_count,
+            SIGNING_KEY["pubkey"] + SIGNING_KEY["pubkey"][2:] * (keys_count - 1),
+            SIGNING_KEY["signature"] + SIGNING_KEY["signature"][2:] * (keys_count - 1),
+            {"from": accounts.at(manager, force=True)},
+        )
+
+    return _add_signing_keys
+
+
+def add_node_operators_calldata(node_operators_count, node_operators):
+    return (
+        "0x"
+        + encode(
+            ["uint256", "(string,address,address)[]"],
+            [
+                node_operators_count,
+                [(no["name"], no["reward_address"], no["manager"]) for no in node_operators],
+            ],
+        ).hex()
+    )
+
+
+@pytest.mark.parametrize("batch_size", BENCHMARK_BATCH_SIZES)
+def test_add_node_operators_gas(
+    batch_size, et_contracts, stranger, commitee_multisig, add_node_operators_factory, simple_dvt, benchmark_motion
+):
+    benchmark_motion(
+        et_contracts.easy_track,
+        "AddNodeOperators",
+        batch_size,
+        add_node_operators_factory,
+        add_node_operators_calldata(simple_dvt.getNodeOperatorsCount(), make_node_operators(batch_size)),
+        commitee_multisig,
+        stranger,
+    )
+
+
+@pytest.mark.parametrize("batch_size", BENCHMARK_BATCH_SIZES)
+def test_deactivate_and_activate_node_operators_gas(
+    batch_size,
+    et_contracts,
+    stranger,
+    commitee_multisig,
+    add_node_operators,
+    deactivate_node_operators_factory,
+    activate_node_operators_factory,
+    benchmark_motion,
+):
+    node_operators = make_node_operators(batch_size)
+    add_node_operators(node_operators)
+    node_operators_data = [(i, no["manager"]) for i, no in enumerate(node_operators)]
+    calldata = "0x" + encode(["(uint256,address)[]"], [node_operators_data]).hex()
+
+    benchmark_motion(
+        et_contracts.easy_track,
+        "DeactivateNodeOperators",
+        batch_size,
+        deactivate_node_operators_factory,
+        calldata,
+        commitee_multisig,
+        stranger,
+    )
+    benchmark_motion(
+        et_contracts.easy_track,
+        "ActivateNodeOperators",
+        batch_size,
+        activate_node_operators_factory,
+        calldata,
+        commitee_multisig,
+        stranger,
+    )
+
+
+@pytest.mark.parametrize("batch_size", BENCHMARK_BATCH_SIZES)
+def test_set_node_operator_names_gas(
+    batch_size,
+    et_contracts,
+    stranger,
+    commitee_multisig,
+    add_node_operators,
+    set_node_operator_name_factory,
+    benchmark_motion,
+):
+    add_node_operators(make_node_operators(batch_size))
+
+    benchmark_motion(
+        et_contracts.easy_track,
+        "SetNodeOperatorNames",
+        batch_size,
+        set_node_operator_name_factory,
+        "0x" + encode(["(uint256,string)[]"], [[(i, f"Renamed Operator {i}") for i in range(batch_size)]]).hex(),
+        commitee_multisig,
+        stranger,
+    )
+
+
+@pytest.mark.parametrize("batch_size", BENCHMARK_BATCH_SIZES)
+def test_set_node_operator_reward_addresses_gas(
+    batch_size,
+    et_contracts,
+    stranger,
+    commitee_multisig,
+    add_node_operators,
+    set_node_operator_reward_address_factory,
+    benchmark_motion,
+):
+    add_node_operators(make_node_operators(batch_size))
+    new_reward_addresses = ["0x000000000000000000000000000000000003{:04}".format(i) for i in range(batch_size)]
+
+    benchmark_motion(
+        et_contracts.easy_track,
+        "SetNodeOperatorRewardAddresses",
+        batch_size,
+        set_node_operator_reward_address_factory,
+        "0x" + encode(["(uint256,address)[]"], [list(enumerate(new_reward_addresses))]).hex(),
+        commitee_multisig,
+        stranger,
+    )
+
+
+@pytest.mark.parametrize("batch_size", BENCHMARK_BATCH_SIZES)
+def test_change_node_operator_managers_gas(
+    batch_size,
+    et_contracts,
+    stranger,
+    commitee_multisig,
+    add_node_operators,
+    change_node_operator_manager_factory,
+    benchmark_motion,
+):
+    node_operators = make_node_operators(batch_size)
+    add_node_operators(node_operators)
+    new_managers = ["0x000000000000000000000000000000000004{:04}".format(i) for i in range(batch_size)]
+
+    benchmark_motion(
+        et_contracts.easy_track,
+        "ChangeNodeOperatorManagers",
+        batch_size,
+        change_node_operator_manager_factory,
+        "0x"
+        + encode(
+            ["(uint256,address,address)[]"],
+            [[(i, no["manager"], new_managers[i]) for i, no in enumerate(node_operators)]],
+        ).hex(),
+        commitee_multisig,
+        stranger,
+    )
+
+
+@pytest.mark.parametrize("batch_size", BENCHMARK_BATCH_SIZES)
+def test_set_vetted_validators_limits_gas(
+    batch_size,
+    et_contracts,
+    stranger,
+    commitee_multisig,
+    simple_dvt,
+    add_node_operators,
+    add_signing_keys,
+    set_vetted_validators_limit_factory,
+    benchmark_motion,
+):
+    first_node_operator_id = simple_dvt.getNodeOperatorsCount()
+    node_operators = make_node_operators(batch_size)
+    add_node_operators(node_operators)
+    for i, no in enumerate(node_operators):
+        add_signing_keys(first_node_operator_id + i, no["manager"], 1)
+
+    benchmark_motion(
+        et_contracts.easy_track,
+        "SetVettedValidatorsLimits",
+        batch_size,
+        set_vetted_validators_limit_factory,
+        "0x"
+        + encode(
+            ["(uint256,uint256)[]"],
+            [[(first_node_operator_id + i, 1) for i in range(batch_size)]],
+        ).hex(),
+        commitee_multisig,
+        stranger,
+    )
+
+
+def test_increase_vetted_validators_limit_gas(
+    et_contracts,
+    stranger,
+    simple_dvt,
+    add_node_operators,
+    add_signing_keys,
+    increase_vetted_validators_limit_factory,
+    benchmark_motion,
+):
+    "IncreaseVettedValidatorsLimit changes the limit of a single node operator, so it has only batch size 1"
+    node_operator_id = simple_dvt.getNodeOperatorsCount()
+    node_operator = make_node_operators(1)[0]
+    add_node_operators([node_operator])
+    add_signing_keys(node_operator_id, node_operator["manager"], 1)
+
+    benchmark_motion(
+        et_contracts.easy_track,
+        "IncreaseVettedValidatorsLimit",
+        1,
+        increase_vetted_validators_limit_factory,
+        "0x" + encode(["(uint256,uint256)"], [(node_operator_id, 1)]).hex(),
+        accounts.at(node_operator["manager"], force=True),
+        stranger,
+    )
+
+
+def test_increase_node_operator_staking_limit_gas(
+    et_contracts,
+    stranger,
+    simple_dvt,
+    add_node_operators,
+    add_signing_keys,
+    increase_node_operator_staking_limit_factory,
+    benchmark_motion,
+):
+    "IncreaseNodeOperatorStakingLimit changes the limit of a single node operator, so it has only batch size 1"
+    node_operator_id = simple_dvt.getNodeOperatorsCount()
+    node_operator = make_node_operators(1)[0]
+    add_node_operators([node_operator])
+    add_signing_keys(node_operator_id, node_operator["manager"], 1)
+    set_account_balance(node_operator["reward_address"])
+
+    benchmark_motion(
+        et_contracts.easy_track,
+        "IncreaseNodeOperatorStakingLimit",
+        1,
+        increase_node_operator_staking_limit_factory,
+        "0x" + encode(["uint256", "uint256"], [node_operator_id, 1]).hex(),
+        accounts.at(node_operator["reward_address"], force=True),
+        stranger,
+    )
+
+
+@pytest.mark.parametrize("batch_size", BENCHMARK_BATCH_SIZES)
+def test_update_target_validator_limits_gas(
+    batch_size,
+    et_contracts,
+    stranger,
+    commitee_multisig,
+    simple_dvt,
+    add_node_operators,
+    update_target_validator_limits_factory,
+    benchmark_motion,
+):
+    first_node_operator_id = simple_dvt.getNodeOperatorsCount()
+    add_node_operators(make_node_operators(batch_size))
+
+    benchmark_motion(
+        et_contracts.easy_track,
+        "UpdateTargetValidatorLimits",
+        batch_size,
+        update_target_validator_limits_factory,
+        "0x"
+        + encode(
+            ["(uint256,uint256,uint256)[]"],
+            [[(first_node_operator_id + i, 1, 10) for i in range(batch_size)]],
+        ).hex(),
+        commitee_multisig,
+        stranger,
+    )
@@ -78,3 +78,9 @@ def test_grant_executor_permissions(accounts, agent, lido_contracts):
 
     for permission in required_permissions:
         assert lido_contracts.aragon.acl.hasPermission(evm_script_executor, permission.app, permission.role)
+
+    assert lido_permissions.filter_granted(lido_permissions.all(), evm_script_executor) == required_permissions
+
+
+def test_permissions_role_hashes(lido_contracts):
+    lido_contracts.permissions.verify_roles()
@@ -2,8 +2,11 @@ import pytest
 from datetime import datetime
 
 from brownie.network import chain
-from brownie import accounts, reverts, ZERO_ADDRESS
+from brownie import accounts, multicall, reverts, web3, ZERO_ADDRESS
 
+from utils import deployment, limits_calendar
+from utils.config import get_multicall_address
+from utils.spendable_forecast import SpendableForecastClient
 
 from utils.test_helpers import (
     assert_single_event,
@@ -516,6 +519,84 @@ def test_fail_if_remove_not_allowed_recipient(allowed_recipients_registry):
     assert not registry.isRecipientAllowed(recipient2)
 
 
+def test_add_recipients(allowed_recipients_registry):
+    (registry, _, add_recipient_role_holder, _, _, _) = allowed_recipients_registry
+    recipients = [accounts[8].address, accounts[9].address]
+    titles = ["Recipient 1", "Recipient 2"]
+
+    tx = registry.addRecipients(recipients, titles, {"from": add_recipient_role_holder})
+
+    assert registry.getAllowedRecipients() == recipients
+    assert [event["_recipient"] for event in tx.events["RecipientAdded"]] == recipients
+    assert [event["_title"] for event in tx.events["RecipientAdded"]] == titles
+
+
+def test_fail_if_add_recipients_with_length_mismatch(allowed_recipients_registry):
+    (registry, _, add_recipient_role_holder, _, _, _) = allowed_recipients_registry
+
+    with reverts("LENGTH_MISMATCH"):
+        registry.addRecipients(
+            [accounts[8].address, accounts[9].address], [RECIPIENT_TITLE], {"from": add_recipient_role_holder}
+        )
+
+
+def test_fail_if_add_recipients_with_duplicates(allowed_recipients_registry):
+    (registry, _, add_recipient_role_holder, _, _, _) = allowed_recipients_registry
+    recipient = accounts[8].address
+
+    with reverts("RECIPIENT_ALREADY_ADDED_TO_ALLOWED_LIST"):
+        registry.addRecipients(
+            [recipient, recipient], [RECIPIENT_TITLE, RECIPIENT_TITLE], {"from": add_recipient_role_holder}
+        )
+
+    assert len(registry.getAllowedRecipients()) == 0
+
+
+def test_remove_recipients(allowed_recipients_registry):
+    (registry, _, add_recipient_role_holder, remove_recipient_role_holder, _, _) = allowed_recipients_registry
+    recipients = [accounts[7].address, accounts[8].address, accounts[9].address]
+    registry.addRecipients(recipients, [RECIPIENT_TITLE] * len(recipients), {"from": add_recipient_role_holder})
+
+    tx = registry.removeRecipients(recipients[:2], {"from": remove_recipient_role_holder})
+
+    assert registry.getAllowedRecipients() == recipients[2:]
+    assert [event["_recipient"] for event in tx.events["RecipientRemoved"]] == recipients[:2]
+
+
+def test_fail_if_remove_recipients_with_not_allowed_recipient(allowed_recipients_registry):
+    (registry, _, add_recipient_role_holder, remove_recipient_role_holder, _, _) = allowed_recipients_registry
+    recipient1 = accounts[8].address
+    recipient2 = accounts[9].address
+    registry.addRecipient(recipient1, RECIPIENT_TITLE, {"from": add_recipient_role_holder})
+
+    with reverts("RECIPIENT_NOT_FOUND_IN_ALLOWED_LIST"):
+        registry.removeRecipients([recipient1, recipient2], {"from": remove_recipient_role_holder})
+
+    assert registry.getAllowedRecipients() == [recipient1]
+
+
+def test_are_recipients_allowed(allowed_recipients_registry):
+    (registry, _, add_recipient_role_holder, _, _, _) = allowed_recipients_registry
+    recipients = [accounts[7].address, accounts[8].address]
+    registry.addRecipients(recipients, [RECIPIENT_TITLE] * len(recipients), {"from": add_recipient_role_holder})
+
+    assert registry.areRecipientsAllowed([])
+    assert registry.areRecipientsAllowed(recipients)
+    assert registry.areRecipientsAllowed(recipients[::-1] + recipients)
+    assert not registry.areRecipientsAllowed(recipients + [accounts[9].address])
+    assert not registry.areRecipientsAllowed([ZERO_ADDRESS])
+
+
+def test_access_stranger_cannot_add_or_remove_recipients(allowed_recipients_registry, stranger):
+    (registry, _, _, _, _, _) = allowed_recipients_registry
+
+    with reverts(access_revert_message(stranger, ADD_RECIPIENT_TO_ALLOWED_LIST_ROLE)):
+        registry.addRecipients([stranger], [RECIPIENT_TITLE], {"from": stranger})
+
+    with reverts(access_revert_message(stranger, REMOVE_RECIPIENT_FROM_ALLOWED_LIST_ROLE)):
+        registry.removeRecipients([stranger], {"from": stranger})
+
+
 # ------------
 # LimitsChecker logic
 # ------------
@@ -647,6 +728,171 @@ def test_limits_checker_views_in_next_period(limits_checker):
     assert limits_checker.getPeriodState()["_spendableBalanceInPeriod"] == spendable_balance
 
 
+def test_spendable_balance_forecast_when_limits_not_set(limits_checker):
+    (limits_checker, _, _) = limits_checker
+
+    assert limits_checker.getSpendableBalanceForecast(0) == (0, 0, 0, 0)
+
+
+def test_spendable_balance_forecast_in_current_period(limits_checker):
+    (
+        limits_checker,
+        set_parameters_role_holder,
+        update_spent_amount_role_holder,
+    ) = limits_checker
+
+    period_limit, period_duration = int(10e18), 1
+    payout_amount = int(3e18)
+    spendable_balance = period_limit - payout_amount
+    limits_checker.setLimitParameters(period_limit, period_duration, {"from": set_parameters_role_holder})
+    # set chain time to the beginning of month to prevent switch while the test is running
+    advance_chain_time_to_beginning_of_the_next_period(period_duration)
+    limits_checker.updateSpentAmount(payout_amount, {"from": update_spent_amount_role_holder})
+    _, period_end = calc_period_range(period_duration, chain.time())
+
+    assert limits_checker.getSpendableBalanceForecast(0) == (
+        spendable_balance,
+        period_end,
+        period_limit,
+        spendable_balance,
+    )
+    # the motion will be enacted in the next period
+    assert limits_checker.getSpendableBalanceForecast(MAX_SECONDS_IN_MONTH)["_maxPayoutAmount"] == period_limit
+
+    for motion_duration in [0, MAX_SECONDS_IN_MONTH]:
+        max_payout_amount = limits_checker.getSpendableBalanceForecast(motion_duration)["_maxPayoutAmount"]
+        assert limits_checker.isUnderSpendableBalance(max_payout_amount, motion_duration)
+        assert not limits_checker.isUnderSpendableBalance(max_payout_amount + 1, motion_duration)
+
+
+def test_spendable_balance_forecast_in_next_period(limits_checker):
+    (
+        limits_checker,
+        set_parameters_role_holder,
+        update_spent_amount_role_holder,
+    ) = limits_checker
+
+    period_limit, period_duration = int(10e18), 1
+    limits_checker.setLimitParameters(period_limit, period_duration, {"from": set_parameters_role_holder})
+    # set chain time to the beginning of month to prevent switch while the test is running
+    advance_chain_time_to_beginning_of_the_next_period(period_duration)
+    limits_checker.updateSpentAmount(period_limit, {"from": update_spent_amount_role_holder})
+
+    chain.sleep(MAX_SECONDS_IN_MONTH * period_duration)
+    chain.mine()
+    _, period_end = calc_period_range(period_duration, chain.time())
+
+    # the period wasn't shifted yet, but the whole limit is available already
+    assert limits_checker.spendableBalance() == 0
+    assert limits_checker.getSpendableBalanceForecast(0) == (period_limit, period_end, period_limit, period_limit)
+
+
+class LimitsCheckerCallsCounter:
+    "Proxies getSpendableBalanceForecast.call() of the limits checker counting the calls"
+
+    def __init__(self, limits_checker):
+        self.getSpendableBalanceForecast = self
+        self._limits_checker = limits_checker
+        self.calls_count = 0
+
+    def call(self, *args, **kwargs):
+        self.calls_count += 1
+        return self._limits_checker.getSpendableBalanceForecast.call(*args, **kwargs)
+
+
+def test_spendable_forecast_client_reuses_forecast_within_block(limits_checker):
+    (limits_checker, set_parameters_role_holder, _) = limits_checker
+
+    period_limit, period_duration = int(10e18), 1
+    limits_checker.setLimitParameters(period_limit, period_duration, {"from": set_parameters_role_holder})
+
+    calls_counter = LimitsCheckerCallsCounter(limits_checker)
+    forecast_client = SpendableForecastClient(calls_counter)
+    block_number = web3.eth.block_number
+
+    forecast = forecast_client.get_forecast(0)
+    assert forecast == limits_checker.getSpendableBalanceForecast(0)
+    assert calls_counter.calls_count == 1
+
+    assert forecast_client.get_forecast(0) == forecast
+    assert forecast_client.get_forecast(0, block_number) == forecast
+    assert forecast_client.get_max_payout_amount(0) == forecast.max_payout_amount
+    assert forecast_client.is_under_spendable_balance(period_limit, 0)
+    assert forecast_client.get_spendable_balances() == forecast[:3]
+    assert calls_counter.calls_count == 1
+
+    # forecasts are cached per motion duration
+    forecast_client.get_forecast(MAX_SECONDS_IN_MONTH)
+    forecast_client.get_forecast(MAX_SECONDS_IN_MONTH)
+    assert calls_counter.calls_count == 2
+
+
+def test_spendable_forecast_client_pins_block_until_refresh(limits_checker):
+    (
+        limits_checker,
+        set_parameters_role_holder,
+        update_spent_amount_role_holder,
+    ) = limits_checker
+
+    period_limit, period_duration = int(10e18), 1
+    payout_amount = int(3e18)
+    limits_checker.setLimitParameters(period_limit, period_duration, {"from": set_parameters_role_holder})
+    # set chain time to the beginning of month to prevent switch while the test is running
+    advance_chain_time_to_beginning_of_the_next_period(period_duration)
+
+    calls_counter = LimitsCheckerCallsCounter(limits_checker)
+    forecast_client = SpendableForecastClient(calls_counter)
+
+    assert forecast_client.get_max_payout_amount(0) == period_limit
+    assert calls_counter.calls_count == 1
+    pinned_block_number = forecast_client.get_block_number()
+
+    limits_checker.updateSpentAmount(payout_amount, {"from": update_spent_amount_role_holder})
+
+    # queries are answered at the pinned block without reading the latest one
+    assert forecast_client.get_block_number() == pinned_block_number
+    assert forecast_client.get_max_payout_amount(0) == period_limit
+    assert calls_counter.calls_count == 1
+
+    # the explicit block doesn't change the pinned one
+    latest_block_number = web3.eth.block_number
+    assert forecast_client.get_max_payout_amount(0, latest_block_number) == period_limit - payout_amount
+    assert forecast_client.get_block_number() == pinned_block_number
+    assert calls_counter.calls_count == 2
+
+    forecast_client.refresh()
+
+    assert forecast_client.get_max_payout_amount(0) == period_limit - payout_amount
+    assert not forecast_client.is_under_spendable_balance(period_limit, 0)
+    assert forecast_client.get_block_number() == latest_block_number
+    assert calls_counter.calls_count == 3
+
+
+def test_spendable_forecast_client_matches_is_under_spendable_balance(limits_checker):
+    (
+        limits_checker,
+        set_parameters_role_holder,
+        update_spent_amount_role_holder,
+    ) = limits_checker
+
+    period_limit, period_duration = int(10e18), 1
+    payout_amount = int(3e18)
+    limits_checker.setLimitParameters(period_limit, period_duration, {"from": set_parameters_role_holder})
+    # set chain time to the beginning of month to prevent switch while the test is running
+    advance_chain_time_to_beginning_of_the_next_period(period_duration)
+    limits_checker.updateSpentAmount(payout_amount, {"from": update_spent_amount_role_holder})
+
+    forecast_client = SpendableForecastClient(limits_checker)
+    spendable_balance = period_limit - payout_amount
+    amounts = [0, spendable_balance - 1, spendable_balance, spendable_balance + 1, period_limit, period_limit + 1]
+
+    for motion_duration in [0, MAX_SECONDS_IN_MONTH]:
+        for amount in amounts:
+            assert forecast_client.is_under_spendable_balance(
+                amount, motion_duration
+            ) == limits_checker.isUnderSpendableBalance(amount, motion_duration)
+
+
 def test_update_spent_amount_within_the_limit(limits_checker):
     (
         limits_checker,
@@ -1090,3 +1336,149 @@ def test_period_end_from_timestamp(
     assert (
         limits_checker.getPeriodEndFromTimestamp(inputs[len(inputs) - 1] + 3600) > expected_result
     )  # hour after the period
+
+
+@pytest.mark.parametrize("period_duration", limits_calendar.PERIOD_DURATIONS_MONTHS)
+def test_period_calendar_matches_limits_checker(limits_checker_with_private_method_exposed, period_duration):
+    (
+        limits_checker,
+        set_parameters_role_holder,
+        _,
+    ) = limits_checker_with_private_method_exposed
+    limits_checker.setLimitParameters(3 * 10**18, period_duration, {"from": set_parameters_role_holder})
+
+    # first and last seconds of every month and a point inside of every week from 2020 to 2040
+    timestamps = []
+    for year in range(2020, 2041):
+        for month in range(1, 13):
+            month_start = limits_calendar.timestamp_from_date(year, month, 1)
+            timestamps += [month_start - 1, month_start, month_start + 1]
+    start, end = timestamps[0], timestamps[-1]
+    timestamps += list(range(start, end, 7 * limits_calendar.SECONDS_PER_DAY + 3601))
+
+    with multicall(address=get_multicall_address()):
+        period_ranges = [
+            (limits_checker.getPeriodStartFromTimestamp(timestamp), limits_checker.getPeriodEndFromTimestamp(timestamp))
+            for timestamp in timestamps
+        ]
+
+    for timestamp, period_range in zip(timestamps, period_ranges):
+        assert period_range == limits_calendar.period_range(timestamp, period_duration), f"timestamp {timestamp}"
+
+
+@pytest.mark.parametrize("period_duration", limits_calendar.PERIOD_DURATIONS_MONTHS)
+def test_in_contract_period_calendar_matches_date_time_contract(
+    owner, LimitsCheckerWithPrivateViewsExposed, limits_checker_with_private_method_exposed, period_duration
+):
+    (
+        limits_checker,
+        set_parameters_role_holder,
+        update_spent_amount_role_holder,
+    ) = limits_checker_with_private_method_exposed
+    in_contract_limits_checker = owner.deploy(
+        LimitsCheckerWithPrivateViewsExposed,
+        [set_parameters_role_holder],
+        [update_spent_amount_role_holder],
+        ZERO_ADDRESS,
+    )
+    in_contract_limits_checker.setDateTimeArithmeticMode(True, {"from": set_parameters_role_holder})
+    for checker in [limits_checker, in_contract_limits_checker]:
+        checker.setLimitParameters(3 * 10**18, period_duration, {"from": set_parameters_role_holder})
+
+    # first second, a point in the middle and last second of every month from 1970 to 2100
+    timestamps = []
+    for year in range(1970, 2101):
+        for month in range(1, 13):
+            month_start = limits_calendar.timestamp_from_date(year, month, 1)
+            next_month_start = limits_calendar.timestamp_from_date(year + month // 12, month % 12 + 1, 1)
+            timestamps += [month_start, month_start + 15 * limits_calendar.SECONDS_PER_DAY + 1, next_month_start - 1]
+
+    # timestamps are checked in batches to fit into the gas limit of eth_call
+    batch_size = 500
+    for i in range(0, len(timestamps), batch_size):
+        batch = timestamps[i : i + batch_size]
+        period_starts, period_ends = in_contract_limits_checker.getPeriodRangesFromTimestamps(batch)
+
+        assert (period_starts, period_ends) == limits_checker.getPeriodRangesFromTimestamps(batch)
+        for timestamp, period_start, period_end in zip(batch, period_starts, period_ends):
+            assert (period_start, period_end) == limits_calendar.period_range(
+                timestamp, period_duration
+            ), f"timestamp {timestamp}"
+
+
+def test_update_spent_amount_with_in_contract_period_calendar(limits_checker):
+    (
+        limits_checker,
+        set_parameters_role_holder,
+        update_spent_amount_role_holder,
+    ) = limits_checker
+    period_limit, period_duration = 3 * 10**18, 3
+
+    tx = limits_checker.setDateTimeArithmeticMode(True, {"from": set_parameters_role_holder})
+    assert_single_event(tx, "DateTimeArithmeticModeChanged", {"_useDateTimeArithmetic": True})
+
+    limits_checker.setLimitParameters(period_limit, period_duration, {"from": set_parameters_role_holder})
+    # set chain time to the beginning of period to prevent switch while the test is running
+    advance_chain_time_to_beginning_of_the_next_period(period_duration)
+
+    tx = limits_checker.updateSpentAmount(period_limit, {"from": update_spent_amount_role_holder})
+    period_start, period_end = calc_period_range(period_duration, chain.time())
+
+    assert_single_event(tx, "CurrentPeriodAdvanced", {"_periodStartTimestamp": period_start})
+    assert limits_checker.getPeriodState() == (period_limit, 0, period_start, period_end)
+
+
+def test_set_date_time_arithmetic_mode(limits_checker, stranger):
+    (limits_checker, set_parameters_role_holder, _) = limits_checker
+    assert not limits_checker.useDateTimeArithmetic()
+
+    with reverts(access_revert_message(stranger, SET_PARAMETERS_ROLE)):
+        limits_checker.setDateTimeArithmeticMode(True, {"from": stranger})
+
+    with reverts("SAME_DATE_TIME_ARITHMETIC_MODE"):
+        limits_checker.setDateTimeArithmeticMode(False, {"from": set_parameters_role_holder})
+
+    limits_checker.setDateTimeArithmeticMode(True, {"from": set_parameters_role_holder})
+    assert limits_checker.useDateTimeArithmetic()
+
+    tx = limits_checker.setDateTimeArithmeticMode(False, {"from": set_parameters_role_holder})
+    assert_single_event(tx, "DateTimeArithmeticModeChanged", {"_useDateTimeArithmetic": False})
+    assert not limits_checker.useDateTimeArithmetic()
+
+
+def test_zero_date_time_contract_does_not_enable_date_time_arithmetic(limits_checker):
+    "Must keep calling the date time contract when its address is set to zero"
+    (limits_checker, set_parameters_role_holder, _) = limits_checker
+
+    limits_checker.setBokkyPooBahsDateTimeContract(ZERO_ADDRESS, {"from": set_parameters_role_holder})
+
+    assert not limits_checker.useDateTimeArithmetic()
+    with reverts():
+        limits_checker.setLimitParameters(3 * 10**18, 3, {"from": set_parameters_role_holder})
+
+
+@pytest.mark.parametrize("use_date_time_arithmetic", [False, True])
+def test_deploy_allowed_recipients_registry_with_date_time_mode(
+    owner, voting, bokkyPooBahsDateTimeContract, use_date_time_arithmetic
+):
+    "Must deploy the registry with the chosen date time mode and calculate the same periods in both"
+    evm_script_executor = accounts[9]
+    registry = deployment.deploy_allowed_recipients_registry(
+        voting,
+        evm_script_executor,
+        bokkyPooBahsDateTimeContract,
+        {"from": owner},
+        use_date_time_arithmetic=use_date_time_arithmetic,
+    )
+    period_limit, period_duration = 3 * 10**18, 3
+
+    assert registry.useDateTimeArithmetic() == use_date_time_arithmetic
+    assert registry.bokkyPooBahsDateTimeContract() == bokkyPooBahsDateTimeContract
+    assert not registry.hasRole(SET_PARAMETERS_ROLE, owner)
+
+    registry.setLimitParameters(period_limit, period_duration, {"from": voting})
+    advance_chain_time_to_beginning_of_the_next_period(period_duration)
+    registry.updateSpentAmount(period_limit, {"from": evm_script_executor})
+
+    period_start, period_end = calc_period_range(period_duration, chain.time())
+    assert registry.getPeriodState() == (period_limit, 0, period_start, period_end)
@@ -1,12 +1,34 @@
+import calendar
 import pytest
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from dateutil.relativedelta import relativedelta
-from brownie import interface
+from brownie import interface, multicall
 from brownie.test import given, strategy
 from hypothesis import Verbosity, settings
+from utils.config import get_multicall_address
 from utils.test_helpers import get_timestamp_from_date
 
+# number of calls aggregated into a single eth_call, keeps the call under the block gas limit
+MULTICALL_BATCH_SIZE = 1_000
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+def batched_calls(method, args_list, batch_size=MULTICALL_BATCH_SIZE):
+    """Calls view method with each args tuple from args_list through Multicall2 and returns the results"""
+    results = []
+    for batch_start in range(0, len(args_list), batch_size):
+        with multicall(address=get_multicall_address()):
+            batch = [method(*args) for args in args_list[batch_start : batch_start + batch_size]]
+        results += [tuple(result) if isinstance(result, (list, tuple)) else result for result in batch]
+    return results
+
+
+def days_range(start_date, end_date):
+    """Returns UTC datetimes of the start of every day from start_date to end_date exclusive"""
+    start, end = datetime(*start_date, tzinfo=timezone.utc), datetime(*end_date, tzinfo=timezone.utc)
+    return [start + timedelta(days=days) for days in range((end - start).days)]
+
 
 class Progress:
     def __init__(self, max_value, current_value=0):
@@ -46,19 +68,21 @@ def test_timestamp_to_date(date_time_library, date):
 
 @pytest.mark.parametrize(
     "start_date,end_date",
-    [[(2020, 1, 1), (2025, 1, 1)]],
+    [[(1970, 1, 1), (2100, 1, 1)]],
 )
 def test_timestamp_to_date_automated(date_time_library, start_date, end_date):
-    current_date = datetime(*start_date, tzinfo=timezone.utc)
+    # every day of the range is checked twice: at its first and at its last second
+    timestamps = [
+        calendar.timegm(day_date.timetuple()) + shift
+        for day_date in days_range(start_date, end_date)
+        for shift in (0, SECONDS_PER_DAY - 1)
+    ]
 
-    while datetime.timestamp(current_date) < get_timestamp_from_date(*end_date):
-        assert date_time_library.timestampToDate(datetime.timestamp(current_date)) == (
-            current_date.year,
-            current_date.month,
-            current_date.day,
-        )
+    dates = batched_calls(date_time_library.timestampToDate, [(timestamp,) for timestamp in timestamps])
 
-        current_date += relativedelta(days=+1)
+    for timestamp, date in zip(timestamps, dates):
+        expected_date = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+        assert date == (expected_date.year, expected_date.month, expected_date.day), f"timestamp {timestamp}"
 
 
 @given(
@@ -98,19 +122,18 @@ def test_timestamp_from_date(date_time_library, date):
 
 @pytest.mark.parametrize(
     "start_date,end_date",
-    [[(2020, 1, 1), (2025, 1, 1)]],
+    [[(1970, 1, 1), (2100, 1, 1)]],
 )
 def test_timestamp_from_date_automated(date_time_library, start_date, end_date):
-    current_date = datetime(*start_date, tzinfo=timezone.utc)
+    dates = days_range(start_date, end_date)
 
-    while datetime.timestamp(current_date) < get_timestamp_from_date(*end_date):
-        assert date_time_library.timestampFromDate(
-            current_date.year,
-            current_date.month,
-            current_date.day,
-        ) == datetime.timestamp(current_date)
+    timestamps = batched_calls(
+        date_time_library.timestampFromDate, [(day_date.year, day_date.month, day_date.day) for day_date in dates]
+    )
 
-        current_date += relativedelta(days=+1)
+    for day_date, timestamp in zip(dates, timestamps):
+        expected_timestamp = calendar.timegm(day_date.timetuple())
+        assert timestamp == expected_timestamp, f"date {day_date}"
 
 
 TEST_START_DATE = datetime(2022, 1, 1, tzinfo=timezone.utc)
@@ -0,0 +1,79 @@
+import pytest
+
+from utils import contracts_registry
+from utils.contracts_registry import LazyAttributes, lazy
+
+
+class Setup(LazyAttributes):
+    def __init__(self, calls):
+        self.calls = calls
+        self.contract = lazy(lambda: calls.append("contract") or "contract")
+        self.plain = "plain"
+
+
+@pytest.fixture
+def setups(monkeypatch):
+    monkeypatch.setattr(contracts_registry, "_setups", {})
+
+
+def test_lazy_attribute_is_resolved_once():
+    "Must compute lazy attribute on the first access only"
+    calls = []
+    setup = Setup(calls)
+    assert calls == []
+    assert setup.plain == "plain"
+    assert calls == []
+
+    assert setup.contract == "contract"
+    assert setup.contract == "contract"
+    assert calls == ["contract"]
+
+
+@pytest.mark.usefixtures("setups")
+def test_get_or_create_reuses_setup_of_network():
+    "Must create setup once per namespace and network"
+    created = []
+
+    def factory():
+        created.append(object())
+        return created[-1]
+
+    setup = contracts_registry.get_or_create("lido", "mainnet", factory)
+    assert contracts_registry.get_or_create("lido", "mainnet", factory) is setup
+    assert contracts_registry.get_or_create("lido", "holesky", factory) is not setup
+    assert contracts_registry.get_or_create("csm", "mainnet", factory) is not setup
+    assert len(created) == 3
+
+
+@pytest.mark.usefixtures("setups")
+def test_invalidate():
+    "Must drop setups matching the network and namespace"
+    keys = [("lido", "mainnet"), ("lido", "holesky"), ("csm", "mainnet"), ("csm", "holesky")]
+
+    def create_all():
+        return {key: contracts_registry.get_or_create(*key, object) for key in keys}
+
+    setups = create_all()
+    contracts_registry.invalidate(network="mainnet")
+    recreated = create_all()
+    assert [recreated[key] is setups[key] for key in keys] == [False, True, False, True]
+
+    setups = recreated
+    contracts_registry.invalidate(network="holesky", namespace="csm")
+    recreated = create_all()
+    assert [recreated[key] is setups[key] for key in keys] == [True, True, True, False]
+
+    setups = recreated
+    contracts_registry.invalidate()
+    recreated = create_all()
+    assert not any(recreated[key] is setups[key] for key in keys)
+
+
+@pytest.mark.usefixtures("setups")
+def test_forked_network_shares_setups():
+    "Must use the same setup for the network and its fork"
+    setup = contracts_registry.get_or_create("easy_track", "mainnet", object)
+    assert contracts_registry.get_or_create("easy_track", "mainnet-fork", object) is setup
+
+    contracts_registry.invalidate(network="mainnet-fork")
+    assert contracts_registry.get_or_create("easy_track", "mainnet", object) is not setup
@@ -3,8 +3,10 @@ import constants
 from brownie.network.state import Chain
 from brownie import reverts, ZERO_ADDRESS
 from utils.evm_script import encode_call_script
+from utils.motion_evm_script import get_motion_created_event, rebuild_motion_evm_script
 from utils.test_helpers import (
     access_revert_message,
+    set_account_balance,
     CANCEL_ROLE,
     PAUSE_ROLE,
     UNPAUSE_ROLE,
@@ -61,6 +63,18 @@ def test_create_motion_has_no_permissions(voting, stranger, easy_track, evm_scri
         easy_track.createMotion(evm_script_factory_stub, b"", {"from": stranger})
 
 
+def test_create_motion_permissions_removed_with_factory(voting, stranger, easy_track, evm_script_factory_stub):
+    "Must revert with message 'HAS_NO_PERMISSIONS' if permissions of the factory"
+    "were granted before the factory was removed and added again with other permissions"
+    easy_track.addEVMScriptFactory(
+        evm_script_factory_stub, evm_script_factory_stub.DEFAULT_PERMISSIONS(), {"from": voting}
+    )
+    easy_track.removeEVMScriptFactory(evm_script_factory_stub, {"from": voting})
+    easy_track.addEVMScriptFactory(evm_script_factory_stub, ZERO_ADDRESS + "11111111", {"from": voting})
+    with reverts("HAS_NO_PERMISSIONS"):
+        easy_track.createMotion(evm_script_factory_stub, b"", {"from": stranger})
+
+
 def test_create_motion_motions_limit_reached(voting, stranger, easy_track, evm_script_factory_stub):
     "Must revert with message 'MOTIONS_LIMIT_REACHED' when motionsCountLimit reached"
     easy_track.setMotionsCountLimit(1, {"from": voting})
@@ -119,6 +133,82 @@ def test_create_motion(owner, voting, easy_track, evm_script_factory_stub):
     assert new_motion[8] == evm_script_factory_stub.DEFAULT_EVM_SCRIPT_HASH()  # evmScriptHash
 
 
+def test_create_motion_with_compact_event(owner, voting, easy_track, evm_script_factory_stub):
+    "Must emit MotionCreated event without EVMScript and MotionEVMScriptHashed event"
+    "with the EVMScript hash when compactMotionCreatedEvent is set"
+    easy_track.addEVMScriptFactory(
+        evm_script_factory_stub,
+        evm_script_factory_stub.DEFAULT_PERMISSIONS(),
+        {"from": voting},
+    )
+    call_data = "0xaabbccddeeff"
+    full_event_tx = easy_track.createMotion(evm_script_factory_stub, call_data, {"from": owner})
+
+    easy_track.setCompactMotionCreatedEvent(True, {"from": voting})
+    tx = easy_track.createMotion(evm_script_factory_stub, call_data, {"from": owner})
+
+    assert len(tx.events) == 2
+    assert tx.events["MotionCreated"]["_motionId"] == 2
+    assert tx.events["MotionCreated"]["_creator"] == owner
+    assert tx.events["MotionCreated"]["_evmScriptFactory"] == evm_script_factory_stub
+    assert tx.events["MotionCreated"]["_evmScriptCallData"] == call_data
+    assert tx.events["MotionCreated"]["_evmScript"] == "0x"
+    assert tx.events["MotionEVMScriptHashed"]["_motionId"] == 2
+    assert tx.events["MotionEVMScriptHashed"]["_evmScriptHash"] == evm_script_factory_stub.DEFAULT_EVM_SCRIPT_HASH()
+    assert easy_track.getMotion(2)["evmScriptHash"] == evm_script_factory_stub.DEFAULT_EVM_SCRIPT_HASH()
+
+    # the EVMScript is rebuilt off-chain with the same call data
+    motion_created_event = get_motion_created_event(tx)
+    assert motion_created_event["_evmScriptCallData"] == call_data
+    assert motion_created_event["_evmScript"] == evm_script_factory_stub.DEFAULT_EVM_SCRIPT()
+    assert get_motion_created_event(full_event_tx)["_evmScript"] == evm_script_factory_stub.DEFAULT_EVM_SCRIPT()
+
+    # the rebuilt EVMScript is checked against the passed hash
+    evm_script_factory_stub.setEVMScript("0x00000001", {"from": owner})
+    tx = easy_track.createMotion(evm_script_factory_stub, call_data, {"from": owner})
+    evm_script_factory_stub.setEVMScript(evm_script_factory_stub.DEFAULT_EVM_SCRIPT(), {"from": owner})
+    with pytest.raises(ValueError):
+        rebuild_motion_evm_script(
+            easy_track,
+            evm_script_factory_stub,
+            owner,
+            call_data,
+            tx.block_number,
+            evm_script_factory_stub.DEFAULT_EVM_SCRIPT_HASH(),
+        )
+
+
+@pytest.mark.usefixtures("distribute_holder_balance")
+def test_motion_views_after_deletion(owner, voting, ldo_holders, ldo, easy_track, evm_script_factory_stub):
+    "getMotions(), getMotion() and motions() must return the same data of packed motions"
+    "after the motions were reordered by deletion"
+    easy_track.addEVMScriptFactory(
+        evm_script_factory_stub,
+        evm_script_factory_stub.DEFAULT_PERMISSIONS(),
+        {"from": voting},
+    )
+    for _ in range(4):
+        easy_track.createMotion(evm_script_factory_stub, b"", {"from": owner})
+    easy_track.objectToMotion(4, {"from": ldo_holders[0]})
+
+    # the last motion is moved to the position of the deleted one
+    easy_track.cancelMotion(2, {"from": owner})
+
+    motions = easy_track.getMotions()
+    assert [motion[0] for motion in motions] == [1, 4, 3]
+    for index, motion in enumerate(motions):
+        assert easy_track.motions(index) == motion
+        assert easy_track.getMotion(motion[0]) == motion
+        assert motion[1] == evm_script_factory_stub
+        assert motion[2] == owner
+        assert motion[3] == constants.MIN_MOTION_DURATION
+        assert motion[6] == constants.DEFAULT_OBJECTIONS_THRESHOLD
+        assert motion[8] == evm_script_factory_stub.DEFAULT_EVM_SCRIPT_HASH()
+
+    assert motions[1][7] == ldo.balanceOfAt(ldo_holders[0], motions[1][5])
+    assert motions[0][7] == motions[2][7] == 0
+
+
 ########
 # CANCEL MOTION
 ########
@@ -340,6 +430,136 @@ def test_enact_motion(owner, voting, easy_track, evm_script_factory_stub, evm_sc
     assert evm_script_executor_stub.evmScript() == evm_script_factory_stub.DEFAULT_EVM_SCRIPT()
 
 
+########
+# ENACT MOTION WITH EVM SCRIPT
+########
+
+
+def test_enact_motion_with_evm_script_when_paused(stranger, voting, easy_track):
+    "Must revert with message 'Pausable: paused' if called on paused EasyTrack"
+    easy_track.pause({"from": voting})
+    with reverts("Pausable: paused"):
+        easy_track.enactMotionWithEVMScript(1, b"", {"from": stranger})
+
+
+def test_enact_motion_with_evm_script_checks(owner, voting, stranger, easy_track, evm_script_factory_stub):
+    "Must revert when motion isn't passed, EVMScript differs from the created one,"
+    "or fast enactment isn't allowed for the EVMScript factory"
+    easy_track.addEVMScriptFactory(
+        evm_script_factory_stub,
+        evm_script_factory_stub.DEFAULT_PERMISSIONS(),
+        {"from": voting},
+    )
+    tx = easy_track.createMotion(evm_script_factory_stub, b"", {"from": owner})
+    evm_script = tx.events["MotionCreated"]["_evmScript"]
+
+    with reverts("MOTION_NOT_PASSED"):
+        easy_track.enactMotionWithEVMScript(1, evm_script, {"from": stranger})
+
+    Chain().sleep(constants.MIN_MOTION_DURATION + 1)
+
+    with reverts("UNEXPECTED_EVM_SCRIPT"):
+        easy_track.enactMotionWithEVMScript(1, "0x" + evm_script.hex() + "00", {"from": stranger})
+
+    with reverts("FAST_ENACTMENT_NOT_ALLOWED"):
+        easy_track.enactMotionWithEVMScript(1, evm_script, {"from": stranger})
+
+    easy_track.setFastEnactmentAllowed(evm_script_factory_stub, True, {"from": voting})
+    easy_track.removeEVMScriptFactory(evm_script_factory_stub, {"from": voting})
+    with reverts("EVM_SCRIPT_FACTORY_NOT_FOUND"):
+        easy_track.enactMotionWithEVMScript(1, evm_script, {"from": stranger})
+
+
+def test_enact_motion_with_evm_script(
+    owner, voting, stranger, easy_track, evm_script_factory_stub, evm_script_executor_stub
+):
+    "Must execute passed EVMScript without its recreation by the EVMScript factory,"
+    "remove motion from list of active motions and emit MotionEnacted(_motionId)"
+    permissions = evm_script_factory_stub.address + evm_script_factory_stub.setEVMScript.signature[2:]
+    easy_track.addEVMScriptFactory(evm_script_factory_stub, permissions, {"from": voting})
+    easy_track.setFastEnactmentAllowed(evm_script_factory_stub, True, {"from": voting})
+    easy_track.setEVMScriptExecutor(evm_script_executor_stub, {"from": voting})
+
+    evm_script = encode_call_script(
+        [(evm_script_factory_stub.address, evm_script_factory_stub.setEVMScript.encode_input(b""))]
+    )
+    evm_script_factory_stub.setEVMScript(evm_script)
+    easy_track.createMotion(evm_script_factory_stub, b"", {"from": owner})
+    Chain().sleep(constants.MIN_MOTION_DURATION + 1)
+
+    # the factory would create a different EVMScript now, but it isn't called on the fast enactment
+    evm_script_factory_stub.setEVMScript("0x00000001")
+
+    tx = easy_track.enactMotionWithEVMScript(1, evm_script, {"from": stranger})
+
+    assert len(easy_track.getMotions()) == 0
+    assert tx.events["MotionEnacted"]["_motionId"] == 1
+    assert evm_script_executor_stub.evmScript() == evm_script
+
+
+########
+# ENACT MOTIONS
+########
+
+
+def test_enact_motions_when_paused(stranger, voting, easy_track):
+    "Must revert with message 'Pausable: paused' if called on paused EasyTrack"
+    easy_track.pause({"from": voting})
+    with reverts("Pausable: paused"):
+        easy_track.enactMotions([1], [b""], {"from": stranger})
+
+
+def test_enact_motions_length_mismatch(stranger, easy_track):
+    "Must revert with message 'LENGTH_MISMATCH' if lengths of motion ids and call data differ"
+    with reverts("LENGTH_MISMATCH"):
+        easy_track.enactMotions([1, 2], [b""], {"from": stranger})
+
+
+def test_enact_motions_reverts_when_any_motion_not_enactable(
+    owner, voting, stranger, easy_track, evm_script_factory_stub, evm_script_executor_stub
+):
+    "Must revert the whole batch with the error of the motion which can't be enacted"
+    easy_track.addEVMScriptFactory(
+        evm_script_factory_stub,
+        evm_script_factory_stub.DEFAULT_PERMISSIONS(),
+        {"from": voting},
+    )
+    easy_track.setEVMScriptExecutor(evm_script_executor_stub, {"from": voting})
+
+    easy_track.createMotion(evm_script_factory_stub, b"", {"from": owner})
+    Chain().sleep(constants.MIN_MOTION_DURATION + 1)
+    easy_track.createMotion(evm_script_factory_stub, b"", {"from": owner})
+
+    with reverts("MOTION_NOT_PASSED"):
+        easy_track.enactMotions([1, 2], [b"", b""], {"from": stranger})
+
+    with reverts("MOTION_NOT_FOUND"):
+        easy_track.enactMotions([1, 1], [b"", b""], {"from": stranger})
+
+    assert [motion[0] for motion in easy_track.getMotions()] == [1, 2]
+
+
+def test_enact_motions(owner, voting, stranger, easy_track, evm_script_factory_stub, evm_script_executor_stub):
+    "Must enact all passed motions, remove them from list of active motions"
+    "and emit MotionEnacted(_motionId) event for each of them"
+    easy_track.addEVMScriptFactory(
+        evm_script_factory_stub,
+        evm_script_factory_stub.DEFAULT_PERMISSIONS(),
+        {"from": voting},
+    )
+    easy_track.setEVMScriptExecutor(evm_script_executor_stub, {"from": voting})
+
+    for _ in range(4):
+        easy_track.createMotion(evm_script_factory_stub, b"", {"from": owner})
+    Chain().sleep(constants.MIN_MOTION_DURATION + 1)
+
+    tx = easy_track.enactMotions([3, 1, 4], [b"", b"", b""], {"from": stranger})
+
+    assert [event["_motionId"] for event in tx.events["MotionEnacted"]] == [3, 1, 4]
+    assert [motion[0] for motion in easy_track.getMotions()] == [2]
+    assert evm_script_executor_stub.evmScript() == evm_script_factory_stub.DEFAULT_EVM_SCRIPT()
+
+
 ########
 # OBJECT TO MOTION
 ########
@@ -513,6 +733,76 @@ def test_object_to_motion_edge_case(owner, stranger, agent, ldo, voting, easy_tr
     assert len(easy_track.getMotions()) == 0
 
 
+def test_object_to_motion_caches_snapshot_total_supply(
+    owner, voting, ldo_holders, EasyTrack, GovernanceTokenStub, evm_script_factory_stub
+):
+    "Must read total supply at the snapshot block on the first objection and reuse it for next objections"
+    governance_token = owner.deploy(GovernanceTokenStub)
+    governance_token.setTotalSupply(10_000 * 10**18)
+    for holder in ldo_holders:
+        governance_token.setBalance(holder, 10**18)
+
+    easy_track = owner.deploy(
+        EasyTrack,
+        governance_token,
+        voting,
+        constants.MIN_MOTION_DURATION,
+        constants.MAX_MOTIONS_LIMIT,
+        constants.DEFAULT_OBJECTIONS_THRESHOLD,
+    )
+    easy_track.addEVMScriptFactory(
+        evm_script_factory_stub,
+        evm_script_factory_stub.DEFAULT_PERMISSIONS(),
+        {"from": voting},
+    )
+    easy_track.createMotion(evm_script_factory_stub, b"", {"from": owner})
+
+    # the first objection reads totalSupplyAt() of the token
+    tx = easy_track.objectToMotion(1, {"from": ldo_holders[0]})
+    assert tx.events["MotionObjected"]["_newObjectionsAmountPct"] == 1
+
+    # the stub returns another total supply now, the cached one must be used
+    governance_token.setTotalSupply(20_000 * 10**18)
+    tx = easy_track.objectToMotion(1, {"from": ldo_holders[1]})
+    assert tx.events["MotionObjected"]["_newObjectionsAmountPct"] == 2
+
+    tx = easy_track.objectToMotion(1, {"from": ldo_holders[2]})
+    assert tx.events["MotionObjected"]["_newObjectionsAmountPct"] == 3
+
+
+def test_object_to_motion_total_supply_changed_after_snapshot(
+    owner, stranger, agent, accounts, ldo, voting, easy_track, evm_script_factory_stub
+):
+    "Must compare objections with total supply at the snapshot block when the supply changed later"
+    snapshot_total_supply = ldo.totalSupply()
+    objections_threshold_amount = int(easy_track.objectionsThreshold() * snapshot_total_supply // 10000) - 1
+    ldo.transfer(owner, objections_threshold_amount, {"from": agent})
+    ldo.transfer(stranger, 1, {"from": agent})
+
+    easy_track.addEVMScriptFactory(
+        evm_script_factory_stub,
+        evm_script_factory_stub.DEFAULT_PERMISSIONS(),
+        {"from": voting},
+    )
+    easy_track.createMotion(evm_script_factory_stub, b"", {"from": owner})
+
+    # double the supply after the snapshot block
+    ldo_controller = accounts.at(ldo.controller(), force=True)
+    set_account_balance(ldo_controller.address)
+    ldo.generateTokens(agent, snapshot_total_supply, {"from": ldo_controller})
+    assert ldo.totalSupply() == 2 * snapshot_total_supply
+
+    tx = easy_track.objectToMotion(1, {"from": owner})
+    assert tx.events["MotionObjected"]["_newObjectionsAmountPct"] == (
+        10000 * objections_threshold_amount // snapshot_total_supply
+    )
+    assert len(easy_track.getMotions()) == 1
+
+    # the threshold is reached against the snapshot supply, not the doubled one
+    easy_track.objectToMotion(1, {"from": stranger})
+    assert len(easy_track.getMotions()) == 0
+
+
 ########
 # CANCEL MOTIONS
 ########
@@ -601,11 +891,63 @@ def test_cancel_all_motions(owner, voting, easy_track, evm_script_factory_stub):
         assert tx.events["MotionCanceled"][idx]["_motionId"] == motion_id
 
 
+def test_cancel_all_motions_bounded_called_by_stranger(stranger, easy_track):
+    "Must revert with correct Access Control message if called"
+    "by address without role 'CANCEL_ROLE'"
+    with reverts(access_revert_message(stranger, CANCEL_ROLE)):
+        easy_track.cancelAllMotionsBounded(1, {"from": stranger})
+
+
+def test_cancel_all_motions_bounded(owner, voting, easy_track, evm_script_factory_stub):
+    "Must cancel at most given number of motions from the end of the list of active motions per call,"
+    "return number of motions left and emit MotionCanceled(_motionId) event for each canceled motion"
+    easy_track.addEVMScriptFactory(
+        evm_script_factory_stub,
+        evm_script_factory_stub.DEFAULT_PERMISSIONS(),
+        {"from": voting},
+    )
+    for _ in range(5):
+        easy_track.createMotion(evm_script_factory_stub, b"", {"from": owner})
+
+    assert easy_track.cancelAllMotionsBounded.call(2, {"from": voting}) == 3
+    tx = easy_track.cancelAllMotionsBounded(2, {"from": voting})
+    assert [event["_motionId"] for event in tx.events["MotionCanceled"]] == [5, 4]
+    assert [motion[0] for motion in easy_track.getMotions()] == [1, 2, 3]
+
+    assert easy_track.cancelAllMotionsBounded.call(10, {"from": voting}) == 0
+    tx = easy_track.cancelAllMotionsBounded(10, {"from": voting})
+    assert [event["_motionId"] for event in tx.events["MotionCanceled"]] == [3, 2, 1]
+    assert len(easy_track.getMotions()) == 0
+
+    # nothing to cancel
+    tx = easy_track.cancelAllMotionsBounded(10, {"from": voting})
+    assert "MotionCanceled" not in tx.events
+
+
 ########
 # SET EVM SCRIPT EXECUTOR
 ########
 
 
+def test_set_compact_motion_created_event_called_by_stranger(stranger, easy_track):
+    "Must revert with correct Access Control message if called"
+    "by address without role 'DEFAULT_ADMIN_ROLE'"
+    with reverts(access_revert_message(stranger)):
+        easy_track.setCompactMotionCreatedEvent(True, {"from": stranger})
+
+
+def test_set_compact_motion_created_event_called_by_owner(voting, easy_track):
+    "Must set compactMotionCreatedEvent and emit CompactMotionCreatedEventChanged event"
+    assert not easy_track.compactMotionCreatedEvent()
+    tx = easy_track.setCompactMotionCreatedEvent(True, {"from": voting})
+    assert tx.events["CompactMotionCreatedEventChanged"]["_compactMotionCreatedEvent"]
+    assert easy_track.compactMotionCreatedEvent()
+
+    tx = easy_track.setCompactMotionCreatedEvent(False, {"from": voting})
+    assert not tx.events["CompactMotionCreatedEventChanged"]["_compactMotionCreatedEvent"]
+    assert not easy_track.compactMotionCreatedEvent()
+
+
 def test_set_evm_script_executor_called_by_stranger(stranger, easy_track):
     "Must revert with correct Access Control message if called"
     "by address without role 'DEFAULT_ADMIN_ROLE'"
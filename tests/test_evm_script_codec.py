@@ -0,0 +1,130 @@
+import eth_abi
+import pytest
+from hexbytes import HexBytes
+
+from utils import evm_script_codec
+from utils.evm_script import create_executor_id
+
+TO = "0x" + "ab" * 20
+OTHER_TO = "0x" + "cd" * 20
+CALLDATA = "0x12345678" + "00" * 31 + "01"
+
+
+def legacy_encode_call_script(actions, spec_id=1):
+    "Encoder used by utils.evm_script before the codec, with brownie's to_bytes() replaced by bytes.fromhex()"
+    result = "0x" + str(spec_id).zfill(8)
+    for to, calldata in actions:
+        addr_bytes = bytes.fromhex(to[2:]).hex()
+        calldata_bytes = calldata[2:] if calldata[0:2] == "0x" else calldata
+        length = eth_abi.encode(["uint32"], [len(calldata_bytes) // 2]).hex()
+        result += addr_bytes + length[56:] + calldata_bytes
+    return result
+
+
+@pytest.mark.parametrize(
+    "actions",
+    [[], [(TO, CALLDATA)], [(TO, CALLDATA), (OTHER_TO, "0x"), (TO, "0x12345678")]],
+)
+def test_round_trip_with_legacy_encoder(actions):
+    "Must encode scripts the same way as the legacy encoder and decode them back"
+    evm_script = evm_script_codec.encode_call_script(actions)
+    assert evm_script == legacy_encode_call_script(actions)
+
+    spec_id, decoded_actions = evm_script_codec.decode_call_script(evm_script)
+    assert spec_id == evm_script_codec.CALLS_SCRIPT_SPEC_ID
+    assert [(to.lower(), calldata) for to, calldata in decoded_actions] == actions
+
+
+def test_iter_call_script_yields_selectors_and_checksummed_addresses():
+    actions = list(evm_script_codec.iter_call_script(evm_script_codec.build_call_script([(TO, CALLDATA)])))
+
+    assert len(actions) == 1
+    assert actions[0].to == evm_script_codec.checksum_address(bytes.fromhex(TO[2:]))
+    assert actions[0].to != TO
+    assert actions[0].selector == bytes.fromhex("12345678")
+    assert actions[0].calldata.tobytes() == bytes.fromhex(CALLDATA[2:])
+
+
+@pytest.mark.parametrize("spec_id", [0, 2, 10, 255, 2**32 - 1])
+def test_spec_ids_other_than_calls_script(spec_id):
+    "Must encode the spec id as uint32 and decode scripts with any spec id unless it is passed"
+    evm_script = evm_script_codec.build_call_script([(TO, CALLDATA)], spec_id)
+
+    assert evm_script[:4] == spec_id.to_bytes(4, "big")
+    assert evm_script_codec.decode_spec_id(evm_script) == spec_id
+    assert len(list(evm_script_codec.iter_call_script(evm_script))) == 1
+    assert len(list(evm_script_codec.iter_call_script(evm_script, spec_id=spec_id))) == 1
+    with pytest.raises(ValueError, match="Unexpected EVMScript spec id"):
+        list(evm_script_codec.iter_call_script(evm_script, spec_id=spec_id + 1))
+
+
+@pytest.mark.parametrize("evm_script", ["0x", "0x000000", b"\x00\x00\x01"])
+def test_too_short_script(evm_script):
+    with pytest.raises(ValueError, match="EVMScript is too short"):
+        evm_script_codec.decode_spec_id(evm_script)
+    with pytest.raises(ValueError, match="EVMScript is too short"):
+        list(evm_script_codec.iter_call_script(evm_script))
+
+
+@pytest.mark.parametrize("header_length", [1, 20, 23])
+def test_truncated_action_header(header_length):
+    evm_script = evm_script_codec.build_call_script([(TO, CALLDATA)])
+    truncated_script = evm_script[: evm_script_codec.SPEC_ID_SIZE + header_length]
+
+    with pytest.raises(ValueError, match="truncated action header at position 4"):
+        list(evm_script_codec.iter_call_script(truncated_script))
+
+
+def test_truncated_calldata():
+    evm_script = evm_script_codec.build_call_script([(TO, CALLDATA), (OTHER_TO, CALLDATA)])
+
+    actions = evm_script_codec.iter_call_script(evm_script[:-1])
+
+    assert next(actions).to.lower() == TO
+    with pytest.raises(ValueError, match="calldata of action at position 64 out of bounds"):
+        next(actions)
+
+
+def test_calldata_length_out_of_bounds():
+    "Must reject the length of calldata pointing beyond the end of the script"
+    evm_script = bytearray(evm_script_codec.build_call_script([(TO, "0x12345678")]))
+    evm_script[24:28] = (2**32 - 1).to_bytes(4, "big")
+
+    with pytest.raises(ValueError, match="out of bounds"):
+        evm_script_codec.decode_call_script(bytes(evm_script))
+
+
+def test_invalid_address_length():
+    with pytest.raises(ValueError, match="Invalid address length 19"):
+        evm_script_codec.build_call_script([("0x" + "ab" * 19, CALLDATA)])
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["0x12ab", "0X12ab", "12ab", bytes.fromhex("12ab"), HexBytes("0x12ab")],
+)
+def test_as_bytes(value):
+    assert bytes(evm_script_codec.as_bytes(value)) == bytes.fromhex("12ab")
+
+
+def test_as_bytes_returns_bytes_like_objects_as_is():
+    for value in [b"\x12\xab", bytearray(b"\x12\xab"), HexBytes("0x12ab")]:
+        assert evm_script_codec.as_bytes(value) is value
+
+
+def test_hex_bytes_script_is_decoded():
+    evm_script = HexBytes(evm_script_codec.build_call_script([(TO, CALLDATA)]))
+
+    assert evm_script_codec.decode_call_script(evm_script) == evm_script_codec.decode_call_script(evm_script.hex())
+
+
+@pytest.mark.parametrize(
+    "spec_id, executor_id",
+    [(0, "0x00000000"), (1, "0x00000001"), (9, "0x00000009"), (10, "0x0000000a"), (256, "0x00000100")],
+)
+def test_create_executor_id(spec_id, executor_id):
+    "Must encode the spec id as uint32. The legacy zero-padded decimal string was wrong for ids >= 10"
+    assert create_executor_id(spec_id) == executor_id
+    assert create_executor_id(spec_id) == evm_script_codec.encode_call_script([], spec_id)
+    if spec_id < 10:
+        assert create_executor_id(spec_id) == "0x" + str(spec_id).zfill(8)
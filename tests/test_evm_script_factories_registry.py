@@ -97,3 +97,35 @@ def test_remove_evm_script_factory(owner, stranger, evm_script_factories_registr
         assert len(evm_script_factories) == len(evm_script_factories_after_remove)
 
         len(set(evm_script_factories).union(evm_script_factories_after_remove)) == len(evm_script_factories)
+
+
+def test_set_fast_enactment_allowed_called_without_permissions(stranger, evm_script_factories_registry):
+    "Must revert with correct Access Control message if called by address without 'DEFAULT_ADMIN_ROLE'"
+    with reverts(access_revert_message(stranger)):
+        evm_script_factories_registry.setFastEnactmentAllowed(stranger, True, {"from": stranger})
+
+
+def test_set_fast_enactment_allowed_factory_not_found(owner, stranger, evm_script_factories_registry):
+    "Must revert with message 'EVM_SCRIPT_FACTORY_NOT_FOUND' if EVMScript factory isn't registered"
+    with reverts("EVM_SCRIPT_FACTORY_NOT_FOUND"):
+        evm_script_factories_registry.setFastEnactmentAllowed(stranger, True, {"from": owner})
+
+
+def test_set_fast_enactment_allowed(owner, stranger, evm_script_factories_registry):
+    "Must update fast enactment flag of EVMScript factory and emit"
+    "EVMScriptFactoryFastEnactmentChanged(_evmScriptFactory, _isAllowed) event."
+    "Flag must be reset on the removal of EVMScript factory"
+    evm_script_factories_registry.addEVMScriptFactory(stranger, stranger.address + "ffccddee", {"from": owner})
+    assert not evm_script_factories_registry.isFastEnactmentAllowed(stranger)
+
+    tx = evm_script_factories_registry.setFastEnactmentAllowed(stranger, True, {"from": owner})
+    assert evm_script_factories_registry.isFastEnactmentAllowed(stranger)
+    assert tx.events["EVMScriptFactoryFastEnactmentChanged"]["_evmScriptFactory"] == stranger
+    assert tx.events["EVMScriptFactoryFastEnactmentChanged"]["_isAllowed"]
+
+    tx = evm_script_factories_registry.removeEVMScriptFactory(stranger, {"from": owner})
+    assert not evm_script_factories_registry.isFastEnactmentAllowed(stranger)
+    assert not tx.events["EVMScriptFactoryFastEnactmentChanged"]["_isAllowed"]
+
+    evm_script_factories_registry.addEVMScriptFactory(stranger, stranger.address + "ffccddee", {"from": owner})
+    assert not evm_script_factories_registry.isFastEnactmentAllowed(stranger)
@@ -0,0 +1,231 @@
+import os
+
+import pytest
+
+from utils import fork_state_cache as fork_state_cache_module
+from utils.fork_state_cache import ForkStateCache
+
+FORK_BLOCK_NUMBER = 100
+
+
+class FakeNode:
+    "Node with anvil-like state dumps. The state is the list of the names of deployed contracts and balances"
+
+    def __init__(self, supports_dumps=True):
+        self.supports_dumps = supports_dumps
+        self.blocks = [f"fork-{FORK_BLOCK_NUMBER}"]
+        self.contracts = []
+        self.balances = {}
+        self.snapshots = {}
+        self.loads = 0
+
+    @property
+    def block_number(self):
+        return FORK_BLOCK_NUMBER + len(self.blocks) - 1
+
+    def get_block(self, block_number):
+        return {"hash": self.blocks[block_number - FORK_BLOCK_NUMBER].encode()}
+
+    def deploy(self, name):
+        self.contracts.append(name)
+        self.blocks.append(f"{name}-{len(self.blocks)}")
+        return {name: f"0x{len(self.contracts):040x}"}
+
+    def reset(self):
+        # requests go through make_request() of the instance, which is replaced by the watching cache
+        self.make_request("anvil_reset", [])
+
+    def set_balance(self, address, balance):
+        self.make_request("anvil_setBalance", [address, hex(balance)])
+
+    def snapshot(self):
+        return self.make_request("evm_snapshot", [])["result"]
+
+    def revert(self, snapshot_id):
+        self.make_request("evm_revert", [snapshot_id])
+
+    def make_request(self, method, params):
+        if method == "anvil_nodeInfo":
+            return {"result": {"forkConfig": {"forkBlockNumber": FORK_BLOCK_NUMBER}}}
+        if method == "anvil_reset":
+            self.blocks, self.contracts, self.balances = self.blocks[:1], [], {}
+            return {"result": None}
+        if method == "anvil_setBalance":
+            self.balances[params[0]] = params[1]
+            return {"result": True}
+        if method == "evm_snapshot":
+            snapshot_id = hex(len(self.snapshots) + 1)
+            self.snapshots[snapshot_id] = (list(self.blocks), list(self.contracts), dict(self.balances))
+            return {"result": snapshot_id}
+        if method == "evm_revert":
+            self.blocks, self.contracts, self.balances = self.snapshots.pop(params[0])
+            return {"result": True}
+        if not self.supports_dumps or method not in ("anvil_dumpState", "anvil_loadState"):
+            return {"error": {"code": -32601, "message": "Method not found"}}
+        if method == "anvil_dumpState":
+            return {
+                "result": {
+                    "contracts": list(self.contracts),
+                    "blocks": list(self.blocks),
+                    "balances": dict(self.balances),
+                }
+            }
+        self.loads += 1
+        state = params[0]
+        self.contracts, self.blocks, self.balances = list(state["contracts"]), list(state["blocks"]), state["balances"]
+        return {"result": True}
+
+
+class FakeWeb3:
+    def __init__(self, node):
+        self.provider = node
+        self.eth = node
+
+
+@pytest.fixture
+def node(monkeypatch):
+    node = FakeNode()
+    monkeypatch.setattr(fork_state_cache_module, "web3", FakeWeb3(node))
+    monkeypatch.delenv(fork_state_cache_module.ENV_FORK_STATE_CACHE, raising=False)
+    return node
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return tmp_path / "cache"
+
+
+def make_cache(cache_dir, tmp_path):
+    build_dir = tmp_path / "build"
+    build_dir.mkdir(exist_ok=True)
+    return ForkStateCache(cache_dir=cache_dir, build_dir=build_dir)
+
+
+def test_cached_deployment_is_loaded_in_next_run(node, cache_dir, tmp_path):
+    "Must deploy and dump the state in the first run and load it in the next one"
+    assert make_cache(cache_dir, tmp_path).cached("a", lambda: node.deploy("a")) == {"a": "0x" + "0" * 39 + "1"}
+    assert node.loads == 0
+
+    node.reset()
+    addresses = make_cache(cache_dir, tmp_path).cached("a", lambda: pytest.fail("must be loaded from cache"))
+    assert addresses == {"a": "0x" + "0" * 39 + "1"}
+    assert node.contracts == ["a"]
+    assert node.loads == 1
+
+
+def test_entries_are_keyed_by_upstream_deployments(node, cache_dir, tmp_path):
+    "Must not load the entry dumped on top of other cached deployments"
+    cache = make_cache(cache_dir, tmp_path)
+    cache.cached("a", lambda: node.deploy("a"))
+    cache.cached("b", lambda: node.deploy("b"))
+    assert node.contracts == ["a", "b"]
+
+    node.reset()
+    deployed = []
+    cache.cached("b", lambda: deployed.append("b") or node.deploy("b"))
+    assert deployed == ["b"]
+    assert node.contracts == ["b"]
+
+    node.reset()
+    cache.cached("a", lambda: pytest.fail("must be loaded from cache"))
+    cache.cached("b", lambda: pytest.fail("must be loaded from cache"))
+    assert node.contracts == ["a", "b"]
+
+
+def test_uncached_upstream_transactions_disable_cache(node, cache_dir, tmp_path):
+    "Must neither load nor dump the state when uncached transactions were sent since the fork block"
+    cache = make_cache(cache_dir, tmp_path)
+    cache.cached("a", lambda: node.deploy("a"))
+
+    node.reset()
+    node.deploy("uncached")
+    cache.cached("a", lambda: node.deploy("a"))
+    assert node.contracts == ["uncached", "a"]
+    assert node.loads == 0
+
+    cache.cached("b", lambda: node.deploy("b"))
+    assert not list(cache_dir.glob("*/b-*.json"))
+
+
+def test_entries_are_keyed_by_state_changes_without_blocks(node, cache_dir, tmp_path):
+    "Must not load the entry dumped after other balance changes made without mining a block"
+    cache = make_cache(cache_dir, tmp_path)
+    cache.cached("a", lambda: node.deploy("a"))
+    node.set_balance("0x01", 10**18)
+    cache.cached("b", lambda: node.deploy("b"))
+
+    node.reset()
+    cache.cached("a", lambda: pytest.fail("must be loaded from cache"))
+    deployed = []
+    cache.cached("b", lambda: deployed.append("b") or node.deploy("b"))
+    assert deployed == ["b"]
+    assert node.balances == {}
+
+    node.reset()
+    cache.cached("a", lambda: pytest.fail("must be loaded from cache"))
+    node.set_balance("0x01", 10**18)
+    cache.cached("b", lambda: pytest.fail("must be loaded from cache"))
+    assert node.contracts == ["a", "b"]
+    assert node.balances == {"0x01": hex(10**18)}
+
+
+def test_state_changes_made_by_deployment_are_not_tracked(node, cache_dir, tmp_path):
+    "Must use next entries after the deployment changing balances was loaded from cache"
+
+    def deploy_a():
+        node.set_balance("0x01", 10**18)
+        return node.deploy("a")
+
+    cache = make_cache(cache_dir, tmp_path)
+    cache.cached("a", deploy_a)
+    cache.cached("b", lambda: node.deploy("b"))
+
+    node.reset()
+    cache.cached("a", lambda: pytest.fail("must be loaded from cache"))
+    cache.cached("b", lambda: pytest.fail("must be loaded from cache"))
+    assert node.balances == {"0x01": hex(10**18)}
+
+
+def test_revert_to_snapshot_restores_tracked_state(node, cache_dir, tmp_path):
+    "Must use the cache after a revert to the snapshot taken in the tracked state"
+    cache = make_cache(cache_dir, tmp_path)
+    cache.cached("a", lambda: node.deploy("a"))
+    snapshot_id = node.snapshot()
+    node.deploy("uncached")
+    node.set_balance("0x01", 10**18)
+    node.revert(snapshot_id)
+    cache.cached("b", lambda: node.deploy("b"))
+
+    node.reset()
+    cache.cached("a", lambda: pytest.fail("must be loaded from cache"))
+    cache.cached("b", lambda: pytest.fail("must be loaded from cache"))
+    assert node.contracts == ["a", "b"]
+
+
+def test_cache_is_disabled_without_state_dumps(node, cache_dir, tmp_path):
+    "Must deploy as usual when the node doesn't support state dumps"
+    node.supports_dumps = False
+    cache = make_cache(cache_dir, tmp_path)
+    assert cache.cached("a", lambda: node.deploy("a")) == {"a": "0x" + "0" * 39 + "1"}
+    assert not cache.enabled
+    assert not cache_dir.exists()
+
+
+def test_cache_is_disabled_by_env(node, cache_dir, tmp_path, monkeypatch):
+    "Must deploy as usual when FORK_STATE_CACHE=0"
+    monkeypatch.setenv(fork_state_cache_module.ENV_FORK_STATE_CACHE, "0")
+    cache = make_cache(cache_dir, tmp_path)
+    cache.cached("a", lambda: node.deploy("a"))
+    assert not cache_dir.exists()
+
+
+def test_prune_keeps_most_recent_keys(cache_dir):
+    "Must remove all but the most recently used cache keys"
+    for index in range(5):
+        key_dir = cache_dir / f"key-{index}"
+        key_dir.mkdir(parents=True)
+        os.utime(key_dir, (index, index))
+
+    ForkStateCache(cache_dir=cache_dir).prune(max_keys=2)
+
+    assert sorted(path.name for path in cache_dir.iterdir()) == ["key-3", "key-4"]
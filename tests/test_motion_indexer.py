@@ -0,0 +1,125 @@
+import pytest
+import constants
+from brownie import chain, web3
+
+from utils.motion_indexer import (
+    MotionIndexer,
+    MOTION_STATUS_ACTIVE,
+    MOTION_STATUS_CANCELED,
+    MOTION_STATUS_ENACTED,
+)
+
+
+@pytest.fixture(scope="module")
+def start_block(easy_track):
+    return easy_track.tx.block_number
+
+
+@pytest.fixture(scope="module")
+def motion_factory(voting, easy_track, evm_script_factory_stub, evm_script_executor_stub):
+    easy_track.addEVMScriptFactory(
+        evm_script_factory_stub,
+        evm_script_factory_stub.DEFAULT_PERMISSIONS(),
+        {"from": voting},
+    )
+    easy_track.setEVMScriptExecutor(evm_script_executor_stub, {"from": voting})
+    return evm_script_factory_stub
+
+
+@pytest.mark.usefixtures("distribute_holder_balance")
+def test_motions_lifecycle(owner, ldo_holders, easy_track, motion_factory, start_block):
+    "Must track status and objections of created, canceled and enacted motions"
+    indexer = MotionIndexer(easy_track, start_block=start_block)
+
+    creation_txs = [easy_track.createMotion(motion_factory, b"", {"from": owner}) for _ in range(3)]
+    easy_track.objectToMotion(1, {"from": ldo_holders[0]})
+    easy_track.cancelMotion(2, {"from": owner})
+    chain.sleep(constants.MIN_MOTION_DURATION + 1)
+    easy_track.enactMotion(3, creation_txs[2].events["MotionCreated"]["_evmScriptCallData"], {"from": owner})
+
+    assert indexer.sync() == web3.eth.block_number
+
+    motion = indexer.get_motion(1)
+    assert motion["status"] == MOTION_STATUS_ACTIVE
+    assert motion["evm_script_factory"] == motion_factory.address.lower()
+    assert motion["creator"] == owner.address.lower()
+    assert motion["objections_amount"] == easy_track.getMotion(1)["objectionsAmount"]
+    assert len(indexer.get_objections(1)) == 1
+
+    assert indexer.get_motion(2)["status"] == MOTION_STATUS_CANCELED
+    assert indexer.get_motion(3)["status"] == MOTION_STATUS_ENACTED
+    assert [m["id"] for m in indexer.get_active_motions(evm_script_factory=motion_factory)] == [1]
+    assert [m["id"] for m in indexer.get_active_motions()] == [m[0] for m in easy_track.getMotions()]
+
+
+def test_incremental_sync(tmpdir, owner, easy_track, motion_factory, start_block):
+    "Must resume indexing from the persisted checkpoint"
+    db_path = str(tmpdir.join("motions.sqlite"))
+
+    easy_track.createMotion(motion_factory, b"", {"from": owner})
+    indexer = MotionIndexer(easy_track, db_path, start_block=start_block, logs_batch_size=1)
+    last_block = indexer.sync()
+    indexer.close()
+
+    easy_track.createMotion(motion_factory, b"", {"from": owner})
+    indexer = MotionIndexer(easy_track, db_path, start_block=start_block)
+    assert indexer.last_block == last_block
+    assert indexer.sync() == web3.eth.block_number
+    assert [m["id"] for m in indexer.get_active_motions()] == [1, 2]
+
+
+def test_reorg_rollback(owner, easy_track, motion_factory, start_block):
+    "Must remove motions created in orphaned blocks"
+    easy_track.createMotion(motion_factory, b"", {"from": owner})
+    indexer = MotionIndexer(easy_track, start_block=start_block)
+    indexer.sync()
+
+    easy_track.cancelMotion(1, {"from": owner})
+    easy_track.createMotion(motion_factory, b"", {"from": owner})
+    indexer.sync()
+    assert indexer.get_motion(1)["status"] == MOTION_STATUS_CANCELED
+    assert indexer.get_motion(2) is not None
+
+    # replace the last two blocks with empty ones
+    chain.undo(2)
+    chain.mine(3)
+    indexer.sync()
+
+    assert indexer.get_motion(1)["status"] == MOTION_STATUS_ACTIVE
+    assert indexer.get_motion(2) is None
+
+
+def test_compact_motion_created_events(owner, voting, easy_track, motion_factory, start_block):
+    "Must rebuild EVMScripts of motions created with compact MotionCreated events"
+    easy_track.createMotion(motion_factory, b"", {"from": owner})
+    easy_track.setCompactMotionCreatedEvent(True, {"from": voting})
+    tx = easy_track.createMotion(motion_factory, b"", {"from": owner})
+    assert tx.events["MotionCreated"]["_evmScript"] == "0x"
+
+    indexer = MotionIndexer(easy_track, start_block=start_block)
+    indexer.sync()
+
+    assert indexer.get_motion(1)["evm_script"] == motion_factory.DEFAULT_EVM_SCRIPT()
+    assert indexer.get_motion(2)["evm_script"] == motion_factory.DEFAULT_EVM_SCRIPT()
+    assert indexer.get_motion(2)["status"] == MOTION_STATUS_ACTIVE
+
+
+def test_compact_motion_created_event_rebuild_failure(
+    monkeypatch, owner, voting, easy_track, motion_factory, start_block
+):
+    "Must store motion with unverified EVMScript when the EVMScript of compact MotionCreated event can't be rebuilt"
+    easy_track.setCompactMotionCreatedEvent(True, {"from": voting})
+    easy_track.createMotion(motion_factory, b"", {"from": owner})
+    easy_track.createMotion(motion_factory, b"", {"from": owner})
+
+    def rebuild_motion_evm_script(*args):
+        raise ValueError("missing trie node")
+
+    monkeypatch.setattr("utils.motion_indexer.rebuild_motion_evm_script", rebuild_motion_evm_script)
+    indexer = MotionIndexer(easy_track, start_block=start_block)
+    indexer.sync()
+
+    assert [motion["id"] for motion in indexer.get_active_motions()] == [1, 2]
+    for motion in indexer.get_active_motions():
+        assert motion["evm_script"] is None
+        assert motion["evm_script_call_data"] == "0x"
@@ -54,6 +54,12 @@ def test_set_motion_duration_called_with_too_small_value(owner, motion_settings)
         motion_settings.setMotionDuration(motion_duration, {"from": owner})
 
 
+def test_set_motion_duration_called_with_too_large_value(owner, motion_settings):
+    "Must revert with 'VALUE_TOO_LARGE' message if value doesn't fit into uint32"
+    with reverts("VALUE_TOO_LARGE"):
+        motion_settings.setMotionDuration(2**32, {"from": owner})
+
+
 def test_set_objections_threshold_called_with_permissions(owner, motion_settings):
     "Must update objections threshold when value is less or equal"
     "than MAX_OBJECTIONS_THRESHOLD and emits ObjectionsThresholdChanged(_newThreshold) event"
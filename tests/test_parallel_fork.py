@@ -0,0 +1,115 @@
+import os
+
+import pytest
+from brownie._config import CONFIG
+
+from utils import parallel_fork
+
+NETWORK = "parallel-fork-test"
+FORK_URL = "http://forked.node"
+
+
+class Config:
+    def __init__(self, numprocesses=None, workerid=None):
+        self._options = {"network": NETWORK, "numprocesses": numprocesses}
+        if workerid is not None:
+            self.workerinput = {"workerid": workerid}
+
+    def getoption(self, name, default=None):
+        return self._options.get(name, default)
+
+
+requested_urls = []
+
+
+class Web3:
+    def __init__(self, provider):
+        self.eth = self
+        self.block_number = 1000
+        requested_urls.append(provider.endpoint_uri)
+
+
+@pytest.fixture
+def cmd_settings(monkeypatch):
+    settings = {"port": 8545, "fork": FORK_URL}
+    monkeypatch.setitem(CONFIG.networks, NETWORK, {"id": NETWORK, "cmd_settings": settings})
+    monkeypatch.setattr(parallel_fork, "Web3", Web3)
+    requested_urls.clear()
+    # configure() exports FORK_BLOCK_NUMBER, setting it here restores the original value after the test
+    monkeypatch.setenv(parallel_fork.ENV_FORK_BLOCK_NUMBER, "")
+    monkeypatch.delenv(parallel_fork.ENV_FORK_BASE_PORT, raising=False)
+    return settings
+
+
+def test_worker_index():
+    assert parallel_fork.worker_index("gw0") == 0
+    assert parallel_fork.worker_index("gw7") == 7
+    assert parallel_fork.worker_index("gw12") == 12
+
+
+def test_worker_port(monkeypatch):
+    "Must offset the worker port from FORK_BASE_PORT, 8545 by default"
+    monkeypatch.delenv(parallel_fork.ENV_FORK_BASE_PORT, raising=False)
+    assert parallel_fork.worker_port(0) == 8545
+    assert parallel_fork.worker_port(3) == 8548
+
+    monkeypatch.setenv(parallel_fork.ENV_FORK_BASE_PORT, "9000")
+    assert parallel_fork.worker_port(0) == 9000
+    assert parallel_fork.worker_port(3) == 9003
+
+
+def test_worker_forks_block_of_master_on_own_port(cmd_settings, monkeypatch):
+    monkeypatch.setenv(parallel_fork.ENV_FORK_BASE_PORT, "9000")
+    monkeypatch.setenv(parallel_fork.ENV_FORK_BLOCK_NUMBER, "123")
+
+    parallel_fork.configure(Config(numprocesses=4, workerid="gw2"))
+
+    assert cmd_settings == {"port": 9002, "fork": FORK_URL, "fork_block": 123}
+    assert requested_urls == []
+
+
+def test_worker_without_fork_block_number(cmd_settings):
+    parallel_fork.configure(Config(numprocesses=4, workerid="gw1"))
+
+    assert cmd_settings == {"port": 8546, "fork": FORK_URL}
+
+
+def test_master_passes_latest_block_to_workers(cmd_settings):
+    "Must resolve the latest block of the forked network once and export it to the workers"
+    parallel_fork.configure(Config(numprocesses=4))
+
+    assert os.environ[parallel_fork.ENV_FORK_BLOCK_NUMBER] == "1000"
+    assert requested_urls == [FORK_URL]
+    # the master doesn't launch a node
+    assert cmd_settings == {"port": 8545, "fork": FORK_URL}
+
+    parallel_fork.configure(Config(numprocesses=4, workerid="gw3"))
+    assert cmd_settings == {"port": 8548, "fork": FORK_URL, "fork_block": 1000}
+
+
+def test_master_keeps_pinned_fork_block_number(cmd_settings, monkeypatch):
+    monkeypatch.setenv(parallel_fork.ENV_FORK_BLOCK_NUMBER, "123")
+
+    parallel_fork.configure(Config(numprocesses=4))
+
+    assert os.environ[parallel_fork.ENV_FORK_BLOCK_NUMBER] == "123"
+    assert requested_urls == []
+
+
+def test_serial_run_forks_pinned_block(cmd_settings, monkeypatch):
+    parallel_fork.configure(Config())
+    assert cmd_settings == {"port": 8545, "fork": FORK_URL}
+
+    monkeypatch.setenv(parallel_fork.ENV_FORK_BLOCK_NUMBER, "123")
+    parallel_fork.configure(Config())
+    assert cmd_settings == {"port": 8545, "fork": FORK_URL, "fork_block": 123}
+
+
+def test_network_without_node_is_not_configured(monkeypatch):
+    "Must not touch networks which don't launch a node, e.g. live networks"
+    network = {"id": NETWORK, "host": FORK_URL}
+    monkeypatch.setitem(CONFIG.networks, NETWORK, network)
+
+    parallel_fork.configure(Config(numprocesses=4, workerid="gw1"))
+
+    assert network == {"id": NETWORK, "host": FORK_URL}
@@ -0,0 +1,59 @@
+""" Batch enactment of passed EasyTrack motions
+
+Call data of motions is taken from MotionCreated events collected by MotionIndexer. Passed motions
+are added to the batch one by one, each addition is checked with a dry run of EasyTrack.enactMotions()
+together with the motions already in the batch. Motions which would revert the batch (including the
+ones conflicting with earlier motions, e.g. adding the same recipient twice) are skipped, so one failing
+motion doesn't revert the whole batch.
+
+    enact_passed_motions(easy_track, {"from": accounts[0]}, start_block=13676729)
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from brownie import chain
+from brownie.exceptions import VirtualMachineError
+
+from utils import log
+from utils.motion_indexer import MotionIndexer
+
+
+def get_enactable_motions(
+    easy_track, sender, indexer: Optional[MotionIndexer] = None, start_block: int = 0
+) -> List[Tuple[int, str]]:
+    """Returns (motion id, EVMScript factory call data) of active motions which can be enacted by the sender"""
+    if indexer is None:
+        indexer = MotionIndexer(easy_track, start_block=start_block)
+    indexer.sync()
+    call_data_by_motion_id = {motion["id"]: motion["evm_script_call_data"] for motion in indexer.get_active_motions()}
+
+    now = chain.time()
+    enactable_motions = []
+    for motion in easy_track.getMotions():
+        motion_id, duration, start_date = motion[0], motion[3], motion[4]
+        if start_date + duration > now:
+            continue
+        if motion_id not in call_data_by_motion_id:
+            log.warning("MotionCreated event not found, skipping motion", motion_id)
+            continue
+        batch = enactable_motions + [(motion_id, call_data_by_motion_id[motion_id])]
+        motion_ids, evm_scripts_call_data = zip(*batch)
+        try:
+            easy_track.enactMotions.call(list(motion_ids), list(evm_scripts_call_data), {"from": sender})
+        except VirtualMachineError as error:
+            log.warning(f"Motion #{motion_id} can't be enacted", error.revert_msg)
+            continue
+        enactable_motions = batch
+    return enactable_motions
+
+
+def enact_passed_motions(easy_track, tx_params: Dict, indexer: Optional[MotionIndexer] = None, start_block: int = 0):
+    """Enacts all passed motions in one transaction. Returns the transaction or None if nothing to enact"""
+    enactable_motions = get_enactable_motions(easy_track, tx_params["from"], indexer, start_block)
+    if not enactable_motions:
+        log.ok("No motions to enact")
+        return None
+
+    motion_ids = [motion_id for motion_id, _ in enactable_motions]
+    log.ok("Enacting motions", ", ".join(f"#{motion_id}" for motion_id in motion_ids))
+    return easy_track.enactMotions(motion_ids, [call_data for _, call_data in enactable_motions], tx_params)
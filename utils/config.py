@@ -1,6 +1,7 @@
 import os
 import sys
 from brownie import network, accounts, web3
+from brownie._config import CONFIG
 from utils import lido
 from typing import Optional
 
@@ -22,6 +23,19 @@ def get_is_live():
     return network.show_active() not in dev_networks
 
 
+def get_multicall_address(network_name=None) -> Optional[str]:
+    """Returns address of Multicall2 (or backward-compatible Multicall3) contract set in
+    the network config. Forked networks use the address of the network they fork"""
+    network_name = network_name or network.show_active()
+    if network_name is None:
+        return None
+    for network_id in [network_name, network_name.split("-")[0]]:
+        network_config = CONFIG.networks.get(network_id, {})
+        if network_config.get("multicall2"):
+            return network_config["multicall2"]
+    return None
+
+
 def get_deployer_account(is_live, network="mainnet"):
     if not is_live:
         deployer = accounts[0]
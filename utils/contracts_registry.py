@@ -0,0 +1,55 @@
+""" Process-wide registry of contract setups
+
+Setups returned by lido.contracts(), deployed_easy_track.contracts() and csm.contracts()
+are created once per network and reused by all callers. Contracts inside the setups are
+instantiated on the first access of the corresponding attribute, so ABI loading and
+eth_getCode checks are made only for the contracts actually used.
+
+Call invalidate() after switching networks or resetting the fork to drop cached handles.
+Forked networks share setups with the network they fork ("mainnet-fork" and "mainnet" are
+the same key), so callers may use either name.
+"""
+
+from typing import Any, Callable, Dict, Optional, Tuple
+
+_setups: Dict[Tuple[str, str], Any] = {}
+
+
+class lazy:
+    """Marks the value of LazyAttributes attribute to be computed on the first access"""
+
+    def __init__(self, factory: Callable[[], Any]):
+        self.factory = factory
+
+
+class LazyAttributes:
+    """Resolves attributes holding lazy values on the first access and caches the result"""
+
+    def __getattribute__(self, name):
+        value = object.__getattribute__(self, name)
+        if isinstance(value, lazy):
+            value = value.factory()
+            object.__setattr__(self, name, value)
+        return value
+
+
+def _network_key(network: str) -> str:
+    """Returns the name of the network the given one forks, in the same way as config.get_network_name()"""
+    return network.split("-")[0]
+
+
+def get_or_create(namespace: str, network: str, factory: Callable[[], Any]) -> Any:
+    key = (namespace, _network_key(network))
+    if key not in _setups:
+        _setups[key] = factory()
+    return _setups[key]
+
+
+def invalidate(network: Optional[str] = None, namespace: Optional[str] = None):
+    """Drops cached setups of the given network and namespace. Drops all setups when called without args"""
+    if network is not None:
+        network = _network_key(network)
+    for key in list(_setups.keys()):
+        setup_namespace, setup_network = key
+        if (namespace is None or namespace == setup_namespace) and (network is None or network == setup_network):
+            del _setups[key]
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 import brownie
 
+from utils import contracts_registry
+from utils.contracts_registry import LazyAttributes, lazy
+
 DEFAULT_NETWORK = "mainnet"
 
 
@@ -23,12 +26,14 @@ def addresses(network=DEFAULT_NETWORK):
 
 
 def contracts(network=DEFAULT_NETWORK):
-    return CSMContractsSetup(brownie.interface, csm_addresses=addresses(network))
+    return contracts_registry.get_or_create(
+        "csm", network, lambda: CSMContractsSetup(brownie.interface, csm_addresses=addresses(network))
+    )
 
 
-class CSMContractsSetup:
+class CSMContractsSetup(LazyAttributes):
     def __init__(self, interface, csm_addresses):
-        self.module = interface.CSModule(csm_addresses.module)
+        self.module = lazy(lambda: interface.CSModule(csm_addresses.module))
 
 
 @dataclass
@@ -1,3 +1,7 @@
+# The creation bytecode is taken from the deployment tx of the v1 version of the IBokkyPooBahsDateTimeContract https://etherscan.io/tx/0x1ae7118a5a6c25090afc6ef5fe025d008b62d8bda43c4fafa247e566f2ccdbd5
+CREATION_BYTECODE = "0x608060405234801561001057600080fd5b506111be806100206000396000f3006080604052600436106102705763ffffffff7c0100000000000000000000000000000000000000000000000000000000600035041662501553811461027557806302e98e0d146102a257806310848ddf146102bd578063126702a0146102d557806314b2d6dc146102ea5780631e0582e91461031c5780631f4f77b21461033a57806322f8a2b81461035857806329441674146103705780632af123b8146103855780633293d007146103a05780633e239e1a146103c75780633f9e0eb7146103df5780634355644d146103fa5780634371c46514610415578063442b8c791461042d578063444fda82146104485780634b321502146104635780634df861261461047e5780635e05bd6d1461049357806362fb9697146104ba57806365c72840146104d55780637217523c146104ed57806374f0314f146105085780637be341091461051d57806389a3a00d146105385780638aa001fc146105535780638bbf51b71461056b5780638d4a2d391461058057806390059aed1461059b5780639220d426146105d157806392d66313146106195780639e524caa14610631578063a324ad241461064c578063a3f144ae14610664578063ad203bd414610679578063b05eb08d14610694578063b3bb8cd4146106ac578063b8d16dbc146106c1578063c7b6fd6a146106d9578063c7edf88c146106f4578063c9d3462214610709578063cfbb9f3714610724578063d2b5074314610739578063d6582d0d1461074e578063de5101af14610766578063e95564301461077e578063ea1c169014610793578063f615ed54146107ab578063f9fd5250146107c6578063fa93f883146107db578063ff2258cb146107f3575b600080fd5b34801561028157600080fd5b5061029060043560243561080e565b60408051918252519081900360200190f35b3480156102ae57600080fd5b50610290600435602435610821565b3480156102c957600080fd5b5061029060043561082d565b3480156102e157600080fd5b5061029061083e565b3480156102f657600080fd5b50610308600435602435604435610843565b604080519115158252519081900360200190f35b34801561032857600080fd5b50610290600435602435604435610858565b34801561034657600080fd5b50610290600435602435604435610865565b34801561036457600080fd5b50610290600435610872565b34801561037c57600080fd5b5061029061087d565b34801561039157600080fd5b50610290600435602435610882565b3480156103ac57600080fd5b5061030860043560243560443560643560843560a43561088e565b3480156103d357600080fd5b506102906004356108a9565b3480156103eb57600080fd5b506102906004356024356108b4565b34801561040657600080fd5b506102906004356024356108c0565b34801561042157600080fd5b506103086004356108cc565b34801561043957600080fd5b506102906004356024356108d7565b34801561045457600080fd5b506102906004356024356108e3565b34801561046f57600080fd5b506102906004356024356108ef565b34801561048a57600080fd5b506102906108fb565b34801561049f57600080fd5b5061029060043560243560443560643560843560a435610901565b3480156104c657600080fd5b5061029060043560243561091b565b3480156104e157600080fd5b50610290600435610927565b3480156104f957600080fd5b50610290600435602435610932565b34801561051457600080fd5b5061029061093e565b34801561052957600080fd5b50610290600435602435610945565b34801561054457600080fd5b50610290600435602435610951565b34801561055f57600080fd5b5061029060043561095d565b34801561057757600080fd5b50610290610968565b34801561058c57600080fd5b5061029060043560243561096d565b3480156105a757600080fd5b506105b3600435610979565b60408051938452602084019290925282820152519081900360600190f35b3480156105dd57600080fd5b506105e6610994565b604080519687526020870195909552858501939093526060850191909152608084015260a0830152519081900360c00190f35b34801561062557600080fd5b506102906004356109b9565b34801561063d57600080fd5b506102906004356024356109c4565b34801561065857600080fd5b506102906004356109d0565b34801561067057600080fd5b506102906109db565b34801561068557600080fd5b506102906004356024356109e2565b3480156106a057600080fd5b506103086004356109ee565b3480156106b857600080fd5b506102906109f9565b3480156106cd57600080fd5b506103086004356109fd565b3480156106e557600080fd5b50610290600435602435610a08565b34801561070057600080fd5b50610290610a14565b34801561071557600080fd5b50610290600435602435610a19565b34801561073057600080fd5b50610290610a25565b34801561074557600080fd5b50610290610a2a565b34801561075a57600080fd5b50610308600435610a2f565b34801561077257600080fd5b506105b3600435610a3a565b34801561078a57600080fd5b50610290610a55565b34801561079f57600080fd5b506105e6600435610a5a565b3480156107b757600080fd5b50610290600435602435610a80565b3480156107d257600080fd5b50610290610a8c565b3480156107e757600080fd5b50610290600435610a91565b3480156107ff57600080fd5b50610290600435602435610a9c565b600061081a8383610aa8565b9392505050565b600061081a8383610abc565b600061083882610ad9565b92915050565b600281565b6000610850848484610b07565b949350505050565b6000610850848484610b5c565b6000610850848484610bd0565b600061083882610bea565b600781565b600061081a8383610bfd565b600061089e878787878787610c17565b979650505050505050565b600061083882610c57565b600061081a8383610c65565b600061081a8383610ceb565b600061083882610d61565b600061081a8383610d76565b600061081a8383610d9c565b600061081a8383610df7565b610e1081565b600061089e878787878787610e0b565b9695505050505050565b600061081a8383610e35565b600061083882610e49565b600061081a8383610e5a565b6201518081565b600061081a8383610e6f565b600061081a8383610ec3565b600061083882610ed6565b600381565b600061081a8383610edd565b600080600061098784610eed565b9250925092509193909250565b6000806000806000806109a642610f82565b949b939a50919850965094509092509050565b600061083882610fc3565b600061081a8383610fdf565b600061083882610ff2565b62253d8c81565b600061081a838361100d565b60006108388261108e565b4290565b6000610838826110b3565b600061081a83836110d5565b600681565b600061081a83836110ea565b600481565b600581565b600061083882611105565b6000806000610a488461111a565b9196909550909350915050565b603c81565b600080600080600080610a6c87610f82565b949c939b5091995097509550909350915050565b600061081a838361112b565b600181565b60006108388261113b565b600061081a838361114a565b610e10810282038281111561083857600080fd5b600081831115610acb57600080fd5b603c8383035b049392505050565b6000808080610aed62015180865b04610eed565b91945092509050610afe8383610c65565b95945050505050565b6000806107b28510158015610b1c5750600084115b8015610b295750600c8411155b15610b5457610b388585610c65565b9050600083118015610b4a5750808311155b15610b5457600191505b509392505050565b6000808080806107b2881015610b7157600080fd5b50505050600460036064611324600c600d198801819005988901918201929092059290920283900561016f9782029096036001190196909602959095056105b56112c090960195909502059190910192909201036225bad61901919050565b600062015180610be1858585610b5c565b02949350505050565b6007620151809091046003010660010190565b600081831115610c0c57600080fd5b610e10838303610ad1565b6000610c24878787610b07565b1561091157601884108015610c395750603c83105b8015610c455750603c82105b15610911575060019695505050505050565b610e10620151809091060490565b60008160011480610c765750816003145b80610c815750816005145b80610c8c5750816007145b80610c975750816008145b80610ca2575081600a145b80610cad575081600c145b15610cba5750601f610838565b60028214610cca5750601e610838565b610cd38361108e565b610cde57601c610ce1565b601d5b60ff169392505050565b600080808080610cfe6201518088610ae7565b600c91890160001901828104939093019650910660010193509150610d238484610c65565b905080821115610d31578091505b62015180870662015180610d46868686610b5c565b0201945086851015610d5757600080fd5b5050505092915050565b60006006610d6e83610bea565b101592915050565b600080808080610d896201518088610ae7565b918801955093509150610d238484610c65565b600080808080610daf6201518088610ae7565b91889003955093509150610dc38484610c65565b905080821115610dd1578091505b62015180870662015180610de6868686610b5c565b0201945086851115610d5757600080fd5b610e10810282018281101561083857600080fd5b600081603c8402610e10860262015180610e268b8b8b610b5c565b02010101979650505050505050565b600081831115610e4457600080fd5b500390565b600080806109116201518085610ae7565b62015180810282018281101561083857600080fd5b600080808080808087891115610e8457600080fd5b610e91620151808a610ae7565b91975095509350610ea56201518089610ae7565b50600c97880297909102019590950393909303979650505050505050565b603c810282018281101561083857600080fd5b603c900690565b8181018281101561083857600080fd5b60008080836226496581018280808062023ab1600486020593506004600362023ab1860201059094039362164b09610fa0600187010205925060046105b58402058503601f01945061098f85605002811515610f4557fe5b059150605061098f83020585039050600b820560301994909401606402929092018301996002600c90940290910392909201975095509350505050565b6000808080808080610f976201518089610ae7565b919a9099919850610e10620151809092068281049850603c929006828104975091909106945092505050565b60008080610fd46201518085610ae7565b509095945050505050565b603c810282038281111561083857600080fd5b600080806110036201518085610ae7565b5095945050505050565b600080808080806110216201518089610ae7565b91965094509250600c808602850188900360001901925082049450600c8206600101935061104f8585610c65565b90508083111561105d578092505b62015180880662015180611072878787610b5c565b020195508786111561108357600080fd5b505050505092915050565b6000600482061580156110a357506064820615155b8061083857505061019090061590565b60008080806110c56201518086610ae7565b91945092509050610afe8361108e565b62015180810282038281111561083857600080fd5b6000818311156110f957600080fd5b62015180838303610ad1565b6000600561111283610bea565b111592915050565b60008080610a486201518085610ae7565b8082038281111561083857600080fd5b6000610e108206603c81610ad1565b60008080808080808789111561115f57600080fd5b61116c620151808a610ae7565b919750955093506111806201518089610ae7565b505095909503989750505050505050505600a165627a7a7230582093939dd9a1018aabebf4ab93ad48e1e2f314aa395c430e73b58496aa461992e10029"
+
+
 def date_time_contract(network: str = "mainnet") -> str:
     if network == "mainnet" or network == "mainnet-fork":
         return "0x75100bd564415731b5936a4a94d0dc29dde5db3c"
@@ -6,3 +10,8 @@ def date_time_contract(network: str = "mainnet") -> str:
     if network == "hoodi" or network == "hoodi-fork":
         return "0xd1df0cf660d531fad9eaabd3e7b4e8881e28ae2f"
     raise NameError(f"""Unknown network "{network}". Supported networks: mainnet, hoodi, holesky.""")
+
+
+def deploy_date_time_contract(deployer, **tx_params) -> str:
+    """Deploys BokkyPooBahsDateTimeContract from CREATION_BYTECODE and returns its address"""
+    return deployer.transfer(data=CREATION_BYTECODE, **tx_params).contract_address
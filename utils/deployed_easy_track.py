@@ -11,6 +11,9 @@ from brownie import (
     Contract,
 )
 
+from utils import contracts_registry
+from utils.contracts_registry import LazyAttributes, lazy
+
 
 def addresses(network="mainnet"):
     if network == "mainnet" or network == "mainnet-fork":
@@ -79,44 +82,54 @@ def contract_or_none(contract: Contract, addr: Optional[str]) -> Optional[Contra
     return contract.at(addr)
 
 
+def lazy_contract_or_none(contract: Contract, addr: Optional[str]) -> lazy:
+    return lazy(lambda: contract_or_none(contract, addr))
+
+
 def contracts(network="mainnet"):
+    return contracts_registry.get_or_create("easy_track", network, lambda: _create_contracts(network))
+
+
+def _create_contracts(network):
     network_addresses = addresses(network)
     return EasyTrackSetup(
-        easy_track=contract_or_none(EasyTrack, network_addresses.easy_track),
-        evm_script_executor=contract_or_none(EVMScriptExecutor, network_addresses.evm_script_executor),
-        increase_node_operator_staking_limit=contract_or_none(
+        easy_track=lazy_contract_or_none(EasyTrack, network_addresses.easy_track),
+        evm_script_executor=lazy_contract_or_none(EVMScriptExecutor, network_addresses.evm_script_executor),
+        increase_node_operator_staking_limit=lazy_contract_or_none(
             IncreaseNodeOperatorStakingLimit,
             network_addresses.increase_node_operator_staking_limit,
         ),
-        top_up_lego_program=contract_or_none(TopUpLegoProgram, network_addresses.top_up_lego_program),
+        top_up_lego_program=lazy_contract_or_none(TopUpLegoProgram, network_addresses.top_up_lego_program),
         reward_programs=RewardPrograms(
-            add_reward_program=contract_or_none(AddRewardProgram, network_addresses.reward_programs.add_reward_program),
-            remove_reward_program=contract_or_none(
+            add_reward_program=lazy_contract_or_none(
+                AddRewardProgram, network_addresses.reward_programs.add_reward_program
+            ),
+            remove_reward_program=lazy_contract_or_none(
                 RemoveRewardProgram,
                 network_addresses.reward_programs.remove_reward_program,
             ),
-            top_up_reward_programs=contract_or_none(
+            top_up_reward_programs=lazy_contract_or_none(
                 TopUpRewardPrograms,
                 network_addresses.reward_programs.top_up_reward_programs,
             ),
-            reward_programs_registry=contract_or_none(
+            reward_programs_registry=lazy_contract_or_none(
                 RewardProgramsRegistry,
                 network_addresses.reward_programs.reward_programs_registry,
             ),
         ),
         referral_partners=RewardPrograms(
-            add_reward_program=contract_or_none(
+            add_reward_program=lazy_contract_or_none(
                 AddRewardProgram, network_addresses.referral_partners.add_reward_program
             ),
-            remove_reward_program=contract_or_none(
+            remove_reward_program=lazy_contract_or_none(
                 RemoveRewardProgram,
                 network_addresses.referral_partners.remove_reward_program,
             ),
-            top_up_reward_programs=contract_or_none(
+            top_up_reward_programs=lazy_contract_or_none(
                 TopUpRewardPrograms,
                 network_addresses.referral_partners.top_up_reward_programs,
             ),
-            reward_programs_registry=contract_or_none(
+            reward_programs_registry=lazy_contract_or_none(
                 RewardProgramsRegistry,
                 network_addresses.referral_partners.reward_programs_registry,
             ),
@@ -124,7 +137,7 @@ def contracts(network="mainnet"):
     )
 
 
-class EasyTrackSetup:
+class EasyTrackSetup(LazyAttributes):
     def __init__(
         self,
         easy_track,
@@ -142,7 +155,7 @@ class EasyTrackSetup:
         self.referral_partners = referral_partners
 
 
-class RewardPrograms:
+class RewardPrograms(LazyAttributes):
     def __init__(
         self,
         add_reward_program,
@@ -1,5 +1,8 @@
 from dataclasses import dataclass
+from brownie.convert import to_address
 from brownie import (
+    web3,
+    ZERO_ADDRESS,
     EasyTrack,
     TopUpLegoProgram,
     EVMScriptExecutor,
@@ -12,8 +15,19 @@ from brownie import (
     RemoveAllowedRecipient,
     TopUpAllowedRecipientsSingleToken,
     AllowedRecipientsRegistry,
+    AllowedTokensRegistry,
+    AddAllowedRecipientInitializable,
+    RemoveAllowedRecipientInitializable,
+    TopUpAllowedRecipientsInitializable,
+    TopUpAllowedRecipientsSingleTokenInitializable,
+    AllowedRecipientsCloneFactory,
+    AllowedRecipientsCloneFactorySingleToken,
 )
 
+# Runtime code of EIP-1167 minimal proxy is the prefix, implementation address and the suffix
+MINIMAL_PROXY_CODE_PREFIX = "363d3d373d3d3d363d73"
+MINIMAL_PROXY_CODE_SUFFIX = "5af43d82803e903d91602b57fd5bf3"
+
 
 @dataclass
 class AllowedRecipientsSingleTokenDeployConfig:
@@ -86,16 +100,103 @@ def deploy_reward_programs_registry(voting, evm_script_executor, tx_params):
     )
 
 
-def deploy_allowed_recipients_registry(voting, evm_script_executor, date_time_contract, tx_params):
-    return AllowedRecipientsRegistry.deploy(
+def deploy_allowed_recipients_registry(
+    voting, evm_script_executor, date_time_contract, tx_params, use_date_time_arithmetic=False
+):
+    """Deploys the registry calling date_time_contract or, with use_date_time_arithmetic,
+    calculating dates in-contract. The deployer holds SET_PARAMETERS_ROLE only to switch the mode"""
+    deployer = tx_params["from"]
+    registry = AllowedRecipientsRegistry.deploy(
         voting,
         [voting, evm_script_executor],
         [voting, evm_script_executor],
-        [voting],
+        [voting, deployer] if use_date_time_arithmetic else [voting],
         [evm_script_executor],
         date_time_contract,
         tx_params,
     )
+    if use_date_time_arithmetic:
+        registry.setDateTimeArithmeticMode(True, tx_params)
+        registry.renounceRole(registry.SET_PARAMETERS_ROLE(), deployer, tx_params)
+    return registry
+
+
+def deploy_allowed_recipients_clone_factory(tx_params):
+    """Deploys implementations of the multi token allowed recipients contracts and the factory cloning them"""
+    return AllowedRecipientsCloneFactory.deploy(
+        AllowedRecipientsRegistry.deploy(ZERO_ADDRESS, [], [], [], [], ZERO_ADDRESS, tx_params),
+        AllowedTokensRegistry.deploy(ZERO_ADDRESS, [], [], tx_params),
+        TopUpAllowedRecipientsInitializable.deploy(tx_params),
+        AddAllowedRecipientInitializable.deploy(tx_params),
+        RemoveAllowedRecipientInitializable.deploy(tx_params),
+        tx_params,
+    )
+
+
+def deploy_allowed_recipients_clone_factory_single_token(tx_params):
+    """Deploys implementations of the single token allowed recipients contracts and the factory cloning them"""
+    return AllowedRecipientsCloneFactorySingleToken.deploy(
+        AllowedRecipientsRegistry.deploy(ZERO_ADDRESS, [], [], [], [], ZERO_ADDRESS, tx_params),
+        TopUpAllowedRecipientsSingleTokenInitializable.deploy(tx_params),
+        AddAllowedRecipientInitializable.deploy(tx_params),
+        RemoveAllowedRecipientInitializable.deploy(tx_params),
+        tx_params,
+    )
+
+
+def get_clone_implementation(address):
+    """Returns implementation address of EIP-1167 minimal proxy or None if the contract isn't a minimal proxy"""
+    code = web3.eth.get_code(address).hex().lower().removeprefix("0x")
+    if not code.startswith(MINIMAL_PROXY_CODE_PREFIX) or not code.endswith(MINIMAL_PROXY_CODE_SUFFIX):
+        return None
+    implementation = code[len(MINIMAL_PROXY_CODE_PREFIX) : -len(MINIMAL_PROXY_CODE_SUFFIX)]
+    if len(implementation) != 40:
+        return None
+    return to_address(implementation)
+
+
+def get_clone_implementation_types(clone_factory_type):
+    """Returns contract types of the implementations of the clone factory by the names of their getters"""
+    top_up_allowed_recipients_type = (
+        TopUpAllowedRecipientsSingleTokenInitializable
+        if clone_factory_type._name == AllowedRecipientsCloneFactorySingleToken._name
+        else TopUpAllowedRecipientsInitializable
+    )
+    implementation_types = {
+        "allowedRecipientsRegistryImplementation": AllowedRecipientsRegistry,
+        "topUpAllowedRecipientsImplementation": top_up_allowed_recipients_type,
+        "addAllowedRecipientImplementation": AddAllowedRecipientInitializable,
+        "removeAllowedRecipientImplementation": RemoveAllowedRecipientInitializable,
+    }
+    if clone_factory_type._name == AllowedRecipientsCloneFactory._name:
+        implementation_types["allowedTokensRegistryImplementation"] = AllowedTokensRegistry
+    return implementation_types
+
+
+def publish_clone_factory_sources(clone_factory_type, clone_factory):
+    """Publishes sources of the clone factory and all its implementations"""
+    clone_factory_type.publish_source(clone_factory)
+    for implementation_getter, implementation_type in get_clone_implementation_types(clone_factory_type).items():
+        implementation_type.publish_source(implementation_type.at(getattr(clone_factory, implementation_getter)()))
+
+
+def check_clone_implementation(
+    clone_factory_type, factory_address, deploy_tx, event_name, contract_address, implementation_getter
+):
+    """Checks that the contract deployed in deploy_tx by the allowed recipients factory at factory_address
+    is a full contract or a minimal proxy clone of the implementation set in the factory. The runtime code
+    of the implementation must match the compiled contract. Returns the implementation address or None for
+    full contracts"""
+    factory_address = to_address(str(factory_address))
+    assert deploy_tx.events[event_name].address == factory_address
+    implementation = get_clone_implementation(contract_address)
+    if implementation is not None:
+        clone_factory = clone_factory_type.at(factory_address)
+        assert implementation == getattr(clone_factory, implementation_getter)()
+        implementation_type = get_clone_implementation_types(clone_factory_type)[implementation_getter]
+        implementation_code = web3.eth.get_code(implementation).hex().lower().removeprefix("0x")
+        assert implementation_code == implementation_type._build["deployedBytecode"].lower().removeprefix("0x")
+    return implementation
 
 
 def deploy_increase_node_operator_staking_limit(node_operators_registry, tx_params):
@@ -1,11 +1,12 @@
 import eth_abi
-from brownie.convert import to_bytes
+
+from utils import evm_script_codec
 
 EMPTY_CALLSCRIPT = "0x00000001"
 
 
 def create_executor_id(id):
-    return "0x" + str(id).zfill(8)
+    return "0x" + evm_script_codec.encode_spec_id(id).hex()
 
 
 def strip_byte_prefix(hexstr):
@@ -13,13 +14,11 @@ def strip_byte_prefix(hexstr):
 
 
 def encode_call_script(actions, spec_id=1):
-    result = create_executor_id(spec_id)
-    for to, calldata in actions:
-        addr_bytes = to_bytes(to, "bytes").hex()
-        calldata_bytes = strip_byte_prefix(calldata)
-        length = eth_abi.encode(["uint32"], [len(calldata_bytes) // 2]).hex()
-        result += addr_bytes + length[56:] + calldata_bytes
-    return result
+    return evm_script_codec.encode_call_script(actions, spec_id)
+
+
+def decode_call_script(evm_script):
+    return evm_script_codec.decode_call_script(evm_script)
 
 
 def encode_calldata(signature, values):
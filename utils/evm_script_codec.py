@@ -0,0 +1,127 @@
+""" EVMScript codec
+
+Pure-Python encoder and decoder of Aragon call scripts. A call script is the
+4 bytes executor (spec) id followed by a list of actions, where each action is
+encoded as (address to, uint32 calldata length, bytes calldata).
+
+The decoder never copies the calldata of actions: iter_call_script() yields
+memoryview slices of the passed buffer, so thousands of scripts read from
+MotionCreated events might be processed without extra allocations.
+"""
+
+import struct
+from functools import lru_cache
+from typing import Iterable, Iterator, List, NamedTuple, Tuple, Union
+
+from eth_utils import to_checksum_address
+
+BytesLike = Union[bytes, bytearray, memoryview, str]
+
+CALLS_SCRIPT_SPEC_ID = 1
+
+SPEC_ID_SIZE = 4
+ADDRESS_SIZE = 20
+CALLDATA_LENGTH_SIZE = 4
+METHOD_SELECTOR_SIZE = 4
+
+_UINT32 = struct.Struct(">I")
+
+# EVMScripts usually call a few contracts many times, so checksums are computed once per address
+ADDRESS_CHECKSUM_CACHE_SIZE = 4096
+
+
+class CallScriptAction(NamedTuple):
+    to: str
+    selector: bytes
+    calldata: memoryview
+
+
+def as_bytes(value: BytesLike) -> Union[bytes, bytearray, memoryview]:
+    """Converts hex string to bytes. Bytes-like objects are returned as is"""
+    if isinstance(value, str):
+        return bytes.fromhex(value[2:] if value[0:2] in ("0x", "0X") else value)
+    return value
+
+
+def address_to_bytes(address) -> bytes:
+    # accepts hex strings, bytes and brownie's Contract/Account objects
+    if not isinstance(address, (str, bytes, bytearray, memoryview)):
+        address = address.address
+    address_bytes = as_bytes(address)
+    if len(address_bytes) != ADDRESS_SIZE:
+        raise ValueError(f"Invalid address length {len(address_bytes)}: {address}")
+    return address_bytes
+
+
+@lru_cache(maxsize=ADDRESS_CHECKSUM_CACHE_SIZE)
+def checksum_address(address_bytes: bytes) -> str:
+    """Returns EIP-55 checksummed hex string of 20 bytes address"""
+    return to_checksum_address(address_bytes)
+
+
+def encode_spec_id(spec_id: int = CALLS_SCRIPT_SPEC_ID) -> bytes:
+    return _UINT32.pack(spec_id)
+
+
+def build_call_script(actions: Iterable[Tuple[BytesLike, BytesLike]], spec_id: int = CALLS_SCRIPT_SPEC_ID) -> bytes:
+    """Encodes list of (to, calldata) tuples into the call script with given spec id"""
+    script = bytearray(_UINT32.pack(spec_id))
+    for to, calldata in actions:
+        calldata_bytes = as_bytes(calldata)
+        script += address_to_bytes(to)
+        script += _UINT32.pack(len(calldata_bytes))
+        script += calldata_bytes
+    return bytes(script)
+
+
+def encode_call_script(actions: Iterable[Tuple[BytesLike, BytesLike]], spec_id: int = CALLS_SCRIPT_SPEC_ID) -> str:
+    """Same as build_call_script() but returns 0x-prefixed hex string"""
+    return "0x" + build_call_script(actions, spec_id).hex()
+
+
+def decode_spec_id(script: BytesLike) -> int:
+    script = as_bytes(script)
+    if len(script) < SPEC_ID_SIZE:
+        raise ValueError(f"EVMScript is too short: {len(script)} bytes")
+    return _UINT32.unpack_from(script, 0)[0]
+
+
+def iter_call_script(script: BytesLike, spec_id: int = None) -> Iterator[CallScriptAction]:
+    """Yields actions of the call script as (to, selector, calldata) tuples.
+
+    to is the checksummed address, so it can be compared with addresses of brownie contracts.
+    calldata is a memoryview of the passed buffer and includes the method selector.
+    When spec_id is passed, the executor id of the script is checked to be equal to it,
+    otherwise scripts with any executor id are decoded.
+    """
+    view = memoryview(as_bytes(script))
+    script_spec_id = decode_spec_id(view)
+    if spec_id is not None and script_spec_id != spec_id:
+        raise ValueError(f"Unexpected EVMScript spec id {script_spec_id}, expected {spec_id}")
+
+    location = SPEC_ID_SIZE
+    script_length = len(view)
+    while location < script_length:
+        calldata_start = location + ADDRESS_SIZE + CALLDATA_LENGTH_SIZE
+        if calldata_start > script_length:
+            raise ValueError(f"Malformed EVMScript: truncated action header at position {location}")
+
+        to = checksum_address(view[location : location + ADDRESS_SIZE].tobytes())
+        (calldata_length,) = _UINT32.unpack_from(view, location + ADDRESS_SIZE)
+
+        calldata_end = calldata_start + calldata_length
+        if calldata_end > script_length:
+            raise ValueError(f"Malformed EVMScript: calldata of action at position {location} out of bounds")
+
+        calldata = view[calldata_start:calldata_end]
+        yield CallScriptAction(to, bytes(calldata[:METHOD_SELECTOR_SIZE]), calldata)
+        location = calldata_end
+
+
+def decode_call_script(script: BytesLike) -> Tuple[int, List[Tuple[str, str]]]:
+    """Decodes the call script into the spec id and list of (to, calldata) tuples,
+    the inverse of encode_call_script()"""
+    return (
+        decode_spec_id(script),
+        [(to, "0x" + calldata.hex()) for to, _, calldata in iter_call_script(script)],
+    )
@@ -0,0 +1,106 @@
+""" Off-chain mirror of EVMScriptPermissions library
+
+Permissions are a list of tuples (address, bytes4) packed into bytes. PermissionSet parses them
+once into a set of bytes24 keys, so the validation of an EVMScript costs O(calls) instead of
+O(calls * permissions) of the linear scan made by EVMScriptPermissions._hasPermission.
+"""
+
+from typing import Dict, FrozenSet, Iterable, Optional
+
+from utils.evm_script_codec import (
+    ADDRESS_SIZE,
+    METHOD_SELECTOR_SIZE,
+    SPEC_ID_SIZE,
+    BytesLike,
+    address_to_bytes,
+    as_bytes,
+    iter_call_script,
+)
+
+PERMISSION_SIZE = ADDRESS_SIZE + METHOD_SELECTOR_SIZE
+
+
+def is_valid_permissions(permissions: BytesLike) -> bool:
+    """Same as EVMScriptPermissions.isValidPermissions"""
+    permissions = as_bytes(permissions)
+    return len(permissions) > 0 and len(permissions) % PERMISSION_SIZE == 0
+
+
+class PermissionSet:
+    def __init__(self, permissions: BytesLike):
+        permissions = bytes(as_bytes(permissions))
+        self.is_valid = is_valid_permissions(permissions)
+        self._keys: FrozenSet[bytes] = frozenset()
+        if self.is_valid:
+            self._keys = frozenset(
+                permissions[location : location + PERMISSION_SIZE]
+                for location in range(0, len(permissions), PERMISSION_SIZE)
+            )
+
+    @classmethod
+    def from_methods(cls, methods: Iterable[tuple]) -> "PermissionSet":
+        """Builds permissions from (address, method selector) tuples"""
+        return cls(b"".join(bytes(address_to_bytes(to)) + bytes(as_bytes(selector)) for to, selector in methods))
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, permission: BytesLike) -> bool:
+        return bytes(as_bytes(permission)) in self._keys
+
+    def can_execute_evm_script(self, evm_script: BytesLike) -> bool:
+        """Validates that passed EVMScript calls only methods allowed in permissions.
+
+        Mirrors EVMScriptPermissions.canExecuteEVMScript. Unlike the library, malformed
+        EVMScripts (with truncated actions) are reported as not executable.
+        """
+        evm_script = as_bytes(evm_script)
+        if not self.is_valid or len(evm_script) <= SPEC_ID_SIZE:
+            return False
+        try:
+            for to, selector, _ in iter_call_script(evm_script):
+                if len(selector) < METHOD_SELECTOR_SIZE or bytes.fromhex(to[2:]) + selector not in self._keys:
+                    return False
+        except ValueError:
+            return False
+        return True
+
+
+class FactoryPermissionsCache:
+    """Caches parsed permissions of EVMScript factories registered in EasyTrack.
+
+    Permissions of every factory are requested from EasyTrack only once. Call invalidate()
+    when factories were added or removed (or the chain was reverted).
+    """
+
+    def __init__(self, easy_track):
+        self._easy_track = easy_track
+        self._permissions: Dict[str, PermissionSet] = {}
+
+    def get(self, evm_script_factory) -> PermissionSet:
+        key = _address_key(evm_script_factory)
+        if key not in self._permissions:
+            self._permissions[key] = PermissionSet(self._easy_track.evmScriptFactoryPermissions(key))
+        return self._permissions[key]
+
+    def preload(self, evm_script_factories: Optional[Iterable] = None):
+        """Loads permissions of given factories or all registered ones if factories are not passed"""
+        if evm_script_factories is None:
+            evm_script_factories = self._easy_track.getEVMScriptFactories()
+        for evm_script_factory in evm_script_factories:
+            self.get(evm_script_factory)
+
+    def can_execute_evm_script(self, evm_script_factory, evm_script: BytesLike) -> bool:
+        return self.get(evm_script_factory).can_execute_evm_script(evm_script)
+
+    def invalidate(self, evm_script_factory=None):
+        if evm_script_factory is None:
+            self._permissions.clear()
+        else:
+            self._permissions.pop(_address_key(evm_script_factory), None)
+
+
+def _address_key(address) -> str:
+    if not isinstance(address, str):
+        address = address.address
+    return address.lower()
@@ -0,0 +1,255 @@
+""" Persistent on-disk cache of the forked node state
+
+Deployments made by test fixtures are dumped to disk together with the addresses of the
+deployed contracts. Next runs load the dumped state instead of repeating the deployment.
+
+Cache entries are keyed by the block number the node was forked from, the hash of the
+compiled contracts and the hash of the fixture sources, so the cache is invalidated
+automatically when any of them changes. Only the MAX_CACHE_KEYS most recently used keys are
+kept on disk, so runs forking the latest block don't grow the cache without bound.
+
+A dump contains the whole state of the node, so loading it replaces the state made by the
+fixtures requested before. To load only dumps made on top of the same state, the cache tracks
+the chain: an entry is used only when the chain is at the block left by the previous cached
+deployment (or at the fork block), and the names of cached deployments made since the fork block
+are a part of the entry key. Requests changing the state without mining a block (balance, code,
+nonce and storage changes) are a part of the key too, and reverts to snapshots restore the
+tracked state. When any other transaction was sent since then, the fixture deploys as usual
+and its state isn't cached.
+
+The cache requires the node to support state dumps (anvil_dumpState/anvil_loadState). Forked
+networks from network-config.yaml run anvil. On nodes without such support the cache is
+disabled and fixtures deploy as usual.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from brownie import web3
+
+from utils import log
+
+ENV_FORK_STATE_CACHE = "FORK_STATE_CACHE"
+DEFAULT_CACHE_DIR = ".fork_state_cache"
+DEFAULT_BUILD_DIR = "build/contracts"
+MAX_CACHE_KEYS = 3
+
+DUMP_STATE_METHODS = ["anvil_dumpState", "hardhat_dumpState"]
+LOAD_STATE_METHODS = ["anvil_loadState", "hardhat_loadState"]
+# requests changing the state of the node without mining a block
+STATE_CHANGE_METHODS = [
+    "anvil_setBalance",
+    "anvil_setCode",
+    "anvil_setNonce",
+    "anvil_setStorageAt",
+    "hardhat_setBalance",
+    "hardhat_setCode",
+    "hardhat_setNonce",
+    "hardhat_setStorageAt",
+    "evm_setAccountBalance",
+]
+RESET_METHODS = ["anvil_reset", "hardhat_reset"]
+
+
+class ForkStateCache:
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, fixture_files: Iterable = (), build_dir=DEFAULT_BUILD_DIR):
+        self._cache_dir = Path(cache_dir)
+        self._fixture_files = [Path(f) for f in fixture_files]
+        self._build_dir = Path(build_dir)
+        self._key = None
+        self._fork_block_number = None
+        self._dump_method = None
+        self._load_method = None
+        # cached deployments and state changes made since the fork block and the block they left the chain at
+        self._upstream: List[str] = []
+        self._upstream_block: Optional[Tuple[int, str]] = None
+        # tracked state at the snapshots taken by evm_snapshot
+        self._snapshots: Dict[str, Tuple[List[str], Optional[Tuple[int, str]]]] = {}
+        self._watching = False
+        self.enabled = os.getenv(ENV_FORK_STATE_CACHE, "1") not in ("0", "false", "")
+
+    @property
+    def key(self) -> str:
+        if self._key is None:
+            key_hash = hashlib.sha256()
+            key_hash.update(str(self.fork_block_number).encode())
+            key_hash.update(artifacts_hash(self._build_dir).encode())
+            key_hash.update(files_hash(self._fixture_files).encode())
+            self._key = key_hash.hexdigest()[:16]
+        return self._key
+
+    @property
+    def fork_block_number(self) -> Optional[int]:
+        if self._fork_block_number is None:
+            self._fork_block_number = get_fork_block_number()
+        return self._fork_block_number
+
+    def watch(self):
+        """Starts tracking of the requests sent to the node. Must be called before any state
+        changes made since the fork block, otherwise cached deployments are used only after
+        the node is reset to the fork block"""
+        if not self.enabled or self._watching:
+            return
+        self._watching = True
+        self._reset_upstream()
+
+        provider = web3.provider
+        make_request = provider.make_request
+
+        def tracked_make_request(method, params):
+            response = make_request(method, params)
+            if "error" not in response:
+                self._track_request(method, params, response.get("result"))
+            return response
+
+        provider.make_request = tracked_make_request
+
+    def cached(self, name: str, deploy: Callable[[], Dict[str, str]]) -> Dict[str, str]:
+        """Returns addresses saved for the deployment with given name loading the dumped
+        state into the node. When there is no cache entry, calls deploy(), which must return
+        addresses of the deployed contracts, and dumps the resulting state"""
+        self.watch()
+        use_cache = self.enabled and self._sync_upstream()
+        if use_cache:
+            addresses = self.load(name)
+            if addresses is not None:
+                self._push_upstream(name)
+                log.ok(f"Fork state '{name}' loaded from cache", self.key)
+                return addresses
+
+        upstream_length = len(self._upstream)
+        addresses = deploy()
+
+        if use_cache:
+            # state changes made by deploy() are in the dump, loading it doesn't repeat them
+            del self._upstream[upstream_length:]
+            self.save(name, addresses)
+            self._push_upstream(name)
+        return addresses
+
+    def load(self, name: str) -> Optional[Dict[str, str]]:
+        entry_path = self._entry_path(name)
+        if not entry_path.exists():
+            return None
+        entry = json.loads(entry_path.read_text())
+        if not self._call_supported(LOAD_STATE_METHODS, [entry["state"]], "_load_method"):
+            return None
+        return entry["addresses"]
+
+    def save(self, name: str, addresses: Dict[str, str]):
+        state = self._call_supported(DUMP_STATE_METHODS, [], "_dump_method")
+        if state is None:
+            log.warning("Node doesn't support state dumps, fork state cache disabled. Run the fork with anvil")
+            self.enabled = False
+            return
+        entry_path = self._entry_path(name)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        entry_path.write_text(json.dumps({"addresses": {k: str(v) for k, v in addresses.items()}, "state": state}))
+        self.prune()
+
+    def prune(self, max_keys: int = MAX_CACHE_KEYS):
+        """Removes all but max_keys most recently used cache keys"""
+        if not self._cache_dir.exists():
+            return
+        key_dirs = sorted(
+            (path for path in self._cache_dir.iterdir() if path.is_dir()),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True,
+        )
+        for key_dir in key_dirs[max_keys:]:
+            shutil.rmtree(key_dir)
+
+    def _sync_upstream(self) -> bool:
+        """Returns if the chain is in the state tracked by the cache"""
+        return self._upstream_block is not None and current_block() == self._upstream_block
+
+    def _push_upstream(self, name: str):
+        self._upstream.append(name)
+        self._upstream_block = current_block()
+
+    def _reset_upstream(self):
+        # after reverts to unknown snapshots the state is known only at the fork block
+        block = current_block()
+        self._upstream = []
+        self._upstream_block = block if block[0] == self.fork_block_number else None
+
+    def _track_request(self, method: str, params, result):
+        if method in STATE_CHANGE_METHODS:
+            self._upstream.append(f"{method}{json.dumps(params)}")
+        elif method == "evm_snapshot":
+            self._snapshots[str(result)] = (list(self._upstream), self._upstream_block)
+        elif method == "evm_revert" and result:
+            snapshot = self._snapshots.get(str(params[0]))
+            if snapshot is None:
+                self._reset_upstream()
+            else:
+                self._upstream, self._upstream_block = list(snapshot[0]), snapshot[1]
+        elif method in RESET_METHODS:
+            self._reset_upstream()
+
+    def _entry_path(self, name: str) -> Path:
+        upstream_hash = hashlib.sha256("\n".join(self._upstream).encode()).hexdigest()[:12]
+        entry_path = self._cache_dir / self.key / f"{name}-{upstream_hash}.json"
+        if entry_path.parent.exists():
+            # marks the key as recently used for prune()
+            entry_path.parent.touch()
+        return entry_path
+
+    def _call_supported(self, methods, params, method_attr):
+        # tries methods one by one and remembers the first one supported by the node
+        known_method = getattr(self, method_attr)
+        for method in [known_method] if known_method else methods:
+            try:
+                response = web3.provider.make_request(method, params)
+            except ValueError:
+                continue
+            if "error" in response:
+                continue
+            setattr(self, method_attr, method)
+            return response["result"]
+        return None
+
+
+def current_block() -> Tuple[int, str]:
+    """Returns the number and the hash of the latest block of the node"""
+    block_number = web3.eth.block_number
+    return block_number, bytes(web3.eth.get_block(block_number)["hash"]).hex()
+
+
+def get_fork_block_number() -> Optional[int]:
+    """Returns the number of the block the node was forked from"""
+    metadata_methods = [
+        ("hardhat_metadata", ["forkedNetwork", "forkBlockNumber"]),
+        ("anvil_nodeInfo", ["forkConfig", "forkBlockNumber"]),
+    ]
+    for method, path in metadata_methods:
+        try:
+            response = web3.provider.make_request(method, [])
+        except ValueError:
+            continue
+        value = response.get("result")
+        for key in path:
+            value = value.get(key) if isinstance(value, dict) else None
+        if value is not None:
+            return int(value)
+    return None
+
+
+def artifacts_hash(build_dir: Path) -> str:
+    artifacts_hash_ = hashlib.sha256()
+    for artifact_path in sorted(Path(build_dir).glob("*.json")):
+        artifact = json.loads(artifact_path.read_text())
+        artifacts_hash_.update(artifact_path.name.encode())
+        artifacts_hash_.update(artifact.get("bytecode", "").encode())
+    return artifacts_hash_.hexdigest()
+
+
+def files_hash(files: Iterable[Path]) -> str:
+    files_hash_ = hashlib.sha256()
+    for file in files:
+        files_hash_.update(Path(file).read_bytes())
+    return files_hash_.hexdigest()
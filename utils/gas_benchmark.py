@@ -0,0 +1,106 @@
+""" Gas baseline of EasyTrack motions
+
+Benchmark tests measure the gas used by createMotion and enactMotion for every EVMScript
+factory over a range of batch sizes and compare it to the baseline stored in gas-baseline.json:
+
+    {"<factory>": {"<batch size>": {"createMotion": <gas>, "enactMotion": <gas>, "enactMotionWithEVMScript": <gas>}}}
+
+enactMotionWithEVMScript is measured only for benchmarks requesting the fast enactment when the
+tested EasyTrack supports it.
+
+Benchmarks are opt-in: they run with GAS_BENCHMARK=1 when the baseline file exists and are
+skipped otherwise. Measurements exceeding the baseline by more than GAS_TOLERANCE (relative,
+0.02 by default) fail the benchmark, as well as measurements missing in the baseline. Run
+benchmarks with GAS_BASELINE_UPDATE=1 to write measured values into the baseline file instead
+of checking them.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from utils import log
+
+ENV_GAS_BENCHMARK = "GAS_BENCHMARK"
+ENV_GAS_BASELINE_UPDATE = "GAS_BASELINE_UPDATE"
+ENV_GAS_TOLERANCE = "GAS_TOLERANCE"
+DEFAULT_GAS_BASELINE_PATH = "gas-baseline.json"
+DEFAULT_GAS_TOLERANCE = 0.02
+
+BENCHMARK_BATCH_SIZES = [1, 5, 10, 20]
+
+
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "") not in ("", "0", "false")
+
+
+def get_skip_reason(path=DEFAULT_GAS_BASELINE_PATH) -> Optional[str]:
+    """Returns the reason to skip benchmarks or None when they have to run"""
+    if _env_flag(ENV_GAS_BASELINE_UPDATE):
+        return None
+    if not _env_flag(ENV_GAS_BENCHMARK):
+        return f"gas benchmarks are disabled, set {ENV_GAS_BENCHMARK}=1 to run them"
+    if not Path(path).exists():
+        return f"no gas baseline in {path}, run benchmarks with {ENV_GAS_BASELINE_UPDATE}=1 to create it"
+    return None
+
+
+class GasBaseline:
+    def __init__(
+        self, path=DEFAULT_GAS_BASELINE_PATH, tolerance: Optional[float] = None, update: Optional[bool] = None
+    ):
+        self.path = Path(path)
+        self.tolerance = float(os.getenv(ENV_GAS_TOLERANCE, DEFAULT_GAS_TOLERANCE)) if tolerance is None else tolerance
+        self.update = _env_flag(ENV_GAS_BASELINE_UPDATE) if update is None else update
+        self.baseline: Dict[str, Dict[str, Dict[str, int]]] = (
+            json.loads(self.path.read_text()) if self.path.exists() else {}
+        )
+        self.measured: Dict[str, Dict[str, Dict[str, int]]] = {}
+
+    def get(self, name: str, batch_size: int) -> Optional[Dict[str, int]]:
+        return self.baseline.get(name, {}).get(str(batch_size))
+
+    def record(
+        self, name: str, batch_size: int, create_gas: int, enact_gas: int, fast_enact_gas: Optional[int] = None
+    ) -> List[str]:
+        """Records the measurement and returns the list of regressions against the baseline"""
+        measurement = {"createMotion": create_gas, "enactMotion": enact_gas}
+        if fast_enact_gas is not None:
+            measurement["enactMotionWithEVMScript"] = fast_enact_gas
+            log.ok(
+                f"{name}[{batch_size}] fast enactment saves",
+                f"{enact_gas - fast_enact_gas} gas ({(1 - fast_enact_gas / enact_gas) * 100:.2f}%)",
+            )
+        self.measured.setdefault(name, {})[str(batch_size)] = measurement
+
+        if self.update:
+            return []
+
+        expected = self.get(name, batch_size) or {}
+        regressions = []
+        for method, gas_used in measurement.items():
+            if method not in expected:
+                regressions.append(
+                    f"{name}[{batch_size}].{method}: {gas_used} gas, no baseline in {self.path} "
+                    f"(run with {ENV_GAS_BASELINE_UPDATE}=1 to add it)"
+                )
+                continue
+            max_gas = expected[method] * (1 + self.tolerance)
+            if gas_used > max_gas:
+                regressions.append(
+                    f"{name}[{batch_size}].{method}: {gas_used} gas, baseline {expected[method]} "
+                    f"(+{(gas_used / expected[method] - 1) * 100:.2f}%, tolerance {self.tolerance * 100:.2f}%)"
+                )
+        return regressions
+
+    def save(self):
+        """Merges measured values into the baseline and writes it to the file"""
+        for name, measurements in self.measured.items():
+            self.baseline.setdefault(name, {}).update(measurements)
+        baseline = {
+            name: dict(sorted(measurements.items(), key=lambda item: int(item[0])))
+            for name, measurements in sorted(self.baseline.items())
+        }
+        self.path.write_text(json.dumps(baseline, indent=2) + "\n")
+        log.ok(f"Gas baseline saved to {self.path}")
@@ -1,5 +1,7 @@
 import brownie
-from utils import evm_script as evm_script_utils, config
+from eth_utils import keccak
+from utils import evm_script as evm_script_utils, config, contracts_registry
+from utils.contracts_registry import LazyAttributes, lazy
 
 DEFAULT_NETWORK = "mainnet"
 
@@ -76,8 +78,19 @@ def addresses(network=DEFAULT_NETWORK):
     )
 
 
-def contracts(network=DEFAULT_NETWORK):
-    return LidoContractsSetup(brownie.interface, lido_addresses=addresses(network))
+def contracts(network=DEFAULT_NETWORK, verify_roles=False):
+    lido_contracts = contracts_registry.get_or_create(
+        "lido",
+        network,
+        lambda: LidoContractsSetup(
+            brownie.interface,
+            lido_addresses=addresses(network),
+            multicall_address=config.get_multicall_address(network),
+        ),
+    )
+    if verify_roles:
+        lido_contracts.permissions.verify_roles()
+    return lido_contracts
 
 
 def external_contracts(network=DEFAULT_NETWORK):
@@ -129,32 +142,39 @@ def allowed_recipients_builder_multi_token(network=DEFAULT_NETWORK):
     )
 
 
-class LidoContractsSetup:
-    def __init__(self, interface, lido_addresses):
+class LidoContractsSetup(LazyAttributes):
+    """Contracts are instantiated on the first access of the corresponding attribute"""
+
+    def __init__(self, interface, lido_addresses, multicall_address=None):
         self.lido_addresses = lido_addresses
+        self.multicall_address = multicall_address
         self.aragon = AragonSetup(
-            acl=interface.ACL(lido_addresses.aragon.acl),
-            agent=interface.Agent(lido_addresses.aragon.agent),
-            voting=interface.Voting(lido_addresses.aragon.voting),
-            finance=interface.Finance(lido_addresses.aragon.finance),
-            gov_token=interface.MiniMeToken(lido_addresses.aragon.gov_token),
-            calls_script=interface.CallsScript(lido_addresses.aragon.calls_script),
-            token_manager=interface.TokenManager(lido_addresses.aragon.token_manager),
-            kernel=interface.Kernel(lido_addresses.aragon.kernel),
+            acl=_lazy_contract(interface.ACL, lido_addresses.aragon.acl),
+            agent=_lazy_contract(interface.Agent, lido_addresses.aragon.agent),
+            voting=_lazy_contract(interface.Voting, lido_addresses.aragon.voting),
+            finance=_lazy_contract(interface.Finance, lido_addresses.aragon.finance),
+            gov_token=_lazy_contract(interface.MiniMeToken, lido_addresses.aragon.gov_token),
+            calls_script=_lazy_contract(interface.CallsScript, lido_addresses.aragon.calls_script),
+            token_manager=_lazy_contract(interface.TokenManager, lido_addresses.aragon.token_manager),
+            kernel=_lazy_contract(interface.Kernel, lido_addresses.aragon.kernel),
         )
-        self.steth = interface.Lido(lido_addresses.steth)
-        self.node_operators_registry = interface.NodeOperatorsRegistry(lido_addresses.node_operators_registry)
-        self.simple_dvt = (
-            None if not lido_addresses.simple_dvt else interface.NodeOperatorsRegistry(lido_addresses.simple_dvt)
+        self.steth = _lazy_contract(interface.Lido, lido_addresses.steth)
+        self.node_operators_registry = _lazy_contract(
+            interface.NodeOperatorsRegistry, lido_addresses.node_operators_registry
+        )
+        self.simple_dvt = _lazy_contract(interface.NodeOperatorsRegistry, lido_addresses.simple_dvt)
+        self.ldo = lazy(lambda: self.aragon.gov_token)
+        self.permissions = lazy(lambda: Permissions(contracts=self))
+        self.staking_router = _lazy_contract(interface.StakingRouter, lido_addresses.staking_router)
+        self.locator = _lazy_contract(interface.LidoLocator, lido_addresses.locator)
+        self.mev_boost_list = _lazy_contract(interface.MEVBoostRelayAllowedList, lido_addresses.mev_boost_list)
+        self.dual_governance_admin_executor = _lazy_contract(
+            interface.DualGovernanceExecutor, lido_addresses.dual_governance_admin_executor
+        )
+        self.dual_governance = _lazy_contract(interface.DualGovernance, lido_addresses.dual_governance)
+        self.emergency_protected_timelock = _lazy_contract(
+            interface.EmergencyProtectedTimelock, lido_addresses.emergency_protected_timelock
         )
-        self.ldo = self.aragon.gov_token
-        self.permissions = Permissions(contracts=self)
-        self.staking_router = interface.StakingRouter(lido_addresses.staking_router)
-        self.locator = interface.LidoLocator(lido_addresses.locator)
-        self.mev_boost_list = interface.MEVBoostRelayAllowedList(lido_addresses.mev_boost_list)
-        self.dual_governance_admin_executor = interface.DualGovernanceExecutor(lido_addresses.dual_governance_admin_executor)
-        self.dual_governance = interface.DualGovernance(lido_addresses.dual_governance)
-        self.emergency_protected_timelock = interface.EmergencyProtectedTimelock(lido_addresses.emergency_protected_timelock)
 
     def create_voting(self, evm_script, description, tx_params=None):
         voting = self.aragon.voting
@@ -222,7 +242,7 @@ class LidoAddressesSetup:
         self.emergency_protected_timelock = emergency_protected_timelock
 
 
-class AragonSetup:
+class AragonSetup(LazyAttributes):
     def __init__(
         self,
         acl,
@@ -247,6 +267,7 @@ class AragonSetup:
 class Permissions:
     def __init__(self, contracts):
         self._acl = contracts.aragon.acl
+        self._multicall_address = contracts.multicall_address
         self.finance = FinancePermissions(contracts.aragon.finance)
         self.agent = AgentPermissions(contracts.aragon.agent)
         self.lido = LidoPermissions(contracts.steth)
@@ -255,11 +276,13 @@ class Permissions:
         self.voting = VotingPermissions(contracts.aragon.voting)
 
     def filter_granted(self, permissions, address):
-        return [
-            permission
-            for permission in permissions
-            if self._acl.hasPermission(address, permission.app, permission.role)
-        ]
+        """Returns permissions granted to the address. All ACL lookups are sent in one multicall"""
+        permissions = list(permissions)
+        with brownie.multicall(address=self._multicall_address):
+            is_granted = [
+                self._acl.hasPermission(address, permission.app, permission.role) for permission in permissions
+            ]
+        return [permission for permission, granted in zip(permissions, is_granted) if granted]
 
     def all(self):
         return (
@@ -271,6 +294,16 @@ class Permissions:
             + list(self.voting.__dict__.values())
         )
 
+    def verify_roles(self, permissions=None):
+        """Checks that locally computed role hashes are equal to the ones returned by the apps.
+        All role getters are called in one multicall"""
+        permissions = list(permissions or self.all())
+        with brownie.multicall(address=self._multicall_address):
+            onchain_roles = [getattr(permission.app, permission.role_name)() for permission in permissions]
+        for permission, onchain_role in zip(permissions, onchain_roles):
+            if onchain_role != permission.role:
+                raise AssertionError(f"Role hash mismatch for {permission}: on-chain value is {onchain_role}")
+
 
 class FinancePermissions:
     def __init__(self, finance_app):
@@ -329,7 +362,9 @@ class Permission:
     def __init__(self, app, role_name):
         self.app = app
         self.role_name = role_name
-        self.role = getattr(app, role_name)()
+        # Aragon apps define roles as keccak256("<ROLE_NAME>"), use Permissions.verify_roles()
+        # to check the hashes against the values returned by the apps
+        self.role = role_hash(role_name)
 
     def __hash__(self):
         return hash((self.app, self.role_name))
@@ -341,3 +376,11 @@ class Permission:
 
     def __str__(self):
         return f"{self.app._name}.{self.role_name} ({self.role})"
+
+
+def _lazy_contract(contract_type, address):
+    return lazy(lambda: None if not address else contract_type(address))
+
+
+def role_hash(role_name):
+    return "0x" + keccak(text=role_name).hex()
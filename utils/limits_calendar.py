@@ -0,0 +1,83 @@
+""" Period calendar of LimitsChecker
+
+Pure integer reimplementation of LimitsChecker._getPeriodStartFromTimestamp and
+LimitsChecker._getPeriodEndFromTimestamp together with the BokkyPooBahs date-time
+functions they use.
+
+Functions use only arithmetic operators, so they accept both plain ints and NumPy
+integer arrays. Arrays are processed element-wise in one call and broadcast against
+each other, e.g. period boundaries of every day for every allowed period duration:
+
+    timestamps = np.arange(start, end, SECONDS_PER_DAY, dtype=np.int64)
+    starts, ends = period_range(timestamps[:, None], np.array(PERIOD_DURATIONS_MONTHS))
+"""
+
+SECONDS_PER_DAY = 24 * 60 * 60
+OFFSET19700101 = 2440588
+
+PERIOD_DURATIONS_MONTHS = (1, 2, 3, 6, 12)
+
+
+def days_to_date(days):
+    """Same as BokkyPooBahsDateTimeLibrary._daysToDate. Returns (year, month, day)"""
+    l = days + 68569 + OFFSET19700101
+    n = 4 * l // 146097
+    l = l - (146097 * n + 3) // 4
+    year = 4000 * (l + 1) // 1461001
+    l = l - 1461 * year // 4 + 31
+    month = 80 * l // 2447
+    day = l - 2447 * month // 80
+    l = month // 11
+    month = month + 2 - 12 * l
+    year = 100 * (n - 49) + year + l
+    return year, month, day
+
+
+def days_from_date(year, month, day):
+    """Same as BokkyPooBahsDateTimeLibrary._daysFromDate"""
+    # (month - 14) / 12 in Solidity rounds towards zero: -1 for January and February, 0 otherwise
+    month_shift = -((14 - month) // 12)
+    return (
+        day
+        - 32075
+        + 1461 * (year + 4800 + month_shift) // 4
+        + 367 * (month - 2 - month_shift * 12) // 12
+        - 3 * ((year + 4900 + month_shift) // 100) // 4
+        - OFFSET19700101
+    )
+
+
+def timestamp_to_date(timestamp):
+    return days_to_date(timestamp // SECONDS_PER_DAY)
+
+
+def timestamp_from_date(year, month, day):
+    return days_from_date(year, month, day) * SECONDS_PER_DAY
+
+
+def first_month_in_period(month, period_duration_months):
+    """Same as LimitsChecker._getFirstMonthInPeriodFromMonth"""
+    return (month - 1) // period_duration_months * period_duration_months + 1
+
+
+def period_start(timestamp, period_duration_months):
+    """Same as LimitsChecker._getPeriodStartFromTimestamp"""
+    year, month, _ = timestamp_to_date(timestamp)
+    return timestamp_from_date(year, first_month_in_period(month, period_duration_months), 1)
+
+
+def period_end(timestamp, period_duration_months):
+    """Same as LimitsChecker._getPeriodEndFromTimestamp.
+
+    The contract adds periodDurationMonths to the period start with BokkyPooBahs addMonths().
+    The period always starts at midnight of the first day of the month, so the day clamping
+    made by addMonths() never applies and the result is the first day of the month after the period.
+    """
+    year, month, _ = timestamp_to_date(timestamp)
+    next_period_month = first_month_in_period(month, period_duration_months) + period_duration_months
+    return timestamp_from_date(year + (next_period_month - 1) // 12, (next_period_month - 1) % 12 + 1, 1)
+
+
+def period_range(timestamp, period_duration_months):
+    """Returns (period start, period end) of the period containing the timestamp"""
+    return period_start(timestamp, period_duration_months), period_end(timestamp, period_duration_months)
@@ -0,0 +1,67 @@
+""" EVMScripts of motions created with compact MotionCreated events
+
+When EasyTrack.compactMotionCreatedEvent() is set, MotionCreated event contains the call data
+of the motion but empty _evmScript, and the hash of the EVMScript is emitted in the following
+MotionEVMScriptHashed event. The EVMScript is rebuilt off-chain calling createEVMScript() of the
+EVMScript factory with the call data of the motion at the creation block. Calls to old blocks
+require an archive node.
+
+    event = get_motion_created_event(easy_track.createMotion(factory, call_data, {"from": creator}))
+    event["_evmScript"]  # the same for full and compact MotionCreated events
+"""
+
+from typing import Dict, Optional
+
+import eth_abi
+from brownie import web3
+from brownie.convert import to_address
+
+from utils.evm_script_codec import as_bytes
+
+CREATE_EVM_SCRIPT_SIGNATURE = "createEVMScript(address,bytes)"
+
+
+def rebuild_motion_evm_script(
+    easy_track,
+    evm_script_factory,
+    creator,
+    evm_script_call_data,
+    block_identifier,
+    evm_script_hash: Optional[str] = None,
+) -> str:
+    """Returns EVMScript created by the factory for the motion at the given block.
+    Raises ValueError if evm_script_hash is passed and differs from the hash of the rebuilt EVMScript"""
+    call_data = web3.keccak(text=CREATE_EVM_SCRIPT_SIGNATURE)[:4] + eth_abi.encode(
+        ["address", "bytes"], [to_address(str(creator)), bytes(as_bytes(evm_script_call_data))]
+    )
+    # EasyTrack is the sender of createEVMScript() calls on the motion creation
+    result = web3.eth.call(
+        {"from": to_address(str(easy_track)), "to": to_address(str(evm_script_factory)), "data": call_data},
+        block_identifier,
+    )
+    (evm_script,) = eth_abi.decode(["bytes"], bytes(result))
+
+    if evm_script_hash is not None and web3.keccak(evm_script) != bytes(as_bytes(evm_script_hash)):
+        raise ValueError(f"Hash of EVMScript rebuilt at block {block_identifier} doesn't match {evm_script_hash}")
+    return "0x" + evm_script.hex()
+
+
+def is_compact_motion_created_event(event) -> bool:
+    """Returns if MotionCreated event was emitted without EVMScript"""
+    return len(as_bytes(event["_evmScript"])) == 0
+
+
+def get_motion_created_event(tx) -> Dict:
+    """Returns args of MotionCreated event of the motion creation transaction. _evmScript of
+    compact events is rebuilt and checked against the hash from MotionEVMScriptHashed event"""
+    event = {key: value for key, value in tx.events["MotionCreated"].items()}
+    if is_compact_motion_created_event(event):
+        event["_evmScript"] = rebuild_motion_evm_script(
+            tx.receiver,
+            event["_evmScriptFactory"],
+            event["_creator"],
+            event["_evmScriptCallData"],
+            tx.block_number,
+            tx.events["MotionEVMScriptHashed"]["_evmScriptHash"],
+        )
+    return event
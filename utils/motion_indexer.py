@@ -0,0 +1,337 @@
+""" Event-sourced index of EasyTrack motions
+
+MotionIndexer reads MotionCreated, MotionObjected, MotionRejected, MotionCanceled and
+MotionEnacted events of the EasyTrack contract with bounded eth_getLogs requests and keeps
+the state of every motion (including finished ones) in a SQLite database.
+
+The indexer stores the last processed block as a checkpoint, so sync() requests only the
+blocks mined since the previous call. Hashes of the last checkpoints are kept to detect
+chain reorganizations: when a stored hash doesn't match the chain anymore, events from the
+orphaned blocks are removed and the state of affected motions is rebuilt from the remaining ones.
+
+EVMScripts of motions created with compact MotionCreated events are rebuilt calling the EVMScript
+factory at the creation block and checked against the hash from MotionEVMScriptHashed event.
+When the EVMScript can't be rebuilt, the motion is stored with NULL evm_script and a warning.
+
+    indexer = MotionIndexer(easy_track, "motions.sqlite", start_block=13676729)
+    indexer.sync()
+    indexer.get_active_motions(evm_script_factory="0x...")
+"""
+
+import json
+import sqlite3
+from typing import Dict, List, Optional
+
+from brownie import web3
+
+from utils import log
+from utils.motion_evm_script import is_compact_motion_created_event, rebuild_motion_evm_script
+
+MOTION_STATUS_ACTIVE = "active"
+MOTION_STATUS_ENACTED = "enacted"
+MOTION_STATUS_REJECTED = "rejected"
+MOTION_STATUS_CANCELED = "canceled"
+
+MOTION_EVENTS = [
+    "MotionCreated",
+    "MotionEVMScriptHashed",
+    "MotionObjected",
+    "MotionRejected",
+    "MotionCanceled",
+    "MotionEnacted",
+]
+
+FINAL_MOTION_STATUSES = {
+    "MotionEnacted": MOTION_STATUS_ENACTED,
+    "MotionRejected": MOTION_STATUS_REJECTED,
+    "MotionCanceled": MOTION_STATUS_CANCELED,
+}
+
+DEFAULT_LOGS_BATCH_SIZE = 5_000
+DEFAULT_REORG_DEPTH = 64
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    block_number INTEGER PRIMARY KEY,
+    block_hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    transaction_hash TEXT NOT NULL,
+    name TEXT NOT NULL,
+    motion_id INTEGER NOT NULL,
+    args TEXT NOT NULL,
+    PRIMARY KEY (block_number, log_index)
+);
+CREATE INDEX IF NOT EXISTS events_motion_id ON events (motion_id);
+CREATE TABLE IF NOT EXISTS motions (
+    id INTEGER PRIMARY KEY,
+    evm_script_factory TEXT NOT NULL,
+    creator TEXT NOT NULL,
+    evm_script_call_data TEXT NOT NULL,
+    evm_script TEXT,
+    status TEXT NOT NULL,
+    objections_amount TEXT NOT NULL,
+    objections_amount_pct INTEGER NOT NULL,
+    created_block INTEGER NOT NULL,
+    created_transaction_hash TEXT NOT NULL,
+    finished_block INTEGER
+);
+CREATE INDEX IF NOT EXISTS motions_status_factory ON motions (status, evm_script_factory);
+"""
+
+
+class MotionIndexer:
+    def __init__(
+        self,
+        easy_track,
+        db_path: str = ":memory:",
+        start_block: int = 0,
+        logs_batch_size: int = DEFAULT_LOGS_BATCH_SIZE,
+        reorg_depth: int = DEFAULT_REORG_DEPTH,
+        confirmations: int = 0,
+    ):
+        self._easy_track = web3.eth.contract(address=easy_track.address, abi=easy_track.abi)
+        # EasyTrack versions without compact MotionCreated events have no MotionEVMScriptHashed in the ABI
+        self._topics = {
+            _hex(web3.keccak(text=_event_signature(self._easy_track, name))): name
+            for name in MOTION_EVENTS
+            if _has_event(self._easy_track, name)
+        }
+        self._start_block = start_block
+        self._logs_batch_size = logs_batch_size
+        self._reorg_depth = reorg_depth
+        self._confirmations = confirmations
+        self._db = sqlite3.connect(db_path)
+        self._db.row_factory = sqlite3.Row
+        self._db.executescript(SCHEMA)
+
+    @property
+    def last_block(self) -> Optional[int]:
+        """Number of the last indexed block or None if nothing was indexed yet"""
+        row = self._db.execute("SELECT MAX(block_number) FROM checkpoints").fetchone()
+        return row[0]
+
+    def sync(self, to_block: Optional[int] = None) -> int:
+        """Indexes events up to to_block (the latest confirmed block by default). Returns the last indexed block"""
+        if to_block is None:
+            to_block = web3.eth.block_number - self._confirmations
+
+        self._rollback_orphaned_blocks()
+
+        from_block = self._start_block if self.last_block is None else self.last_block + 1
+        while from_block <= to_block:
+            batch_to_block = min(from_block + self._logs_batch_size - 1, to_block)
+            logs = self._get_logs(from_block, batch_to_block)
+            with self._db:
+                for log_entry in logs:
+                    self._store_event(log_entry)
+                self._save_checkpoint(batch_to_block)
+            from_block = batch_to_block + 1
+
+        return self.last_block
+
+    def get_motion(self, motion_id: int) -> Optional[Dict]:
+        row = self._db.execute("SELECT * FROM motions WHERE id = ?", (motion_id,)).fetchone()
+        return _motion_from_row(row) if row else None
+
+    def get_motions(self, status: Optional[str] = None, evm_script_factory: Optional[str] = None) -> List[Dict]:
+        query, params = "SELECT * FROM motions WHERE 1 = 1", []
+        if status is not None:
+            query, params = query + " AND status = ?", params + [status]
+        if evm_script_factory is not None:
+            query, params = query + " AND evm_script_factory = ?", params + [_address_key(evm_script_factory)]
+        return [_motion_from_row(row) for row in self._db.execute(query + " ORDER BY id", params)]
+
+    def get_active_motions(self, evm_script_factory: Optional[str] = None) -> List[Dict]:
+        return self.get_motions(MOTION_STATUS_ACTIVE, evm_script_factory)
+
+    def get_objections(self, motion_id: int) -> List[Dict]:
+        rows = self._db.execute(
+            "SELECT * FROM events WHERE motion_id = ? AND name = 'MotionObjected' ORDER BY block_number, log_index",
+            (motion_id,),
+        )
+        return [dict(json.loads(row["args"]), block_number=row["block_number"]) for row in rows]
+
+    def close(self):
+        self._db.close()
+
+    def _get_logs(self, from_block: int, to_block: int) -> List:
+        # nodes limit the size of eth_getLogs responses, so the range is split in halves on failures
+        try:
+            return web3.eth.get_logs(
+                {
+                    "address": self._easy_track.address,
+                    "fromBlock": from_block,
+                    "toBlock": to_block,
+                    "topics": [list(self._topics.keys())],
+                }
+            )
+        except ValueError:
+            if from_block == to_block:
+                raise
+            middle_block = (from_block + to_block) // 2
+            return self._get_logs(from_block, middle_block) + self._get_logs(middle_block + 1, to_block)
+
+    def _store_event(self, log_entry):
+        name = self._topics[_hex(log_entry["topics"][0])]
+        event = getattr(self._easy_track.events, name)().process_log(log_entry)
+        args = {key: _serializable(value) for key, value in event["args"].items()}
+        if name == "MotionCreated" and is_compact_motion_created_event(args):
+            # the rebuilt EVMScript is stored with the event, so rollbacks don't call the factory again
+            args["_evmScript"] = self._rebuild_evm_script(args, log_entry["blockNumber"])
+        self._db.execute(
+            "INSERT OR IGNORE INTO events VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                log_entry["blockNumber"],
+                log_entry["logIndex"],
+                _hex(log_entry["transactionHash"]),
+                name,
+                args["_motionId"],
+                json.dumps(args),
+            ),
+        )
+        self._apply_event(name, args, log_entry["blockNumber"], _hex(log_entry["transactionHash"]))
+
+    def _rebuild_evm_script(self, args: Dict, block_number: int) -> Optional[str]:
+        """Returns the rebuilt EVMScript of the motion or None if the factory call fails. Calls fail
+        when the node has no state of the creation block or the factory was changed since then"""
+        try:
+            return rebuild_motion_evm_script(
+                self._easy_track.address,
+                args["_evmScriptFactory"],
+                args["_creator"],
+                args["_evmScriptCallData"],
+                block_number,
+            )
+        except Exception as error:
+            log.warning(f"Failed to rebuild EVMScript of motion {args['_motionId']}, stored unverified", error)
+            return None
+
+    def _apply_event(self, name: str, args: Dict, block_number: int, transaction_hash: str):
+        motion_id = args["_motionId"]
+        if name == "MotionCreated":
+            self._db.execute(
+                "INSERT OR REPLACE INTO motions VALUES (?, ?, ?, ?, ?, ?, '0', 0, ?, ?, NULL)",
+                (
+                    motion_id,
+                    _address_key(args["_evmScriptFactory"]),
+                    _address_key(args["_creator"]),
+                    args["_evmScriptCallData"],
+                    args["_evmScript"],
+                    MOTION_STATUS_ACTIVE,
+                    block_number,
+                    transaction_hash,
+                ),
+            )
+        elif name == "MotionEVMScriptHashed":
+            row = self._db.execute("SELECT evm_script FROM motions WHERE id = ?", (motion_id,)).fetchone()
+            if row is not None and row["evm_script"] is None:
+                # the failure to rebuild the EVMScript was reported on MotionCreated event
+                return
+            if row is None or _hex(web3.keccak(hexstr=row["evm_script"])) != args["_evmScriptHash"]:
+                log.warning("Rebuilt EVMScript doesn't match the hash emitted on the creation of motion", motion_id)
+        elif name == "MotionObjected":
+            self._db.execute(
+                "UPDATE motions SET objections_amount = ?, objections_amount_pct = ? WHERE id = ?",
+                (str(args["_newObjectionsAmount"]), args["_newObjectionsAmountPct"], motion_id),
+            )
+        else:
+            self._db.execute(
+                "UPDATE motions SET status = ?, finished_block = ? WHERE id = ?",
+                (FINAL_MOTION_STATUSES[name], block_number, motion_id),
+            )
+
+    def _save_checkpoint(self, block_number: int):
+        self._db.execute(
+            "INSERT OR REPLACE INTO checkpoints VALUES (?, ?)",
+            (block_number, _hex(web3.eth.get_block(block_number)["hash"])),
+        )
+        self._db.execute(
+            "DELETE FROM checkpoints WHERE block_number NOT IN "
+            "(SELECT block_number FROM checkpoints ORDER BY block_number DESC LIMIT ?)",
+            (self._reorg_depth,),
+        )
+
+    def _rollback_orphaned_blocks(self):
+        checkpoints = self._db.execute("SELECT * FROM checkpoints ORDER BY block_number DESC").fetchall()
+        if not checkpoints:
+            return
+
+        chain_head = web3.eth.block_number
+        valid_checkpoint = next(
+            (
+                checkpoint
+                for checkpoint in checkpoints
+                if checkpoint["block_number"] <= chain_head
+                and _hex(web3.eth.get_block(checkpoint["block_number"])["hash"]) == checkpoint["block_hash"]
+            ),
+            None,
+        )
+        if valid_checkpoint is None:
+            raise RuntimeError(f"Chain reorganization is deeper than {len(checkpoints)} checkpoints, reindex required")
+
+        rollback_block = valid_checkpoint["block_number"]
+        if rollback_block == checkpoints[0]["block_number"]:
+            return
+
+        log.warning("Chain reorganization detected, rolling back motions index to block", rollback_block)
+        with self._db:
+            affected_motion_ids = [
+                row[0]
+                for row in self._db.execute(
+                    "SELECT DISTINCT motion_id FROM events WHERE block_number > ?", (rollback_block,)
+                )
+            ]
+            self._db.execute("DELETE FROM events WHERE block_number > ?", (rollback_block,))
+            self._db.execute("DELETE FROM checkpoints WHERE block_number > ?", (rollback_block,))
+            for motion_id in affected_motion_ids:
+                self._rebuild_motion(motion_id)
+
+    def _rebuild_motion(self, motion_id: int):
+        self._db.execute("DELETE FROM motions WHERE id = ?", (motion_id,))
+        events = self._db.execute(
+            "SELECT * FROM events WHERE motion_id = ? ORDER BY block_number, log_index", (motion_id,)
+        ).fetchall()
+        for event in events:
+            self._apply_event(
+                event["name"], json.loads(event["args"]), event["block_number"], event["transaction_hash"]
+            )
+
+
+def _has_event(contract, event_name: str) -> bool:
+    return any(item["type"] == "event" and item["name"] == event_name for item in contract.abi)
+
+
+def _event_signature(contract, event_name: str) -> str:
+    abi = next(item for item in contract.abi if item["type"] == "event" and item["name"] == event_name)
+    return f"{event_name}({','.join(item['type'] for item in abi['inputs'])})"
+
+
+def _motion_from_row(row) -> Dict:
+    motion = dict(row)
+    motion["objections_amount"] = int(motion["objections_amount"])
+    return motion
+
+
+def _serializable(value):
+    if isinstance(value, (bytes, bytearray)):
+        return "0x" + value.hex()
+    if isinstance(value, str) and value.startswith("0x") and len(value) == 42:
+        return value.lower()
+    if isinstance(value, int) and value >= 2**63:
+        return str(value)
+    return value
+
+
+def _hex(value) -> str:
+    if isinstance(value, str):
+        return value.lower() if value.startswith("0x") else "0x" + value.lower()
+    return "0x" + bytes(value).hex()
+
+
+def _address_key(address) -> str:
+    if not isinstance(address, str):
+        address = address.address
+    return address.lower()
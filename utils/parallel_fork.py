@@ -0,0 +1,72 @@
+""" Parallel test runs with one forked node per pytest-xdist worker
+
+`brownie test -n <N> --network mainnet-fork` spreads tests across N workers. Every
+worker launches its own forked node on the port FORK_BASE_PORT + worker index, so workers
+never share the chain state.
+
+To keep runs deterministic all nodes fork the same block. The master process resolves the
+latest block of the forked network once and passes it to the workers in the FORK_BLOCK_NUMBER
+env variable. Set FORK_BLOCK_NUMBER explicitly to pin the block in serial runs too.
+"""
+
+import os
+from typing import Optional
+
+from brownie._config import CONFIG
+from web3 import HTTPProvider, Web3
+
+from utils import log
+
+ENV_FORK_BASE_PORT = "FORK_BASE_PORT"
+ENV_FORK_BLOCK_NUMBER = "FORK_BLOCK_NUMBER"
+DEFAULT_FORK_BASE_PORT = 8545
+
+
+def configure(config):
+    """Configures the forked node of the current pytest process. Must be called from pytest_configure"""
+    network_name = config.getoption("network", None) or CONFIG.settings["networks"]["default"]
+    if network_name not in CONFIG.networks or "cmd_settings" not in CONFIG.networks[network_name]:
+        return
+
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is not None:
+        configure_worker(network_name, worker_index(workerinput["workerid"]))
+        return
+
+    if config.getoption("numprocesses", None):
+        fork_block_number = resolve_fork_block_number(network_name)
+        if fork_block_number is not None:
+            # workers are spawned after pytest_configure and inherit the environment of the master
+            os.environ[ENV_FORK_BLOCK_NUMBER] = str(fork_block_number)
+            log.ok("Workers will fork block", fork_block_number)
+    elif os.getenv(ENV_FORK_BLOCK_NUMBER):
+        CONFIG.networks[network_name]["cmd_settings"]["fork_block"] = int(os.getenv(ENV_FORK_BLOCK_NUMBER))
+
+
+def configure_worker(network_name: str, index: int):
+    cmd_settings = CONFIG.networks[network_name]["cmd_settings"]
+    # the port is assigned, not incremented, so the setting doesn't depend on changes made by brownie itself
+    cmd_settings["port"] = worker_port(index)
+    if os.getenv(ENV_FORK_BLOCK_NUMBER):
+        cmd_settings["fork_block"] = int(os.getenv(ENV_FORK_BLOCK_NUMBER))
+
+
+def worker_index(worker_id: str) -> int:
+    """Converts xdist worker id ("gw0", "gw1", ...) into the index of the worker"""
+    return int("".join(char for char in worker_id if char.isdigit()))
+
+
+def worker_port(index: int) -> int:
+    return int(os.getenv(ENV_FORK_BASE_PORT, DEFAULT_FORK_BASE_PORT)) + index
+
+
+def resolve_fork_block_number(network_name: str) -> Optional[int]:
+    """Returns the block to fork: FORK_BLOCK_NUMBER if set, otherwise the latest block of the forked network"""
+    if os.getenv(ENV_FORK_BLOCK_NUMBER):
+        return int(os.getenv(ENV_FORK_BLOCK_NUMBER))
+
+    fork = CONFIG.networks[network_name]["cmd_settings"].get("fork")
+    if fork is None:
+        return None
+    fork_url = CONFIG.networks[fork]["host"] if fork in CONFIG.networks else fork
+    return Web3(HTTPProvider(os.path.expandvars(fork_url))).eth.block_number
@@ -0,0 +1,76 @@
+""" Client of LimitsChecker.getSpendableBalanceForecast() cached per block
+
+Treasury tooling checks many amounts and motion durations against the limits of the same
+registry. The client requests the forecast once per (block, motion duration) and answers
+the checks locally, so the search of the largest top-up doesn't need a loop of eth_calls.
+
+The latest block number is read once, on the first query, and the following queries are
+answered at that block until refresh() is called. Pass block_identifier to query a given
+block without touching the pinned one.
+
+    forecast_client = SpendableForecastClient(allowed_recipients_registry)
+    forecast_client.get_max_payout_amount(motion_duration=72 * 60 * 60)
+    forecast_client.is_under_spendable_balance(10**18, motion_duration=72 * 60 * 60)
+    forecast_client.refresh()  # the next query reads the new latest block
+"""
+
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from brownie import web3
+
+
+class SpendableForecast(NamedTuple):
+    spendable_balance_now: int
+    period_end_timestamp: int
+    spendable_balance_in_next_period: int
+    max_payout_amount: int
+
+
+class SpendableForecastClient:
+    def __init__(self, limits_checker):
+        self._limits_checker = limits_checker
+        self._pinned_block_number: Optional[int] = None
+        self._forecasts: Dict[Tuple[int, int], SpendableForecast] = {}
+
+    def refresh(self) -> None:
+        """Drops the cached forecasts, so the next query reads the latest block again"""
+        self._pinned_block_number = None
+        self._forecasts = {}
+
+    def get_block_number(self) -> int:
+        """Returns the block the queries without block_identifier are answered at"""
+        if self._pinned_block_number is None:
+            self._pinned_block_number = web3.eth.block_number
+        return self._pinned_block_number
+
+    def get_forecast(self, motion_duration: int, block_identifier: Optional[int] = None) -> SpendableForecast:
+        """Returns forecast at the given block, the pinned one by default"""
+        if block_identifier is None:
+            block_identifier = self.get_block_number()
+        key = (block_identifier, motion_duration)
+        if key not in self._forecasts:
+            self._forecasts[key] = SpendableForecast(
+                *self._limits_checker.getSpendableBalanceForecast.call(
+                    motion_duration, block_identifier=block_identifier
+                )
+            )
+        return self._forecasts[key]
+
+    def get_max_payout_amount(self, motion_duration: int, block_identifier: Optional[int] = None) -> int:
+        """Returns the largest payout which passes the limits check on the motion creation"""
+        return self.get_forecast(motion_duration, block_identifier).max_payout_amount
+
+    def is_under_spendable_balance(
+        self, amount: int, motion_duration: int, block_identifier: Optional[int] = None
+    ) -> bool:
+        """Same as LimitsChecker.isUnderSpendableBalance() without a call for every amount"""
+        return amount <= self.get_max_payout_amount(motion_duration, block_identifier)
+
+    def get_spendable_balances(self, block_identifier: Optional[int] = None) -> Tuple[int, int, int]:
+        """Returns (spendable now, period end timestamp, spendable after the period end)"""
+        forecast = self.get_forecast(0, block_identifier)
+        return (
+            forecast.spendable_balance_now,
+            forecast.period_end_timestamp,
+            forecast.spendable_balance_in_next_period,
+        )
@@ -2,7 +2,7 @@ from datetime import datetime, timezone
 
 from brownie import chain
 
-from utils import log
+from utils import limits_calendar, log
 from utils.config import set_balance_in_wei
 
 CANCEL_ROLE = "0x9f959e00d95122f5cbd677010436cf273ef535b86b056afc172852144b9491d7"
@@ -89,82 +89,12 @@ def get_next_month_start_timestamp(any_point_in_this_month: datetime, num_months
 
 def calc_period_first_month(period_duration, current_month):
     """Calculates the same value as LimitsChecker/_getFirstMonthInPeriodFromMonth"""
-    data = {
-        (1, 1): 1,
-        (1, 2): 2,
-        (1, 3): 3,
-        (1, 4): 4,
-        (1, 5): 5,
-        (1, 6): 6,
-        (1, 7): 7,
-        (1, 8): 8,
-        (1, 9): 9,
-        (1, 10): 10,
-        (1, 11): 11,
-        (1, 12): 12,
-        (2, 1): 1,
-        (2, 2): 1,
-        (2, 3): 3,
-        (2, 4): 3,
-        (2, 5): 5,
-        (2, 6): 5,
-        (2, 7): 7,
-        (2, 8): 7,
-        (2, 9): 9,
-        (2, 10): 9,
-        (2, 11): 11,
-        (2, 12): 11,
-        (3, 1): 1,
-        (3, 2): 1,
-        (3, 3): 1,
-        (3, 4): 4,
-        (3, 5): 4,
-        (3, 6): 4,
-        (3, 7): 7,
-        (3, 8): 7,
-        (3, 9): 7,
-        (3, 10): 10,
-        (3, 11): 10,
-        (3, 12): 10,
-        (6, 1): 1,
-        (6, 2): 1,
-        (6, 3): 1,
-        (6, 4): 1,
-        (6, 5): 1,
-        (6, 6): 1,
-        (6, 7): 7,
-        (6, 8): 7,
-        (6, 9): 7,
-        (6, 10): 7,
-        (6, 11): 7,
-        (6, 12): 7,
-        (12, 1): 1,
-        (12, 2): 1,
-        (12, 3): 1,
-        (12, 4): 1,
-        (12, 5): 1,
-        (12, 6): 1,
-        (12, 7): 1,
-        (12, 8): 1,
-        (12, 9): 1,
-        (12, 10): 1,
-        (12, 11): 1,
-        (12, 12): 1,
-    }
-    return data[(period_duration, current_month)]
+    return limits_calendar.first_month_in_period(current_month, period_duration)
 
 
 def calc_period_range(period_duration: int, now_timestamp: int):
     """Calculates the same range as LimitsChecker.sol"""
-    now = datetime.fromtimestamp(now_timestamp)
-    first_month = calc_period_first_month(period_duration, now.month)
-    first_month_date = now.replace(month=first_month)
-    next_period_date = get_date_in_next_period(first_month_date, period_duration)
-
-    return (
-        get_month_start_timestamp(first_month_date),
-        get_month_start_timestamp(next_period_date),
-    )
+    return limits_calendar.period_range(now_timestamp, period_duration)
 
 
 def advance_chain_time_to_n_seconds_before_current_period_end(period_duration: int, seconds_before: int):